@@ -54,6 +54,54 @@ class InputPluginStats(PluginStats, frozen=True, extra='forbid'):
     generated: int = Field(ge=0, description='Number of generated timestamps')
 
 
+class TemplateRenderStats(BaseModel, frozen=True, extra='forbid'):
+    """Render statistics of template."""
+
+    alias: str = Field(description='Alias of the template')
+    calls: int = Field(ge=0, description='Number of renders')
+    total: float = Field(
+        ge=0,
+        description='Estimated total render time (in seconds)',
+    )
+    mean: float = Field(ge=0, description='Mean render time (in seconds)')
+
+
+class TemplateLineRenderStats(BaseModel, frozen=True, extra='forbid'):
+    """Render statistics of template source line."""
+
+    template: str = Field(description='Name of the template')
+    line: int = Field(ge=0, description='Line number in template source')
+    hits: int = Field(
+        ge=0,
+        description=(
+            'Number of executed lines of compiled template code mapped '
+            'to the line'
+        ),
+    )
+    total: float = Field(
+        ge=0,
+        description=(
+            'Time spent on the line including time of functions called '
+            'from it in sampled renders (in seconds)'
+        ),
+    )
+    share: float = Field(
+        ge=0,
+        description='Share of line time in time of sampled renders',
+    )
+
+
+class TemplatesRenderProfile(BaseModel, frozen=True, extra='forbid'):
+    """Profile of templates rendering."""
+
+    templates: list[TemplateRenderStats] = Field(
+        description='Templates statistics ordered by total render time',
+    )
+    lines: list[TemplateLineRenderStats] = Field(
+        description='Most expensive template source lines',
+    )
+
+
 class EventPluginStats(PluginStats, frozen=True, extra='forbid'):
     """Event plugin statistics."""
 
@@ -66,6 +114,13 @@ class EventPluginStats(PluginStats, frozen=True, extra='forbid'):
         ge=0,
         description='Number of intentionally dropped events',
     )
+    render_profile: TemplatesRenderProfile | None = Field(
+        default=None,
+        description=(
+            'Profile of templates rendering, only available for template '
+            'event plugin with enabled profiling'
+        ),
+    )
 
 
 class OutputPluginStats(PluginStats, frozen=True, extra='forbid'):
@@ -157,3 +212,71 @@ class BulkStartResponse(BaseModel, extra='forbid', frozen=True):
 
     running_generator_ids: list[str]
     non_running_generator_ids: list[str]
+
+
+class LatencyStats(BaseModel, frozen=True, extra='forbid'):
+    """Latency statistics of pipeline operation."""
+
+    count: int = Field(ge=0, description='Number of measured operations')
+    total: float = Field(
+        ge=0,
+        description='Total duration of operations (in seconds)',
+    )
+    min: float = Field(ge=0, description='Minimal duration (in seconds)')
+    mean: float = Field(ge=0, description='Mean duration (in seconds)')
+    max: float = Field(ge=0, description='Maximal duration (in seconds)')
+    p50: float = Field(ge=0, description='50th percentile (in seconds)')
+    p90: float = Field(ge=0, description='90th percentile (in seconds)')
+    p99: float = Field(ge=0, description='99th percentile (in seconds)')
+    p999: float = Field(ge=0, description='99.9th percentile (in seconds)')
+
+
+class InputStageProfile(BaseModel, frozen=True, extra='forbid'):
+    """Latency profile of input stage."""
+
+    put_wait: LatencyStats = Field(
+        description='Time blocked on putting batches to timestamps queue',
+    )
+
+
+class EventStageProfile(BaseModel, frozen=True, extra='forbid'):
+    """Latency profile of event stage."""
+
+    get_wait: LatencyStats = Field(
+        description='Time blocked on getting batches from timestamps queue',
+    )
+    render: LatencyStats = Field(
+        description='Time of producing events for timestamp batches',
+    )
+    put_wait: LatencyStats = Field(
+        description='Time blocked on putting batches to events queue',
+    )
+
+
+class OutputStageProfile(BaseModel, frozen=True, extra='forbid'):
+    """Latency profile of output stage."""
+
+    get_wait: LatencyStats = Field(
+        description='Time blocked on getting batches from events queue',
+    )
+
+
+class OutputPluginProfile(PluginStats, frozen=True, extra='forbid'):
+    """Latency profile of output plugin."""
+
+    format: LatencyStats = Field(
+        description='Time of formatting event batches',
+    )
+    write: LatencyStats = Field(description='Time of writing event batches')
+
+
+class GeneratorProfile(BaseModel, frozen=True, extra='forbid'):
+    """Latency profile of generator pipeline."""
+
+    id: str = Field(min_length=1, description='Generator id')
+    input: InputStageProfile = Field(description='Input stage profile')
+    event: EventStageProfile = Field(description='Event stage profile')
+    output: OutputStageProfile = Field(description='Output stage profile')
+    output_plugins: list[OutputPluginProfile] = Field(
+        description='Output plugins profiles',
+    )
@@ -28,11 +28,20 @@ from eventum.api.routers.generators.dependencies import (
 from eventum.api.routers.generators.models import (
     BulkStartResponse,
     EventPluginStats,
+    EventStageProfile,
     GeneratorInfo,
+    GeneratorProfile,
     GeneratorStats,
     GeneratorStatus,
     InputPluginStats,
+    InputStageProfile,
+    LatencyStats,
+    OutputPluginProfile,
     OutputPluginStats,
+    OutputStageProfile,
+    TemplateLineRenderStats,
+    TemplateRenderStats,
+    TemplatesRenderProfile,
 )
 from eventum.api.utils.file_streaming import stream_file
 from eventum.api.utils.response_description import merge_responses
@@ -43,11 +52,18 @@ from eventum.api.utils.websocket_annotations import (
 )
 from eventum.app.manager import ManagingError
 from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import EventPluginCounters
 from eventum.logging.file_paths import construct_generator_logfile_path
+from eventum.plugins.event.base.plugin import EventPlugin
+from eventum.plugins.event.plugins.template.plugin import TemplateEventPlugin
+from eventum.utils.profiler import LatencyHistogram, LatencySnapshot
 
 router = APIRouter()
 ws_router = APIRouter()
 
+# Number of the most expensive template lines in render profile
+RENDER_PROFILE_LINES = 20
+
 
 @router.get(
     '/',
@@ -278,6 +294,7 @@ async def get_generator_stats(
             produced=plugins.event.produced,
             produce_failed=plugins.event.produce_failed,
             dropped=plugins.event.dropped,
+            render_profile=_render_profile(plugins.event),
         ),
         output=[
             OutputPluginStats(
@@ -292,6 +309,107 @@ async def get_generator_stats(
     )
 
 
+@router.get(
+    '/{id}/profile',
+    description=(
+        'Get latency profile of running generator pipeline stages '
+        'and output plugins'
+    ),
+    responses=_get_generator.responses,
+)
+async def get_generator_profile(
+    id: str,
+    generator: GeneratorDep,
+) -> GeneratorProfile:
+    if generator.is_running and generator.start_time is not None:
+        try:
+            plugins = generator.get_plugins_info()
+            snapshot = generator.get_profiler().snapshot()
+        except RuntimeError:
+            snapshot = None
+    else:
+        snapshot = None
+
+    if snapshot is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Generator is not running',
+        )
+
+    def latency(name: str) -> LatencyStats:
+        stats = snapshot.get(name) or LatencyHistogram().snapshot()
+        return _latency_stats(stats)
+
+    return GeneratorProfile(
+        id=id,
+        input=InputStageProfile(put_wait=latency('input.put_wait')),
+        event=EventStageProfile(
+            get_wait=latency('event.get_wait'),
+            render=latency('event.render'),
+            put_wait=latency('event.put_wait'),
+        ),
+        output=OutputStageProfile(get_wait=latency('output.get_wait')),
+        output_plugins=[
+            OutputPluginProfile(
+                plugin_name=plugin.name,
+                plugin_id=plugin.id,
+                format=latency(f'output.{plugin.id}.format'),
+                write=latency(f'output.{plugin.id}.write'),
+            )
+            for plugin in plugins.output
+        ],
+    )
+
+
+def _render_profile(
+    plugin: EventPlugin | EventPluginCounters,
+) -> TemplatesRenderProfile | None:
+    """Get render profile of event plugin if it is available."""
+    if not isinstance(plugin, TemplateEventPlugin):
+        return None
+
+    profile = plugin.render_profile
+    if profile is None:
+        return None
+
+    return TemplatesRenderProfile(
+        templates=[
+            TemplateRenderStats(
+                alias=stats.alias,
+                calls=stats.calls,
+                total=stats.total,
+                mean=stats.mean,
+            )
+            for stats in profile.templates
+        ],
+        lines=[
+            TemplateLineRenderStats(
+                template=stats.template,
+                line=stats.line,
+                hits=stats.hits,
+                total=stats.total,
+                share=stats.share,
+            )
+            for stats in profile.lines[:RENDER_PROFILE_LINES]
+        ],
+    )
+
+
+def _latency_stats(snapshot: LatencySnapshot) -> LatencyStats:
+    """Convert latency snapshot to response model."""
+    return LatencyStats(
+        count=snapshot.count,
+        total=snapshot.total,
+        min=snapshot.min,
+        mean=snapshot.mean,
+        max=snapshot.max,
+        p50=snapshot.p50,
+        p90=snapshot.p90,
+        p99=snapshot.p99,
+        p999=snapshot.p999,
+    )
+
+
 @router.get(
     '/group-actions/stats-running',
     description='Get stats of all running generators',
@@ -328,6 +446,7 @@ async def get_running_generators_stats(
                     produced=plugins.event.produced,
                     produce_failed=plugins.event.produce_failed,
                     dropped=plugins.event.dropped,
+                    render_profile=_render_profile(plugins.event),
                 ),
                 output=[
                     OutputPluginStats(
@@ -17,6 +17,7 @@ from eventum.app.models.parameters.server import (
 )
 from eventum.app.models.settings import Settings
 from eventum.core.parameters import GenerationParameters, GeneratorParameters
+from eventum.utils.profiler import PipelineProfiler
 
 
 @pytest.fixture()
@@ -149,6 +150,47 @@ def test_get_generator_status(client, manager, tmp_settings):
     assert data['is_initializing'] is False
 
 
+# --- GET /{id}/profile ---
+
+
+def test_get_generator_profile_not_running(client, manager, tmp_settings):
+    config_path = _make_config_file(tmp_settings, 'gen_prof')
+    params = GeneratorParameters(id='gen_prof', path=Path(config_path))
+    manager.add(params)
+    response = client.get('/generators/gen_prof/profile')
+    assert response.status_code == 400
+
+
+def test_get_generator_profile_not_found(client):
+    response = client.get('/generators/missing/profile')
+    assert response.status_code == 404
+
+
+def test_get_generator_profile(client, manager):
+    profiler = PipelineProfiler()
+    profiler.histogram('event.render').record(2_000_000)
+    output_plugin = MagicMock()
+    output_plugin.name = 'file'
+    output_plugin.id = 1
+
+    generator = MagicMock()
+    generator.is_running = True
+    generator.get_profiler.return_value = profiler
+    generator.get_plugins_info.return_value.output = [output_plugin]
+
+    with patch.object(manager, 'get_generator', return_value=generator):
+        response = client.get('/generators/gen_run/profile')
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data['id'] == 'gen_run'
+    assert data['event']['render']['count'] == 1
+    assert data['event']['render']['max'] == pytest.approx(0.002, rel=0.1)
+    assert data['input']['put_wait']['count'] == 0
+    assert data['output_plugins'][0]['plugin_name'] == 'file'
+    assert data['output_plugins'][0]['write']['count'] == 0
+
+
 # --- POST /{id}/start ---
 
 
@@ -19,6 +19,7 @@ from eventum.core.executor import ExecutionError, Executor
 from eventum.core.parameters import GeneratorParameters
 from eventum.core.plugins_initializer import (
     InitializedPlugins,
+    create_event_plugin_factory,
     init_plugins,
 )
 
@@ -127,12 +128,18 @@ def run_bounded(
         event=config.event,
         output=config.output,
         params=params,
+        replicated_event=params.event_workers > 1,
     )
     executor = Executor(
         input=plugins.input,
         event=plugins.event,
         output=plugins.output,
         params=params,
+        event_factory=(
+            create_event_plugin_factory(event=config.event, params=params)
+            if params.event_workers > 1
+            else None
+        ),
     )
 
     if max_events is not None and max_events < 1:
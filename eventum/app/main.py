@@ -16,6 +16,9 @@ from eventum.app.startup import (
     StartupGeneratorParametersList,
 )
 from eventum.exceptions import ContextualError
+from eventum.plugins.event.plugins.template.bytecode_cache import (
+    BYTECODE_CACHE_SETTINGS,
+)
 from eventum.security.manage import SECURITY_SETTINGS
 
 logger = structlog.stdlib.get_logger()
@@ -59,6 +62,9 @@ class App:
             settings.path.keyring_cryptfile
         )
 
+        logger.debug('Setting up templates cache')
+        BYTECODE_CACHE_SETTINGS['directory'] = settings.path.templates_cache
+
         self._manager = GeneratorManager()
         self._startup = Startup(
             file_path=settings.path.startup,
@@ -29,6 +29,11 @@ class PathParameters(BaseModel, extra='forbid', frozen=True):
         other than this parameter value will not be operable using API
         endpoints.
 
+    templates_cache : Path | None, default=None
+        Absolute path to directory for caching compiled templates of
+        template event plugins, if not set then templates are compiled
+        without caching.
+
     """
 
     logs: Path
@@ -36,11 +41,18 @@ class PathParameters(BaseModel, extra='forbid', frozen=True):
     generators_dir: Path
     keyring_cryptfile: Path
     generator_config_filename: Path = Path('generator.yml')
-
-    @field_validator('logs', 'startup', 'generators_dir', 'keyring_cryptfile')
+    templates_cache: Path | None = None
+
+    @field_validator(
+        'logs',
+        'startup',
+        'generators_dir',
+        'keyring_cryptfile',
+        'templates_cache',
+    )
     @classmethod
-    def validate_absolute_paths(cls, v: Path) -> Path:  # noqa: D102
-        if not v.is_absolute():
+    def validate_absolute_paths(cls, v: Path | None) -> Path | None:  # noqa: D102
+        if v is not None and not v.is_absolute():
             msg = 'Path must be absolute'
             raise ValueError(msg)
 
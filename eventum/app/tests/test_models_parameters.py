@@ -37,6 +37,17 @@ def test_path_parameters_relative_path_raises():
         )
 
 
+def test_path_parameters_relative_templates_cache_raises():
+    with pytest.raises(ValidationError, match='Path must be absolute'):
+        PathParameters(
+            logs=Path('/var/log'),
+            startup=Path('/etc/startup.yml'),
+            generators_dir=Path('/etc/generators'),
+            keyring_cryptfile=Path('/etc/keyring.cfg'),
+            templates_cache=Path('cache'),
+        )
+
+
 def test_path_parameters_generator_config_filename_default():
     params = PathParameters(
         logs=Path('/var/log'),
@@ -23,6 +23,11 @@ from eventum.cli.pydantic_converter import from_model
 from eventum.cli.splash_screen import SPLASH_SCREEN
 from eventum.core.generator import Generator
 from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import InitializedPlugins
+from eventum.plugins.event.plugins.template.bytecode_cache import (
+    BYTECODE_CACHE_SETTINGS,
+)
+from eventum.plugins.event.plugins.template.plugin import TemplateEventPlugin
 from eventum.security.manage import SECURITY_SETTINGS
 from eventum.utils.dotted_keys import DottedKeyError, expand_dotted_keys
 from eventum.utils.validation_prettier import prettify_validation_errors
@@ -195,6 +200,38 @@ VERBOSITY_TO_LOG_LEVEL: dict[VerbosityLevel, logconf.LogLevel] = {
 }
 
 
+# Number of the most expensive template lines in reported render profile
+RENDER_PROFILE_LINES = 20
+
+
+def _report_render_profile(plugins: InitializedPlugins) -> None:
+    """Print profile of templates rendering to stderr if event plugin
+    has it.
+    """
+    if not isinstance(plugins.event, TemplateEventPlugin):
+        return
+
+    profile = plugins.event.render_profile
+    if profile is None or not profile.templates:
+        return
+
+    lines = ['Templates render profile:']
+    lines.extend(
+        f'  {stats.alias}: {stats.calls} renders, '
+        f'{stats.total:.3f}s total, {stats.mean * 1e6:.1f}us mean'
+        for stats in profile.templates
+    )
+
+    lines.append('Most expensive template lines (sampled renders):')
+    lines.extend(
+        f'  {stats.template}:{stats.line}: {stats.share:.1%} '
+        f'({stats.hits} hits, {stats.total:.3f}s)'
+        for stats in profile.lines[:RENDER_PROFILE_LINES]
+    )
+
+    click.echo('\n'.join(lines), err=True)
+
+
 @cli.command
 @from_model(GeneratorParameters)
 @click.option(
@@ -216,10 +253,17 @@ VERBOSITY_TO_LOG_LEVEL: dict[VerbosityLevel, logconf.LogLevel] = {
     type=click.Path(exists=True, resolve_path=True),
     help='Path to keyring cryptfile',
 )
+@click.option(
+    '--templates-cache',
+    default=None,
+    type=click.Path(file_okay=False, resolve_path=True),
+    help='Path to directory for caching compiled templates',
+)
 def generate(
     generator_parameters: GeneratorParameters,
     verbose: NonVerbose | VerbosityLevel,
     cryptfile: str | None,
+    templates_cache: str | None,
 ) -> None:
     """Generate events using single generator."""
     if verbose == 0:
@@ -230,8 +274,14 @@ def generate(
     if cryptfile is not None:
         SECURITY_SETTINGS['cryptfile_location'] = Path(cryptfile)
 
+    if templates_cache is not None:
+        BYTECODE_CACHE_SETTINGS['directory'] = Path(templates_cache)
+
     logger.info('Starting generator')
-    generator = Generator(generator_parameters)
+    generator = Generator(
+        generator_parameters,
+        on_end=_report_render_profile,
+    )
     status = generator.start()
 
     if not status:
@@ -0,0 +1,234 @@
+"""Adaptive controller of timestamps batch size."""
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from eventum.core.parameters import AdaptiveBatchParameters
+    from eventum.core.queue import PipelineQueue
+    from eventum.plugins.input.batcher import TimestampsBatcher
+    from eventum.utils.profiler import LatencyHistogram, PipelineProfiler
+
+logger = structlog.stdlib.get_logger()
+
+# Maximum factor of batch size change in single adjustment
+MAX_STEP = 2.0
+
+# Relative growth of processing time per event that is treated as
+# degradation when searching for the best throughput
+COST_TOLERANCE = 0.05
+
+
+class BatchSizeController:
+    """Controller adjusting batch size of timestamps batcher at runtime.
+
+    Processing time of a batch is estimated from latency histograms
+    of event stage render and output plugins write (the slowest output
+    plugin is taken as plugins write concurrently). Divided by mean
+    size of batches produced since previous adjustment it gives
+    processing time per event, which is used to choose the next batch
+    size:
+
+    - with `latency` goal size is chosen so that time of batch passing
+      the pipeline, including waiting behind batches already in the
+      timestamps queue, is near the target latency;
+    - with `throughput` goal size is stepped in one direction while
+      processing time per event does not degrade and reversed
+      otherwise.
+
+    Change of size in single adjustment is limited by `MAX_STEP`
+    factor.
+
+    Parameters
+    ----------
+    batcher : TimestampsBatcher
+        Batcher to adjust size of.
+
+    params : AdaptiveBatchParameters
+        Parameters of adaptive batch sizing.
+
+    profiler : PipelineProfiler
+        Profiler of pipeline with render and write latencies.
+
+    clock : Callable[[], float], default=time.monotonic
+        Clock to measure intervals between adjustments.
+
+    """
+
+    def __init__(
+        self,
+        batcher: TimestampsBatcher,
+        params: AdaptiveBatchParameters,
+        profiler: PipelineProfiler,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize controller.
+
+        Parameters
+        ----------
+        batcher : TimestampsBatcher
+            Batcher to adjust size of.
+
+        params : AdaptiveBatchParameters
+            Parameters of adaptive batch sizing.
+
+        profiler : PipelineProfiler
+            Profiler of pipeline with render and write latencies.
+
+        clock : Callable[[], float], default=time.monotonic
+            Clock to measure intervals between adjustments.
+
+        """
+        self._batcher = batcher
+        self._params = params
+        self._profiler = profiler
+        self._clock = clock
+
+        self._size = self._clamp(batcher.batch_size or params.max_size)
+        batcher.batch_size = self._size
+
+        self._last_adjustment = clock()
+        self._observed_batches = 0
+        self._observed_timestamps = 0
+
+        # count and total of histograms at previous adjustment
+        self._previous_totals: dict[str, tuple[int, int]] = {}
+
+        self._previous_cost: float | None = None
+        self._direction = 1
+
+    def _clamp(self, size: float) -> int:
+        """Clamp size to configured bounds."""
+        return min(
+            max(round(size), self._params.min_size),
+            self._params.max_size,
+        )
+
+    def _mean_latency(
+        self,
+        name: str,
+        histogram: LatencyHistogram,
+    ) -> float | None:
+        """Get mean of values (in seconds) recorded by histogram since
+        previous call, `None` is returned if nothing is recorded.
+        """
+        count, total = histogram.count, histogram.total
+        previous_count, previous_total = self._previous_totals.get(
+            name,
+            (0, 0),
+        )
+        self._previous_totals[name] = (count, total)
+
+        if count <= previous_count:
+            return None
+
+        return (total - previous_total) / (count - previous_count) / 1e9
+
+    def _batch_latency(self) -> float | None:
+        """Estimate processing time of single batch (in seconds),
+        `None` is returned if no batches are rendered since previous
+        estimation.
+        """
+        histograms = self._profiler.histograms
+
+        render = histograms.get('event.render')
+        if render is None:
+            return None
+
+        render_latency = self._mean_latency('event.render', render)
+        if render_latency is None:
+            return None
+
+        write_latencies = [
+            self._mean_latency(name, histogram)
+            for name, histogram in histograms.items()
+            if name.startswith('output.') and name.endswith('.write')
+        ]
+
+        return render_latency + max(
+            (latency for latency in write_latencies if latency is not None),
+            default=0.0,
+        )
+
+    def _size_for_latency(self, cost: float, queued: int) -> float:
+        """Get size that fits target latency with specified processing
+        time per event and number of batches queued ahead.
+        """
+        if cost <= 0:
+            return self._params.max_size
+
+        return self._params.target_latency / (cost * (queued + 1))
+
+    def _size_for_throughput(self, cost: float) -> float:
+        """Get next size of search for the lowest processing time per
+        event.
+        """
+        if self._previous_cost is not None and cost > self._previous_cost * (
+            1 + COST_TOLERANCE
+        ):
+            self._direction = -self._direction
+
+        self._previous_cost = cost
+
+        if self._direction > 0:
+            return self._size * MAX_STEP
+
+        return self._size / MAX_STEP
+
+    def observe(self, size: int, queue: PipelineQueue) -> None:
+        """Observe produced batch and adjust batch size if adjustment
+        interval has passed.
+
+        Parameters
+        ----------
+        size : int
+            Size of produced batch.
+
+        queue : PipelineQueue
+            Timestamps queue the batch is put to.
+
+        """
+        self._observed_batches += 1
+        self._observed_timestamps += size
+
+        now = self._clock()
+        if now - self._last_adjustment < self._params.interval:
+            return
+
+        latency = self._batch_latency()
+        if latency is None:
+            return
+
+        cost = latency / (self._observed_timestamps / self._observed_batches)
+
+        self._last_adjustment = now
+        self._observed_batches = 0
+        self._observed_timestamps = 0
+
+        if self._params.goal == 'latency':
+            desired = self._size_for_latency(cost, queue.size)
+        else:
+            desired = self._size_for_throughput(cost)
+
+        new_size = self._clamp(
+            min(max(desired, self._size / MAX_STEP), self._size * MAX_STEP),
+        )
+        if new_size == self._size:
+            return
+
+        logger.debug(
+            'Adjusting batch size',
+            previous_size=self._size,
+            size=new_size,
+            batch_latency=latency,
+        )
+        self._size = new_size
+        self._batcher.batch_size = new_size
+
+    @property
+    def size(self) -> int:
+        """Current batch size."""
+        return self._size
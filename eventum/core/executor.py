@@ -1,19 +1,31 @@
 """Executor that orchestrates the input - event - output pipeline."""
 
 import asyncio
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from operator import attrgetter
 from threading import Event, Thread
 
 import structlog
 
 from eventum.core.parameters import GeneratorParameters
-from eventum.core.queue import PipelineQueue
-from eventum.core.stages import EventStage, InputStage, OutputStage
+from eventum.core.plugins_initializer import EventPluginCounters
+from eventum.core.queue import PipelineQueue, create_queue
+from eventum.core.stages import (
+    EventStage,
+    InputStage,
+    OutputStage,
+    ParallelEventStage,
+)
 from eventum.exceptions import ContextualError
 from eventum.plugins.event.base.plugin import EventPlugin
 from eventum.plugins.input.base.plugin import InputPlugin
-from eventum.plugins.input.protocols import IdentifiedTimestamps
+from eventum.plugins.input.protocols import (
+    IdentifiedTimestamps,
+    SupportsIdentifiedTimestampsIterate,
+)
 from eventum.plugins.output.base.plugin import OutputPlugin
+from eventum.plugins.output.batch import EventBatch
+from eventum.utils.profiler import PipelineProfiler
 
 logger = structlog.stdlib.get_logger()
 
@@ -38,8 +50,9 @@ class Executor:
     input : Sequence[InputPlugin]
         Input plugins.
 
-    event : EventPlugin
-        Event plugin.
+    event : EventPlugin | EventPluginCounters
+        Event plugin, or only its counters if events are produced by
+        multiple event workers.
 
     output : Sequence[OutputPlugin]
         Output plugins.
@@ -47,25 +60,44 @@ class Executor:
     params : GeneratorParameters
         Generator parameters.
 
+    event_factory : Callable[[int], EventPlugin] | None, default=None
+        Factory of event plugin replicas, required if more than one
+        event worker is configured in generator parameters.
+
+    source : SupportsIdentifiedTimestampsIterate | None, default=None
+        Source of timestamp batches produced elsewhere (e.g. by parent
+        process of generator shards), if provided input plugins are
+        not executed and can be omitted.
+
+    input_tags : dict[int, tuple[str, ...]] | None, default=None
+        Map of input plugin ID to tags, required if `source` is
+        provided.
+
     Raises
     ------
     ValueError
-        If input or output plugin sequences are empty.
+        If input plugin sequence is empty and no source is provided,
+        or output plugin sequence is empty.
 
     ImproperlyConfiguredError
-        If the input pipeline cannot be configured.
+        If the input pipeline cannot be configured or event workers
+        cannot be initialized (e.g. event plugin is sequential).
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         input: Sequence[InputPlugin],
-        event: EventPlugin,
+        event: EventPlugin | EventPluginCounters,
         output: Sequence[OutputPlugin],
         params: GeneratorParameters,
+        *,
+        event_factory: Callable[[int], EventPlugin] | None = None,
+        source: SupportsIdentifiedTimestampsIterate | None = None,
+        input_tags: dict[int, tuple[str, ...]] | None = None,
     ) -> None:
         """Initialize executor with plugin stages and parameters."""
-        if not input:
+        if not input and source is None:
             msg = 'At least one input plugin must be provided'
             raise ValueError(msg)
 
@@ -77,25 +109,123 @@ class Executor:
         self._stop_event = Event()
         self._skip_past = params.live_mode and params.skip_past
         self._execution_error: ExecutionError | None = None
+        self._profiler = PipelineProfiler()
 
         logger.debug('Initializing queues')
         self._timestamps_queue: PipelineQueue[IdentifiedTimestamps] = (
-            PipelineQueue(maxsize=params.queue.max_timestamp_batches)
+            create_queue(
+                implementation=params.queue.implementation,
+                maxsize=params.queue.max_timestamp_batches,
+                max_weight=params.queue.max_timestamps,
+                weigher=len,
+            )
         )
-        self._events_queue: PipelineQueue[list[str]] = PipelineQueue(
+        self._events_queue: PipelineQueue[EventBatch] = create_queue(
+            implementation=params.queue.implementation,
             maxsize=params.queue.max_event_batches,
+            max_weight=(
+                params.queue.max_event_bytes
+                if params.queue.max_event_bytes is not None
+                else params.queue.max_events
+            ),
+            weigher=(
+                attrgetter('nbytes')
+                if params.queue.max_event_bytes is not None
+                else len
+            ),
         )
 
         logger.debug('Configuring stages')
-        self._input_stage = InputStage(plugins=input, params=params)
+        self._input_stage = InputStage(
+            plugins=input,
+            params=params,
+            profiler=self._profiler,
+            source=source,
+            input_tags=input_tags,
+        )
         self._input_stage.configure(stop_event=self._stop_event)
 
-        self._event_stage = EventStage(
-            plugin=event,
-            input_tags=self._input_stage.input_tags,
+        self._event_stage: EventStage | ParallelEventStage
+        if params.event_workers == 1:
+            if isinstance(event, EventPluginCounters):
+                msg = 'Event plugin instance is required for single worker'
+                raise ImproperlyConfiguredError(
+                    msg,
+                    context={'event_workers': params.event_workers},
+                )
+
+            self._event_stage = EventStage(
+                plugin=event,
+                input_tags=self._input_stage.input_tags,
+                params=params,
+                profiler=self._profiler,
+            )
+        else:
+            self._event_stage = self._create_parallel_event_stage(
+                event=event,
+                event_factory=event_factory,
+            )
+
+        self._output_stage = OutputStage(
+            plugins=output,
             params=params,
+            profiler=self._profiler,
         )
-        self._output_stage = OutputStage(plugins=output, params=params)
+
+    def _create_parallel_event_stage(
+        self,
+        event: EventPlugin | EventPluginCounters,
+        event_factory: Callable[[int], EventPlugin] | None,
+    ) -> ParallelEventStage:
+        """Create event stage with multiple event workers.
+
+        Raises
+        ------
+        ImproperlyConfiguredError
+            If factory is not provided, event plugin is sequential or
+            replicas cannot be created.
+
+        """
+        if event.is_sequential:
+            msg = (
+                'Sequential event plugin cannot be used with multiple workers'
+            )
+            raise ImproperlyConfiguredError(
+                msg,
+                context={
+                    'plugin_name': event.name,
+                    'event_workers': self._params.event_workers,
+                },
+            )
+
+        if event_factory is None:
+            msg = 'Event plugin factory is required for multiple workers'
+            raise ImproperlyConfiguredError(
+                msg,
+                context={'event_workers': self._params.event_workers},
+            )
+
+        logger.debug(
+            'Configuring event workers',
+            event_workers=self._params.event_workers,
+        )
+        try:
+            return ParallelEventStage(
+                plugin=event,
+                factory=event_factory,
+                input_tags=self._input_stage.input_tags,
+                params=self._params,
+                profiler=self._profiler,
+            )
+        except Exception as e:
+            msg = 'Failed to initialize event workers'
+            raise ImproperlyConfiguredError(
+                msg,
+                context={
+                    'event_workers': self._params.event_workers,
+                    'reason': str(e),
+                },
+            ) from e
 
     def execute(self) -> None:
         """Start the pipeline and block until all stages complete.
@@ -120,6 +250,11 @@ class Executor:
         self._stop_event.set()
         self._input_stage.stop_interactive_plugins()
 
+    @property
+    def profiler(self) -> PipelineProfiler:
+        """Profiler with latency histograms of pipeline stages."""
+        return self._profiler
+
     # - Pipeline orchestration ----------------------------------------
 
     def _start_pipeline(self) -> tuple[Thread, Thread, Thread]:
@@ -2,8 +2,10 @@
 
 import os
 import time
+from collections.abc import Callable
 from datetime import datetime
 from threading import Event, Lock, Thread, get_native_id
+from typing import cast
 from zoneinfo import ZoneInfo
 
 import structlog
@@ -19,14 +21,21 @@ from eventum.core.parameters import GeneratorParameters
 from eventum.core.plugins_initializer import (
     InitializationError,
     InitializedPlugins,
+    create_event_plugin_factory,
     init_plugins,
 )
+from eventum.core.sharding import ShardedExecutor
+from eventum.utils.profiler import PipelineProfiler
 
 
 class Generator:
     """Thread-wrapped generator."""
 
-    def __init__(self, params: GeneratorParameters) -> None:
+    def __init__(
+        self,
+        params: GeneratorParameters,
+        on_end: Callable[[InitializedPlugins], None] | None = None,
+    ) -> None:
         """Initialize generator.
 
         Parameters
@@ -34,12 +43,17 @@ class Generator:
         params : GeneratorParameters
             Generator parameters.
 
+        on_end : Callable[[InitializedPlugins], None] | None, default=None
+            Callback that is called with plugins after execution ends
+            and before plugins are released.
+
         """
         self._params = params
+        self._on_end = on_end
 
         self._config: GeneratorConfig | None = None
         self._plugins: InitializedPlugins | None = None
-        self._executor: Executor | None = None
+        self._executor: Executor | ShardedExecutor | None = None
 
         self._thread: Thread | None = None
         self._initialized_event = Event()
@@ -54,7 +68,7 @@ class Generator:
 
         self._start_time: datetime | None = None
 
-    def _start(self) -> None:  # noqa: PLR0911, PLR0915
+    def _start(self) -> None:  # noqa: C901, PLR0911, PLR0915
         """Start generation."""
         structlog.contextvars.bind_contextvars(generator_id=self._params.id)
 
@@ -92,6 +106,9 @@ class Generator:
                 event=self._config.event,
                 output=self._config.output,
                 params=self._params,
+                replicated_event=(
+                    self._params.event_workers > 1 or self._params.shards > 1
+                ),
             )
         except InitializationError as e:
             self._logger.error(str(e), **e.context)
@@ -107,12 +124,7 @@ class Generator:
 
         self._logger.info('Initializing plugins executor')
         try:
-            self._executor = Executor(
-                input=self._plugins.input,
-                event=self._plugins.event,
-                output=self._plugins.output,
-                params=self._params,
-            )
+            self._executor = self._create_executor()
         except ImproperlyConfiguredError as e:
             self._logger.error(str(e), **e.context)
             self._release()
@@ -149,8 +161,59 @@ class Generator:
             self._logger.info('Ending execution')
             self._successfully_done_event.set()
         finally:
+            if self._on_end is not None:
+                self._call_on_end(self._on_end)
             self._release()
 
+    def _call_on_end(
+        self,
+        callback: Callable[[InitializedPlugins], None],
+    ) -> None:
+        """Call callback of execution end with plugins."""
+        try:
+            callback(cast('InitializedPlugins', self._plugins))
+        except Exception as e:
+            self._logger.exception(
+                'Unexpected error occurred in execution end callback',
+                reason=str(e),
+            )
+
+    def _create_executor(self) -> Executor | ShardedExecutor:
+        """Create executor for initialized plugins.
+
+        Returns
+        -------
+        Executor | ShardedExecutor
+            Sharded executor if more than one shard is configured,
+            plain executor otherwise.
+
+        Raises
+        ------
+        ImproperlyConfiguredError
+            If plugins cannot be executed with generator parameters.
+
+        """
+        config = cast('GeneratorConfig', self._config)
+        plugins = cast('InitializedPlugins', self._plugins)
+
+        if self._params.shards > 1:
+            return ShardedExecutor(plugins=plugins, params=self._params)
+
+        return Executor(
+            input=plugins.input,
+            event=plugins.event,
+            output=plugins.output,
+            params=self._params,
+            event_factory=(
+                create_event_plugin_factory(
+                    event=config.event,
+                    params=self._params,
+                )
+                if self._params.event_workers > 1
+                else None
+            ),
+        )
+
     def start(self) -> bool:
         """Start generator in separate thread waiting for its
         initialization. Ignore call if generator is already running.
@@ -244,6 +307,28 @@ class Generator:
 
         return self._plugins
 
+    def get_profiler(self) -> PipelineProfiler:
+        """Get profiler of generator pipeline.
+
+        Returns
+        -------
+        PipelineProfiler
+            Profiler with latency histograms of pipeline stages.
+
+        Raises
+        ------
+        RuntimeError
+            If profiler is unavailable (e.g. generator wasn't yet
+            started).
+
+        """
+        executor = self._executor
+        if executor is None:
+            msg = 'No profiling information is available'
+            raise RuntimeError(msg)
+
+        return executor.profiler
+
     def get_config(self) -> GeneratorConfig:
         """Get generator config.
 
@@ -1,12 +1,53 @@
 """Generator parameters."""
 
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Literal, Self
 from zoneinfo import available_timezones
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+class AdaptiveBatchParameters(BaseModel, extra='forbid', frozen=True):
+    """Parameters of adaptive batch sizing.
+
+    Attributes
+    ----------
+    goal : Literal['latency', 'throughput'], default='latency'
+        Goal of adjusting batch size, `latency` keeps time for batch
+        to pass through the pipeline (including waiting in timestamps
+        queue) near `target_latency`, `throughput` searches for batch
+        size with the lowest processing time per event.
+
+    target_latency : float, default=1.0
+        Target time (in seconds) for batch to pass through the
+        pipeline, used with `latency` goal.
+
+    min_size : int, default=100
+        Minimum batch size.
+
+    max_size : int, default=100000
+        Maximum batch size.
+
+    interval : float, default=1.0
+        Minimum interval (in seconds) between adjustments.
+
+    """
+
+    goal: Literal['latency', 'throughput'] = Field(default='latency')
+    target_latency: float = Field(default=1.0, gt=0)
+    min_size: int = Field(default=100, ge=1)
+    max_size: int = Field(default=100_000, ge=1)
+    interval: float = Field(default=1.0, gt=0)
+
+    @model_validator(mode='after')
+    def validate_sizes(self) -> Self:  # noqa: D102
+        if self.min_size > self.max_size:
+            msg = 'Minimum batch size cannot be greater than maximum'
+            raise ValueError(msg)
+
+        return self
+
+
 class BatchParameters(BaseModel, extra='forbid', frozen=True):
     """Batcher parameters.
 
@@ -18,14 +59,20 @@ class BatchParameters(BaseModel, extra='forbid', frozen=True):
     delay : float | None, default=1.0
         Batch delay (in seconds) for generating events.
 
+    adaptive : AdaptiveBatchParameters | None, default=None
+        Parameters of adaptive batch sizing, if provided batch size is
+        adjusted at runtime based on observed render and write
+        latencies and timestamps queue occupancy, starting from `size`.
+
     Notes
     -----
-    At least one parameter must be not `None`.
+    At least one of `size` and `delay` parameters must be not `None`.
 
     """
 
     size: int | None = Field(default=None, ge=1)
     delay: float | None = Field(default=None, ge=0.1)
+    adaptive: AdaptiveBatchParameters | None = Field(default=None)
 
     @model_validator(mode='before')
     @classmethod
@@ -53,16 +100,65 @@ class QueueParameters(BaseModel, extra='forbid', frozen=True):
 
     Attributes
     ----------
+    implementation : Literal['stdlib', 'ring'], default='stdlib'
+        Implementation of queues, `stdlib` is a wrapper over standard
+        library queue, `ring` is a ring buffer that can additionally
+        be bounded by number of timestamps, events or bytes.
+
     max_timestamp_batches : int, default=10
         Maximum number of batches in timestamps queue.
 
     max_event_batches : int, default=10
         Maximum number of batches in events queue.
 
+    max_timestamps : int | None, default=None
+        Maximum total number of timestamps in timestamps queue.
+
+    max_events : int | None, default=None
+        Maximum total number of events in events queue.
+
+    max_event_bytes : int | None, default=None
+        Maximum total size (in bytes) of events in events queue.
+
+    max_output_batches : int, default=10
+        Maximum number of batches waiting to be written in queue of
+        each output plugin.
+
+    Notes
+    -----
+    Bounds by number of timestamps, events or bytes are only supported
+    by `ring` implementation, events queue can be bounded either by
+    number of events or by bytes.
+
     """
 
+    implementation: Literal['stdlib', 'ring'] = Field(default='stdlib')
     max_timestamp_batches: int = Field(default=10, ge=1)
     max_event_batches: int = Field(default=10, ge=1)
+    max_timestamps: int | None = Field(default=None, ge=1)
+    max_events: int | None = Field(default=None, ge=1)
+    max_event_bytes: int | None = Field(default=None, ge=1)
+    max_output_batches: int = Field(default=10, ge=1)
+
+    @model_validator(mode='after')
+    def validate_bounds(self) -> Self:  # noqa: D102
+        weighted = (
+            self.max_timestamps is not None
+            or self.max_events is not None
+            or self.max_event_bytes is not None
+        )
+        if weighted and self.implementation != 'ring':
+            msg = (
+                'Bounds by number of timestamps, events or bytes '
+                'require ring queue implementation'
+            )
+            raise ValueError(msg)
+
+        if self.max_events is not None and self.max_event_bytes is not None:
+            msg = 'Only one of max events or max event bytes can be set'
+            raise ValueError(msg)
+
+        return self
 
 
 class GenerationParameters(BaseModel, extra='forbid', frozen=True):
@@ -85,12 +181,26 @@ class GenerationParameters(BaseModel, extra='forbid', frozen=True):
         timestamps by disabling output plugins concurrency.
 
     max_concurrency : int, default=100
-        Maximum number of write operations performed by output plugins
-        concurrently.
+        Maximum number of write operations performed by each output
+        plugin concurrently.
 
     write_timeout : int, default=10
         Timeout (in seconds) before canceling single write task.
 
+    event_workers : int, default=1
+        Number of event plugin replicas producing events concurrently.
+        Replicas run in threads on free-threaded interpreter and in
+        processes otherwise. Each replica keeps its own state (e.g.
+        template `locals`/`shared` state and picker position), so
+        sequential event plugins (`replay`) cannot be replicated.
+
+    shards : int, default=1
+        Number of processes the generator is split into. Input plugins
+        run in the parent process, which dispatches timestamp batches
+        to shards in round-robin order, and each shard runs its own
+        event and output plugins. Sequential event plugins (`replay`)
+        and adaptive batch sizing cannot be used with sharding.
+
     """
 
     timezone: str = Field(default='UTC', min_length=3)
@@ -99,6 +209,8 @@ class GenerationParameters(BaseModel, extra='forbid', frozen=True):
     keep_order: bool = Field(default=False)
     max_concurrency: int = Field(default=100, ge=1)
     write_timeout: int = Field(default=10, ge=1)
+    event_workers: int = Field(default=1, ge=1)
+    shards: int = Field(default=1, ge=1)
 
     @field_validator('timezone')
     @classmethod
@@ -109,6 +221,16 @@ class GenerationParameters(BaseModel, extra='forbid', frozen=True):
         msg = f'Unknown time zone `{v}`'
         raise ValueError(msg)
 
+    @model_validator(mode='after')
+    def validate_sharding(self) -> Self:  # noqa: D102
+        # batches are processed in shard processes, so their latencies
+        # cannot be observed by batcher in the parent process
+        if self.shards > 1 and self.batch.adaptive is not None:
+            msg = 'Adaptive batch sizing cannot be used with sharding'
+            raise ValueError(msg)
+
+        return self
+
 
 class GeneratorParameters(GenerationParameters, frozen=True):
     """Parameters for single generator.
@@ -133,6 +255,15 @@ class GeneratorParameters(GenerationParameters, frozen=True):
     params: dict[str, Any], default={}
         Parameters that can be used in generator configuration file.
 
+    seed : int | None, default=None
+        Seed for random streams of plugins, if it is set then the same
+        events are generated for the same timestamps on each run. Each
+        plugin, event workers and shards get their own streams derived
+        from the seed. Random streams of template modules (e.g. `rand`,
+        `faker`) and samples are process wide, so they are reproducible
+        only when the generator does not share the process with other
+        generators and events are rendered by a single event worker.
+
     """
 
     id: str = Field(min_length=1)
@@ -140,6 +271,7 @@ class GeneratorParameters(GenerationParameters, frozen=True):
     live_mode: bool = True
     skip_past: bool = Field(default=True)
     params: dict[str, Any] = Field(default_factory=dict)
+    seed: int | None = Field(default=None, ge=0)
 
     def as_absolute(self, base_dir: Path) -> Self:
         """Get instance with absolute path to generator.
@@ -1,8 +1,9 @@
 """Functions for loading, initialization and configuring plugins."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Literal, assert_never, overload
+from functools import partial
+from typing import Any, Literal, assert_never, overload
 from zoneinfo import ZoneInfo
 
 import structlog
@@ -33,6 +34,7 @@ from eventum.plugins.output.base.plugin import (
     OutputPlugin,
     OutputPluginParams,
 )
+from eventum.utils.seeding import derive_seed
 from eventum.utils.validation_prettier import prettify_validation_errors
 
 logger = structlog.stdlib.get_logger()
@@ -42,6 +44,105 @@ class InitializationError(ContextualError):
     """Error during initialization."""
 
 
+class EventPluginCounters:
+    """Counters of event plugin whose events are produced only by its
+    replicas (in event workers or generator shards).
+
+    It is used instead of plugin instance in the process that only
+    collects statistics of replicas, so plugin resources (e.g.
+    templates and samples) are not loaded there.
+
+    Parameters
+    ----------
+    name : str
+        Canonical name of the plugin.
+
+    id : int
+        ID of the plugin.
+
+    sequential : bool
+        Whether the plugin is sequential.
+
+    """
+
+    def __init__(self, name: str, id: int, *, sequential: bool) -> None:
+        """Initialize counters.
+
+        Parameters
+        ----------
+        name : str
+            Canonical name of the plugin.
+
+        id : int
+            ID of the plugin.
+
+        sequential : bool
+            Whether the plugin is sequential.
+
+        """
+        self._name = name
+        self._id = id
+        self._sequential = sequential
+
+        self._produced = 0
+        self._produce_failed = 0
+        self._dropped = 0
+
+    def merge_counters(
+        self,
+        produced: int,
+        produce_failed: int,
+        dropped: int,
+    ) -> None:
+        """Add counters of plugin replicas.
+
+        Parameters
+        ----------
+        produced : int
+            Number of produced events.
+
+        produce_failed : int
+            Number of unsuccessfully produced events.
+
+        dropped : int
+            Number of dropped events.
+
+        """
+        self._produced += produced
+        self._produce_failed += produce_failed
+        self._dropped += dropped
+
+    @property
+    def name(self) -> str:
+        """Canonical name of the plugin."""
+        return self._name
+
+    @property
+    def id(self) -> int:
+        """ID of the plugin."""
+        return self._id
+
+    @property
+    def is_sequential(self) -> bool:
+        """Whether the plugin is sequential."""
+        return self._sequential
+
+    @property
+    def produced(self) -> int:
+        """Number of produced events."""
+        return self._produced
+
+    @property
+    def produce_failed(self) -> int:
+        """Number of unsuccessfully produced events."""
+        return self._produce_failed
+
+    @property
+    def dropped(self) -> int:
+        """Number of dropped events."""
+        return self._dropped
+
+
 @dataclass(frozen=True)
 class InitializedPlugins:
     """Initialized plugins.
@@ -51,8 +152,9 @@ class InitializedPlugins:
     input : list[InputPlugin]
         List of initialized input plugins.
 
-    event : EventPlugin
-        Initialized event plugin.
+    event : EventPlugin | EventPluginCounters
+        Initialized event plugin or its counters if the plugin is
+        initialized only in replicas.
 
     output : list[OutputPlugin]
         List of initialized output plugins.
@@ -60,44 +162,17 @@ class InitializedPlugins:
     """
 
     input: list[InputPlugin]
-    event: EventPlugin
+    event: EventPlugin | EventPluginCounters
     output: list[OutputPlugin]
 
 
-@overload
-def init_plugin(
-    name: str,
-    type: Literal['input'],
-    config: PluginConfigFields,
-    params: InputPluginParams,
-) -> InputPlugin: ...
-
-
-@overload
-def init_plugin(
-    name: str,
-    type: Literal['event'],
-    config: PluginConfigFields,
-    params: EventPluginParams,
-) -> EventPlugin: ...
-
-
-@overload
-def init_plugin(
-    name: str,
-    type: Literal['output'],
-    config: PluginConfigFields,
-    params: OutputPluginParams,
-) -> OutputPlugin: ...
-
-
-def init_plugin(
+def _load_plugin(
     name: str,
     type: Literal['input', 'event', 'output'],
     config: PluginConfigFields,
     params: InputPluginParams | EventPluginParams | OutputPluginParams,
-) -> InputPlugin | EventPlugin | OutputPlugin:
-    """Initialize plugin.
+) -> tuple[type[Any], Any]:
+    """Load plugin class and validate config for it.
 
     Parameters
     ----------
@@ -115,13 +190,13 @@ def init_plugin(
 
     Returns
     -------
-    InputPlugin | EventPlugin | OutputPlugin
-        Initialized plugin.
+    tuple[type[Any], Any]
+        Plugin class and validated config.
 
     Raises
     ------
     InitializationError
-        If any error occurs during initializing.
+        If plugin cannot be loaded or config is invalid.
 
     """
     log = logger.bind(
@@ -173,6 +248,81 @@ def init_plugin(
             },
         ) from None
 
+    return PluginCls, plugin_config
+
+
+@overload
+def init_plugin(
+    name: str,
+    type: Literal['input'],
+    config: PluginConfigFields,
+    params: InputPluginParams,
+) -> InputPlugin: ...
+
+
+@overload
+def init_plugin(
+    name: str,
+    type: Literal['event'],
+    config: PluginConfigFields,
+    params: EventPluginParams,
+) -> EventPlugin: ...
+
+
+@overload
+def init_plugin(
+    name: str,
+    type: Literal['output'],
+    config: PluginConfigFields,
+    params: OutputPluginParams,
+) -> OutputPlugin: ...
+
+
+def init_plugin(
+    name: str,
+    type: Literal['input', 'event', 'output'],
+    config: PluginConfigFields,
+    params: InputPluginParams | EventPluginParams | OutputPluginParams,
+) -> InputPlugin | EventPlugin | OutputPlugin:
+    """Initialize plugin.
+
+    Parameters
+    ----------
+    name : str
+        Name of plugin to use.
+
+    type : Literal['input', 'event', 'output']
+        Type of plugin.
+
+    config : PluginConfigFields
+        Config for plugin instance.
+
+    params : InputPluginParams | EventPluginParams | OutputPluginParams
+        Parameters for plugin instance.
+
+    Returns
+    -------
+    InputPlugin | EventPlugin | OutputPlugin
+        Initialized plugin.
+
+    Raises
+    ------
+    InitializationError
+        If any error occurs during initializing.
+
+    """
+    PluginCls, plugin_config = _load_plugin(  # noqa: N806
+        name=name,
+        type=type,
+        config=config,
+        params=params,
+    )
+
+    log = logger.bind(
+        plugin_name=name,
+        plugin_type=type,
+        plugin_id=params['id'],
+    )
     log.debug('Instantiating plugin')
     try:
         return PluginCls(config=plugin_config, params=params)
@@ -191,11 +341,183 @@ def init_plugin(
         ) from e
 
 
-def init_plugins(
+def _seed_params[
+    T: (InputPluginParams, EventPluginParams, OutputPluginParams)
+](
+    params: T,
+    seed: int | None,
+    key: tuple[int | str, ...],
+) -> T:
+    """Set seed derived from generator seed in plugin parameters.
+
+    Parameters
+    ----------
+    params : T
+        Plugin parameters to update.
+
+    seed : int | None
+        Seed of the generator, if it is `None` then parameters are
+        returned unchanged.
+
+    key : tuple[int | str, ...]
+        Key identifying random streams of the plugin instance.
+
+    Returns
+    -------
+    T
+        Updated plugin parameters.
+
+    """
+    if seed is not None:
+        params['seed'] = derive_seed(seed, *key)
+
+    return params
+
+
+def _init_event_plugin_replica(
+    replica: int,
+    *,
+    name: str,
+    config: PluginConfigFields,
+    params: EventPluginParams,
+    seed: int | None,
+) -> EventPlugin:
+    """Initialize replica of event plugin with its own random streams.
+
+    Parameters
+    ----------
+    replica : int
+        Index of the replica.
+
+    name : str
+        Name of plugin to use.
+
+    config : PluginConfigFields
+        Config for plugin instance.
+
+    params : EventPluginParams
+        Parameters for plugin instance without seed.
+
+    seed : int | None
+        Seed of replicas derived from seed of the generator.
+
+    Returns
+    -------
+    EventPlugin
+        Initialized plugin.
+
+    Raises
+    ------
+    InitializationError
+        If any error occurs during initializing.
+
+    """
+    return init_plugin(
+        name=name,
+        type='event',
+        config=config,
+        params=_seed_params(
+            params.copy(),
+            seed=seed,
+            key=(replica,),
+        ),
+    )
+
+
+def create_event_plugin_factory(
+    event: PluginConfig,
+    params: GeneratorParameters,
+    *,
+    shard: int = 0,
+) -> Callable[[int], EventPlugin]:
+    """Create factory of event plugin instances.
+
+    Parameters
+    ----------
+    event : PluginConfig
+        Event plugin configuration.
+
+    params : GeneratorParameters
+        Generators parameters.
+
+    shard : int, default=0
+        Index of the generator shard in which instances are used.
+
+    Returns
+    -------
+    Callable[[int], EventPlugin]
+        Picklable factory that initializes new event plugin instance
+        on each call, it accepts index of the replica so replicas get
+        distinct random streams when generator is seeded and raises
+        `InitializationError` if any error occurs during initializing.
+
+    """
+    plugin_name, plugin_conf = next(iter(event.items()))
+
+    return partial(
+        _init_event_plugin_replica,
+        name=plugin_name,
+        config=plugin_conf,
+        params=EventPluginParams(id=1, base_path=params.path.parent),
+        seed=(
+            derive_seed(params.seed, 'event', 1, shard)
+            if params.seed is not None
+            else None
+        ),
+    )
+
+
+def init_event_plugin_counters(
+    event: PluginConfig,
+    params: GeneratorParameters,
+) -> EventPluginCounters:
+    """Initialize counters of event plugin without instantiating it.
+    Plugin is loaded and its config is validated, so configuration
+    errors are raised as early as with plugin instantiation.
+
+    Parameters
+    ----------
+    event : PluginConfig
+        Event plugin configuration.
+
+    params : GeneratorParameters
+        Generators parameters.
+
+    Returns
+    -------
+    EventPluginCounters
+        Initialized counters.
+
+    Raises
+    ------
+    InitializationError
+        If plugin cannot be loaded or config is invalid.
+
+    """
+    plugin_name, plugin_conf = next(iter(event.items()))
+
+    PluginCls, _ = _load_plugin(  # noqa: N806
+        name=plugin_name,
+        type='event',
+        config=plugin_conf,
+        params={'id': 1, 'base_path': params.path.parent},
+    )
+
+    return EventPluginCounters(
+        name=plugin_name,
+        id=1,
+        sequential=PluginCls.is_sequential,
+    )
+
+
+def init_plugins(  # noqa: PLR0913
     input: Iterable[PluginConfig],
     event: PluginConfig,
     output: Iterable[PluginConfig],
     params: GeneratorParameters,
+    *,
+    replicated_event: bool = False,
+    shard: int = 0,
 ) -> InitializedPlugins:
     """Initialize plugins.
 
@@ -214,6 +536,14 @@ def init_plugins(
         Generators parameters that can be needed for plugins
         initialization (plugin params, e.g. timezone).
 
+    replicated_event : bool, default=False
+        Whether event plugin is used only through its replicas (event
+        workers or generator shards), in this case only its counters
+        are initialized.
+
+    shard : int, default=0
+        Index of the generator shard in which plugins are used.
+
     Returns
     -------
     InitializedPlugins
@@ -242,28 +572,33 @@ def init_plugins(
                 name=plugin_name,
                 type='input',
                 config=plugin_conf,
-                params={
-                    'id': plugin_id,
-                    'timezone': ZoneInfo(params.timezone),
-                    'base_path': plugins_base_path,
-                },
+                params=_seed_params(
+                    InputPluginParams(
+                        id=plugin_id,
+                        timezone=ZoneInfo(params.timezone),
+                        base_path=plugins_base_path,
+                    ),
+                    seed=params.seed,
+                    key=('input', plugin_id, shard),
+                ),
             ),
         )
 
     logger.debug('Initializing event plugin')
-    plugin_name, plugin_conf = next(iter(event.items()))
-    plugin_id = 1
     logger.debug(
         'Initializing event plugin',
-        plugin_name=plugin_name,
-        plugin_id=plugin_id,
-    )
-    event_plugin = init_plugin(
-        name=plugin_name,
-        type='event',
-        config=plugin_conf,
-        params={'id': plugin_id, 'base_path': plugins_base_path},
+        plugin_name=next(iter(event)),
+        plugin_id=1,
     )
+    event_plugin: EventPlugin | EventPluginCounters
+    if replicated_event:
+        event_plugin = init_event_plugin_counters(event=event, params=params)
+    else:
+        event_plugin = create_event_plugin_factory(
+            event=event,
+            params=params,
+            shard=shard,
+        )(0)
 
     logger.debug('Initializing output plugins')
     output_plugins: list[OutputPlugin] = []
@@ -280,7 +615,14 @@ def init_plugins(
                 name=plugin_name,
                 type='output',
                 config=plugin_conf,
-                params={'id': plugin_id, 'base_path': plugins_base_path},
+                params=_seed_params(
+                    OutputPluginParams(
+                        id=plugin_id,
+                        base_path=plugins_base_path,
+                    ),
+                    seed=params.seed,
+                    key=('output', plugin_id, shard),
+                ),
             ),
         )
 
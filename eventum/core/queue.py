@@ -1,16 +1,32 @@
-"""Typed pipeline queue for inter-stage communication."""
+"""Typed pipeline queues for inter-stage communication."""
 
+import asyncio
+import contextlib
 import queue
-from typing import Generic, TypeVar
+import threading
+from collections.abc import Callable
+from typing import Generic, Literal, TypeVar, override
 
 T = TypeVar('T')
 
+type QueueImplementation = Literal['stdlib', 'ring']
+type AsyncWaiter = tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+
+
+def _resolve_waiter(future: asyncio.Future[None]) -> None:
+    """Resolve waiter future if it is still pending."""
+    if not future.done():
+        future.set_result(None)
+
 
 class PipelineQueue(Generic[T]):
     """Typed wrapper over stdlib queue with sentinel-based closing.
 
     Stages receive queues as constructor parameters and communicate
-    exclusively through them.
+    exclusively through them. Consumer running in event loop can use
+    `aget_many` to await items without handing off to a thread, in
+    this case producers wake the consumer via
+    `loop.call_soon_threadsafe`.
 
     Parameters
     ----------
@@ -29,7 +45,61 @@ class PipelineQueue(Generic[T]):
 
         """
         self._maxsize = maxsize
-        self._queue: queue.Queue[T | None] = queue.Queue(maxsize=maxsize)
+
+        self._waiter: AsyncWaiter | None = None
+        self._waiter_lock = threading.Lock()
+
+        self._init_storage()
+
+    def _init_storage(self) -> None:
+        """Initialize storage of items."""
+        self._queue: queue.Queue[T | None] = queue.Queue(
+            maxsize=self._maxsize,
+        )
+
+        # sentinel consumed by `aget_many` that is not yet reported
+        self._sentinel_received = False
+
+    def _wake_waiter(self) -> None:
+        """Wake async consumer waiting for items, must be called with
+        the lock guarding waiter held.
+        """
+        if self._waiter is None:
+            return
+
+        loop, future = self._waiter
+        self._waiter = None
+
+        # loop can be already closed if consumer is gone
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_resolve_waiter, future)
+
+    def _set_waiter(self, waiter: AsyncWaiter) -> bool:
+        """Register async consumer waiting for items.
+
+        Parameters
+        ----------
+        waiter : AsyncWaiter
+            Event loop of consumer and future to resolve on new items.
+
+        Returns
+        -------
+        bool
+            `True` if waiter is registered, `False` if queue already
+            has items or is closed or shut down, so there is nothing
+            to wait for.
+
+        """
+        with self._waiter_lock:
+            if (
+                self._sentinel_received
+                or self._queue.is_shutdown
+                or not self._queue.empty()
+            ):
+                return False
+
+            self._waiter = waiter
+            return True
 
     def put(self, item: T) -> None:
         """Put an item into the queue.
@@ -47,6 +117,9 @@ class PipelineQueue(Generic[T]):
         """
         self._queue.put(item)
 
+        with self._waiter_lock:
+            self._wake_waiter()
+
     def get(self) -> T | None:
         """Get an item from the queue.
 
@@ -62,10 +135,84 @@ class PipelineQueue(Generic[T]):
             If the queue has been shut down.
 
         """
+        if self._sentinel_received:
+            return None
+
         item = self._queue.get()
         self._queue.task_done()
         return item
 
+    def _get_many_nowait(self, max_items: int) -> list[T] | None:
+        """Get available items from the queue without blocking.
+
+        Returns
+        -------
+        list[T] | None
+            Items from the queue (empty list if there are no items),
+            or ``None`` if the queue has been closed via sentinel and
+            all items are consumed.
+
+        Raises
+        ------
+        queue.ShutDown
+            If the queue has been shut down.
+
+        """
+        if self._sentinel_received:
+            return None
+
+        items: list[T] = []
+        while len(items) < max_items:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            self._queue.task_done()
+
+            if item is None:
+                self._sentinel_received = True
+                return items or None
+
+            items.append(item)
+
+        return items
+
+    async def aget_many(self, max_items: int) -> list[T] | None:
+        """Await available items from the queue in event loop.
+
+        Parameters
+        ----------
+        max_items : int
+            Maximum number of items to get.
+
+        Returns
+        -------
+        list[T] | None
+            Items from the queue, or ``None`` if the queue has been
+            closed via sentinel and all items are consumed.
+
+        Raises
+        ------
+        queue.ShutDown
+            If the queue has been shut down.
+
+        Notes
+        -----
+        Only one consumer is allowed to await items at a time.
+
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            items = self._get_many_nowait(max_items)
+            if items is None or items:
+                return items
+
+            future = loop.create_future()
+            if self._set_waiter((loop, future)):
+                await future
+
     def close(self) -> None:
         """Close the queue by sending sentinel and waiting for it
         to be consumed.
@@ -74,6 +221,10 @@ class PipelineQueue(Generic[T]):
         """
         try:
             self._queue.put(None)
+
+            with self._waiter_lock:
+                self._wake_waiter()
+
             self._queue.join()
         except queue.ShutDown:
             pass
@@ -86,7 +237,309 @@ class PipelineQueue(Generic[T]):
         """
         self._queue.shutdown(immediate=True)
 
+        with self._waiter_lock:
+            self._wake_waiter()
+
     @property
     def is_full(self) -> bool:
         """Whether the queue is full."""
         return self._queue.full()
+
+    @property
+    def size(self) -> int:
+        """Approximate number of items in the queue."""
+        return self._queue.qsize()
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of items in the queue."""
+        return self._maxsize
+
+
+class RingPipelineQueue(PipelineQueue[T]):
+    """Pipeline queue over preallocated ring buffer guarded by single
+    lock, optionally bounded by total weight of items.
+
+    Unlike stdlib queue it does not track unfinished tasks, so each
+    operation takes one lock acquisition, and `aget_many` drains all
+    available items at once.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of items in the queue.
+
+    max_weight : int | None, default=None
+        Maximum total weight of items in the queue, item that alone
+        exceeds it is still accepted by an empty queue.
+
+    weigher : Callable[[T], int] | None, default=None
+        Function to calculate weight of item, required if `max_weight`
+        is set.
+
+    Raises
+    ------
+    ValueError
+        If `max_weight` is set without `weigher`.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        max_weight: int | None = None,
+        weigher: Callable[[T], int] | None = None,
+    ) -> None:
+        """Initialize ring pipeline queue.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of items in the queue.
+
+        max_weight : int | None, default=None
+            Maximum total weight of items in the queue.
+
+        weigher : Callable[[T], int] | None, default=None
+            Function to calculate weight of item.
+
+        Raises
+        ------
+        ValueError
+            If `max_weight` is set without `weigher`.
+
+        """
+        if max_weight is not None and weigher is None:
+            msg = 'Weigher must be provided for queue bounded by weight'
+            raise ValueError(msg)
+
+        self._max_weight = max_weight
+        self._weigher = weigher
+
+        super().__init__(maxsize)
+
+    @override
+    def _init_storage(self) -> None:
+        # one extra slot is reserved for sentinel
+        self._buffer: list[T | None] = [None] * (self._maxsize + 1)
+        self._weights = [0] * (self._maxsize + 1)
+        self._head = 0
+        self._size = 0
+        self._weight = 0
+
+        self._closing = False
+        self._closed = False
+        self._is_shutdown = False
+
+        # waiter is guarded by the same lock as the buffer
+        self._lock = threading.Lock()
+        self._waiter_lock = self._lock
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._sentinel_consumed = threading.Condition(self._lock)
+
+    def _has_room(self, weight: int) -> bool:
+        """Check whether item of specified weight can be put."""
+        if self._size >= self._maxsize:
+            return False
+
+        if self._max_weight is None or self._size == 0:
+            return True
+
+        return self._weight + weight <= self._max_weight
+
+    def _append(self, item: T | None, weight: int) -> None:
+        """Append item to the tail of the buffer."""
+        tail = (self._head + self._size) % len(self._buffer)
+        self._buffer[tail] = item
+        self._weights[tail] = weight
+        self._size += 1
+        self._weight += weight
+        self._not_empty.notify()
+        self._wake_waiter()
+
+    def _pop(self) -> T | None:
+        """Pop item from the head of the buffer."""
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None
+        self._weight -= self._weights[self._head]
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+
+        if item is None:
+            self._closed = True
+            self._sentinel_consumed.notify_all()
+
+        return item
+
+    def _wait_items(self) -> None:
+        """Wait until the buffer is not empty.
+
+        Raises
+        ------
+        queue.ShutDown
+            If the queue has been shut down.
+
+        """
+        while True:
+            if self._is_shutdown:
+                raise queue.ShutDown
+
+            if self._size > 0 or self._closed:
+                return
+
+            self._not_empty.wait()
+
+    @override
+    def put(self, item: T) -> None:
+        weight = 0 if self._weigher is None else self._weigher(item)
+
+        with self._not_full:
+            while True:
+                if self._is_shutdown:
+                    raise queue.ShutDown
+
+                if self._has_room(weight):
+                    break
+
+                self._not_full.wait()
+
+            self._append(item, weight)
+
+    @override
+    def get(self) -> T | None:
+        with self._not_empty:
+            self._wait_items()
+
+            if self._size == 0:
+                return None
+
+            item = self._pop()
+            self._not_full.notify()
+
+        return item
+
+    def _drain(self, max_items: int) -> list[T]:
+        """Pop available items up to the sentinel, the sentinel itself
+        is popped only if it is the first item.
+        """
+        items: list[T] = []
+        while self._size > 0 and len(items) < max_items:
+            if self._buffer[self._head] is None:
+                if not items:
+                    self._pop()
+                break
+
+            items.append(self._pop())  # type: ignore[arg-type]
+
+        self._not_full.notify_all()
+        return items
+
+    @override
+    def _get_many_nowait(self, max_items: int) -> list[T] | None:
+        with self._lock:
+            if self._is_shutdown:
+                raise queue.ShutDown
+
+            items = self._drain(max_items)
+            if not items and self._closed:
+                return None
+
+        return items
+
+    @override
+    def _set_waiter(self, waiter: AsyncWaiter) -> bool:
+        with self._lock:
+            if self._is_shutdown or self._closed or self._size > 0:
+                return False
+
+            self._waiter = waiter
+            return True
+
+    @override
+    def close(self) -> None:
+        with self._lock:
+            if self._is_shutdown or self._closing:
+                return
+
+            self._closing = True
+            self._append(None, 0)
+
+            while not (self._closed or self._is_shutdown):
+                self._sentinel_consumed.wait()
+
+    @override
+    def shutdown(self) -> None:
+        with self._lock:
+            self._is_shutdown = True
+            self._buffer = [None] * len(self._buffer)
+            self._size = 0
+            self._weight = 0
+
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+            self._sentinel_consumed.notify_all()
+            self._wake_waiter()
+
+    @property
+    @override
+    def is_full(self) -> bool:
+        with self._lock:
+            return self._size >= self._maxsize or (
+                self._max_weight is not None
+                and self._weight >= self._max_weight
+            )
+
+    @property
+    @override
+    def size(self) -> int:
+        with self._lock:
+            return self._size
+
+
+def create_queue(
+    implementation: QueueImplementation,
+    maxsize: int,
+    max_weight: int | None = None,
+    weigher: Callable[[T], int] | None = None,
+) -> PipelineQueue[T]:
+    """Create pipeline queue of specified implementation.
+
+    Parameters
+    ----------
+    implementation : QueueImplementation
+        Implementation of the queue.
+
+    maxsize : int
+        Maximum number of items in the queue.
+
+    max_weight : int | None, default=None
+        Maximum total weight of items in the queue, only supported by
+        ring implementation.
+
+    weigher : Callable[[T], int] | None, default=None
+        Function to calculate weight of item.
+
+    Returns
+    -------
+    PipelineQueue[T]
+        Created queue.
+
+    Raises
+    ------
+    ValueError
+        If parameters are not supported by the implementation.
+
+    """
+    if implementation == 'ring':
+        return RingPipelineQueue(
+            maxsize=maxsize,
+            max_weight=max_weight,
+            weigher=weigher,
+        )
+
+    if max_weight is not None:
+        msg = 'Queue bounded by weight requires ring implementation'
+        raise ValueError(msg)
+
+    return PipelineQueue(maxsize=maxsize)
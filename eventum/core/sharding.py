@@ -0,0 +1,718 @@
+"""Sharded execution of generator in multiple processes."""
+
+import multiprocessing
+import queue as queue_mod
+import signal
+from dataclasses import dataclass, field
+from itertools import cycle
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+import eventum.logging.config as logconf
+from eventum.core.config_loader import load
+from eventum.core.executor import (
+    ExecutionError,
+    Executor,
+    ImproperlyConfiguredError,
+)
+from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import (
+    InitializedPlugins,
+    create_event_plugin_factory,
+    init_plugins,
+)
+from eventum.core.queue import PipelineQueue, create_queue
+from eventum.core.stages import InputStage
+from eventum.exceptions import ContextualError
+from eventum.utils.profiler import PipelineProfiler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.context import ForkServerProcess
+    from multiprocessing.queues import Queue as ProcessQueue
+    from multiprocessing.synchronize import Event as ProcessEvent
+
+    from eventum.plugins.input.protocols import IdentifiedTimestamps
+
+logger = structlog.stdlib.get_logger()
+
+STATS_REPORT_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class ShardCounters:
+    """Snapshot of plugin counters of a single shard.
+
+    Attributes
+    ----------
+    produced : int
+        Number of produced events.
+
+    produce_failed : int
+        Number of unsuccessfully produced events.
+
+    dropped : int
+        Number of dropped events.
+
+    written : dict[int, int]
+        Number of written events per output plugin ID.
+
+    write_failed : dict[int, int]
+        Number of unsuccessfully written events per output plugin ID.
+
+    format_failed : dict[int, int]
+        Number of unsuccessfully formatted events per output plugin ID.
+
+    """
+
+    produced: int = 0
+    produce_failed: int = 0
+    dropped: int = 0
+    written: dict[int, int] = field(default_factory=dict)
+    write_failed: dict[int, int] = field(default_factory=dict)
+    format_failed: dict[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def collect(cls, plugins: InitializedPlugins) -> ShardCounters:
+        """Collect counters of plugins.
+
+        Parameters
+        ----------
+        plugins : InitializedPlugins
+            Plugins to collect counters from.
+
+        Returns
+        -------
+        ShardCounters
+            Collected counters.
+
+        """
+        return cls(
+            produced=plugins.event.produced,
+            produce_failed=plugins.event.produce_failed,
+            dropped=plugins.event.dropped,
+            written={p.id: p.written for p in plugins.output},
+            write_failed={p.id: p.write_failed for p in plugins.output},
+            format_failed={p.id: p.format_failed for p in plugins.output},
+        )
+
+    def merge_difference(
+        self,
+        previous: ShardCounters,
+        plugins: InitializedPlugins,
+    ) -> None:
+        """Merge increase of counters relative to previous snapshot into
+        plugins.
+
+        Parameters
+        ----------
+        previous : ShardCounters
+            Previous snapshot of the same shard.
+
+        plugins : InitializedPlugins
+            Plugins to merge counters into.
+
+        """
+        plugins.event.merge_counters(
+            produced=self.produced - previous.produced,
+            produce_failed=self.produce_failed - previous.produce_failed,
+            dropped=self.dropped - previous.dropped,
+        )
+
+        for output_plugin in plugins.output:
+            output_plugin.merge_counters(
+                written=(
+                    self.written.get(output_plugin.id, 0)
+                    - previous.written.get(output_plugin.id, 0)
+                ),
+                write_failed=(
+                    self.write_failed.get(output_plugin.id, 0)
+                    - previous.write_failed.get(output_plugin.id, 0)
+                ),
+                format_failed=(
+                    self.format_failed.get(output_plugin.id, 0)
+                    - previous.format_failed.get(output_plugin.id, 0)
+                ),
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class ShardLog:
+    """Log entry emitted in shard process."""
+
+    method_name: str
+    event_dict: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ShardStats:
+    """Counters and profiler reported by shard process."""
+
+    index: int
+    counters: ShardCounters
+    profiler: PipelineProfiler = field(default_factory=PipelineProfiler)
+
+
+@dataclass(frozen=True, slots=True)
+class ShardDone:
+    """Completion of shard process.
+
+    Attributes
+    ----------
+    index : int
+        Index of the shard.
+
+    error : str | None
+        Error message if shard ended up with error.
+
+    context : dict[str, str]
+        Context of the error.
+
+    """
+
+    index: int
+    error: str | None = None
+    context: dict[str, str] = field(default_factory=dict)
+
+
+type ShardMessage = ShardLog | ShardStats | ShardDone
+
+
+class ShardTimestampsSource:
+    """Source of timestamp batches dispatched to shard by the parent
+    process. Iteration ends when `None` is received from the queue or
+    stop is requested.
+
+    Parameters
+    ----------
+    timestamps : ProcessQueue[IdentifiedTimestamps | None]
+        Queue of timestamp batches dispatched to the shard.
+
+    stop_event : ProcessEvent
+        Event for signaling stop request from the parent process.
+
+    """
+
+    def __init__(
+        self,
+        timestamps: ProcessQueue[IdentifiedTimestamps | None],
+        stop_event: ProcessEvent,
+    ) -> None:
+        """Initialize source.
+
+        Parameters
+        ----------
+        timestamps : ProcessQueue[IdentifiedTimestamps | None]
+            Queue of timestamp batches dispatched to the shard.
+
+        stop_event : ProcessEvent
+            Event for signaling stop request from the parent process.
+
+        """
+        self._timestamps = timestamps
+        self._stop_event = stop_event
+
+    def iterate(
+        self,
+        *,
+        skip_past: bool = True,  # noqa: ARG002
+    ) -> Iterator[IdentifiedTimestamps]:
+        """Iterate over dispatched timestamp batches. Past timestamps
+        are skipped by input plugins in the parent process, so
+        `skip_past` parameter is ignored.
+
+        Parameters
+        ----------
+        skip_past : bool, default=True
+            Ignored.
+
+        Yields
+        ------
+        IdentifiedTimestamps
+            Array of timestamps with plugin ids.
+
+        """
+        while not self._stop_event.is_set():
+            try:
+                timestamps = self._timestamps.get(
+                    timeout=STATS_REPORT_INTERVAL,
+                )
+            except queue_mod.Empty:
+                continue
+
+            if timestamps is None:
+                return
+
+            yield timestamps
+
+
+def _run_shard(  # noqa: C901, PLR0913
+    params: GeneratorParameters,
+    index: int,
+    *,
+    input_tags: dict[int, tuple[str, ...]],
+    timestamps: ProcessQueue[IdentifiedTimestamps | None],
+    messages: ProcessQueue[ShardMessage],
+    stop_event: ProcessEvent,
+) -> None:
+    """Run event and output stages of generator pipeline in the shard
+    process.
+
+    Parameters
+    ----------
+    params : GeneratorParameters
+        Generator parameters.
+
+    index : int
+        Index of the shard.
+
+    input_tags : dict[int, tuple[str, ...]]
+        Map of input plugin ID to tags.
+
+    timestamps : ProcessQueue[IdentifiedTimestamps | None]
+        Queue of timestamp batches dispatched to the shard.
+
+    messages : ProcessQueue[ShardMessage]
+        Queue for messages to the parent process.
+
+    stop_event : ProcessEvent
+        Event for signaling stop request from the parent process.
+
+    """
+    # termination is requested by the parent process via stop event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    logconf.use_forwarding(
+        lambda method_name, event_dict: messages.put(
+            ShardLog(method_name=method_name, event_dict=event_dict),
+        ),
+    )
+    structlog.contextvars.bind_contextvars(
+        generator_id=params.id,
+        shard=index,
+    )
+
+    def done(error: ContextualError | None = None) -> None:
+        if error is None:
+            messages.put(ShardDone(index=index))
+        else:
+            messages.put(
+                ShardDone(
+                    index=index,
+                    error=str(error),
+                    context={k: str(v) for k, v in error.context.items()},
+                ),
+            )
+
+    try:
+        config = load(params.path, params.params)
+        plugins = init_plugins(
+            input=[],
+            event=config.event,
+            output=config.output,
+            params=params,
+            replicated_event=params.event_workers > 1,
+            shard=index,
+        )
+        executor = Executor(
+            input=plugins.input,
+            event=plugins.event,
+            output=plugins.output,
+            params=params,
+            event_factory=(
+                create_event_plugin_factory(
+                    event=config.event,
+                    params=params,
+                    shard=index,
+                )
+                if params.event_workers > 1
+                else None
+            ),
+            source=ShardTimestampsSource(
+                timestamps=timestamps,
+                stop_event=stop_event,
+            ),
+            input_tags=input_tags,
+        )
+    except ContextualError as e:
+        done(e)
+        return
+    except Exception as e:  # noqa: BLE001
+        done(
+            ContextualError(
+                'Unexpected error occurred during initializing shard',
+                context={'reason': str(e)},
+            ),
+        )
+        return
+
+    finished = Event()
+
+    def watch_stop() -> None:
+        while not finished.is_set():
+            if stop_event.wait(timeout=STATS_REPORT_INTERVAL):
+                executor.request_stop()
+                return
+
+    def report_stats() -> None:
+        while not finished.wait(timeout=STATS_REPORT_INTERVAL):
+            messages.put(
+                ShardStats(
+                    index=index,
+                    counters=ShardCounters.collect(plugins),
+                    profiler=executor.profiler,
+                ),
+            )
+
+    threads = [
+        Thread(target=watch_stop, name=f'shard-stop:{params.id}'),
+        Thread(target=report_stats, name=f'shard-stats:{params.id}'),
+    ]
+    for thread in threads:
+        thread.start()
+
+    error: ContextualError | None = None
+    try:
+        executor.execute()
+    except ExecutionError as e:
+        error = e
+    except Exception as e:  # noqa: BLE001
+        error = ContextualError(
+            'Unexpected error occurred during execution',
+            context={'reason': str(e)},
+        )
+    finally:
+        finished.set()
+        for thread in threads:
+            thread.join()
+
+    messages.put(
+        ShardStats(
+            index=index,
+            counters=ShardCounters.collect(plugins),
+            profiler=executor.profiler,
+        ),
+    )
+    done(error)
+
+
+class ShardedExecutor:
+    """Executor that splits generator into multiple processes (shards).
+
+    Input plugins are executed once in the parent process, produced
+    timestamp batches are dispatched to shards in round-robin order
+    (a batch is passed to the next shard having room in its queue).
+    Each shard loads the generator configuration, initializes its own
+    event and output plugins and runs them over dispatched batches.
+    Counters reported by shards are merged into the plugins of the
+    parent process, so they can be used for statistics as in the
+    single process mode.
+
+    Parameters
+    ----------
+    plugins : InitializedPlugins
+        Plugins initialized in the parent process, input plugins are
+        executed while event and output plugins only accumulate
+        counters of shards.
+
+    params : GeneratorParameters
+        Generator parameters.
+
+    Raises
+    ------
+    ImproperlyConfiguredError
+        If plugins cannot be sharded or the input pipeline cannot be
+        configured.
+
+    """
+
+    def __init__(
+        self,
+        plugins: InitializedPlugins,
+        params: GeneratorParameters,
+    ) -> None:
+        """Initialize sharded executor."""
+        if plugins.event.is_sequential:
+            msg = 'Sequential event plugin cannot be used in shards'
+            raise ImproperlyConfiguredError(
+                msg,
+                context={
+                    'plugin_name': plugins.event.name,
+                    'shards': params.shards,
+                },
+            )
+
+        self._plugins = plugins
+        self._params = params
+
+        self._input_profiler = PipelineProfiler()
+        self._profilers: dict[int, PipelineProfiler] = {}
+
+        self._input_stop_event = Event()
+        self._timestamps_queue: PipelineQueue[IdentifiedTimestamps] = (
+            create_queue(
+                implementation=params.queue.implementation,
+                maxsize=params.queue.max_timestamp_batches,
+                max_weight=params.queue.max_timestamps,
+                weigher=len,
+            )
+        )
+        self._input_stage = InputStage(
+            plugins=plugins.input,
+            params=params,
+            profiler=self._input_profiler,
+        )
+        self._input_stage.configure(stop_event=self._input_stop_event)
+
+        self._context = multiprocessing.get_context('forkserver')
+        self._stop_event = self._context.Event()
+        self._messages: ProcessQueue[ShardMessage] = self._context.Queue()
+        self._shard_queues: list[ProcessQueue[IdentifiedTimestamps | None]] = [
+            self._context.Queue(maxsize=params.queue.max_timestamp_batches)
+            for _ in range(params.shards)
+        ]
+        for shard_queue in self._shard_queues:
+            # batches left in queues of stopped shards are discarded
+            shard_queue.cancel_join_thread()
+
+    def execute(self) -> None:
+        """Start shard processes and block until all of them complete.
+
+        Raises
+        ------
+        ExecutionError
+            If any of the shards ends up with error.
+
+        """
+        count = self._params.shards
+        processes: list[ForkServerProcess] = [
+            self._context.Process(
+                target=_run_shard,
+                args=(self._params, index),
+                kwargs={
+                    'input_tags': self._input_stage.input_tags,
+                    'timestamps': self._shard_queues[index],
+                    'messages': self._messages,
+                    'stop_event': self._stop_event,
+                },
+                name=f'shard-{index}:{self._params.id}',
+            )
+            for index in range(count)
+        ]
+
+        logger.debug('Starting shard processes', shards=count)
+        for process in processes:
+            process.start()
+
+        threads = [
+            Thread(
+                target=self._input_stage.execute,
+                kwargs={
+                    'output': self._timestamps_queue,
+                    'skip_past': (
+                        self._params.live_mode and self._params.skip_past
+                    ),
+                },
+                name=f'input:{self._params.id}',
+            ),
+            Thread(
+                target=self._dispatch_timestamps,
+                args=(processes,),
+                name=f'shard-dispatch:{self._params.id}',
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+
+        errors = self._consume_messages(processes)
+
+        # unblock input stage if shards are done before consuming all
+        # timestamps (e.g. all of them failed)
+        self._timestamps_queue.shutdown()
+        for thread in threads:
+            thread.join()
+
+        for process in processes:
+            process.join()
+
+        if errors:
+            msg = 'Some of generator shards failed'
+            raise ExecutionError(msg, context={'errors': errors})
+
+    def _put_to_shard(
+        self,
+        item: IdentifiedTimestamps | None,
+        index: int,
+        process: ForkServerProcess,
+    ) -> bool:
+        """Put item to the queue of the shard, blocking until there is
+        room in the queue.
+
+        Returns
+        -------
+        bool
+            Whether the item is put, `False` is returned if the shard
+            process is not alive or stop is requested.
+
+        """
+        while process.is_alive() and not self._stop_event.is_set():
+            try:
+                self._shard_queues[index].put(
+                    item,
+                    timeout=STATS_REPORT_INTERVAL,
+                )
+            except queue_mod.Full:
+                continue
+            else:
+                return True
+
+        return False
+
+    def _dispatch_timestamps(
+        self,
+        processes: list[ForkServerProcess],
+    ) -> None:
+        """Dispatch timestamp batches produced by input stage to shards
+        until input stage is exhausted, then signal shards that input
+        is over.
+
+        Parameters
+        ----------
+        processes : list[ForkServerProcess]
+            Shard processes.
+
+        """
+        order = cycle(range(len(processes)))
+
+        try:
+            while True:
+                timestamps = self._timestamps_queue.get()
+                if timestamps is None:
+                    break
+
+                if not self._dispatch(timestamps, order, processes):
+                    logger.debug('No shards left to dispatch timestamps to')
+                    self._timestamps_queue.shutdown()
+                    break
+        except queue_mod.ShutDown:
+            logger.debug('Timestamps dispatching interrupted')
+
+        for index, process in enumerate(processes):
+            self._put_to_shard(None, index, process)
+
+    def _dispatch(
+        self,
+        timestamps: IdentifiedTimestamps,
+        order: Iterator[int],
+        processes: list[ForkServerProcess],
+    ) -> bool:
+        """Put timestamp batch to the next shard in round-robin order
+        having room in its queue, or wait for room in queue of the next
+        shard if all queues are full.
+
+        Returns
+        -------
+        bool
+            Whether the batch is dispatched, `False` is returned if
+            no shard processes are alive or stop is requested.
+
+        """
+        for _ in range(len(processes)):
+            index = next(order)
+            if not processes[index].is_alive():
+                continue
+
+            try:
+                self._shard_queues[index].put_nowait(timestamps)
+            except queue_mod.Full:
+                continue
+            else:
+                return True
+
+        for _ in range(len(processes)):
+            index = next(order)
+            if self._put_to_shard(timestamps, index, processes[index]):
+                return True
+
+            if self._stop_event.is_set():
+                return False
+
+        return False
+
+    def _consume_messages(
+        self,
+        processes: list[ForkServerProcess],
+    ) -> list[dict[str, Any]]:
+        """Handle messages of shards until all of them are done.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Errors of failed shards.
+
+        """
+        counters = {i: ShardCounters() for i in range(len(processes))}
+        pending = set(counters)
+        errors: list[dict[str, Any]] = []
+
+        while pending:
+            try:
+                message = self._messages.get(timeout=STATS_REPORT_INTERVAL)
+            except queue_mod.Empty:
+                crashed = {i for i in pending if not processes[i].is_alive()}
+                if crashed and self._messages.empty():
+                    errors.extend(
+                        {
+                            'shard': i,
+                            'reason': 'Process terminated unexpectedly',
+                            'exit_code': processes[i].exitcode,
+                        }
+                        for i in crashed
+                    )
+                    pending -= crashed
+                continue
+
+            match message:
+                case ShardLog(method_name=method_name, event_dict=event_dict):
+                    logconf.emit_forwarded(logger, method_name, event_dict)
+                case ShardStats(
+                    index=index,
+                    counters=new_counters,
+                    profiler=profiler,
+                ):
+                    new_counters.merge_difference(
+                        previous=counters[index],
+                        plugins=self._plugins,
+                    )
+                    counters[index] = new_counters
+                    self._profilers[index] = profiler
+                case ShardDone(index=index, error=None):
+                    pending.discard(index)
+                case ShardDone(index=index, error=error, context=context):
+                    errors.append({'shard': index, 'reason': error, **context})
+                    pending.discard(index)
+
+        return errors
+
+    def request_stop(self) -> None:
+        """Request graceful stop of input stage and all shards.
+        Idempotent.
+        """
+        self._input_stop_event.set()
+        self._input_stage.stop_interactive_plugins()
+        self._stop_event.set()
+
+    @property
+    def profiler(self) -> PipelineProfiler:
+        """Profiler with latency histograms of input stage in the parent
+        process merged with histograms from the latest reports of all
+        shards.
+        """
+        merged = PipelineProfiler()
+        merged.merge(self._input_profiler)
+        for profiler in list(self._profilers.values()):
+            merged.merge(profiler)
+
+        return merged
@@ -3,5 +3,6 @@
 from eventum.core.stages.event_stage import EventStage
 from eventum.core.stages.input_stage import InputStage
 from eventum.core.stages.output_stage import OutputStage
+from eventum.core.stages.parallel_event_stage import ParallelEventStage
 
-__all__ = ['EventStage', 'InputStage', 'OutputStage']
+__all__ = ['EventStage', 'InputStage', 'OutputStage', 'ParallelEventStage']
@@ -1,17 +1,17 @@
 """Event stage of the pipeline — consumes timestamps, produces events."""
 
 import queue as queue_mod
-from datetime import datetime
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import structlog
 
-from eventum.plugins.event.base.plugin import EventPlugin, ProduceParams
-from eventum.plugins.event.exceptions import (
-    PluginEventsExhaustedError,
-    PluginProduceError,
+from eventum.plugins.event.base.plugin import (
+    BatchProduceParams,
+    EventPlugin,
 )
+from eventum.plugins.output.batch import EventBatch
+from eventum.utils.profiler import PipelineProfiler
 from eventum.utils.throttler import Throttler
 
 if TYPE_CHECKING:
@@ -39,6 +39,10 @@ class EventStage:
     params : GeneratorParameters
         Generator parameters.
 
+    profiler : PipelineProfiler | None, default=None
+        Profiler to record time spent waiting on queues and producing
+        event batches.
+
     """
 
     def __init__(
@@ -46,6 +50,7 @@ class EventStage:
         plugin: EventPlugin,
         input_tags: dict[int, tuple[str, ...]],
         params: GeneratorParameters,
+        profiler: PipelineProfiler | None = None,
     ) -> None:
         """Initialize event stage.
 
@@ -60,64 +65,50 @@ class EventStage:
         params : GeneratorParameters
             Generator parameters.
 
+        profiler : PipelineProfiler | None, default=None
+            Profiler to record time spent waiting on queues and
+            producing event batches.
+
         """
         self._plugin = plugin
         self._input_tags = input_tags
         self._params = params
         self._timezone = ZoneInfo(self._params.timezone)
 
-    def _produce_batch(
+        profiler = profiler or PipelineProfiler()
+        self._get_latency = profiler.histogram('event.get_wait')
+        self._render_latency = profiler.histogram('event.render')
+        self._put_latency = profiler.histogram('event.put_wait')
+
+    def produce_batch(
         self,
         timestamps: IdentifiedTimestamps,
-        input: PipelineQueue[IdentifiedTimestamps],
     ) -> tuple[list[str], bool]:
         """Produce events for a single timestamp batch.
 
+        Parameters
+        ----------
+        timestamps : IdentifiedTimestamps
+            Timestamp batch.
+
         Returns
         -------
         tuple[list[str], bool]
             Produced events and whether the plugin is exhausted.
 
         """
-        dt_timestamps = timestamps['timestamp'].astype(dtype=datetime)
-        params: ProduceParams = ProduceParams(
-            tags=...,  # type: ignore[typeddict-item]
-            timestamp=...,  # type: ignore[typeddict-item]
+        input_tags = self._input_tags
+        params = BatchProduceParams(
+            timestamps=timestamps['timestamp'],
+            timezone=self._timezone,
+            tags=[input_tags[id] for id in timestamps['id'].tolist()],
         )
-        events: list[str] = []
-
-        for id, timestamp in zip(
-            timestamps['id'],
-            dt_timestamps,
-            strict=False,
-        ):
-            params['tags'] = self._input_tags[id]
-            params['timestamp'] = timestamp.replace(
-                tzinfo=self._timezone,
-            )
-
-            try:
-                events.extend(self._plugin.produce(params))
-            except PluginProduceError as e:
-                logger.error(str(e), **e.context)
-            except PluginEventsExhaustedError:
-                logger.debug(
-                    'Events exhausted, closing upstream queue',
-                )
-                input.shutdown()
-                return events, True
-            except Exception as e:
-                logger.exception(
-                    'Unexpected error during event plugin execution',
-                    reason=str(e),
-                )
-
-        return events, False
+        return self._plugin.produce_batch(params)
 
     def execute(
         self,
         input: PipelineQueue[IdentifiedTimestamps],
-        output: PipelineQueue[list[str]],
+        output: PipelineQueue[EventBatch],
     ) -> None:
         """Consume timestamps and produce event batches.
 
@@ -126,7 +117,7 @@ class EventStage:
         input : PipelineQueue[IdentifiedTimestamps]
             Queue of timestamp batches to consume.
 
-        output : PipelineQueue[list[str]]
+        output : PipelineQueue[EventBatch]
             Queue for produced event batches.
 
         Notes
@@ -142,12 +133,18 @@ class EventStage:
 
         try:
             while not exhausted:
-                timestamps = input.get()
+                with self._get_latency.measure():
+                    timestamps = input.get()
 
                 if timestamps is None:
                     break
 
-                events, exhausted = self._produce_batch(timestamps, input)
+                with self._render_latency.measure():
+                    events, exhausted = self.produce_batch(timestamps)
+
+                if exhausted:
+                    logger.debug('Events exhausted, closing upstream queue')
+                    input.shutdown()
 
                 if events:
                     if output.is_full and self._params.live_mode:
@@ -160,7 +157,10 @@ class EventStage:
                             ),
                         )
 
-                    output.put(events)
+                    batch = EventBatch.from_events(events)
+
+                    with self._put_latency.measure():
+                        output.put(batch)
         except queue_mod.ShutDown:
             logger.debug('Event stage interrupted by queue shutdown')
         except Exception as e:
@@ -7,15 +7,17 @@ from zoneinfo import ZoneInfo
 
 import structlog
 
+from eventum.core.batch_controller import BatchSizeController
 from eventum.plugins.input.adapters import IdentifiedTimestampsPluginAdapter
 from eventum.plugins.input.batcher import TimestampsBatcher
 from eventum.plugins.input.exceptions import PluginGenerationError
 from eventum.plugins.input.merger import InputPluginsMerger
 from eventum.plugins.input.scheduler import BatchScheduler
+from eventum.utils.profiler import PipelineProfiler
 from eventum.utils.throttler import Throttler
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from eventum.core.parameters import GeneratorParameters
     from eventum.core.queue import PipelineQueue
@@ -44,12 +46,35 @@ class InputStage:
     params : GeneratorParameters
         Generator parameters.
 
+    profiler : PipelineProfiler | None, default=None
+        Profiler to record time spent waiting on the timestamps queue,
+        also used by adaptive batch sizing to observe pipeline
+        latencies.
+
+    source : SupportsIdentifiedTimestampsIterate | None, default=None
+        Source of timestamp batches produced elsewhere (e.g. batches
+        dispatched to generator shard by the parent process), if
+        provided it is used instead of input plugins.
+
+    input_tags : dict[int, tuple[str, ...]] | None, default=None
+        Map of input plugin ID to tags, required if `source` is
+        provided as tags cannot be taken from input plugins.
+
+    Raises
+    ------
+    ValueError
+        If `source` is provided without `input_tags`.
+
     """
 
     def __init__(
         self,
         plugins: Sequence[InputPlugin],
         params: GeneratorParameters,
+        profiler: PipelineProfiler | None = None,
+        *,
+        source: SupportsIdentifiedTimestampsIterate | None = None,
+        input_tags: dict[int, tuple[str, ...]] | None = None,
     ) -> None:
         """Initialize input stage.
 
@@ -61,12 +86,39 @@ class InputStage:
         params : GeneratorParameters
             Generator parameters.
 
+        profiler : PipelineProfiler | None, default=None
+            Profiler to record time spent waiting on the timestamps
+            queue.
+
+        source : SupportsIdentifiedTimestampsIterate | None, default=None
+            Source of timestamp batches produced elsewhere.
+
+        input_tags : dict[int, tuple[str, ...]] | None, default=None
+            Map of input plugin ID to tags.
+
+        Raises
+        ------
+        ValueError
+            If `source` is provided without `input_tags`.
+
         """
+        if source is not None and input_tags is None:
+            msg = 'Input tags must be provided for external source'
+            raise ValueError(msg)
+
         self._plugins = list(plugins)
         self._params = params
+        self._source = source
+
+        self._profiler = profiler or PipelineProfiler()
+        self._put_latency = self._profiler.histogram('input.put_wait')
         self._timezone = ZoneInfo(self._params.timezone)
 
-        self._input_tags = self._build_input_tags_map()
+        self._input_tags = (
+            input_tags
+            if input_tags is not None
+            else self._build_input_tags_map()
+        )
 
         self._configured_non_interactive: (
             SupportsIdentifiedTimestampsIterate | None
@@ -75,6 +127,11 @@ class InputStage:
             SupportsIdentifiedTimestampsIterate | None
         )
 
+        self._controllers: dict[
+            SupportsIdentifiedTimestampsIterate,
+            BatchSizeController,
+        ] = {}
+
         self._stop_event: Event | None = None
 
     def _build_input_tags_map(self) -> dict[int, tuple[str, ...]]:
@@ -109,6 +166,12 @@ class InputStage:
 
         self._stop_event = stop_event
 
+        if self._source is not None:
+            logger.debug('Using external source of timestamps')
+            self._configured_non_interactive = self._source
+            self._configured_interactive = None
+            return
+
         class _PluginItem(TypedDict):
             plugins: list[InputPlugin]
             lax_batcher_mode: bool
@@ -170,17 +233,24 @@ class InputStage:
                     context={'reason': str(e)},
                 ) from None
 
+            configured: SupportsIdentifiedTimestampsIterate = batcher
             if self._params.live_mode:
                 logger.debug('Wrapping to batch scheduler')
-                result.append(
-                    BatchScheduler(
-                        source=batcher,
-                        timezone=self._timezone,
-                        stop_event=stop_event,
-                    ),
+                configured = BatchScheduler(
+                    source=batcher,
+                    timezone=self._timezone,
+                    stop_event=stop_event,
                 )
-            else:
-                result.append(batcher)
+
+            if self._params.batch.adaptive is not None:
+                logger.debug('Enabling adaptive batch sizing')
+                self._controllers[configured] = BatchSizeController(
+                    batcher=batcher,
+                    params=self._params.batch.adaptive,
+                    profiler=self._profiler,
+                )
+
+            result.append(configured)
 
         self._configured_non_interactive = result[0]
         self._configured_interactive = result[1]
@@ -275,7 +345,13 @@ class InputStage:
             Throttler for queue-full warnings.
 
         """
-        for timestamps in source.iterate(skip_past=skip_past):
+        batches: Iterator[IdentifiedTimestamps] = source.iterate(
+            skip_past=skip_past,
+        )
+
+        controller = self._controllers.get(source)
+
+        for timestamps in batches:
             if self._stop_event is not None and self._stop_event.is_set():
                 break
 
@@ -290,7 +366,11 @@ class InputStage:
                     ),
                 )
 
-            output.put(timestamps)
+            with self._put_latency.measure():
+                output.put(timestamps)
+
+            if controller is not None:
+                controller.observe(timestamps.size, output)
 
     def _iterate_merged_sources(
         self,
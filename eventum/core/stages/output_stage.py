@@ -1,25 +1,184 @@
 """Output stage of the pipeline — consumes events, writes to outputs."""
 
 import asyncio
+from collections import Counter
 from typing import TYPE_CHECKING, cast
 
 import structlog
 
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
+from eventum.utils.profiler import PipelineProfiler
+from eventum.utils.throttler import Throttler
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Sequence
 
     from eventum.core.parameters import GeneratorParameters
     from eventum.core.queue import PipelineQueue
-    from eventum.plugins.output.base.plugin import OutputPlugin
+    from eventum.plugins.output.base.plugin import (
+        OutputPlugin,
+        TimedFormattingResult,
+    )
+    from eventum.plugins.output.batch import EventBatch
 
 logger = structlog.stdlib.get_logger()
 
+type WriteItem = tuple[EventBatch, asyncio.Task[TimedFormattingResult] | None]
+
+
+class _PluginWriter:
+    """Writer of single output plugin consuming its own queue of event
+    batches with bounded number of in-flight write operations, so each
+    plugin drains at its own pace.
+
+    Parameters
+    ----------
+    plugin : OutputPlugin
+        Output plugin to write with.
+
+    params : GeneratorParameters
+        Generator parameters.
+
+    """
+
+    def __init__(
+        self,
+        plugin: OutputPlugin,
+        params: GeneratorParameters,
+    ) -> None:
+        """Initialize writer.
+
+        Parameters
+        ----------
+        plugin : OutputPlugin
+            Output plugin to write with.
+
+        params : GeneratorParameters
+            Generator parameters.
+
+        """
+        self._plugin = plugin
+        self._params = params
+        self._queue: asyncio.Queue[WriteItem | None] = asyncio.Queue(
+            maxsize=params.queue.max_output_batches,
+        )
+        self._semaphore = asyncio.Semaphore(value=params.max_concurrency)
+        self._tasks: set[asyncio.Task[int]] = set()
+
+    async def put(self, item: WriteItem | None) -> None:
+        """Put item to the queue of writer, waiting for free slot if
+        queue is full.
+
+        Parameters
+        ----------
+        item : WriteItem | None
+            Batch of events with shared formatting of batch, or `None`
+            to signal that there will be no more batches.
+
+        """
+        await self._queue.put(item)
+
+    def put_nowait(self, item: WriteItem) -> bool:
+        """Put item to the queue of writer if it is not full.
+
+        Parameters
+        ----------
+        item : WriteItem
+            Batch of events with shared formatting of batch.
+
+        Returns
+        -------
+        bool
+            Whether item is put.
+
+        """
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            return False
+
+        return True
+
+    async def run(self) -> None:
+        """Write batches from the queue until `None` is received and
+        wait for in-flight write operations.
+        """
+        loop = asyncio.get_running_loop()
+
+        while (item := await self._queue.get()) is not None:
+            events, formatting = item
+            await self._semaphore.acquire()
+
+            task = loop.create_task(
+                asyncio.wait_for(
+                    self._plugin.write(events, formatting),
+                    self._params.write_timeout,
+                ),
+                name=f'Writing with {self._plugin}',
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._handle_write_result)
+
+            if self._params.keep_order:
+                await asyncio.gather(task, return_exceptions=True)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _handle_write_result(self, task: asyncio.Task[int]) -> None:
+        """Handle result of an output plugin write task.
+
+        Parameters
+        ----------
+        task : asyncio.Task[int]
+            Done future.
+
+        """
+        try:
+            task.result()
+        except PluginWriteError as e:
+            logger.error(str(e), **e.context)
+        except TimeoutError:
+            logger.warning(
+                (
+                    'Write operation timed out, EPS is to high '
+                    'for output target, consider decreasing EPS '
+                    'or changing batching settings to avoid '
+                    'loosing events'
+                ),
+                task_name=task.get_name(),
+                timeout=self._params.write_timeout,
+            )
+        except Exception as e:
+            logger.exception(
+                'Unexpected error occurred during output plugin write',
+                reason=str(e),
+            )
+        except asyncio.CancelledError:
+            logger.warning('Write operation discarded')
+        finally:
+            self._semaphore.release()
+            self._tasks.discard(task)
+
+    @property
+    def plugin(self) -> OutputPlugin:
+        """Output plugin."""
+        return self._plugin
+
 
 class OutputStage:
     """Consumes event batches and writes to output plugins.
 
+    Each plugin has its own queue of batches and window of concurrent
+    write operations, so a slow plugin does not take write slots of
+    the others. Consuming of events queue waits only for free slots in
+    queues of required plugins, batches for best-effort plugins with
+    full queue are dropped.
+
+    Plugins with identical formatter configuration share formatting of
+    each batch, so the batch is formatted only once per distinct
+    configuration.
+
     Parameters
     ----------
     plugins : Sequence[OutputPlugin]
@@ -28,12 +187,18 @@ class OutputStage:
     params : GeneratorParameters
         Generator parameters.
 
+    profiler : PipelineProfiler | None, default=None
+        Profiler to record time spent waiting on the events queue, the
+        formatting and writing histograms of plugins are registered in
+        it as `output.<plugin id>.format` and `output.<plugin id>.write`.
+
     """
 
     def __init__(
         self,
         plugins: Sequence[OutputPlugin],
         params: GeneratorParameters,
+        profiler: PipelineProfiler | None = None,
     ) -> None:
         """Initialize output stage.
 
@@ -45,13 +210,39 @@ class OutputStage:
         params : GeneratorParameters
             Generator parameters.
 
+        profiler : PipelineProfiler | None, default=None
+            Profiler to record time spent waiting on the events queue.
+
         """
         self._plugins = list(plugins)
         self._params = params
-        self._tasks: set[asyncio.Task] = set()
-        self._semaphore = asyncio.Semaphore(
-            value=self._params.max_concurrency,
+        self._writers = [
+            _PluginWriter(plugin=plugin, params=params)
+            for plugin in self._plugins
+        ]
+        self._drop_throttler = Throttler(limit=1, period=10)
+
+        formatter_keys = Counter(
+            plugin.formatter_key
+            for plugin in self._plugins
+            if plugin.formatter_key is not None
         )
+        self._shared_formatter_keys: set[Hashable] = {
+            key for key, count in formatter_keys.items() if count > 1
+        }
+
+        profiler = profiler or PipelineProfiler()
+        self._get_latency = profiler.histogram('output.get_wait')
+
+        for plugin in self._plugins:
+            profiler.register(
+                f'output.{plugin.id}.format',
+                plugin.format_latency,
+            )
+            profiler.register(
+                f'output.{plugin.id}.write',
+                plugin.write_latency,
+            )
 
     async def open(self) -> None:
         """Open all output plugins for writing.
@@ -92,88 +283,107 @@ class OutputStage:
 
     async def execute(
         self,
-        input: PipelineQueue[list[str]],
+        input: PipelineQueue[EventBatch],
     ) -> None:
         """Consume event batches and write to output plugins.
 
         Parameters
         ----------
-        input : PipelineQueue[list[str]]
-            Queue of event batches to consume.
+        input : PipelineQueue[EventBatch]
+            Queue of event batches to consume. Batches are awaited in
+            the event loop directly and all batches available in the
+            queue are taken at once.
 
         """
+        await logger.adebug('Starting to consume events queue')
+
         loop = asyncio.get_running_loop()
+        writing = [
+            loop.create_task(writer.run(), name=f'Writer of {writer.plugin}')
+            for writer in self._writers
+        ]
 
-        gathering_tasks: list[asyncio.Task] = []
-        await logger.adebug('Starting to consume events queue')
+        try:
+            while True:
+                with self._get_latency.measure():
+                    batches = await input.aget_many(
+                        self._params.queue.max_event_batches,
+                    )
 
-        while True:
-            events = await asyncio.to_thread(input.get)
+                if batches is None:
+                    break
 
-            if events is None:
-                break
+                for events in batches:
+                    await self._dispatch(events)
 
-            for plugin in self._plugins:
-                await self._semaphore.acquire()
+            for writer in self._writers:
+                await writer.put(None)
 
-                task = loop.create_task(
-                    asyncio.wait_for(
-                        plugin.write(events),
-                        self._params.write_timeout,
-                    ),
-                    name=f'Writing with {plugin}',
-                )
-                self._tasks.add(task)
-                gathering_tasks.append(task)
+            await asyncio.gather(*writing)
+        finally:
+            for task in writing:
+                task.cancel()
 
-                task.add_done_callback(self._handle_write_result)
+    async def _dispatch(self, events: EventBatch) -> None:
+        """Put event batch to queues of all output plugins, waiting for
+        free slots in queues of required plugins.
 
-            if self._params.keep_order:
-                await asyncio.gather(
-                    *gathering_tasks,
-                    return_exceptions=True,
-                )
+        Parameters
+        ----------
+        events : EventBatch
+            Batch of events to write.
 
-            gathering_tasks.clear()
+        """
+        loop = asyncio.get_running_loop()
+        formatting: dict[
+            Hashable,
+            asyncio.Task[TimedFormattingResult],
+        ] = {}
+
+        for writer in self._writers:
+            plugin = writer.plugin
+
+            key = plugin.formatter_key
+            if key in self._shared_formatter_keys and key not in formatting:
+                formatting[key] = loop.create_task(
+                    plugin.format(events),
+                    name=f'Formatting with {plugin}',
+                )
+                formatting[key].add_done_callback(
+                    self._handle_formatting_result,
+                )
 
-        if self._tasks:
-            await asyncio.gather(
-                *self._tasks,
-                return_exceptions=True,
-            )
-            self._tasks.clear()
+            item = (events, formatting.get(key))
+
+            if not plugin.is_best_effort:
+                await writer.put(item)
+            elif not writer.put_nowait(item):
+                plugin.drop(len(events))
+                self._drop_throttler(
+                    logger.warning,
+                    (
+                        'Queue of best-effort output plugin is full, '
+                        'events are dropped, consider decreasing EPS '
+                        'or increasing concurrency of the plugin'
+                    ),
+                    plugin=str(plugin),
+                )
 
-    def _handle_write_result(self, task: asyncio.Task[int]) -> None:
-        """Handle result of an output plugin write task.
+    @staticmethod
+    def _handle_formatting_result(
+        task: asyncio.Task[TimedFormattingResult],
+    ) -> None:
+        """Handle result of a shared formatting task. Errors are
+        handled by write tasks of plugins sharing the formatting, but
+        they can be done before the formatting (e.g. on timeout) or
+        the batch can be dropped for them, so exception is retrieved
+        here to not leave it unhandled.
 
         Parameters
         ----------
-        task : asyncio.Task[int]
+        task : asyncio.Task[TimedFormattingResult]
             Done future.
 
         """
-        try:
-            task.result()
-        except PluginWriteError as e:
-            logger.error(str(e), **e.context)
-        except TimeoutError:
-            logger.warning(
-                (
-                    'Write operation timed out, EPS is to high '
-                    'for output target, consider decreasing EPS '
-                    'or changing batching settings to avoid '
-                    'loosing events'
-                ),
-                task_name=task.get_name(),
-                timeout=self._params.write_timeout,
-            )
-        except Exception as e:
-            logger.exception(
-                'Unexpected error occurred during output plugin write',
-                reason=str(e),
-            )
-        except asyncio.CancelledError:
-            logger.warning('Write operation discarded')
-        finally:
-            self._semaphore.release()
-            self._tasks.remove(task)
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,574 @@
+"""Parallel event stage of the pipeline — fans timestamp batches out
+to a pool of event plugin replicas.
+"""
+
+import multiprocessing
+import queue as queue_mod
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures import Executor as PoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+import eventum.logging.config as logconf
+from eventum.core.stages.event_stage import EventStage
+from eventum.exceptions import ContextualError
+from eventum.plugins.output.batch import EventBatch
+from eventum.utils.profiler import PipelineProfiler
+from eventum.utils.throttler import Throttler
+
+if TYPE_CHECKING:
+    from multiprocessing.sharedctypes import Synchronized
+
+    from eventum.core.parameters import GeneratorParameters
+    from eventum.core.plugins_initializer import EventPluginCounters
+    from eventum.core.queue import PipelineQueue
+    from eventum.plugins.event.base.plugin import EventPlugin
+    from eventum.plugins.input.protocols import IdentifiedTimestamps
+
+logger = structlog.stdlib.get_logger()
+
+# Factory of event plugin replicas accepting index of the replica
+type EventPluginFactory = Callable[[int], EventPlugin]
+
+
+def use_threads() -> bool:
+    """Check whether event workers should run in threads.
+
+    Returns
+    -------
+    bool
+        `True` if interpreter is free-threaded (GIL is disabled),
+        `False` otherwise.
+
+    """
+    return not sys._is_gil_enabled()  # noqa: SLF001
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Result of producing events for single timestamp batch by event
+    plugin replica.
+
+    Attributes
+    ----------
+    events : EventBatch
+        Produced events.
+
+    exhausted : bool
+        Whether the plugin replica is exhausted.
+
+    produced : int
+        Number of produced events.
+
+    produce_failed : int
+        Number of unsuccessfully produced events.
+
+    dropped : int
+        Number of dropped events.
+
+    render_time : int
+        Duration of producing events (in nanoseconds).
+
+    logs : list[tuple[str, dict[str, Any]]]
+        Log entries (method name and event dict) captured in worker
+        process that must be emitted in the parent process.
+
+    """
+
+    events: EventBatch
+    exhausted: bool
+    produced: int
+    produce_failed: int
+    dropped: int
+    render_time: int = 0
+    logs: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+
+class EventWorker:
+    """Event plugin replica that produces events for timestamp batches.
+
+    Parameters
+    ----------
+    plugin : EventPlugin
+        Event plugin replica.
+
+    input_tags : dict[int, tuple[str, ...]]
+        Map of input plugin ID to tags.
+
+    params : GeneratorParameters
+        Generator parameters.
+
+    """
+
+    def __init__(
+        self,
+        plugin: EventPlugin,
+        input_tags: dict[int, tuple[str, ...]],
+        params: GeneratorParameters,
+    ) -> None:
+        """Initialize event worker.
+
+        Parameters
+        ----------
+        plugin : EventPlugin
+            Event plugin replica.
+
+        input_tags : dict[int, tuple[str, ...]]
+            Map of input plugin ID to tags.
+
+        params : GeneratorParameters
+            Generator parameters.
+
+        """
+        self._plugin = plugin
+        self._stage = EventStage(
+            plugin=plugin,
+            input_tags=input_tags,
+            params=params,
+        )
+
+    def produce(self, timestamps: IdentifiedTimestamps) -> BatchResult:
+        """Produce events for a single timestamp batch.
+
+        Parameters
+        ----------
+        timestamps : IdentifiedTimestamps
+            Timestamp batch.
+
+        Returns
+        -------
+        BatchResult
+            Produced events with counters of the batch.
+
+        """
+        produced = self._plugin.produced
+        produce_failed = self._plugin.produce_failed
+        dropped = self._plugin.dropped
+
+        start = time.perf_counter_ns()
+        events, exhausted = self._stage.produce_batch(timestamps)
+        render_time = time.perf_counter_ns() - start
+
+        return BatchResult(
+            events=EventBatch.from_events(events),
+            exhausted=exhausted,
+            produced=self._plugin.produced - produced,
+            produce_failed=self._plugin.produce_failed - produce_failed,
+            dropped=self._plugin.dropped - dropped,
+            render_time=render_time,
+        )
+
+
+# Worker of the current process (only set in pool worker processes)
+_process_worker: EventWorker | None = None
+
+# Log entries captured in the current pool worker process
+_process_logs: list[tuple[str, dict[str, Any]]] = []
+
+# Reason of failed worker initialization in the current pool worker
+# process, it is reported to the parent on warm up
+_process_init_error: str | None = None
+
+
+def _init_process_worker(
+    factory: EventPluginFactory,
+    replicas_counter: Synchronized[int],
+    input_tags: dict[int, tuple[str, ...]],
+    params: GeneratorParameters,
+) -> None:
+    """Initialize event worker in pool worker process.
+
+    Index of the replica is taken from counter shared by worker
+    processes. Errors are not raised as it would break the pool
+    without reason, instead they are saved to be reported on warm up.
+    """
+    global _process_worker, _process_init_error  # noqa: PLW0603
+
+    logconf.use_forwarding(
+        lambda method_name, event_dict: _process_logs.append(
+            (method_name, event_dict),
+        ),
+    )
+    structlog.contextvars.bind_contextvars(generator_id=params.id)
+
+    with replicas_counter.get_lock():
+        replica = replicas_counter.value
+        replicas_counter.value += 1
+
+    try:
+        plugin = factory(replica)
+    except ContextualError as e:
+        _process_init_error = f'{e} ({e.context})'
+        return
+    except Exception as e:  # noqa: BLE001
+        _process_init_error = f'{e.__class__.__name__}: {e}'
+        return
+
+    _process_worker = EventWorker(
+        plugin=plugin,
+        input_tags=input_tags,
+        params=params,
+    )
+
+
+def _warm_up_process_worker() -> str | None:
+    """Check that event worker of the current process is initialized.
+
+    Returns
+    -------
+    str | None
+        Reason of failed initialization or `None` if worker is
+        initialized.
+
+    """
+    return _process_init_error
+
+
+def _produce_in_process(timestamps: IdentifiedTimestamps) -> BatchResult:
+    """Produce events using event worker of the current process."""
+    if _process_worker is None:
+        msg = 'Event worker is not initialized in this process'
+        raise RuntimeError(msg)
+
+    result = _process_worker.produce(timestamps)
+    logs = _process_logs.copy()
+    _process_logs.clear()
+
+    return BatchResult(
+        events=result.events,
+        exhausted=result.exhausted,
+        produced=result.produced,
+        produce_failed=result.produce_failed,
+        dropped=result.dropped,
+        render_time=result.render_time,
+        logs=logs,
+    )
+
+
+class ParallelEventStage:
+    """Consumes timestamp batches and produces event batches using
+    multiple event plugin replicas concurrently.
+
+    Replicas run in a thread pool when interpreter is free-threaded
+    and in a process pool otherwise. Counters of replicas are merged
+    into the primary plugin, so it can be used for statistics as in
+    the single worker mode. The pool is started on initialization and
+    every worker is awaited to initialize its replica, so
+    configuration errors are raised before execution.
+
+    Parameters
+    ----------
+    plugin : EventPlugin | EventPluginCounters
+        Primary event plugin (or only its counters) that accumulates
+        counters of replicas.
+
+    factory : EventPluginFactory
+        Factory of event plugin replicas, it must be picklable to be
+        used in process pool. It is called with index of the replica
+        in range [0, `event_workers`).
+
+    input_tags : dict[int, tuple[str, ...]]
+        Map of input plugin ID to tags.
+
+    params : GeneratorParameters
+        Generator parameters.
+
+    profiler : PipelineProfiler | None, default=None
+        Profiler to record time spent waiting on queues and producing
+        event batches.
+
+    Raises
+    ------
+    Exception
+        If replica creation fails in thread mode (propagated from
+        factory).
+
+    RuntimeError
+        If replica creation fails in process mode.
+
+    """
+
+    def __init__(
+        self,
+        plugin: EventPlugin | EventPluginCounters,
+        factory: EventPluginFactory,
+        input_tags: dict[int, tuple[str, ...]],
+        params: GeneratorParameters,
+        profiler: PipelineProfiler | None = None,
+    ) -> None:
+        """Initialize parallel event stage.
+
+        Parameters
+        ----------
+        plugin : EventPlugin | EventPluginCounters
+            Primary event plugin (or only its counters) that
+            accumulates counters of replicas.
+
+        factory : EventPluginFactory
+            Factory of event plugin replicas.
+
+        input_tags : dict[int, tuple[str, ...]]
+            Map of input plugin ID to tags.
+
+        params : GeneratorParameters
+            Generator parameters.
+
+        profiler : PipelineProfiler | None, default=None
+            Profiler to record time spent waiting on queues and
+            producing event batches.
+
+        """
+        self._plugin = plugin
+        self._factory = factory
+        self._input_tags = input_tags
+        self._params = params
+        self._workers_count = params.event_workers
+        self._max_pending = params.event_workers * 2
+
+        profiler = profiler or PipelineProfiler()
+        self._get_latency = profiler.histogram('event.get_wait')
+        self._render_latency = profiler.histogram('event.render')
+        self._put_latency = profiler.histogram('event.put_wait')
+
+        self._use_threads = use_threads()
+        self._idle_workers: queue_mod.SimpleQueue[EventWorker] = (
+            queue_mod.SimpleQueue()
+        )
+
+        if self._use_threads:
+            for replica in range(self._workers_count):
+                self._idle_workers.put(
+                    EventWorker(
+                        plugin=factory(replica),
+                        input_tags=input_tags,
+                        params=params,
+                    ),
+                )
+
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> PoolExecutor:
+        """Create pool of event workers and wait until they are
+        initialized.
+
+        Raises
+        ------
+        RuntimeError
+            If any of workers fails to initialize in process mode.
+
+        """
+        if self._use_threads:
+            return ThreadPoolExecutor(
+                max_workers=self._workers_count,
+                thread_name_prefix=f'event:{self._params.id}',
+            )
+
+        context = multiprocessing.get_context('forkserver')
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers_count,
+            mp_context=context,
+            initializer=_init_process_worker,
+            initargs=(
+                self._factory,
+                context.Value('i', 0),
+                self._input_tags,
+                self._params,
+            ),
+        )
+
+        # processes are spawned on demand, so each warm up call that
+        # is submitted while others are not completed starts a worker
+        try:
+            warm_ups = [
+                pool.submit(_warm_up_process_worker)
+                for _ in range(self._workers_count)
+            ]
+            errors = [future.result() for future in warm_ups]
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+
+        for error in errors:
+            if error is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+                msg = f'Failed to initialize event worker: {error}'
+                raise RuntimeError(msg)
+
+        return pool
+
+    def _produce_in_thread(
+        self,
+        timestamps: IdentifiedTimestamps,
+    ) -> BatchResult:
+        """Produce events using one of idle thread workers."""
+        worker = self._idle_workers.get()
+        try:
+            return worker.produce(timestamps)
+        finally:
+            self._idle_workers.put(worker)
+
+    def _submit(
+        self,
+        pool: PoolExecutor,
+        timestamps: IdentifiedTimestamps,
+    ) -> Future[BatchResult]:
+        """Submit timestamp batch to the pool."""
+        if self._use_threads:
+            return pool.submit(self._produce_in_thread, timestamps)
+
+        return pool.submit(_produce_in_process, timestamps)
+
+    def _collect(
+        self,
+        pending: deque[Future[BatchResult]],
+    ) -> list[BatchResult]:
+        """Wait for completion of pending batches.
+
+        With `keep_order` parameter enabled only the oldest batch is
+        awaited so the results are reordered to submission order,
+        otherwise all batches that are completed first are returned.
+        """
+        if self._params.keep_order:
+            return [pending.popleft().result()]
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        results: list[BatchResult] = []
+
+        for future in list(pending):
+            if future in done:
+                pending.remove(future)
+                results.append(future.result())
+
+        return results
+
+    def _handle_result(
+        self,
+        result: BatchResult,
+        output: PipelineQueue[EventBatch],
+        throttler: Throttler,
+    ) -> None:
+        """Merge counters and logs of the batch and publish its events."""
+        self._plugin.merge_counters(
+            produced=result.produced,
+            produce_failed=result.produce_failed,
+            dropped=result.dropped,
+        )
+
+        self._render_latency.record(result.render_time)
+
+        for method_name, event_dict in result.logs:
+            logconf.emit_forwarded(logger, method_name, event_dict)
+
+        if not result.events:
+            return
+
+        if output.is_full and self._params.live_mode:
+            throttler(
+                logger.warning,
+                (
+                    'Events queue is full, consider decreasing '
+                    'EPS or changing batching settings to avoid '
+                    'time lag with actual event timestamps'
+                ),
+            )
+
+        with self._put_latency.measure():
+            output.put(result.events)
+
+    def _drain(
+        self,
+        pending: deque[Future[BatchResult]],
+        output: PipelineQueue[EventBatch],
+        throttler: Throttler,
+    ) -> bool:
+        """Collect completed batches and publish their events.
+
+        Returns
+        -------
+        bool
+            Whether any of plugin replicas is exhausted.
+
+        """
+        exhausted = False
+
+        for result in self._collect(pending):
+            self._handle_result(result, output, throttler)
+            exhausted = exhausted or result.exhausted
+
+        return exhausted
+
+    def execute(
+        self,
+        input: PipelineQueue[IdentifiedTimestamps],
+        output: PipelineQueue[EventBatch],
+    ) -> None:
+        """Consume timestamps and produce event batches.
+
+        Parameters
+        ----------
+        input : PipelineQueue[IdentifiedTimestamps]
+            Queue of timestamp batches to consume.
+
+        output : PipelineQueue[EventBatch]
+            Queue for produced event batches.
+
+        Notes
+        -----
+        This method is synchronous and intended to be called from a
+        dedicated thread.
+
+        """
+        exhausted = False
+        throttler = Throttler(limit=1, period=10)
+        pending: deque[Future[BatchResult]] = deque()
+
+        logger.debug(
+            'Starting to consume timestamps queue',
+            workers=self._workers_count,
+            mode='threads' if self._use_threads else 'processes',
+        )
+
+        pool = self._pool
+        try:
+            while not exhausted:
+                with self._get_latency.measure():
+                    timestamps = input.get()
+
+                if timestamps is None:
+                    break
+
+                pending.append(self._submit(pool, timestamps))
+
+                while len(pending) >= self._max_pending and not exhausted:
+                    exhausted = self._drain(pending, output, throttler)
+
+            while pending and not exhausted:
+                exhausted = self._drain(pending, output, throttler)
+
+            if exhausted:
+                logger.debug('Events exhausted, closing upstream queue')
+                input.shutdown()
+        except queue_mod.ShutDown:
+            logger.debug('Event stage interrupted by queue shutdown')
+        except Exception as e:
+            logger.exception(
+                'Fatal error in event stage',
+                reason=str(e),
+            )
+            input.shutdown()
+        finally:
+            logger.debug('Finishing event workers execution')
+            pool.shutdown(wait=True, cancel_futures=True)
+            output.close()
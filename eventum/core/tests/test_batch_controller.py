@@ -0,0 +1,182 @@
+"""Tests for adaptive batch size controller."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from eventum.core.batch_controller import BatchSizeController
+from eventum.core.parameters import AdaptiveBatchParameters
+from eventum.utils.profiler import PipelineProfiler
+
+
+class _Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_batcher(size: int | None = 1000) -> MagicMock:
+    batcher = MagicMock()
+    batcher.batch_size = size
+    return batcher
+
+
+def _make_queue(size: int = 0) -> MagicMock:
+    queue = MagicMock()
+    queue.size = size
+    return queue
+
+
+def _step(
+    controller: BatchSizeController,
+    profiler: PipelineProfiler,
+    clock: _Clock,
+    *,
+    render: int,
+    write: int = 0,
+    queued: int = 0,
+) -> None:
+    """Simulate one adjustment interval with one processed batch."""
+    profiler.histogram('event.render').record(render)
+    profiler.histogram('output.1.write').record(write)
+    clock.now += 1
+    controller.observe(controller.size, _make_queue(queued))
+
+
+def test_initial_size_is_clamped():
+    batcher = _make_batcher(size=1_000_000)
+    controller = BatchSizeController(
+        batcher=batcher,
+        params=AdaptiveBatchParameters(max_size=5000),
+        profiler=PipelineProfiler(),
+    )
+
+    assert controller.size == 5000
+    assert batcher.batch_size == 5000
+
+
+def test_initial_size_without_batcher_size():
+    controller = BatchSizeController(
+        batcher=_make_batcher(size=None),
+        params=AdaptiveBatchParameters(max_size=5000),
+        profiler=PipelineProfiler(),
+    )
+
+    assert controller.size == 5000
+
+
+def test_no_adjustment_before_interval():
+    clock = _Clock()
+    profiler = PipelineProfiler()
+    batcher = _make_batcher()
+    controller = BatchSizeController(
+        batcher=batcher,
+        params=AdaptiveBatchParameters(interval=10),
+        profiler=profiler,
+        clock=clock,
+    )
+
+    _step(controller, profiler, clock, render=10**9)
+
+    assert controller.size == 1000
+
+
+def test_no_adjustment_without_rendered_batches():
+    clock = _Clock()
+    batcher = _make_batcher()
+    controller = BatchSizeController(
+        batcher=batcher,
+        params=AdaptiveBatchParameters(),
+        profiler=PipelineProfiler(),
+        clock=clock,
+    )
+
+    clock.now += 1
+    controller.observe(1000, _make_queue())
+
+    assert controller.size == 1000
+
+
+def test_latency_goal_shrinks_slow_batches():
+    clock = _Clock()
+    profiler = PipelineProfiler()
+    batcher = _make_batcher()
+    controller = BatchSizeController(
+        batcher=batcher,
+        params=AdaptiveBatchParameters(target_latency=0.1),
+        profiler=profiler,
+        clock=clock,
+    )
+
+    # 1000 events in 0.3s + 0.1s write, target size is 250
+    _step(controller, profiler, clock, render=300_000_000, write=10**8)
+    assert controller.size == 500
+    assert batcher.batch_size == 500
+
+    _step(controller, profiler, clock, render=150_000_000, write=5 * 10**7)
+    assert controller.size == 250
+
+
+def test_latency_goal_grows_fast_batches():
+    clock = _Clock()
+    profiler = PipelineProfiler()
+    controller = BatchSizeController(
+        batcher=_make_batcher(),
+        params=AdaptiveBatchParameters(target_latency=1.0, max_size=3000),
+        profiler=profiler,
+        clock=clock,
+    )
+
+    _step(controller, profiler, clock, render=1_000_000)
+    assert controller.size == 2000
+
+    _step(controller, profiler, clock, render=2_000_000)
+    assert controller.size == 3000
+
+
+def test_latency_goal_accounts_queued_batches():
+    clock = _Clock()
+    profiler = PipelineProfiler()
+    controller = BatchSizeController(
+        batcher=_make_batcher(),
+        params=AdaptiveBatchParameters(target_latency=1.0),
+        profiler=profiler,
+        clock=clock,
+    )
+
+    # batch alone fits target, but three batches are queued ahead
+    _step(controller, profiler, clock, render=500_000_000, queued=3)
+
+    assert controller.size == 500
+
+
+def test_throughput_goal_reverses_on_degradation():
+    clock = _Clock()
+    profiler = PipelineProfiler()
+    controller = BatchSizeController(
+        batcher=_make_batcher(),
+        params=AdaptiveBatchParameters(goal='throughput'),
+        profiler=profiler,
+        clock=clock,
+    )
+
+    _step(controller, profiler, clock, render=1_000_000)
+    assert controller.size == 2000
+
+    # per event cost is the same, keep growing
+    _step(controller, profiler, clock, render=2_000_000)
+    assert controller.size == 4000
+
+    # per event cost degraded, step back
+    _step(controller, profiler, clock, render=8_000_000)
+    assert controller.size == 2000
+
+
+@pytest.mark.parametrize(('min_size', 'max_size'), [(10, 5), (0, 5)])
+def test_invalid_parameters(min_size, max_size):
+    with pytest.raises(ValueError):
+        AdaptiveBatchParameters(min_size=min_size, max_size=max_size)
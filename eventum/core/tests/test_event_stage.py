@@ -2,8 +2,11 @@
 
 import queue as queue_mod
 import threading
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
 
 import numpy as np
 import pytest
@@ -11,11 +14,13 @@ import pytest
 from eventum.core.parameters import GeneratorParameters
 from eventum.core.queue import PipelineQueue
 from eventum.core.stages.event_stage import EventStage
+from eventum.plugins.event.base.plugin import EventPlugin
 from eventum.plugins.event.exceptions import (
     PluginEventsExhaustedError,
     PluginProduceError,
 )
 from eventum.plugins.input.protocols import IdentifiedTimestamps
+from eventum.plugins.output.batch import EventBatch
 
 
 def _make_timestamps(
@@ -32,6 +37,13 @@ def _make_timestamps(
     return ts
 
 
+def _make_plugin() -> MagicMock:
+    """Create a mock event plugin with default batch producing."""
+    plugin = MagicMock()
+    plugin.produce_batch = partial(EventPlugin.produce_batch, plugin)
+    return plugin
+
+
 def _make_params(**overrides) -> GeneratorParameters:
     defaults: dict = {
         'id': 'test',
@@ -49,7 +61,7 @@ def _make_event_stage(
 ) -> EventStage:
     """Factory for EventStage with sensible defaults."""
     if plugin is None:
-        plugin = MagicMock()
+        plugin = _make_plugin()
         plugin.produce.return_value = ['event1']
     if input_tags is None:
         input_tags = {1: ('tag1',)}
@@ -85,12 +97,12 @@ def _feed_and_close(input_q: PipelineQueue, batches: list) -> None:
 
 def test_execute_normal_flow():
     """Timestamps in, events out, sentinel propagation."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['event1']
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     # Feed input from a thread
     threading.Thread(
@@ -116,12 +128,12 @@ def test_execute_normal_flow():
 
 def test_execute_multiple_batches():
     """Multiple timestamp batches produce multiple event batches."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['ev']
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -145,12 +157,12 @@ def test_execute_multiple_batches():
 
 def test_execute_plugin_returns_multiple_events():
     """Plugin.produce() returning multiple events per timestamp."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['ev1', 'ev2']
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -173,7 +185,7 @@ def test_execute_plugin_returns_multiple_events():
 
 def test_execute_uses_correct_tags():
     """input_tags[id] is passed to plugin.produce as tags."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     produced_tags: list[tuple[str, ...]] = []
 
     def capture_produce(params):
@@ -187,7 +199,7 @@ def test_execute_uses_correct_tags():
         input_tags={1: ('web', 'prod'), 2: ('db',)},
     )
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -207,12 +219,48 @@ def test_execute_uses_correct_tags():
     assert produced_tags[0] == ('web', 'prod')
 
 
+def test_produce_batch_passes_aware_timestamps():
+    """Timestamps are passed as datetimes in generator time zone."""
+    plugin = _make_plugin()
+    produced: list[tuple[datetime, tuple[str, ...]]] = []
+
+    def capture_produce(params):
+        produced.append((params['timestamp'], params['tags']))
+        return ['ev']
+
+    plugin.produce.side_effect = capture_produce
+
+    stage = _make_event_stage(
+        plugin=plugin,
+        input_tags={1: ('web',), 2: ('db',)},
+        params=_make_params(timezone='Europe/Moscow'),
+    )
+    timestamps = np.concatenate(
+        [
+            _make_timestamps(count=1, plugin_id=1),
+            _make_timestamps(count=1, plugin_id=2),
+        ],
+    )
+    timestamps['timestamp'][1] += np.timedelta64(1500, 'us')
+
+    events, exhausted = stage.produce_batch(timestamps)
+
+    tz = ZoneInfo('Europe/Moscow')
+    assert events == ['ev', 'ev']
+    assert not exhausted
+    assert produced == [
+        (datetime(2025, 1, 1, tzinfo=tz), ('web',)),
+        (datetime(2025, 1, 1, 0, 0, 0, 1500, tzinfo=tz), ('db',)),
+    ]
+    assert all(ts.tzinfo is tz for ts, _ in produced)
+
+
 # - Error handling ----------------------------------------------------
 
 
 def test_execute_produce_error_skips_and_continues():
     """PluginProduceError for one timestamp skips it, continues others."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     call_count = 0
 
     def produce_with_error(params):
@@ -229,7 +277,7 @@ def test_execute_produce_error_skips_and_continues():
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -252,7 +300,7 @@ def test_execute_produce_error_skips_and_continues():
 
 def test_execute_unexpected_error_skips_and_continues():
     """Generic exception for one timestamp is handled like ProduceError."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     call_count = 0
 
     def produce_with_error(params):
@@ -266,7 +314,7 @@ def test_execute_unexpected_error_skips_and_continues():
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -289,7 +337,7 @@ def test_execute_unexpected_error_skips_and_continues():
 
 def test_execute_exhausted_error_shuts_down_input():
     """PluginEventsExhaustedError shuts down input queue and closes output."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     call_count = 0
 
     def produce_exhausting(params):
@@ -303,7 +351,7 @@ def test_execute_exhausted_error_shuts_down_input():
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     # Put data but don't close - stage should shutdown() the input
     input_q.put(_make_timestamps(count=3))
@@ -328,7 +376,7 @@ def test_execute_exhausted_error_shuts_down_input():
 
 def test_execute_all_produce_fail_empty_batch():
     """If all produce calls fail, no events put to output."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.side_effect = PluginProduceError(
         'fail',
         context={'reason': 'test'},
@@ -336,7 +384,7 @@ def test_execute_all_produce_fail_empty_batch():
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -358,10 +406,10 @@ def test_execute_all_produce_fail_empty_batch():
 
 def test_execute_empty_input():
     """Input queue immediately closed leads to output immediately closed."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(target=input_q.close).start()
 
@@ -381,12 +429,12 @@ def test_execute_empty_input():
 
 def test_execute_always_closes_output():
     """output.close() is called regardless of execution path."""
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['ev']
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     threading.Thread(
         target=_feed_and_close,
@@ -416,12 +464,12 @@ def test_execute_closes_output_on_input_shutdown():
     Regression: without try-finally, queue.ShutDown from input.get()
     would bypass output.close(), leaving the output stage hanging.
     """
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['ev']
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     # Put data then immediately shutdown (simulates upstream failure)
     input_q.put(_make_timestamps(count=1))
@@ -448,12 +496,12 @@ def test_execute_closes_output_on_output_queue_shutdown():
     Regression: output.put() raises queue.ShutDown, but output.close()
     must still be called (which is now safe thanks to close() resilience).
     """
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['ev']
 
     stage = _make_event_stage(plugin=plugin)
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     # Feed timestamps from a thread
     feeder = threading.Thread(
@@ -491,7 +539,7 @@ def test_execute_fatal_error_shuts_down_input():
     queue. If the input stage was blocked on put() (queue full), it would
     hang forever, deadlocking the entire pipeline.
     """
-    plugin = MagicMock()
+    plugin = _make_plugin()
     plugin.produce.return_value = ['ev']
 
     # Use an input_tags map that is MISSING the plugin id to trigger
@@ -499,7 +547,7 @@ def test_execute_fatal_error_shuts_down_input():
     stage = _make_event_stage(plugin=plugin, input_tags={})
 
     input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
-    output_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
 
     # Feed timestamps with plugin_id=1, but input_tags has no key 1
     threading.Thread(
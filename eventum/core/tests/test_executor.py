@@ -6,8 +6,16 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from eventum.core.executor import ExecutionError, Executor
+from eventum.core.executor import (
+    ExecutionError,
+    Executor,
+    ImproperlyConfiguredError,
+)
 from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import EventPluginCounters
+from eventum.core.queue import RingPipelineQueue
+from eventum.core.stages import EventStage, ParallelEventStage
+from eventum.plugins.output.batch import EventBatch
 
 
 def _make_params(**overrides) -> GeneratorParameters:
@@ -30,9 +38,11 @@ def _make_mock_input_plugin(plugin_id=1, tags=('default',)):
     return plugin
 
 
-def _make_mock_event_plugin():
-    """Create a mock EventPlugin."""
-    return MagicMock()
+def _make_mock_event_plugin(replica: int = 0):
+    """Create a mock EventPlugin (replica index is ignored)."""
+    plugin = MagicMock()
+    plugin.is_sequential = False
+    return plugin
 
 
 def _make_mock_output_plugin():
@@ -274,6 +284,30 @@ def test_queue_sizes_from_params():
     assert executor._events_queue._queue.maxsize == 3
 
 
+def test_ring_queues_from_params():
+    """Ring queues are bounded by weights from params."""
+    params = _make_params(
+        queue={
+            'implementation': 'ring',
+            'max_timestamps': 1000,
+            'max_event_bytes': 4096,
+        },
+    )
+    executor = Executor(
+        input=[_make_mock_input_plugin()],
+        event=_make_mock_event_plugin(),
+        output=[_make_mock_output_plugin()],
+        params=params,
+    )
+    assert isinstance(executor._timestamps_queue, RingPipelineQueue)
+    assert executor._timestamps_queue._max_weight == 1000
+    assert isinstance(executor._events_queue, RingPipelineQueue)
+    assert executor._events_queue._max_weight == 4096
+
+    batch = EventBatch.from_events(['abc', 'de'])
+    assert executor._events_queue._weigher(batch) == 5
+
+
 def test_skip_past_computed():
     """skip_past is True only when live_mode and skip_past are both True."""
     executor_live = Executor(
@@ -291,3 +325,63 @@ def test_skip_past_computed():
         params=_make_params(live_mode=False, skip_past=True),
     )
     assert executor_sample._skip_past is False
+
+
+def test_single_event_worker_uses_event_stage():
+    """Default parameters use plain event stage without workers."""
+    executor = Executor(
+        input=[_make_mock_input_plugin()],
+        event=_make_mock_event_plugin(),
+        output=[_make_mock_output_plugin()],
+        params=_make_params(),
+    )
+    assert isinstance(executor._event_stage, EventStage)
+
+
+def test_multiple_event_workers_require_factory():
+    """Multiple event workers cannot be used without plugin factory."""
+    with pytest.raises(ImproperlyConfiguredError, match='factory'):
+        Executor(
+            input=[_make_mock_input_plugin()],
+            event=_make_mock_event_plugin(),
+            output=[_make_mock_output_plugin()],
+            params=_make_params(event_workers=2),
+        )
+
+
+def test_multiple_event_workers_reject_sequential_plugin():
+    """Sequential event plugin cannot be replicated."""
+    event = _make_mock_event_plugin()
+    event.is_sequential = True
+
+    with pytest.raises(ImproperlyConfiguredError, match='Sequential'):
+        Executor(
+            input=[_make_mock_input_plugin()],
+            event=event,
+            output=[_make_mock_output_plugin()],
+            params=_make_params(event_workers=2),
+            event_factory=_make_mock_event_plugin,
+        )
+
+
+def test_single_event_worker_requires_plugin_instance():
+    """Counters of event plugin cannot be used for single worker."""
+    with pytest.raises(ImproperlyConfiguredError, match='instance'):
+        Executor(
+            input=[_make_mock_input_plugin()],
+            event=EventPluginCounters(name='replay', id=1, sequential=True),
+            output=[_make_mock_output_plugin()],
+            params=_make_params(),
+        )
+
+
+def test_multiple_event_workers_use_parallel_stage():
+    """Multiple event workers use parallel event stage."""
+    executor = Executor(
+        input=[_make_mock_input_plugin()],
+        event=_make_mock_event_plugin(),
+        output=[_make_mock_output_plugin()],
+        params=_make_params(event_workers=2),
+        event_factory=_make_mock_event_plugin,
+    )
+    assert isinstance(executor._event_stage, ParallelEventStage)
@@ -122,6 +122,24 @@ def test_start_success(mock_load, mock_init, mock_executor_cls):
     assert gen.is_ended_up_successfully is True
 
 
+@patch('eventum.core.generator.Executor')
+@patch('eventum.core.generator.init_plugins')
+@patch('eventum.core.generator.load')
+def test_on_end_called_with_plugins(mock_load, mock_init, mock_executor_cls):
+    mock_load.return_value = MagicMock()
+    plugins = MagicMock()
+    mock_init.return_value = plugins
+    mock_executor_cls.return_value = MagicMock()
+    on_end = MagicMock(side_effect=RuntimeError('boom'))
+
+    gen = Generator(params=_make_params(), on_end=on_end)
+    assert gen.start() is True
+    gen.join()
+
+    on_end.assert_called_once_with(plugins)
+    assert gen.is_ended_up_successfully is True
+
+
 # --- stop / join edge cases ---
 
 
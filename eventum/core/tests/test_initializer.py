@@ -8,7 +8,10 @@ from pydantic import ValidationError
 
 from eventum.core.parameters import GeneratorParameters
 from eventum.core.plugins_initializer import (
+    EventPluginCounters,
     InitializationError,
+    create_event_plugin_factory,
+    init_event_plugin_counters,
     init_plugin,
     init_plugins,
 )
@@ -66,6 +69,40 @@ def test_initializer():
     assert isinstance(plugins.output[1], FileOutputPlugin)
 
 
+def test_initializer_replicated_event():
+    plugins = init_plugins(
+        input=[{'static': {'count': 1}}],
+        event={'replay': {'path': str(TEMPLATE_PATH)}},
+        output=[{'stdout': {}}],
+        params=GeneratorParameters(
+            id='test',
+            live_mode=False,
+            path=BASE_DIR / 'ephemeral.yml',
+        ),
+        replicated_event=True,
+    )
+
+    assert isinstance(plugins.event, EventPluginCounters)
+    assert plugins.event.name == 'replay'
+    assert plugins.event.is_sequential
+
+    plugins.event.merge_counters(produced=3, produce_failed=1, dropped=2)
+    assert plugins.event.produced == 3
+    assert plugins.event.produce_failed == 1
+    assert plugins.event.dropped == 2
+
+
+def test_init_event_plugin_counters_invalid_config():
+    with pytest.raises(InitializationError, match='Invalid configuration'):
+        init_event_plugin_counters(
+            event={'template': {'unknown': 1}},
+            params=GeneratorParameters(
+                id='test',
+                path=BASE_DIR / 'ephemeral.yml',
+            ),
+        )
+
+
 # --- init_plugin error cases ---
 
 
@@ -201,3 +238,48 @@ def test_init_plugin_output_type_calls_output_loader(mock_load):
             params={'id': 1, 'base_path': Path('.')},
         )
     mock_load.assert_called_once_with(name='fake')
+
+
+def test_initializer_seed():
+    def init(seed, shard=0):
+        return init_plugins(
+            input=[{'static': {'count': 1}}, {'static': {'count': 1}}],
+            event={'replay': {'path': str(TEMPLATE_PATH)}},
+            output=[{'stdout': {}}],
+            params=GeneratorParameters(
+                id='test',
+                live_mode=False,
+                path=BASE_DIR / 'ephemeral.yml',
+                seed=seed,
+            ),
+            shard=shard,
+        )
+
+    plugins = init(seed=1)
+    seeds = [
+        plugins.input[0]._seed,
+        plugins.input[1]._seed,
+        plugins.event._seed,
+        plugins.output[0]._seed,
+    ]
+
+    assert len(set(seeds)) == len(seeds)
+    assert init(seed=1).event._seed == plugins.event._seed
+    assert init(seed=2).event._seed != plugins.event._seed
+    assert init(seed=1, shard=1).event._seed != plugins.event._seed
+
+    assert init(seed=None).event._seed is None
+
+
+def test_event_plugin_factory_seeds_replicas():
+    factory = create_event_plugin_factory(
+        event={'replay': {'path': str(TEMPLATE_PATH)}},
+        params=GeneratorParameters(
+            id='test',
+            path=BASE_DIR / 'ephemeral.yml',
+            seed=1,
+        ),
+    )
+
+    assert factory(0)._seed == factory(0)._seed
+    assert factory(0)._seed != factory(1)._seed
@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from eventum.core.parameters import GeneratorParameters
 from eventum.core.queue import PipelineQueue
@@ -110,6 +111,21 @@ def test_configure_zero_plugins():
     assert stage._configured_interactive is None
 
 
+def test_configure_adaptive_batching():
+    """configure() attaches batch size controller when enabled."""
+    p1 = _make_mock_input_plugin(plugin_id=1, is_interactive=False)
+    stage = InputStage(
+        plugins=[p1],
+        params=_make_params(
+            batch={'size': 500, 'adaptive': {'max_size': 1000}},
+        ),
+    )
+    stage.configure(stop_event=threading.Event())
+
+    controller = stage._controllers[stage._configured_non_interactive]
+    assert controller.size == 500
+
+
 # - Execute: no sources -----------------------------------------------
 
 
@@ -167,6 +183,68 @@ def test_execute_single_source():
     assert len(batches[1]) == 2
 
 
+def test_execute_single_source_observed_by_controller():
+    """Batches put to output queue are observed by controller."""
+    source = _make_mock_source([_make_timestamps(count=3)])
+
+    p1 = _make_mock_input_plugin()
+    stage = InputStage(plugins=[p1], params=_make_params())
+    stage._configured_non_interactive = source
+    stage._configured_interactive = None
+    stage._stop_event = threading.Event()
+    controller = MagicMock()
+    stage._controllers[source] = controller
+
+    output_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
+
+    stage_thread = threading.Thread(
+        target=stage.execute,
+        kwargs={'output': output_q, 'skip_past': False},
+    )
+    stage_thread.start()
+    _collect_output(output_q)
+    stage_thread.join(timeout=5)
+
+    controller.observe.assert_called_once_with(3, output_q)
+
+
+def test_execute_external_source():
+    """External source is used instead of input plugins."""
+    batches = [_make_timestamps(count=i) for i in range(1, 4)]
+    source = _make_mock_source(batches)
+
+    stage = InputStage(
+        plugins=[],
+        params=_make_params(),
+        source=source,
+        input_tags={1: ('web',)},
+    )
+    stage.configure(stop_event=threading.Event())
+
+    output_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
+
+    stage_thread = threading.Thread(
+        target=stage.execute,
+        kwargs={'output': output_q, 'skip_past': False},
+    )
+    stage_thread.start()
+
+    produced = _collect_output(output_q)
+    stage_thread.join(timeout=5)
+
+    assert [len(batch) for batch in produced] == [1, 2, 3]
+    assert stage.input_tags == {1: ('web',)}
+
+
+def test_external_source_requires_input_tags():
+    with pytest.raises(ValueError, match='tags'):
+        InputStage(
+            plugins=[],
+            params=_make_params(),
+            source=_make_mock_source([]),
+        )
+
+
 def test_execute_single_source_stop_event():
     """Setting stop_event mid-iteration breaks the loop."""
     stop = threading.Event()
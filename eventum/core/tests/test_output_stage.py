@@ -6,12 +6,16 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from structlog.testing import capture_logs
 
 from eventum.core.executor import ExecutionError
 from eventum.core.parameters import GeneratorParameters
 from eventum.core.queue import PipelineQueue
 from eventum.core.stages.output_stage import OutputStage
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
+from eventum.plugins.output.fields import Format, JsonFormatterConfig
+from eventum.plugins.output.plugins.file.config import FileOutputPluginConfig
+from eventum.plugins.output.plugins.file.plugin import FileOutputPlugin
 
 
 def _make_params(**overrides) -> GeneratorParameters:
@@ -24,12 +28,20 @@ def _make_params(**overrides) -> GeneratorParameters:
     return GeneratorParameters(**defaults)
 
 
-def _make_mock_output_plugin(write_return: int = 5):
+def _make_mock_output_plugin(
+    write_return: int = 5,
+    formatter_key=None,
+    *,
+    is_best_effort: bool = False,
+):
     """Create a mock OutputPlugin with async methods."""
     plugin = MagicMock()
+    plugin.is_best_effort = is_best_effort
     plugin.open = AsyncMock()
     plugin.close = AsyncMock()
     plugin.write = AsyncMock(return_value=write_return)
+    plugin.format = AsyncMock(return_value=MagicMock())
+    plugin.formatter_key = formatter_key
     plugin.__str__ = MagicMock(return_value='<mock output>')  # type: ignore
     return plugin
 
@@ -163,8 +175,108 @@ async def test_execute_multiple_plugins():
 
     await stage.execute(input=input_q)
 
-    p1.write.assert_awaited_once_with(['ev1'])
-    p2.write.assert_awaited_once_with(['ev1'])
+    p1.write.assert_awaited_once_with(['ev1'], None)
+    p2.write.assert_awaited_once_with(['ev1'], None)
+
+
+@pytest.mark.asyncio
+async def test_execute_shares_formatting():
+    """Batch is formatted once per distinct formatter key."""
+    p1 = _make_mock_output_plugin(formatter_key='json')
+    p2 = _make_mock_output_plugin(formatter_key='json')
+    p3 = _make_mock_output_plugin(formatter_key='template')
+    p4 = _make_mock_output_plugin()
+    stage = _make_output_stage(plugins=[p1, p2, p3, p4])
+    input_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+
+    threading.Thread(
+        target=_feed_and_close,
+        args=(input_q, [['ev1'], ['ev2']]),
+    ).start()
+
+    await stage.execute(input=input_q)
+
+    assert p1.format.await_count == 2
+    p2.format.assert_not_awaited()
+
+    for batch_index, events in enumerate((['ev1'], ['ev2'])):
+        call_1 = p1.write.await_args_list[batch_index]
+        call_2 = p2.write.await_args_list[batch_index]
+        assert call_1.args[0] == events
+        assert call_1.args[1] is call_2.args[1]
+
+    p3.format.assert_not_awaited()
+    p3.write.assert_awaited_with(['ev2'], None)
+    p4.write.assert_awaited_with(['ev2'], None)
+
+
+@pytest.mark.asyncio
+async def test_execute_shared_formatting_with_file_plugins(tmp_path):
+    """Plugins sharing formatting write the same formatted events."""
+    paths = [tmp_path / 'first.log', tmp_path / 'second.log']
+    plugins = [
+        FileOutputPlugin(
+            config=FileOutputPluginConfig(
+                path=path,
+                formatter=JsonFormatterConfig(format=Format.JSON),
+            ),
+            params={'id': i},
+        )
+        for i, path in enumerate(paths)
+    ]
+    stage = _make_output_stage(plugins=plugins)
+    input_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+
+    threading.Thread(
+        target=_feed_and_close,
+        args=(input_q, [['{"a": 1}', '{"b": 2}']]),
+    ).start()
+
+    await stage.open()
+    await stage.execute(input=input_q)
+    await stage.close()
+
+    first, second = (path.read_text().splitlines() for path in paths)
+    assert first == second
+    assert len(first) == 2
+
+    for plugin in plugins:
+        assert plugin.written == 2
+        assert plugin.format_latency.count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_shared_formatting_errors_logged_per_plugin(tmp_path):
+    """Each plugin sharing formatting logs its errors."""
+    plugins = [
+        FileOutputPlugin(
+            config=FileOutputPluginConfig(
+                path=tmp_path / f'{i}.log',
+                formatter=JsonFormatterConfig(format=Format.JSON),
+            ),
+            params={'id': i},
+        )
+        for i in range(2)
+    ]
+    stage = _make_output_stage(plugins=plugins)
+    input_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+
+    threading.Thread(
+        target=_feed_and_close,
+        args=(input_q, [['{"a": 1}', 'invalid']]),
+    ).start()
+
+    await stage.open()
+    with capture_logs() as logs:
+        await stage.execute(input=input_q)
+    await stage.close()
+
+    errors = [log for log in logs if log['event'] == 'Failed to format event']
+    assert len(errors) == 2
+
+    for plugin in plugins:
+        assert plugin.written == 1
+        assert plugin.format_latency.count == 1
 
 
 @pytest.mark.asyncio
@@ -189,7 +301,7 @@ async def test_execute_drains_remaining_tasks():
     """After sentinel, remaining in-flight tasks are awaited."""
     p1 = _make_mock_output_plugin()
 
-    async def slow_write(events):
+    async def slow_write(events, formatting=None):
         await asyncio.sleep(0.1)
         return len(events)
 
@@ -236,7 +348,7 @@ async def test_handle_write_result_timeout():
     """Write timeout is handled (logged, not re-raised)."""
     p1 = _make_mock_output_plugin()
 
-    async def slow_write(events):
+    async def slow_write(events, formatting=None):
         await asyncio.sleep(10)
         return 1
 
@@ -276,25 +388,31 @@ async def test_handle_write_result_unexpected_error():
 
 
 @pytest.mark.asyncio
-async def test_semaphore_limits_concurrency():
-    """max_concurrency limits the number of concurrent writes."""
-    max_concurrent = 0
-    current_concurrent = 0
-    lock = asyncio.Lock()
-
-    async def tracked_write(events):
-        nonlocal max_concurrent, current_concurrent
-        async with lock:
-            current_concurrent += 1
-            max_concurrent = max(max_concurrent, current_concurrent)
-        await asyncio.sleep(0.05)
-        async with lock:
-            current_concurrent -= 1
-        return len(events)
+async def test_concurrency_is_limited_per_plugin():
+    """max_concurrency limits the number of concurrent writes of each
+    plugin.
+    """
+    max_concurrent: dict[int, int] = {}
+    current_concurrent: dict[int, int] = {}
+
+    def make_tracked_write(plugin_id: int):
+        async def tracked_write(events, formatting=None):
+            current_concurrent[plugin_id] = (
+                current_concurrent.get(plugin_id, 0) + 1
+            )
+            max_concurrent[plugin_id] = max(
+                max_concurrent.get(plugin_id, 0),
+                current_concurrent[plugin_id],
+            )
+            await asyncio.sleep(0.05)
+            current_concurrent[plugin_id] -= 1
+            return len(events)
+
+        return tracked_write
 
     plugins = [_make_mock_output_plugin() for _ in range(3)]
-    for p in plugins:
-        p.write.side_effect = tracked_write
+    for i, p in enumerate(plugins):
+        p.write.side_effect = make_tracked_write(i)
 
     params = _make_params(max_concurrency=2, keep_order=False)
     stage = _make_output_stage(plugins=plugins, params=params)
@@ -306,4 +424,86 @@ async def test_semaphore_limits_concurrency():
     ).start()
 
     await stage.execute(input=input_q)
-    assert max_concurrent <= 2
+    assert max_concurrent == {0: 2, 1: 2, 2: 2}
+
+
+@pytest.mark.asyncio
+async def test_slow_plugin_does_not_block_others():
+    """Fast plugin writes all batches while slow plugin is still
+    writing.
+    """
+    release = asyncio.Event()
+
+    async def blocked_write(events, formatting=None):
+        await release.wait()
+        return len(events)
+
+    slow = _make_mock_output_plugin()
+    slow.write.side_effect = blocked_write
+    fast = _make_mock_output_plugin()
+
+    params = _make_params(max_concurrency=1)
+    stage = _make_output_stage(plugins=[slow, fast], params=params)
+    input_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+
+    threading.Thread(
+        target=_feed_and_close,
+        args=(input_q, [['ev1'], ['ev2'], ['ev3']]),
+    ).start()
+
+    execution = asyncio.create_task(stage.execute(input=input_q))
+
+    for _ in range(100):
+        if fast.write.await_count == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    assert fast.write.await_count == 3
+    assert slow.write.await_count == 1
+
+    release.set()
+    await asyncio.wait_for(execution, 2)
+    assert slow.write.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_best_effort_plugin_drops_batches_when_full():
+    """Batches for best-effort plugin with full queue are dropped."""
+    release = asyncio.Event()
+
+    async def blocked_write(events, formatting=None):
+        await release.wait()
+        return len(events)
+
+    best_effort = _make_mock_output_plugin(is_best_effort=True)
+    best_effort.write.side_effect = blocked_write
+    required = _make_mock_output_plugin()
+
+    params = _make_params(
+        max_concurrency=1,
+        queue={'max_output_batches': 1},
+    )
+    stage = _make_output_stage(plugins=[best_effort, required], params=params)
+    input_q: PipelineQueue[list[str]] = PipelineQueue(maxsize=10)
+
+    threading.Thread(
+        target=_feed_and_close,
+        args=(input_q, [['ev1'], ['ev2'], ['ev3', 'ev4']]),
+    ).start()
+
+    execution = asyncio.create_task(stage.execute(input=input_q))
+
+    for _ in range(100):
+        if required.write.await_count == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    release.set()
+    await asyncio.wait_for(execution, 2)
+
+    assert required.write.await_count == 3
+
+    written = sum(len(c.args[0]) for c in best_effort.write.await_args_list)
+    dropped = sum(c.args[0] for c in best_effort.drop.call_args_list)
+    assert dropped > 0
+    assert written + dropped == 4
@@ -0,0 +1,235 @@
+"""Tests for ParallelEventStage."""
+
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import create_event_plugin_factory
+from eventum.core.queue import PipelineQueue
+from eventum.core.stages import parallel_event_stage
+from eventum.core.stages.parallel_event_stage import ParallelEventStage
+from eventum.plugins.event.base.plugin import EventPlugin
+from eventum.plugins.event.exceptions import PluginEventsExhaustedError
+from eventum.plugins.input.protocols import IdentifiedTimestamps
+from eventum.plugins.output.batch import EventBatch
+
+SCRIPTS_DIR = (
+    Path(__file__).parents[2]
+    / 'plugins'
+    / 'event'
+    / 'plugins'
+    / 'script'
+    / 'tests'
+    / 'static'
+)
+
+
+def _make_timestamps(
+    count: int = 5,
+    plugin_id: int = 1,
+    start: int = 0,
+) -> IdentifiedTimestamps:
+    """Create a test IdentifiedTimestamps array."""
+    ts = np.empty(
+        count,
+        dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+    )
+    ts['timestamp'] = np.datetime64('2025-01-01T00:00:00', 'us') + (
+        np.arange(start, start + count) * np.timedelta64(1, 's')
+    )
+    ts['id'] = plugin_id
+    return ts
+
+
+def _make_params(**overrides) -> GeneratorParameters:
+    defaults: dict = {
+        'id': 'test',
+        'path': Path('/tmp/config.yml'),
+        'live_mode': False,
+        'event_workers': 4,
+    }
+    defaults.update(overrides)
+    return GeneratorParameters(**defaults)
+
+
+def _make_replica(delay: float = 0.0) -> MagicMock:
+    """Create event plugin replica producing ISO timestamps."""
+    plugin = MagicMock()
+    plugin.produced = 0
+    plugin.produce_failed = 0
+    plugin.dropped = 0
+
+    def produce(params):
+        if delay:
+            time.sleep(delay)
+        plugin.produced += 1
+        return [params['timestamp'].isoformat()]
+
+    plugin.produce.side_effect = produce
+    plugin.produce_batch = partial(EventPlugin.produce_batch, plugin)
+    return plugin
+
+
+def _run_stage(stage, batches) -> list:
+    """Feed batches, run stage and collect produced event batches."""
+    input_q: PipelineQueue[IdentifiedTimestamps] = PipelineQueue(maxsize=10)
+    output_q: PipelineQueue[EventBatch] = PipelineQueue(maxsize=10)
+
+    def feed():
+        for batch in batches:
+            input_q.put(batch)
+        input_q.close()
+
+    threading.Thread(target=feed).start()
+    stage_thread = threading.Thread(
+        target=stage.execute,
+        kwargs={'input': input_q, 'output': output_q},
+    )
+    stage_thread.start()
+
+    results = []
+    while (item := output_q.get()) is not None:
+        results.append(item)
+
+    stage_thread.join(timeout=10)
+    assert not stage_thread.is_alive()
+    return results
+
+
+@pytest.fixture
+def threads_mode(monkeypatch):
+    monkeypatch.setattr(parallel_event_stage, 'use_threads', lambda: True)
+
+
+@pytest.fixture
+def processes_mode(monkeypatch):
+    monkeypatch.setattr(parallel_event_stage, 'use_threads', lambda: False)
+
+
+def test_thread_workers_produce_all_events(threads_mode):
+    primary = MagicMock()
+    factory = MagicMock(side_effect=lambda _: _make_replica())
+    stage = ParallelEventStage(
+        plugin=primary,
+        factory=factory,
+        input_tags={1: ('tag',)},
+        params=_make_params(),
+    )
+
+    assert [c.args for c in factory.call_args_list] == [
+        (0,),
+        (1,),
+        (2,),
+        (3,),
+    ]
+
+    batches = [_make_timestamps(count=3, start=i * 3) for i in range(10)]
+    results = _run_stage(stage, batches)
+
+    events = [event for batch in results for event in batch]
+    assert len(events) == 30
+    assert primary.merge_counters.call_count == 10
+    assert (
+        sum(
+            c.kwargs['produced'] for c in primary.merge_counters.call_args_list
+        )
+        == 30
+    )
+
+
+def test_thread_workers_keep_order(threads_mode):
+    stage = ParallelEventStage(
+        plugin=MagicMock(),
+        factory=lambda _: _make_replica(delay=0.001),
+        input_tags={1: ('tag',)},
+        params=_make_params(keep_order=True),
+    )
+
+    batches = [_make_timestamps(count=5, start=i * 5) for i in range(20)]
+    results = _run_stage(stage, batches)
+
+    events = [event for batch in results for event in batch]
+    assert events == sorted(events)
+    assert len(events) == 100
+
+
+def test_thread_workers_exhaustion_stops_stage(threads_mode):
+    def factory(replica):
+        plugin = _make_replica()
+        plugin.produce.side_effect = PluginEventsExhaustedError()
+        return plugin
+
+    stage = ParallelEventStage(
+        plugin=MagicMock(),
+        factory=factory,
+        input_tags={1: ('tag',)},
+        params=_make_params(),
+    )
+
+    results = _run_stage(stage, [_make_timestamps(count=2)])
+    assert results == []
+
+
+def test_thread_workers_factory_error_propagates(threads_mode):
+    factory = MagicMock(side_effect=RuntimeError('boom'))
+
+    with pytest.raises(RuntimeError, match='boom'):
+        ParallelEventStage(
+            plugin=MagicMock(),
+            factory=factory,
+            input_tags={1: ('tag',)},
+            params=_make_params(),
+        )
+
+
+def test_process_workers_factory_error_raised_on_init(processes_mode):
+    params = _make_params(
+        event_workers=2,
+        path=SCRIPTS_DIR / 'generator.yml',
+    )
+    factory = create_event_plugin_factory(
+        event={'script': {'path': 'missing.py'}},
+        params=params,
+    )
+
+    with pytest.raises(RuntimeError, match='missing.py'):
+        ParallelEventStage(
+            plugin=MagicMock(),
+            factory=factory,
+            input_tags={1: ('tag',)},
+            params=params,
+        )
+
+
+def test_process_workers_produce_events(processes_mode):
+    params = _make_params(
+        event_workers=2,
+        keep_order=True,
+        path=SCRIPTS_DIR / 'generator.yml',
+    )
+    factory = create_event_plugin_factory(
+        event={'script': {'path': 'one_event.py'}},
+        params=params,
+    )
+    primary = factory(0)
+
+    stage = ParallelEventStage(
+        plugin=primary,
+        factory=factory,
+        input_tags={1: ('tag',)},
+        params=params,
+    )
+
+    batches = [_make_timestamps(count=4, start=i * 4) for i in range(5)]
+    results = _run_stage(stage, batches)
+
+    events = [event for batch in results for event in batch]
+    assert len(events) == 20
+    assert events == sorted(events)
+    assert primary.produced == 20
@@ -64,6 +64,27 @@ def test_batch_parameters_frozen():
         params.size = 999  # type: ignore
 
 
+def test_batch_parameters_adaptive():
+    params = BatchParameters.model_validate(
+        {'size': 1000, 'adaptive': {'goal': 'throughput'}},
+    )
+    assert params.adaptive is not None
+    assert params.adaptive.goal == 'throughput'
+    assert params.adaptive.target_latency == 1.0
+
+
+def test_batch_parameters_adaptive_disabled_by_default():
+    assert BatchParameters().adaptive is None
+
+
+def test_adaptive_batching_with_shards_raises():
+    with pytest.raises(ValidationError, match='sharding'):
+        GenerationParameters(
+            shards=2,
+            batch={'size': 1000, 'adaptive': {}},
+        )
+
+
 # --- QueueParameters ---
 
 
@@ -84,6 +105,23 @@ def test_queue_parameters_one_passes():
     assert params.max_event_batches == 1
 
 
+def test_queue_parameters_weight_bounds_require_ring():
+    with pytest.raises(ValidationError, match='ring'):
+        QueueParameters(max_events=100)
+
+    params = QueueParameters(implementation='ring', max_event_bytes=1024)
+    assert params.max_event_bytes == 1024
+
+
+def test_queue_parameters_event_bounds_are_exclusive():
+    with pytest.raises(ValidationError):
+        QueueParameters(
+            implementation='ring',
+            max_events=100,
+            max_event_bytes=1024,
+        )
+
+
 def test_queue_parameters_extra_fields_forbidden():
     with pytest.raises(ValidationError):
         QueueParameters(unknown_field=5)  # type: ignore
@@ -132,9 +170,15 @@ def test_generation_parameters_write_timeout_one_passes():
     assert params.write_timeout == 1
 
 
+def test_generation_parameters_event_workers_zero_raises():
+    with pytest.raises(ValidationError):
+        GenerationParameters(event_workers=0)
+
+
 def test_generation_parameters_defaults():
     params = GenerationParameters()
     assert params.keep_order is False
+    assert params.event_workers == 1
     assert params.max_concurrency == 100
     assert params.write_timeout == 10
     assert isinstance(params.batch, BatchParameters)
@@ -2,6 +2,7 @@
 
 import time
 from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
 from threading import Thread
 from unittest.mock import AsyncMock, MagicMock
@@ -12,6 +13,7 @@ from numpy.typing import NDArray
 
 from eventum.core.executor import ExecutionError, Executor
 from eventum.core.parameters import GeneratorParameters
+from eventum.plugins.event.base.plugin import EventPlugin
 from eventum.plugins.output.exceptions import PluginOpenError
 
 
@@ -69,6 +71,7 @@ def _make_mock_event_plugin(events_per_call: int = 1):
         return [f'event-{params["timestamp"]}' for _ in range(events_per_call)]
 
     plugin.produce = produce
+    plugin.produce_batch = partial(EventPlugin.produce_batch, plugin)
     return plugin
 
 
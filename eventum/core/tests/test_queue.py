@@ -1,11 +1,13 @@
 """Tests for PipelineQueue."""
 
+import asyncio
 import queue as queue_mod
 import threading
+import time
 
 import pytest
 
-from eventum.core.queue import PipelineQueue
+from eventum.core.queue import PipelineQueue, RingPipelineQueue, create_queue
 
 
 # - Basic operations --------------------------------------------------
@@ -51,6 +53,15 @@ def test_is_full_after_get():
     assert q.is_full is False
 
 
+def test_size(make_queue):
+    """Size reports number of items in the queue."""
+    q = make_queue(maxsize=3)
+    q.put('a')
+    q.put('b')
+    assert q.size == 2
+    assert q.maxsize == 3
+
+
 # - Sentinel-based close ---------------------------------------------
 
 
@@ -197,3 +208,194 @@ def test_blocking_put_at_maxsize():
     assert q.get() == 'second'
     t.join(timeout=2)
     assert not t.is_alive()
+
+
+# - Bulk get ----------------------------------------------------------
+
+
+@pytest.fixture(params=['stdlib', 'ring'])
+def make_queue(request):
+    """Factory of queues of both implementations."""
+
+    def factory(maxsize: int) -> PipelineQueue:
+        return create_queue(implementation=request.param, maxsize=maxsize)
+
+    return factory
+
+
+# - Ring queue --------------------------------------------------------
+
+
+def test_ring_fifo_with_wraparound():
+    q: RingPipelineQueue[int] = RingPipelineQueue(maxsize=3)
+
+    for i in range(10):
+        q.put(i)
+        q.put(i + 100)
+        assert q.get() == i
+        assert q.get() == i + 100
+
+
+def test_ring_close_blocks_until_sentinel_consumed():
+    q: RingPipelineQueue[str] = RingPipelineQueue(maxsize=1)
+    q.put('a')
+    close_returned = threading.Event()
+
+    def closer():
+        q.close()
+        close_returned.set()
+
+    t = threading.Thread(target=closer)
+    t.start()
+
+    assert not close_returned.wait(timeout=0.3)
+    assert q.get() == 'a'
+    assert q.get() is None
+    assert close_returned.wait(timeout=2)
+    t.join(timeout=2)
+
+
+def test_ring_shutdown_unblocks_put_and_close():
+    q: RingPipelineQueue[str] = RingPipelineQueue(maxsize=1)
+    q.put('a')
+    errors: list[Exception] = []
+
+    def blocked_put():
+        try:
+            q.put('b')
+        except queue_mod.ShutDown as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=blocked_put),
+        threading.Thread(target=q.close),
+    ]
+    for t in threads:
+        t.start()
+
+    time.sleep(0.1)
+    q.shutdown()
+
+    for t in threads:
+        t.join(timeout=2)
+        assert not t.is_alive()
+
+    assert len(errors) == 1
+
+    with pytest.raises(queue_mod.ShutDown):
+        q.get()
+
+
+def test_ring_bounded_by_weight():
+    q: RingPipelineQueue[str] = RingPipelineQueue(
+        maxsize=10,
+        max_weight=5,
+        weigher=len,
+    )
+    q.put('abc')
+    assert q.is_full is False
+    q.put('de')
+    assert q.is_full is True
+
+    put_completed = threading.Event()
+
+    def slow_put():
+        q.put('f')
+        put_completed.set()
+
+    t = threading.Thread(target=slow_put)
+    t.start()
+
+    assert not put_completed.wait(timeout=0.3)
+    assert q.get() == 'abc'
+    assert put_completed.wait(timeout=2)
+    t.join(timeout=2)
+
+    assert q.get() == 'de'
+    assert q.get() == 'f'
+
+
+def test_ring_accepts_oversized_item_when_empty():
+    q: RingPipelineQueue[str] = RingPipelineQueue(
+        maxsize=10,
+        max_weight=2,
+        weigher=len,
+    )
+    q.put('abcdef')
+    assert q.is_full is True
+    assert q.get() == 'abcdef'
+
+
+def test_ring_weight_requires_weigher():
+    with pytest.raises(ValueError, match='Weigher'):
+        RingPipelineQueue(maxsize=10, max_weight=5)
+
+
+def test_create_queue():
+    assert type(create_queue('stdlib', maxsize=1)) is PipelineQueue
+    assert type(create_queue('ring', maxsize=1)) is RingPipelineQueue
+
+    with pytest.raises(ValueError, match='ring'):
+        create_queue('stdlib', maxsize=1, max_weight=1, weigher=len)
+
+
+# - Async consumer ----------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_aget_many_returns_available_items(make_queue):
+    q = make_queue(maxsize=10)
+    q.put('a')
+    q.put('b')
+
+    assert await q.aget_many(max_items=10) == ['a', 'b']
+
+
+@pytest.mark.asyncio
+async def test_aget_many_limits_number_of_items(make_queue):
+    q = make_queue(maxsize=10)
+    for item in 'abc':
+        q.put(item)
+
+    assert await q.aget_many(max_items=2) == ['a', 'b']
+    assert await q.aget_many(max_items=2) == ['c']
+
+
+@pytest.mark.asyncio
+async def test_aget_many_wakes_on_put_from_thread(make_queue):
+    q = make_queue(maxsize=10)
+    threading.Timer(0.1, q.put, args=('a',)).start()
+
+    assert await asyncio.wait_for(q.aget_many(max_items=10), 2) == ['a']
+
+
+@pytest.mark.asyncio
+async def test_aget_many_consumes_until_close(make_queue):
+    q = make_queue(maxsize=2)
+    count = 100
+
+    def producer():
+        for i in range(count):
+            q.put(i)
+        q.close()
+
+    t = threading.Thread(target=producer)
+    t.start()
+
+    items = []
+    while (batch := await q.aget_many(max_items=10)) is not None:
+        items.extend(batch)
+
+    t.join(timeout=2)
+    assert not t.is_alive()
+    assert items == list(range(count))
+    assert await q.aget_many(max_items=10) is None
+
+
+@pytest.mark.asyncio
+async def test_aget_many_wakes_on_shutdown(make_queue):
+    q = make_queue(maxsize=10)
+    threading.Timer(0.1, q.shutdown).start()
+
+    with pytest.raises(queue_mod.ShutDown):
+        await asyncio.wait_for(q.aget_many(max_items=10), 2)
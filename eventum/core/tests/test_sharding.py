@@ -0,0 +1,189 @@
+"""Tests for sharded execution."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from eventum.core.executor import ImproperlyConfiguredError
+from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import InitializedPlugins, init_plugins
+from eventum.core.sharding import ShardCounters, ShardedExecutor
+
+# Script that records produced events to the file of its shard process,
+# so the results do not depend on concurrent appends to the same file
+PRODUCE_SCRIPT = """\
+import os
+
+_file = None
+
+
+def produce(params):
+    global _file
+    if _file is None:
+        _file = open(f'{directory}/events-{{os.getpid()}}.log', 'a')
+
+    event = params['timestamp'].isoformat()
+    _file.write(event + '\\n')
+    _file.flush()
+    return event
+"""
+
+
+def _make_plugins(produced=0, written=0) -> InitializedPlugins:
+    input_plugin = MagicMock()
+    input_plugin.id = 1
+    input_plugin.is_interactive = False
+
+    event_plugin = MagicMock()
+    event_plugin.name = 'script'
+    event_plugin.is_sequential = False
+    event_plugin.produced = produced
+    event_plugin.produce_failed = 0
+    event_plugin.dropped = 0
+
+    output_plugin = MagicMock()
+    output_plugin.id = 1
+    output_plugin.written = written
+    output_plugin.write_failed = 0
+    output_plugin.format_failed = 0
+
+    return InitializedPlugins(
+        input=[input_plugin],
+        event=event_plugin,
+        output=[output_plugin],
+    )
+
+
+def test_counters_collect():
+    counters = ShardCounters.collect(_make_plugins(produced=5, written=4))
+    assert counters.produced == 5
+    assert counters.written == {1: 4}
+
+
+def test_counters_merge_difference():
+    plugins = _make_plugins()
+    previous = ShardCounters(produced=10, written={1: 8})
+    current = ShardCounters(produced=30, written={1: 20})
+
+    current.merge_difference(previous=previous, plugins=plugins)
+
+    plugins.input[0].merge_counters.assert_not_called()
+    plugins.event.merge_counters.assert_called_once_with(
+        produced=20,
+        produce_failed=0,
+        dropped=0,
+    )
+    plugins.output[0].merge_counters.assert_called_once_with(
+        written=12,
+        write_failed=0,
+        format_failed=0,
+    )
+
+
+def test_sequential_event_plugin_cannot_be_sharded():
+    plugins = _make_plugins()
+    plugins.event.name = 'replay'
+    plugins.event.is_sequential = True
+
+    with pytest.raises(ImproperlyConfiguredError, match='Sequential'):
+        ShardedExecutor(
+            plugins=plugins,
+            params=GeneratorParameters(
+                id='test',
+                path=Path('/tmp/generator.yml'),
+                shards=2,
+            ),
+        )
+
+
+def _execute_sharded(
+    path: Path,
+    input: list[dict],
+    shards: int,
+) -> tuple[InitializedPlugins, dict[str, list[str]]]:
+    """Execute generator with specified input plugins in shards and
+    return its plugins with events recorded by each shard process.
+    """
+    (path / 'produce.py').write_text(PRODUCE_SCRIPT.format(directory=path))
+    config = {
+        'input': input,
+        'event': {'script': {'path': 'produce.py'}},
+        'output': [{'file': {'path': os.devnull}}],
+    }
+    (path / 'generator.yml').write_text(yaml.dump(config))
+    params = GeneratorParameters(
+        id='test',
+        path=path / 'generator.yml',
+        live_mode=False,
+        shards=shards,
+        batch={'size': 100},
+    )
+    plugins = init_plugins(
+        input=config['input'],
+        event=config['event'],
+        output=config['output'],
+        params=params,
+        replicated_event=True,
+    )
+
+    ShardedExecutor(plugins=plugins, params=params).execute()
+
+    events = {
+        file.name: file.read_text().splitlines()
+        for file in path.glob('events-*.log')
+    }
+    return plugins, events
+
+
+def test_sharded_execution(tmp_path):
+    plugins, events = _execute_sharded(
+        path=tmp_path,
+        input=[{'static': {'count': 1000}}],
+        shards=3,
+    )
+
+    assert len(events) == 3
+    assert sum(len(lines) for lines in events.values()) == 1000
+    assert plugins.input[0].generated == 1000
+    assert plugins.event.produced == 1000
+    assert plugins.output[0].written == 1000
+
+
+def test_sharded_execution_of_random_input(tmp_path):
+    (tmp_path / 'pattern.yml').write_text(
+        yaml.dump(
+            {
+                'label': 'Random pattern',
+                'oscillator': {
+                    'start': 'now',
+                    'end': '+1s',
+                    'period': 0.1,
+                    'unit': 'seconds',
+                },
+                'multiplier': {'ratio': 500},
+                'randomizer': {'deviation': 0.5, 'direction': 'mixed'},
+                'spreader': {
+                    'distribution': 'uniform',
+                    'parameters': {'low': 0, 'high': 1},
+                },
+            },
+        ),
+    )
+    plugins, events = _execute_sharded(
+        path=tmp_path,
+        input=[{'time_patterns': {'patterns': ['pattern.yml']}}],
+        shards=2,
+    )
+
+    generated = plugins.input[0].generated
+    lines = [line for shard in events.values() for line in shard]
+
+    # timestamps are generated once and each batch is processed by
+    # exactly one shard
+    assert generated > 0
+    assert len(lines) == generated
+    assert plugins.event.produced == generated
+    assert plugins.output[0].written == generated
@@ -3,8 +3,9 @@
 import logging
 import logging.config
 import logging.handlers
+from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, assert_never
+from typing import TYPE_CHECKING, Any, Literal, assert_never
 
 import structlog
 
@@ -14,7 +15,11 @@ from eventum.logging.file_paths import (
     construct_server_logfile_path,
 )
 from eventum.logging.handlers import RoutingHandler
-from eventum.logging.processors import derive_extras, remove_keys_processor
+from eventum.logging.processors import (
+    derive_extras,
+    forward_processor,
+    remove_keys_processor,
+)
 
 if TYPE_CHECKING:
     from structlog.typing import Processor
@@ -52,6 +57,54 @@ def clear() -> None:
     structlog.reset_defaults()
 
 
+def use_forwarding(send: Callable[[str, dict[str, Any]], None]) -> None:
+    """Configure logging for forwarding log entries to another place
+    (e.g. from child process to the parent one) where they are emitted
+    using `emit_forwarded`.
+
+    Parameters
+    ----------
+    send : Callable[[str, dict[str, Any]], None]
+        Function that accepts method name and event dict of each log
+        entry.
+
+    """
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.format_exc_info,
+            forward_processor(send),
+        ],
+        cache_logger_on_first_use=True,
+    )
+
+
+def emit_forwarded(
+    logger: structlog.stdlib.BoundLogger,
+    method_name: str,
+    event_dict: dict[str, Any],
+) -> None:
+    """Emit log entry forwarded from another place.
+
+    Parameters
+    ----------
+    logger : structlog.stdlib.BoundLogger
+        Logger to use for emitting.
+
+    method_name : str
+        Name of logger method that originally emitted log entry.
+
+    event_dict : dict[str, Any]
+        Event dict of log entry.
+
+    """
+    # traceback is already rendered to the event dict
+    if method_name == 'exception':
+        method_name = 'error'
+
+    getattr(logger, method_name)(**event_dict)
+
+
 def use_stderr(level: LogLevel) -> None:
     """Configure logging for writing to console.
 
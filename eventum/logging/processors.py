@@ -4,6 +4,7 @@ import logging
 from collections.abc import Callable, Iterable
 from typing import Any
 
+from structlog import DropEvent
 from structlog.typing import EventDict, Processor
 
 
@@ -95,3 +96,48 @@ def remove_keys_processor(
         return event_dict
 
     return processor
+
+
+def forward_processor(
+    send: Callable[[str, dict[str, Any]], None],
+) -> Callable[[Any, str, EventDict], EventDict]:
+    """Return a processor function that passes log entries to the
+    provided function instead of rendering them and drops them.
+
+    Parameters
+    ----------
+    send : Callable[[str, dict[str, Any]], None]
+        Function that accepts method name and event dict, e.g. for
+        emitting log entries of child process in the parent process.
+
+    Returns
+    -------
+    Callable
+        A structlog processor function that forwards event dicts.
+
+    Notes
+    -----
+    Values of event dict that are not of primitive types are converted
+    to strings, so event dicts can be safely pickled.
+
+    """
+
+    def processor(
+        _: Any,
+        method_name: str,
+        event_dict: EventDict,
+    ) -> EventDict:
+        send(
+            method_name,
+            {
+                key: (
+                    value
+                    if isinstance(value, str | int | float | bool | None)
+                    else str(value)
+                )
+                for key, value in event_dict.items()
+            },
+        )
+        raise DropEvent
+
+    return processor
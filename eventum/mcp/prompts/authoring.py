@@ -15,7 +15,8 @@ for each plugin you pick:
    - Input (timing): `cron`/`timer` for steady rates, `time_patterns` \
 for realistic peaks, `linspace`/`timestamps` for a fixed or past \
 range, `static` for a fixed batch at start time, `http` for \
-request-driven ticks.
+request-driven ticks, `replay` for the original timing of a log file \
+replayed with the `replay` event plugin.
    - Event (content): pick the family. `template` renders Jinja - read \
 `eventum://templating/reference` for the in-template API (samples, \
 `module.rand`/`faker`/`mimesis`, `locals`/`shared`/`globals` state, \
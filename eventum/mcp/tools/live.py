@@ -191,8 +191,9 @@ async def register_generator(
     ``params`` supplies ``${params.*}`` substitutions. ``execution``
     overrides the server's default generation settings for this
     generator - any of live_mode, skip_past, timezone, keep_order,
-    max_concurrency, write_timeout, batch, queue. ``autostart``
-    controls whether the server starts it on the next boot.
+    max_concurrency, write_timeout, event_workers, shards, batch,
+    queue. ``autostart`` controls whether the server starts it on the
+    next boot.
     """
     if context.read_only:
         return read_only_failure({'id': generator_id})
@@ -547,7 +548,7 @@ def register(mcp: FastMCP, context: LiveContext, *, transport: str) -> None:
         execution : dict[str, Any] | None
             Overrides for the server's generation settings: live_mode,
             skip_past, timezone, keep_order, max_concurrency,
-            write_timeout, batch, queue.
+            write_timeout, event_workers, shards, batch, queue.
 
         autostart : bool
             Whether the generator starts on the next server boot.
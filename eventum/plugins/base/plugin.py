@@ -124,12 +124,17 @@ class PluginParams(TypedDict):
         Base path for all relative paths used in plugin configurations,
         if it is not provided then current working directory is used.
 
+    seed : NotRequired[int]
+        Seed for random streams of plugin, if it is not provided then
+        streams are seeded from OS entropy.
+
     """
 
     id: Required[int]
     ephemeral_name: NotRequired[str]
     ephemeral_type: NotRequired[str]
     base_path: NotRequired[Path]
+    seed: NotRequired[int]
 
 
 ConfigT = TypeVar('ConfigT', bound=(PluginConfig | RootModel))
@@ -171,6 +176,7 @@ class Plugin(ABC, Generic[ConfigT, ParamsT]):
         self._guid = str(uuid4())
 
         self._base_path: Path = params.get('base_path', Path.cwd())  # type: ignore[assignment]
+        self._seed: int | None = params.get('seed')  # type: ignore[assignment]
 
         self._logger = self.logger.bind(
             plugin_name=self.name,
@@ -1,15 +1,20 @@
 """Definition of base event plugin."""
 
 from abc import abstractmethod
-from datetime import datetime
-from typing import TypedDict, TypeVar, override
+from collections.abc import Iterator
+from datetime import datetime, tzinfo
+from typing import Any, ClassVar, TypedDict, TypeVar, override
 
+import numpy as np
+from numpy.typing import NDArray
 from pydantic import RootModel
 
 from eventum.plugins.base.plugin import Plugin, PluginParams
 from eventum.plugins.event.base.config import EventPluginConfig
 from eventum.plugins.event.exceptions import (
     PluginEventDroppedError,
+    PluginEventsExhaustedError,
+    PluginProduceError,
     PluginProduceSignal,
 )
 
@@ -31,6 +36,66 @@ class ProduceParams(TypedDict):
     tags: tuple[str, ...]
 
 
+class BatchProduceParams(TypedDict):
+    """Params for `produce_batch` method of `EventPlugin`.
+
+    Attributes
+    ----------
+    timestamps : NDArray[np.datetime64]
+        Naive timestamps of events in `timezone`.
+
+    timezone : tzinfo
+        Timezone of timestamps.
+
+    tags : list[tuple[str, ...]]
+        Tags from input plugins that generated timestamps, one item
+        for each timestamp.
+
+    """
+
+    timestamps: NDArray[np.datetime64]
+    timezone: tzinfo
+    tags: list[tuple[str, ...]]
+
+
+def iterate_produce_params(
+    params: BatchProduceParams,
+) -> Iterator[ProduceParams]:
+    """Iterate over params of single timestamps of the batch.
+
+    Parameters
+    ----------
+    params : BatchProduceParams
+        Params of the batch.
+
+    Yields
+    ------
+    ProduceParams
+        Params of single timestamp with aware timestamp.
+
+    Notes
+    -----
+    The same dictionary is yielded on each iteration with updated
+    values, so it must not be stored by consumer.
+
+    """
+    # timestamps are converted to python objects in numpy at once, so
+    # iteration does not create numpy scalars
+    naive_timestamps: list[datetime] = (
+        params['timestamps'].astype(dtype=datetime).tolist()
+    )
+    timezone = params['timezone']
+
+    single_params: ProduceParams = ProduceParams(
+        tags=...,  # type: ignore[typeddict-item]
+        timestamp=...,  # type: ignore[typeddict-item]
+    )
+    for timestamp, tags in zip(naive_timestamps, params['tags'], strict=True):
+        single_params['tags'] = tags
+        single_params['timestamp'] = timestamp.replace(tzinfo=timezone)
+        yield single_params
+
+
 class EventPluginParams(PluginParams):
     """Parameters for event plugin."""
 
@@ -43,7 +108,25 @@ ParamsT = TypeVar('ParamsT', bound=EventPluginParams)
 
 
 class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
-    """Base class for all event plugins."""
+    """Base class for all event plugins.
+
+    Other Parameters
+    ----------------
+    sequential : bool, default=False
+        Whether to mark event plugin as sequential. Sequential event
+        plugins produce events by consuming a single sequence (e.g.
+        lines of a file), so their replicas would produce the same
+        events and they cannot be replicated across event workers or
+        generator shards.
+
+    Attributes
+    ----------
+    is_sequential : bool
+        Whether the plugin is sequential.
+
+    """
+
+    is_sequential: ClassVar[bool] = False
 
     @override
     def __init__(self, config: ConfigT, params: ParamsT) -> None:
@@ -53,6 +136,16 @@ class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
         self._produce_failed = 0
         self._dropped = 0
 
+    def __init_subclass__(
+        cls,
+        *,
+        sequential: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls.is_sequential = sequential
+
     def produce(self, params: ProduceParams) -> list[str]:
         """Produce events with provided parameters.
 
@@ -95,6 +188,73 @@ class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
         self._produced += len(result)
         return result
 
+    def produce_batch(
+        self,
+        params: BatchProduceParams,
+    ) -> tuple[list[str], bool]:
+        """Produce events for a batch of timestamps.
+
+        Parameters
+        ----------
+        params : BatchProduceParams
+            Parameters for events producing.
+
+        Returns
+        -------
+        tuple[list[str], bool]
+            Produced events and whether the plugin is exhausted.
+
+        Notes
+        -----
+        Errors of producing events for single timestamps are logged
+        and do not interrupt the batch. If plugin is exhausted, events
+        produced before are returned. Default implementation calls
+        `produce` for each timestamp, plugins can override it to
+        handle the whole batch at once.
+
+        """
+        events: list[str] = []
+
+        for single_params in iterate_produce_params(params):
+            try:
+                events.extend(self.produce(single_params))
+            except PluginProduceError as e:
+                self._logger.error(str(e), **e.context)
+            except PluginEventsExhaustedError:
+                return events, True
+            except Exception as e:
+                self._logger.exception(
+                    'Unexpected error during event plugin execution',
+                    reason=str(e),
+                )
+
+        return events, False
+
+    def merge_counters(
+        self,
+        produced: int,
+        produce_failed: int,
+        dropped: int,
+    ) -> None:
+        """Add counters of plugin replicas producing events on behalf
+        of this plugin.
+
+        Parameters
+        ----------
+        produced : int
+            Number of produced events.
+
+        produce_failed : int
+            Number of unsuccessfully produced events.
+
+        dropped : int
+            Number of dropped events.
+
+        """
+        self._produced += produced
+        self._produce_failed += produce_failed
+        self._dropped += dropped
+
     @abstractmethod
     def _produce(self, params: ProduceParams) -> list[str]:
         """Produce events with provided parameters.
@@ -39,7 +39,13 @@ class ReplayEventPluginConfig(EventPluginConfig, frozen=True):
         Number of bytes to read from the file at a time. This parameter
         controls how often to access file and how many data will be
         stored in in memory. If 0 is provided then the entire file is
-        read at once.
+        read at once. Not used if `mmap` is enabled.
+
+    mmap : bool, default=False
+        Whether to map the file into memory instead of reading it by
+        chunks. Offsets of lines are indexed once and the index of
+        large files is persisted alongside the file, lines of small
+        files are decoded once and cached for repeated replaying.
 
     encoding : Encoding, default='utf_8'
         Encoding of the log file.
@@ -51,4 +57,5 @@ class ReplayEventPluginConfig(EventPluginConfig, frozen=True):
     timestamp_format: str | None = None
     repeat: bool = False
     chunk_size: int = Field(default=1_048_576, ge=0)
+    mmap: bool = False
     encoding: Encoding = Field(default='utf_8')
@@ -0,0 +1,97 @@
+"""Formatting of timestamps substituted into replayed lines."""
+
+from datetime import datetime, tzinfo
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Length of `YYYY-MM-DDTHH:MM:SS` part of ISO 8601 timestamp
+_ISO_SECONDS_LENGTH = 19
+
+
+def format_timestamp(timestamp: datetime, fmt: str | None) -> str:
+    """Format timestamp.
+
+    Parameters
+    ----------
+    timestamp : datetime
+        Timestamp to format.
+
+    fmt : str | None
+        Format string in C89 standard, if `None` then ISO 8601 format
+        is used.
+
+    Returns
+    -------
+    str
+        Formatted timestamp.
+
+    """
+    if fmt is None:
+        return timestamp.isoformat()
+
+    return timestamp.strftime(fmt)
+
+
+def format_timestamps(
+    timestamps: NDArray[np.datetime64],
+    timezone: tzinfo,
+    fmt: str | None,
+) -> list[str]:
+    """Format batch of timestamps.
+
+    Timestamps are grouped by seconds and each distinct second is
+    formatted only once, microseconds are then added to ISO 8601
+    timestamps by concatenation. Formats with microseconds directive
+    (`%f`) are applied to each timestamp.
+
+    Parameters
+    ----------
+    timestamps : NDArray[np.datetime64]
+        Naive timestamps in `timezone`.
+
+    timezone : tzinfo
+        Timezone of timestamps.
+
+    fmt : str | None
+        Format string in C89 standard, if `None` then ISO 8601 format
+        is used.
+
+    Returns
+    -------
+    list[str]
+        Formatted timestamps.
+
+    """
+    if not len(timestamps):
+        return []
+
+    timestamps = timestamps.astype('datetime64[us]', copy=False)
+
+    if fmt is not None and '%f' in fmt:
+        return [
+            ts.replace(tzinfo=timezone).strftime(fmt)
+            for ts in timestamps.astype(datetime).tolist()
+        ]
+
+    seconds = timestamps.astype('datetime64[s]')
+    unique_seconds, inverse = np.unique(seconds, return_inverse=True)
+
+    formatted = [
+        format_timestamp(ts.replace(tzinfo=timezone), fmt)
+        for ts in unique_seconds.astype(datetime).tolist()
+    ]
+    result: list[str] = [formatted[i] for i in inverse.tolist()]
+
+    if fmt is not None:
+        return result
+
+    microseconds = (timestamps - seconds).astype(np.int64)
+    for i in np.flatnonzero(microseconds).tolist():
+        value = result[i]
+        result[i] = (
+            f'{value[:_ISO_SECONDS_LENGTH]}.{microseconds[i]:06d}'
+            f'{value[_ISO_SECONDS_LENGTH:]}'
+        )
+
+    return result
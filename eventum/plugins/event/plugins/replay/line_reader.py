@@ -0,0 +1,253 @@
+"""Reader of lines of file mapped into memory."""
+
+import mmap
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import suppress
+from pathlib import Path
+
+import numpy as np
+import structlog
+from numpy.typing import NDArray
+
+from eventum.utils.byte_search import find_line_starts
+
+logger = structlog.stdlib.get_logger()
+
+# Max size of file (in bytes) for caching its decoded lines in memory
+# after the first reading
+DECODED_LINES_CACHE_MAX_SIZE = 64 * 2**20
+
+# Min size of file (in bytes) for persisting its offsets index, index
+# of smaller files is cheap to build each time
+PERSISTED_INDEX_MIN_SIZE = 16 * 2**20
+
+# Suffix of file with offsets index persisted alongside the source file
+INDEX_FILE_SUFFIX = '.offsets.npz'
+
+
+def _get_index_path(path: Path) -> Path:
+    """Get path of offsets index file of the source file.
+
+    Parameters
+    ----------
+    path : Path
+        Path to source file.
+
+    Returns
+    -------
+    Path
+        Path to index file.
+
+    """
+    return path.with_name(f'.{path.name}{INDEX_FILE_SUFFIX}')
+
+
+def _load_index(path: Path, stat: os.stat_result) -> NDArray[np.int64] | None:
+    """Load offsets index of file if it is persisted for the current
+    version of file.
+
+    Parameters
+    ----------
+    path : Path
+        Path to source file.
+
+    stat : os.stat_result
+        Status of source file.
+
+    Returns
+    -------
+    NDArray[np.int64] | None
+        Start offsets of lines or `None` if index is missing or stale.
+
+    """
+    try:
+        with np.load(_get_index_path(path), allow_pickle=False) as index:
+            if (
+                int(index['size']) != stat.st_size
+                or int(index['mtime_ns']) != stat.st_mtime_ns
+            ):
+                return None
+
+            return index['starts'].astype(np.int64, copy=False)
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError) as e:
+        logger.debug(
+            'Failed to load offsets index of file',
+            reason=str(e),
+            file_path=str(path),
+        )
+        return None
+
+
+def _save_index(
+    path: Path,
+    stat: os.stat_result,
+    starts: NDArray[np.int64],
+) -> None:
+    """Persist offsets index of file, failures are ignored as index
+    is only an optimization.
+
+    Parameters
+    ----------
+    path : Path
+        Path to source file.
+
+    stat : os.stat_result
+        Status of source file.
+
+    starts : NDArray[np.int64]
+        Start offsets of lines.
+
+    """
+    index_path = _get_index_path(path)
+    temp_path: Path | None = None
+    try:
+        # index is written to temporary file and then renamed, so
+        # readers never see partially written index
+        with tempfile.NamedTemporaryFile(
+            dir=index_path.parent,
+            prefix=index_path.name,
+            delete=False,
+        ) as f:
+            temp_path = Path(f.name)
+            np.savez(
+                f,
+                starts=starts,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+            )
+        temp_path.replace(index_path)
+    except OSError as e:
+        if temp_path is not None:
+            with suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+        logger.debug(
+            'Failed to save offsets index of file',
+            reason=str(e),
+            file_path=str(path),
+        )
+
+
+class MappedLineReader[T]:
+    """Reader of lines of file mapped into memory.
+
+    Start offsets of lines are found once and persisted alongside the
+    file (keyed by its size and modification time) if file is at least
+    `PERSISTED_INDEX_MIN_SIZE` bytes, so lines are read by slicing
+    mapped file without scanning it again. Lines are parsed right
+    after decoding (e.g. split for substitutions), parsed lines of files
+    up to `DECODED_LINES_CACHE_MAX_SIZE` bytes are cached after the
+    first reading, so repeated reading does not decode and parse them
+    again.
+
+    Lines are separated by line feed byte, trailing line feed and
+    carriage return characters are stripped from decoded lines.
+
+    Parameters
+    ----------
+    path : Path
+        Path to file.
+
+    encoding : str
+        Encoding of file.
+
+    parse : Callable[[str], T]
+        Function for parsing decoded lines.
+
+    Raises
+    ------
+    OSError
+        If file cannot be mapped.
+
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encoding: str,
+        parse: Callable[[str], T],
+    ) -> None:
+        """Map file and load or build its offsets index.
+
+        Parameters
+        ----------
+        path : Path
+            Path to file.
+
+        encoding : str
+            Encoding of file.
+
+        parse : Callable[[str], T]
+            Function for parsing decoded lines.
+
+        Raises
+        ------
+        OSError
+            If file cannot be mapped.
+
+        """
+        self._encoding = encoding
+        self._parse = parse
+
+        with path.open('rb') as f:
+            stat = os.fstat(f.fileno())
+            self._data: mmap.mmap | bytes = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if stat.st_size
+                else b''
+            )
+
+        persist_index = stat.st_size >= PERSISTED_INDEX_MIN_SIZE
+
+        starts = _load_index(path, stat) if persist_index else None
+        if starts is None:
+            starts = find_line_starts(self._data)
+            if persist_index:
+                _save_index(path, stat, starts)
+
+        self._starts = starts
+        self._ends = (
+            np.append(starts[1:], len(self._data)) if len(starts) else starts
+        )
+
+        self._cache_lines = len(self._data) <= DECODED_LINES_CACHE_MAX_SIZE
+        self._lines: list[T] | None = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _decode(self, start: int, end: int) -> T:
+        """Decode and parse line with specified offsets."""
+        return self._parse(
+            self._data[start:end].decode(self._encoding).rstrip('\n\r'),
+        )
+
+    def __iter__(self) -> Iterator[T]:
+        if self._lines is not None:
+            yield from self._lines
+            return
+
+        decode = self._decode
+        lines = (
+            decode(start, end)
+            for start, end in zip(
+                self._starts.tolist(),
+                self._ends.tolist(),
+                strict=True,
+            )
+        )
+
+        if not self._cache_lines:
+            yield from lines
+            return
+
+        cached: list[T] = []
+        for line in lines:
+            cached.append(line)
+            yield line
+
+        self._lines = cached
@@ -3,10 +3,11 @@
 import os
 import re
 from collections.abc import Iterator
-from datetime import datetime
+from itertools import islice
 from typing import cast, override
 
 from eventum.plugins.event.base.plugin import (
+    BatchProduceParams,
     EventPlugin,
     EventPluginParams,
     ProduceParams,
@@ -16,11 +17,20 @@ from eventum.plugins.event.exceptions import (
     PluginProduceError,
 )
 from eventum.plugins.event.plugins.replay.config import ReplayEventPluginConfig
+from eventum.plugins.event.plugins.replay.formatting import (
+    format_timestamp,
+    format_timestamps,
+)
+from eventum.plugins.event.plugins.replay.line_reader import MappedLineReader
 from eventum.plugins.exceptions import PluginConfigurationError
 
+# Parts of line before and after the substituted timestamp
+type LineTemplate = tuple[str, str]
+
 
 class ReplayEventPlugin(
     EventPlugin[ReplayEventPluginConfig, EventPluginParams],
+    sequential=True,
 ):
     """Event plugin for producing events using existing log
     file by replaying it line by line.
@@ -38,6 +48,7 @@ class ReplayEventPlugin(
         self._check_file_existence()
 
         self._pattern = self._initialize_pattern()
+        self._reader = self._initialize_reader()
         self._lines = self._get_next_line()
         self._last_read_position = 0
 
@@ -83,6 +94,41 @@ class ReplayEventPlugin(
         else:
             return None
 
+    def _initialize_reader(
+        self,
+    ) -> MappedLineReader[str | LineTemplate] | None:
+        """Initialize reader of mapped file if it is enabled.
+
+        Returns
+        -------
+        MappedLineReader[str | LineTemplate] | None
+            Reader of mapped file or none.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If file cannot be mapped.
+
+        """
+        if not self._config.mmap:
+            return None
+
+        try:
+            return MappedLineReader(
+                path=self._filepath,
+                encoding=self._config.encoding,
+                parse=self._parse_line,
+            )
+        except OSError as e:
+            msg = 'Failed to map file into memory'
+            raise PluginConfigurationError(
+                msg,
+                context={
+                    'reason': str(e),
+                    'file_path': str(self._filepath),
+                },
+            ) from None
+
     def _read_next_lines(self, hint: int = 0) -> list[str]:
         """Read next lines from the file.
 
@@ -141,13 +187,14 @@ class ReplayEventPlugin(
         )
         return lines
 
-    def _get_next_line(self) -> Iterator[str]:
-        """Get next line.
+    def _get_next_line(self) -> Iterator[str | LineTemplate]:
+        """Get next line split around position of timestamp.
 
         Yields
         ------
-        str
-            Line.
+        str | LineTemplate
+            Line split around position of timestamp or original line
+            if timestamp is not substituted into it.
 
         Notes
         -----
@@ -155,8 +202,19 @@ class ReplayEventPlugin(
 
         """
         while True:
-            while lines := self._read_next_lines(self._config.chunk_size):
-                yield from lines
+            if self._reader is not None:
+                yield from self._reader
+
+                if not len(self._reader):
+                    break
+
+                self._logger.info(
+                    'End of file is reached',
+                    file_path=str(self._filepath),
+                )
+            else:
+                while lines := self._read_next_lines(self._config.chunk_size):
+                    yield from map(self._parse_line, lines)
 
             if not self._config.repeat:
                 break
@@ -168,44 +226,20 @@ class ReplayEventPlugin(
 
             self._last_read_position = 0
 
-    def _format_timestamp(self, timestamp: datetime) -> str:
-        """Format timestamp to specified format.
-
-        Parameters
-        ----------
-        timestamp : datetime
-            Timestamp to format.
-
-        Returns
-        -------
-        str
-            Formatted timestamp.
-
-        """
-        if self._config.timestamp_format is None:
-            return timestamp.isoformat()
-        return timestamp.strftime(
-            self._config.timestamp_format,
-        )
-
-    def _substitute_string(
+    def _split_string(
         self,
         message: str,
-        string: str,
         pattern: re.Pattern,
         group_name: str,
-    ) -> str:
-        """Substitute string into original message in position defined
-        by pattern named group.
+    ) -> LineTemplate:
+        """Split message around position defined by pattern named
+        group.
 
         Parameters
         ----------
         message : str
             Original message.
 
-        string : str
-            String to substitute.
-
         pattern : re.Pattern
             Pattern that defines position of substitution.
 
@@ -214,13 +248,13 @@ class ReplayEventPlugin(
 
         Returns
         -------
-        str
-            New message with substituted string.
+        LineTemplate
+            Parts of message before and after the group.
 
         Raises
         ------
         ValueError
-            If substitution is failed.
+            If split is failed.
 
         """
         msg_match = pattern.search(message)
@@ -240,24 +274,30 @@ class ReplayEventPlugin(
             msg = f'Group `{group_name}` did not contribute to the match'
             raise ValueError(msg)
 
-        return message[:match_start] + string + message[match_end:]
+        return (message[:match_start], message[match_end:])
 
-    @override
-    def _produce(self, params: ProduceParams) -> list[str]:
-        try:
-            line = next(self._lines)
-        except StopIteration:
-            raise PluginEventsExhaustedError from None
+    def _parse_line(self, line: str) -> str | LineTemplate:
+        """Split line around position of timestamp defined by timestamp
+        pattern.
 
-        if self._pattern is None:
-            return [line]
+        Parameters
+        ----------
+        line : str
+            Original line.
+
+        Returns
+        -------
+        str | LineTemplate
+            Parts of line before and after timestamp or original line
+            if pattern is not set or split is failed.
 
-        fmt_timestamp = self._format_timestamp(timestamp=params['timestamp'])
+        """
+        if self._pattern is None:
+            return line
 
         try:
-            line = self._substitute_string(
+            return self._split_string(
                 message=line,
-                string=fmt_timestamp,
                 pattern=self._pattern,
                 group_name='timestamp',
             )
@@ -266,5 +306,54 @@ class ReplayEventPlugin(
                 'Failed to substitute timestamp into original message',
                 reason=str(e),
             )
+            return line
+
+    @override
+    def _produce(self, params: ProduceParams) -> list[str]:
+        try:
+            line = next(self._lines)
+        except StopIteration:
+            raise PluginEventsExhaustedError from None
+
+        if isinstance(line, str):
+            return [line]
+
+        prefix, suffix = line
+        timestamp = format_timestamp(
+            params['timestamp'],
+            self._config.timestamp_format,
+        )
+        return [prefix + timestamp + suffix]
+
+    @override
+    def produce_batch(
+        self,
+        params: BatchProduceParams,
+    ) -> tuple[list[str], bool]:
+        count = len(params['timestamps'])
+
+        try:
+            lines = list(islice(self._lines, count))
+        except PluginProduceError as e:
+            self._logger.error(str(e), **e.context)
+            self._produce_failed += count
+            return [], False
+
+        exhausted = len(lines) < count
+
+        if self._pattern is None:
+            events = cast('list[str]', lines)
+        else:
+            # timestamps are formatted only when they are substituted
+            timestamps = format_timestamps(
+                params['timestamps'][: len(lines)],
+                params['timezone'],
+                self._config.timestamp_format,
+            )
+            events = [
+                line if isinstance(line, str) else line[0] + ts + line[1]
+                for line, ts in zip(lines, timestamps, strict=True)
+            ]
 
-        return [line]
+        self._produced += len(events)
+        return events, exhausted
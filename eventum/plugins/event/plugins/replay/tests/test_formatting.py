@@ -0,0 +1,67 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from eventum.plugins.event.plugins.replay.formatting import (
+    format_timestamp,
+    format_timestamps,
+)
+
+TIMEZONE = ZoneInfo('Europe/Moscow')
+
+
+def expected(timestamps, fmt):
+    return [
+        format_timestamp(ts.replace(tzinfo=TIMEZONE), fmt)
+        for ts in timestamps.astype('datetime64[us]').astype(datetime).tolist()
+    ]
+
+
+@pytest.mark.parametrize(
+    'fmt',
+    [None, '%Y-%m-%d %H:%M:%S', '%d/%b/%Y:%H:%M:%S %z', '%H:%M:%S.%f'],
+)
+def test_format_timestamps(fmt):
+    timestamps = np.array(
+        [
+            '2024-01-01T00:00:00',
+            '2024-01-01T00:00:00.000500',
+            '2024-01-01T00:00:00.250000',
+            '2024-01-01T00:00:01',
+            '2024-01-01T00:00:00',
+        ],
+        dtype='datetime64[us]',
+    )
+
+    assert format_timestamps(timestamps, TIMEZONE, fmt) == expected(
+        timestamps,
+        fmt,
+    )
+
+
+def test_format_timestamps_iso():
+    timestamps = np.array(
+        ['2024-01-01T00:00:00', '2024-01-01T00:00:00.123456'],
+        dtype='datetime64[us]',
+    )
+
+    assert format_timestamps(timestamps, TIMEZONE, None) == [
+        '2024-01-01T00:00:00+03:00',
+        '2024-01-01T00:00:00.123456+03:00',
+    ]
+
+
+def test_format_timestamps_empty():
+    timestamps = np.array([], dtype='datetime64[us]')
+
+    assert format_timestamps(timestamps, TIMEZONE, None) == []
+
+
+def test_format_timestamps_nanoseconds_precision():
+    timestamps = np.array(['2024-01-01T00:00:00.5'], dtype='datetime64[ns]')
+
+    assert format_timestamps(timestamps, TIMEZONE, None) == [
+        '2024-01-01T00:00:00.500000+03:00',
+    ]
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+import eventum.plugins.event.plugins.replay.line_reader as line_reader_module
+from eventum.plugins.event.plugins.replay.line_reader import MappedLineReader
+
+
+def test_lines(tmp_path):
+    path = tmp_path / 'test.log'
+    path.write_bytes(b'first\r\n\nthird\nlast')
+
+    reader = MappedLineReader(path, 'utf_8', str)
+
+    assert len(reader) == 4
+    assert list(reader) == ['first', '', 'third', 'last']
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'test.log'
+    path.touch()
+
+    reader = MappedLineReader(path, 'utf_8', str)
+
+    assert len(reader) == 0
+    assert list(reader) == []
+
+
+def test_decoded_lines_are_cached(tmp_path):
+    path = tmp_path / 'test.log'
+    path.write_text('a\nb\n')
+
+    reader = MappedLineReader(path, 'utf_8', str)
+
+    assert list(reader) == ['a', 'b']
+    assert reader._lines == ['a', 'b']
+    assert list(reader) == ['a', 'b']
+
+
+def test_decoded_lines_of_large_file_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        line_reader_module,
+        'DECODED_LINES_CACHE_MAX_SIZE',
+        1,
+    )
+    path = tmp_path / 'test.log'
+    path.write_text('a\nb\n')
+
+    reader = MappedLineReader(path, 'utf_8', str)
+
+    assert list(reader) == ['a', 'b']
+    assert reader._lines is None
+
+
+@pytest.fixture
+def persisted_index(monkeypatch):
+    monkeypatch.setattr(line_reader_module, 'PERSISTED_INDEX_MIN_SIZE', 0)
+
+
+def test_index_is_persisted(tmp_path, persisted_index):
+    path = tmp_path / 'test.log'
+    path.write_text('a\nbb\nccc\n')
+
+    MappedLineReader(path, 'utf_8', str)
+    index_path = tmp_path / '.test.log.offsets.npz'
+    assert index_path.exists()
+
+    # persisted index is used instead of scanning file
+    stat = path.stat()
+    path.write_text('x\nyy\nzzz\n')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert list(MappedLineReader(path, 'utf_8', str)) == ['x', 'yy', 'zzz']
+
+
+def test_stale_index_is_rebuilt(tmp_path, persisted_index):
+    path = tmp_path / 'test.log'
+    path.write_text('a\nbb\n')
+    MappedLineReader(path, 'utf_8', str)
+
+    path.write_text('a\nb\nc\n')
+
+    assert list(MappedLineReader(path, 'utf_8', str)) == ['a', 'b', 'c']
+
+
+def test_corrupted_index_is_ignored(tmp_path, persisted_index):
+    path = tmp_path / 'test.log'
+    path.write_text('a\nbb\n')
+    (tmp_path / '.test.log.offsets.npz').write_text('garbage')
+
+    assert list(MappedLineReader(path, 'utf_8', str)) == ['a', 'bb']
+
+
+def test_parsed_lines_are_cached(tmp_path):
+    path = tmp_path / 'test.log'
+    path.write_text('a\nb\n')
+    parsed = []
+
+    def parse(line):
+        parsed.append(line)
+        return line.upper()
+
+    reader = MappedLineReader(path, 'utf_8', parse)
+
+    assert list(reader) == ['A', 'B']
+    assert list(reader) == ['A', 'B']
+    assert parsed == ['a', 'b']
@@ -1,6 +1,8 @@
 from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pytest
 
 from eventum.plugins.event.plugins.replay.config import ReplayEventPluginConfig
@@ -149,3 +151,122 @@ def test_plugin_missing_file():
             ),
             params={'id': 1},
         )
+
+
+def test_plugin_produce_batch():
+    plugin = ReplayEventPlugin(
+        config=ReplayEventPluginConfig(
+            path=STATIC_DIR / 'example',
+            timestamp_pattern=r'\[(?P<timestamp>.*?)\]',
+            timestamp_format='%Y',
+        ),
+        params={'id': 1},
+    )
+    timestamps = np.full(6, np.datetime64('2025-01-01T00:00:00', 'us'))
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'timezone': ZoneInfo('UTC'),
+            'tags': [('a',)] * 6,
+        }
+    )
+
+    assert not exhausted
+    assert events[:2] == [
+        '127.0.0.1 - - [2025] "GET /index.html HTTP/1.1" 200 1024',
+        '127.0.0.1 - - [2025] "POST /form HTTP/1.1" 201 512',
+    ]
+    assert len(events) == 6
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'timezone': ZoneInfo('UTC'),
+            'tags': [('a',)] * 6,
+        }
+    )
+
+    assert exhausted
+    assert len(events) == 4
+    assert plugin.produced == 10
+
+
+def test_plugin_mmap_repeat():
+    plugin = ReplayEventPlugin(
+        config=ReplayEventPluginConfig(
+            path=STATIC_DIR / 'example',
+            timestamp_pattern=r'\[(?P<timestamp>.*?)\]',
+            repeat=True,
+            mmap=True,
+        ),
+        params={'id': 1},
+    )
+    reference_plugin = ReplayEventPlugin(
+        config=ReplayEventPluginConfig(
+            path=STATIC_DIR / 'example',
+            timestamp_pattern=r'\[(?P<timestamp>.*?)\]',
+            repeat=True,
+        ),
+        params={'id': 1},
+    )
+
+    now = datetime.now().astimezone()
+    for _ in range(25):
+        assert plugin.produce(
+            params={'timestamp': now, 'tags': ('a',)}
+        ) == reference_plugin.produce(
+            params={'timestamp': now, 'tags': ('a',)}
+        )
+
+
+def test_plugin_mmap_produce_batch():
+    plugin = ReplayEventPlugin(
+        config=ReplayEventPluginConfig(
+            path=STATIC_DIR / 'example',
+            timestamp_pattern=r'\[(?P<timestamp>.*?)\]',
+            timestamp_format='%Y',
+            mmap=True,
+        ),
+        params={'id': 1},
+    )
+    timestamps = np.full(6, np.datetime64('2025-01-01T00:00:00', 'us'))
+    params = {
+        'timestamps': timestamps,
+        'timezone': ZoneInfo('UTC'),
+        'tags': [('a',)] * 6,
+    }
+
+    events, exhausted = plugin.produce_batch(params=params)
+
+    assert not exhausted
+    assert events[:2] == [
+        '127.0.0.1 - - [2025] "GET /index.html HTTP/1.1" 200 1024',
+        '127.0.0.1 - - [2025] "POST /form HTTP/1.1" 201 512',
+    ]
+
+    events, exhausted = plugin.produce_batch(params=params)
+
+    assert exhausted
+    assert len(events) == 4
+
+
+def test_plugin_mmap_empty_file(tmp_path):
+    path = tmp_path / 'empty.log'
+    path.touch()
+
+    plugin = ReplayEventPlugin(
+        config=ReplayEventPluginConfig(path=path, repeat=True, mmap=True),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': np.full(2, np.datetime64('2025-01-01', 'us')),
+            'timezone': ZoneInfo('UTC'),
+            'tags': [('a',)] * 2,
+        }
+    )
+
+    assert exhausted
+    assert events == []
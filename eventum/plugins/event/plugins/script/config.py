@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from pydantic import Field
+
 from eventum.plugins.event.base.config import EventPluginConfig
 
 
@@ -13,6 +15,19 @@ class ScriptEventPluginConfig(EventPluginConfig, frozen=True):
     path : Path
         Path to script.
 
+    workers : int, default=0
+        Number of worker processes running the script, each process
+        imports the script separately. If 0 is provided then script is
+        run in the generator process.
+
+    batch_size : int, default=1000
+        Max number of timestamps sent to worker process at once,
+        batches of timestamps are split into parts of this size that
+        are processed by workers concurrently. Not used if `workers`
+        is 0.
+
     """
 
     path: Path
+    workers: int = Field(default=0, ge=0)
+    batch_size: int = Field(default=1000, ge=1)
@@ -1,21 +1,31 @@
 """Definition of replay event plugin."""
 
+import weakref
 from collections.abc import Callable
+from functools import partial
 from importlib import util
-from typing import override
+from typing import Any, override
 
+import eventum.logging.config as logconf
 from eventum.plugins.event.base.plugin import (
+    BatchProduceParams,
     EventPlugin,
     EventPluginParams,
     ProduceParams,
 )
 from eventum.plugins.event.exceptions import (
+    PluginEventDroppedError,
+    PluginEventsExhaustedError,
     PluginProduceError,
     PluginProduceSignal,
 )
 from eventum.plugins.event.plugins.script.config import ScriptEventPluginConfig
+from eventum.plugins.event.plugins.script.worker_pool import ProcessWorkerPool
 from eventum.plugins.exceptions import PluginConfigurationError
 
+type ProduceFunction = Callable[[ProduceParams], str | list[str]]
+type BatchProduceFunction = Callable[[BatchProduceParams], list[str]]
+
 
 class ScriptEventPlugin(
     EventPlugin[ScriptEventPluginConfig, EventPluginParams],
@@ -32,9 +42,26 @@ class ScriptEventPlugin(
     ```
     For more information see documentation string of `ProduceParams`.
 
+    User script can also include function producing events for the
+    whole batch of timestamps at once (e.g. to vectorize generation
+    logic using numpy), in this case it is used instead of `produce`
+    function for batches:
+    ```
+    def produce_batch(params: BatchProduceParams) -> list[str]:
+        ...
+    ```
+    For more information see documentation string of
+    `BatchProduceParams`.
+
+    If worker processes are configured, batches are produced by
+    replicas of the plugin running in the pool of worker processes, so
+    script does not block the generator process. Single timestamps are
+    still produced in the generator process.
+
     """
 
     _FUNCTION_NAME = 'produce'
+    _BATCH_FUNCTION_NAME = 'produce_batch'
 
     @override
     def __init__(
@@ -45,15 +72,61 @@ class ScriptEventPlugin(
         super().__init__(config, params)
 
         self._logger.debug('Importing function from external module')
-        self._function = self._import_function()
+        self._function, self._batch_function = self._import_functions()
+        self._pool = self._initialize_pool(params)
+
+    def _initialize_pool(
+        self,
+        params: EventPluginParams,
+    ) -> ProcessWorkerPool | None:
+        """Initialize pool of worker processes if it is enabled.
+
+        Parameters
+        ----------
+        params : EventPluginParams
+            Parameters of the plugin that are passed to its replicas.
+
+        Returns
+        -------
+        ProcessWorkerPool | None
+            Pool of worker processes or none.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If any of workers fails to initialize.
+
+        """
+        if self._config.workers == 0:
+            return None
+
+        self._logger.debug(
+            'Starting worker processes',
+            count=self._config.workers,
+        )
+        pool = ProcessWorkerPool(
+            factory=partial(
+                ScriptEventPlugin,
+                config=self._config.model_copy(update={'workers': 0}),
+                params=params,
+            ),
+            workers=self._config.workers,
+            chunk_size=self._config.batch_size,
+        )
+        weakref.finalize(self, pool.close)
+
+        return pool
 
-    def _import_function(self) -> Callable[[ProduceParams], str | list[str]]:
-        """Import the function from the user defined module.
+    def _import_functions(
+        self,
+    ) -> tuple[ProduceFunction, BatchProduceFunction | None]:
+        """Import the functions from the user defined module.
 
         Returns
         -------
-        Callable[[ProduceParams], str | list[str]]
-            Function.
+        tuple[ProduceFunction, BatchProduceFunction | None]
+            Function producing events for single timestamp and
+            function producing events for batch if it is defined.
 
         Raises
         ------
@@ -115,23 +188,33 @@ class ScriptEventPlugin(
                 context={'file_path': str(script_path)},
             ) from None
 
-        return function
+        batch_function = getattr(
+            module,
+            ScriptEventPlugin._BATCH_FUNCTION_NAME,
+            None,
+        )
 
-    @override
-    def _produce(self, params: ProduceParams) -> list[str]:
-        try:
-            result = self._function(params)
-        except PluginProduceSignal:
-            raise
-        except Exception as e:
-            msg = 'Exception occurred during function execution'
-            raise PluginProduceError(
-                msg,
-                context={
-                    'reason': f'{e.__class__.__name__}: {e}',
-                },
-            ) from e
+        return function, batch_function
+
+    def _validate_result(self, result: Any) -> list[str]:
+        """Validate result returned by user function.
+
+        Parameters
+        ----------
+        result : Any
+            Result returned by function.
+
+        Returns
+        -------
+        list[str]
+            Produced events.
+
+        Raises
+        ------
+        PluginProduceError
+            If result is not a string or list of strings.
 
+        """
         if isinstance(result, str):
             return [result]
         if isinstance(result, list):
@@ -160,3 +243,118 @@ class ScriptEventPlugin(
             msg,
             context={},
         )
+
+    def _call(
+        self,
+        function: ProduceFunction | BatchProduceFunction,
+        params: Any,
+    ) -> list[str]:
+        """Call user function and validate its result.
+
+        Parameters
+        ----------
+        function : ProduceFunction | BatchProduceFunction
+            Function to call.
+
+        params : Any
+            Parameters to pass to the function.
+
+        Returns
+        -------
+        list[str]
+            Produced events.
+
+        Raises
+        ------
+        PluginProduceError
+            If exception is raised in the function or it returned
+            result of invalid type.
+
+        """
+        try:
+            result = function(params)
+        except PluginProduceSignal:
+            raise
+        except Exception as e:
+            msg = 'Exception occurred during function execution'
+            raise PluginProduceError(
+                msg,
+                context={
+                    'reason': f'{e.__class__.__name__}: {e}',
+                },
+            ) from e
+
+        return self._validate_result(result)
+
+    @override
+    def _produce(self, params: ProduceParams) -> list[str]:
+        return self._call(self._function, params)
+
+    def _produce_batch_in_pool(
+        self,
+        pool: ProcessWorkerPool,
+        params: BatchProduceParams,
+    ) -> tuple[list[str], bool]:
+        """Produce events for batch of timestamps in worker processes.
+
+        Parameters
+        ----------
+        pool : ProcessWorkerPool
+            Pool of worker processes.
+
+        params : BatchProduceParams
+            Parameters for events producing.
+
+        Returns
+        -------
+        tuple[list[str], bool]
+            Produced events and whether the plugin is exhausted.
+
+        """
+        try:
+            result = pool.produce_batch(params)
+        except Exception as e:  # noqa: BLE001
+            self._produce_failed += len(params['timestamps'])
+            self._logger.error(
+                'Failed to produce events in worker process',
+                reason=f'{e.__class__.__name__}: {e}',
+            )
+            return [], False
+
+        for method_name, event_dict in result.logs:
+            logconf.emit_forwarded(self._logger, method_name, event_dict)
+
+        self.merge_counters(
+            produced=result.produced,
+            produce_failed=result.produce_failed,
+            dropped=result.dropped,
+        )
+        return result.events, result.exhausted
+
+    @override
+    def produce_batch(
+        self,
+        params: BatchProduceParams,
+    ) -> tuple[list[str], bool]:
+        if self._pool is not None:
+            return self._produce_batch_in_pool(self._pool, params)
+
+        if self._batch_function is None:
+            return super().produce_batch(params)
+
+        count = len(params['timestamps'])
+
+        try:
+            events = self._call(self._batch_function, params)
+        except PluginEventDroppedError:
+            self._dropped += count
+            return [], False
+        except PluginEventsExhaustedError:
+            return [], True
+        except PluginProduceError as e:
+            self._produce_failed += count
+            self._logger.error(str(e), **e.context)
+            return [], False
+
+        self._produced += len(events)
+        return events, False
@@ -0,0 +1,11 @@
+def produce(params: dict) -> str | list[str]:
+    return 'single'
+
+
+def produce_batch(params: dict) -> list[str]:
+    years = params['timestamps'].astype('datetime64[Y]').astype(int) + 1970
+
+    return [
+        f'{year} {tags[0]}'
+        for year, tags in zip(years.tolist(), params['tags'], strict=True)
+    ]
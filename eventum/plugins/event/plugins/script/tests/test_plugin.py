@@ -1,6 +1,8 @@
 from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pytest
 
 from eventum.plugins.event.exceptions import PluginProduceError
@@ -80,3 +82,170 @@ def test_plugin_unexistent_file():
             config=ScriptEventPluginConfig(path=STATIC_DIR / 'abcdefg.py'),
             params={'id': 1},
         )
+
+
+def test_plugin_produce_batch():
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(path=STATIC_DIR / 'batch_events.py'),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': np.array(
+                ['2024-05-01T00:00:00', '2025-05-01T00:00:00'],
+                dtype='datetime64[us]',
+            ),
+            'timezone': ZoneInfo('UTC'),
+            'tags': [('a',), ('b',)],
+        }
+    )
+
+    assert events == ['2024 a', '2025 b']
+    assert not exhausted
+    assert plugin.produced == 2
+
+
+def test_plugin_produce_batch_without_batch_function():
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(path=STATIC_DIR / 'events_list.py'),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': np.array(
+                ['2025-05-01T00:00:00'],
+                dtype='datetime64[us]',
+            ),
+            'timezone': ZoneInfo('UTC'),
+            'tags': [('a',)],
+        }
+    )
+
+    assert events == ['2025-05-01T00:00:00+00:00', 'a']
+    assert not exhausted
+
+
+def test_plugin_produce_batch_exception_in_function():
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(
+            path=STATIC_DIR / 'exception_in_function.py'
+        ),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': np.array(
+                ['2025-05-01T00:00:00', '2025-05-01T00:00:01'],
+                dtype='datetime64[us]',
+            ),
+            'timezone': ZoneInfo('UTC'),
+            'tags': [('a',), ('a',)],
+        }
+    )
+
+    assert events == []
+    assert not exhausted
+    assert plugin.produce_failed == 2
+
+
+@pytest.fixture
+def batch_params():
+    return {
+        'timestamps': np.array(
+            [
+                '2024-05-01T00:00:00',
+                '2025-05-01T00:00:00',
+                '2026-05-01T00:00:00',
+            ],
+            dtype='datetime64[us]',
+        ),
+        'timezone': ZoneInfo('UTC'),
+        'tags': [('a',), ('b',), ('c',)],
+    }
+
+
+def test_plugin_produce_batch_in_workers(batch_params):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(
+            path=STATIC_DIR / 'batch_events.py',
+            workers=2,
+            batch_size=2,
+        ),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(params=batch_params)
+
+    assert events == ['2024 a', '2025 b', '2026 c']
+    assert not exhausted
+    assert plugin.produced == 3
+
+    plugin._pool.close()
+
+
+def test_plugin_produce_batch_in_workers_without_batch_function(
+    batch_params,
+):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(
+            path=STATIC_DIR / 'events_list.py',
+            workers=2,
+            batch_size=1,
+        ),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(params=batch_params)
+
+    assert events == [
+        '2024-05-01T00:00:00+00:00',
+        'a',
+        '2025-05-01T00:00:00+00:00',
+        'b',
+        '2026-05-01T00:00:00+00:00',
+        'c',
+    ]
+    assert not exhausted
+    assert plugin.produced == 6
+
+    plugin._pool.close()
+
+
+def test_plugin_produce_batch_in_workers_exception_in_function(
+    batch_params,
+):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(
+            path=STATIC_DIR / 'exception_in_function.py',
+            workers=1,
+        ),
+        params={'id': 1},
+    )
+
+    events, exhausted = plugin.produce_batch(params=batch_params)
+
+    assert events == []
+    assert not exhausted
+    assert plugin.produce_failed == 3
+
+    plugin._pool.close()
+
+
+def test_plugin_produce_batch_in_closed_pool(batch_params):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(
+            path=STATIC_DIR / 'batch_events.py',
+            workers=1,
+        ),
+        params={'id': 1},
+    )
+    plugin._pool.close()
+
+    events, exhausted = plugin.produce_batch(params=batch_params)
+
+    assert events == []
+    assert not exhausted
+    assert plugin.produce_failed == 3
@@ -0,0 +1,266 @@
+"""Pool of worker processes producing events using event plugin
+replicas.
+"""
+
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import eventum.logging.config as logconf
+from eventum.exceptions import ContextualError
+from eventum.plugins.event.base.plugin import BatchProduceParams, EventPlugin
+from eventum.plugins.exceptions import PluginConfigurationError
+
+# Factory of event plugin replica, it must be picklable
+type EventPluginFactory = Callable[[], EventPlugin]
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkResult:
+    """Result of producing events for chunk of timestamp batch.
+
+    Attributes
+    ----------
+    events : list[str]
+        Produced events.
+
+    exhausted : bool
+        Whether the plugin replica is exhausted.
+
+    produced : int
+        Number of produced events.
+
+    produce_failed : int
+        Number of unsuccessfully produced events.
+
+    dropped : int
+        Number of dropped events.
+
+    logs : list[tuple[str, dict[str, Any]]]
+        Log entries (method name and event dict) captured in worker
+        process that must be emitted in the parent process.
+
+    """
+
+    events: list[str]
+    exhausted: bool
+    produced: int = 0
+    produce_failed: int = 0
+    dropped: int = 0
+    logs: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+
+# Plugin replica of the current process (only set in worker processes)
+_replica: EventPlugin | None = None
+
+# Log entries captured in the current worker process
+_logs: list[tuple[str, dict[str, Any]]] = []
+
+# Reason of failed replica initialization in the current worker
+# process, it is reported to the parent on warm up
+_init_error: str | None = None
+
+
+def _init_worker(factory: EventPluginFactory) -> None:
+    """Initialize plugin replica in worker process.
+
+    Errors are not raised as it would break the pool without reason,
+    instead they are saved to be reported on warm up.
+    """
+    global _replica, _init_error  # noqa: PLW0603
+
+    logconf.use_forwarding(
+        lambda method_name, event_dict: _logs.append(
+            (method_name, event_dict),
+        ),
+    )
+
+    try:
+        _replica = factory()
+    except ContextualError as e:
+        _init_error = f'{e} ({e.context})'
+    except Exception as e:  # noqa: BLE001
+        _init_error = f'{e.__class__.__name__}: {e}'
+
+
+def _warm_up_worker() -> str | None:
+    """Check that plugin replica of the current process is
+    initialized.
+
+    Returns
+    -------
+    str | None
+        Reason of failed initialization or `None` if replica is
+        initialized.
+
+    """
+    return _init_error
+
+
+def _produce_in_worker(params: BatchProduceParams) -> ChunkResult:
+    """Produce events using plugin replica of the current process."""
+    if _replica is None:
+        msg = 'Plugin replica is not initialized in this process'
+        raise RuntimeError(msg)
+
+    produced = _replica.produced
+    produce_failed = _replica.produce_failed
+    dropped = _replica.dropped
+
+    events, exhausted = _replica.produce_batch(params)
+    logs = _logs.copy()
+    _logs.clear()
+
+    return ChunkResult(
+        events=events,
+        exhausted=exhausted,
+        produced=_replica.produced - produced,
+        produce_failed=_replica.produce_failed - produce_failed,
+        dropped=_replica.dropped - dropped,
+        logs=logs,
+    )
+
+
+class ProcessWorkerPool:
+    """Pool of worker processes each producing events using its own
+    event plugin replica.
+
+    Timestamp batches are split into chunks that are produced by
+    workers concurrently, results of chunks are merged in order of
+    timestamps. The pool is started on initialization and every worker
+    is awaited to initialize its replica, so configuration errors are
+    raised before producing.
+
+    Parameters
+    ----------
+    factory : EventPluginFactory
+        Factory of event plugin replicas, it must be picklable.
+
+    workers : int
+        Number of worker processes.
+
+    chunk_size : int
+        Max number of timestamps sent to worker at once.
+
+    Raises
+    ------
+    PluginConfigurationError
+        If any of workers fails to initialize its replica.
+
+    """
+
+    def __init__(
+        self,
+        factory: EventPluginFactory,
+        workers: int,
+        chunk_size: int,
+    ) -> None:
+        """Start worker processes and initialize replicas.
+
+        Parameters
+        ----------
+        factory : EventPluginFactory
+            Factory of event plugin replicas, it must be picklable.
+
+        workers : int
+            Number of worker processes.
+
+        chunk_size : int
+            Max number of timestamps sent to worker at once.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If any of workers fails to initialize its replica.
+
+        """
+        self._chunk_size = chunk_size
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('forkserver'),
+            initializer=_init_worker,
+            initargs=(factory,),
+        )
+
+        # processes are spawned on demand, so each warm up call that
+        # is submitted while others are not completed starts a worker
+        try:
+            warm_ups = [
+                self._pool.submit(_warm_up_worker) for _ in range(workers)
+            ]
+            errors = [future.result() for future in warm_ups]
+        except BaseException:
+            self.close()
+            raise
+
+        for error in errors:
+            if error is not None:
+                self.close()
+                msg = 'Failed to initialize worker process'
+                raise PluginConfigurationError(
+                    msg,
+                    context={'reason': error},
+                )
+
+    def produce_batch(self, params: BatchProduceParams) -> ChunkResult:
+        """Produce events for batch of timestamps.
+
+        Parameters
+        ----------
+        params : BatchProduceParams
+            Parameters for events producing.
+
+        Returns
+        -------
+        ChunkResult
+            Merged results of chunks of the batch, if some replica is
+            exhausted then results of subsequent chunks are discarded.
+
+        """
+        timestamps = params['timestamps']
+        tags = params['tags']
+        size = self._chunk_size
+
+        futures = [
+            self._pool.submit(
+                _produce_in_worker,
+                BatchProduceParams(
+                    timestamps=timestamps[i : i + size],
+                    timezone=params['timezone'],
+                    tags=tags[i : i + size],
+                ),
+            )
+            for i in range(0, len(timestamps), size)
+        ]
+
+        events: list[str] = []
+        logs: list[tuple[str, dict[str, Any]]] = []
+        produced = produce_failed = dropped = 0
+        exhausted = False
+
+        for future in futures:
+            result = future.result()
+            if exhausted:
+                continue
+
+            events.extend(result.events)
+            logs.extend(result.logs)
+            produced += result.produced
+            produce_failed += result.produce_failed
+            dropped += result.dropped
+            exhausted = result.exhausted
+
+        return ChunkResult(
+            events=events,
+            exhausted=exhausted,
+            produced=produced,
+            produce_failed=produce_failed,
+            dropped=dropped,
+            logs=logs,
+        )
+
+    def close(self) -> None:
+        """Stop worker processes."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,139 @@
+"""Alias table for weighted random sampling in constant time."""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class AliasTable:
+    """Table for picking indices with probabilities proportional to
+    their weights using Vose's alias method.
+
+    Table is built once in linear time, after that each pick takes
+    constant time regardless of the number of weights. Randomness is
+    provided by caller as uniform values in range [0.0, 1.0), so table
+    can be used with any random stream.
+
+    Parameters
+    ----------
+    weights : Sequence[float] | NDArray[np.float64]
+        Non negative weights, at least one of them must be positive.
+
+    Raises
+    ------
+    ValueError
+        If weights are empty, contain negative or non finite values or
+        all of them are zero.
+
+    """
+
+    __slots__ = ('_alias', '_alias_array', '_prob', '_prob_array', '_size')
+
+    def __init__(self, weights: Sequence[float] | NDArray[np.float64]) -> None:
+        """Build table.
+
+        Parameters
+        ----------
+        weights : Sequence[float] | NDArray[np.float64]
+            Non negative weights, at least one of them must be
+            positive.
+
+        Raises
+        ------
+        ValueError
+            If weights are empty, contain negative or non finite values
+            or all of them are zero.
+
+        """
+        array = np.asarray(weights, dtype=np.float64)
+        size = len(array)
+
+        if not size:
+            msg = 'Weights must not be empty'
+            raise ValueError(msg)
+
+        if not np.all(np.isfinite(array)) or np.any(array < 0):
+            msg = 'Weights must be non negative finite numbers'
+            raise ValueError(msg)
+
+        total = array.sum()
+        if total <= 0:
+            msg = 'Total of weights must be greater than zero'
+            raise ValueError(msg)
+
+        prob: list[float] = (array * (size / total)).tolist()
+        alias = list(range(size))
+
+        small = [i for i, p in enumerate(prob) if p < 1.0]
+        large = [i for i, p in enumerate(prob) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large[-1]
+
+            alias[less] = more
+            prob[more] -= 1.0 - prob[less]
+
+            if prob[more] < 1.0:
+                small.append(large.pop())
+
+        # remaining columns are full up to rounding errors
+        for i in small + large:
+            prob[i] = 1.0
+
+        self._size = size
+        self._prob = prob
+        self._alias = alias
+        self._prob_array = np.array(prob, dtype=np.float64)
+        self._alias_array = np.array(alias, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def pick(self, u: float) -> int:
+        """Pick index.
+
+        Parameters
+        ----------
+        u : float
+            Uniform random value in range [0.0, 1.0).
+
+        Returns
+        -------
+        int
+            Picked index.
+
+        """
+        scaled = u * self._size
+        column = int(scaled)
+        if column == self._size:
+            column -= 1
+
+        if scaled - column < self._prob[column]:
+            return column
+
+        return self._alias[column]
+
+    def pick_many(self, u: NDArray[np.float64]) -> NDArray[np.intp]:
+        """Pick index for each of uniform random values.
+
+        Parameters
+        ----------
+        u : NDArray[np.float64]
+            Uniform random values in range [0.0, 1.0).
+
+        Returns
+        -------
+        NDArray[np.intp]
+            Picked indices.
+
+        """
+        scaled = u * self._size
+        columns = np.minimum(scaled.astype(np.intp), self._size - 1)
+
+        return np.where(
+            scaled - columns < self._prob_array[columns],
+            columns,
+            self._alias_array[columns],
+        )
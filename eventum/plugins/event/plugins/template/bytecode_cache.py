@@ -0,0 +1,115 @@
+"""Persistent cache of compiled templates shared by all template event
+plugins of the process.
+"""
+
+import os
+from contextlib import suppress
+from functools import cache
+from hashlib import sha1
+from pathlib import Path
+from typing import TypedDict, override
+
+import structlog
+from jinja2 import FileSystemBytecodeCache
+
+from eventum import __version__
+
+logger = structlog.stdlib.get_logger()
+
+
+class BytecodeCacheSettings(TypedDict):
+    """Settings of templates bytecode cache.
+
+    Attributes
+    ----------
+    directory : Path | None
+        Absolute path to directory for storing compiled templates, if
+        `None` is set then caching is disabled.
+
+    """
+
+    directory: Path | None
+
+
+BYTECODE_CACHE_SETTINGS = BytecodeCacheSettings(directory=None)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """File system bytecode cache with entries keyed by template path,
+    its modification time and version of eventum, so that entries of
+    changed templates and of other versions are never reused.
+
+    Parameters
+    ----------
+    directory : Path
+        Path to existing directory for storing compiled templates.
+
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize cache.
+
+        Parameters
+        ----------
+        directory : Path
+            Path to existing directory for storing compiled templates.
+
+        """
+        super().__init__(directory=str(directory))
+
+    @override
+    def get_cache_key(self, name: str, filename: str | None = None) -> str:
+        key = f'{__version__}|{name}|{filename}'
+
+        if filename is not None:
+            with suppress(OSError):
+                key += f'|{os.stat(filename).st_mtime_ns}'  # noqa: PTH116
+
+        return sha1(key.encode('utf-8')).hexdigest()  # noqa: S324
+
+
+@cache
+def _create_bytecode_cache(directory: Path) -> TemplateBytecodeCache | None:
+    """Create bytecode cache in specified directory.
+
+    Parameters
+    ----------
+    directory : Path
+        Path to directory for storing compiled templates, it is
+        created if it does not exist.
+
+    Returns
+    -------
+    TemplateBytecodeCache | None
+        Created cache or `None` if directory cannot be created.
+
+    """
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(
+            'Failed to create directory for templates cache, '
+            'templates will be compiled without caching',
+            reason=str(e),
+            file_path=str(directory),
+        )
+        return None
+
+    return TemplateBytecodeCache(directory)
+
+
+def get_bytecode_cache() -> TemplateBytecodeCache | None:
+    """Get bytecode cache configured in settings.
+
+    Returns
+    -------
+    TemplateBytecodeCache | None
+        Bytecode cache shared by all callers in the process or `None`
+        if caching is disabled.
+
+    """
+    directory = BYTECODE_CACHE_SETTINGS['directory']
+    if directory is None:
+        return None
+
+    return _create_bytecode_cache(directory)
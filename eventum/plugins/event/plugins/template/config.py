@@ -227,10 +227,20 @@ class TemplateEventPluginConfigCommonFields(
     sample : dict[str, SampleConfig]
         Samples passed to templates.
 
+    profile : bool, default=False
+        Whether to profile templates rendering. Profile contains
+        number of renders and render time of each template, and time
+        spent on template source lines collected from a sample of
+        renders. Profiling slows down rendering. Profile is collected
+        only for events produced by the plugin itself, so it is empty
+        when events are produced by replicas of the plugin (multiple
+        event workers or shards).
+
     """
 
     params: dict[str, Any] = Field(default_factory=dict)
     samples: dict[str, SampleConfig] = Field(default_factory=dict)
+    profile: bool = False
 
     def get_picking_common_fields(self) -> dict[str, Any]:
         """Get common fields used in templates picking.
@@ -21,6 +21,7 @@ from pydantic import (
     ConfigDict,
     Field,
     StringConstraints,
+    field_validator,
     model_validator,
 )
 
@@ -32,13 +33,13 @@ from eventum.plugins.event.plugins.template.context import (
     EventTimestampContext,
 )
 from eventum.plugins.event.plugins.template.fsm.operators import (
+    is_in,
     len_eq,
     len_ge,
     len_gt,
     len_le,
     len_lt,
 )
-from eventum.plugins.event.plugins.template.state import State
 
 logger = structlog.stdlib.get_logger()
 
@@ -49,9 +50,28 @@ class Checkable(ABC, Generic[ContextT]):
     """Base class for models used in condition checking."""
 
     @abstractmethod
+    def compile(self) -> Callable[[ContextT], bool]:
+        """Compile condition into function checking it.
+
+        All the work that does not depend on context (e.g. resolving
+        of state field names, compiling of regular expressions) is
+        done once during compilation, so compiled function is cheap
+        to call for each event.
+
+        Returns
+        -------
+        Callable[[ContextT], bool]
+            Function checking condition using provided context.
+
+        """
+        ...
+
     def check(self, context: ContextT) -> bool:
         """Check class-specific condition using provided context.
 
+        Condition is compiled on each call, use `compile` for checking
+        condition multiple times.
+
         Parameters
         ----------
         context : ContextT
@@ -68,60 +88,62 @@ class Checkable(ABC, Generic[ContextT]):
             If required kwarg is missing.
 
         """
-        ...
+        return self.compile()(context)
 
 
-def _compare_with_state(
+def _compile_state_comparison(
     operator: Callable[[Any, Any], bool],
-    state: State,
-    field_name: str,
+    field: str,
     target_value: Any,
-) -> bool:
-    """Perform comparison with value from state.
+) -> Callable[[EventStateContext], bool]:
+    """Compile comparison of value from state with target value.
 
     Parameters
     ----------
     operator : Callable[[Any, Any], bool]
         Binary operator for comparing values.
 
-    state : State
-        State with value for comparison.
-
-    field_name : str
-        Field name of value in state that is compared with target value.
+    field : str
+        Field name of value in state (including state name) that is
+        compared with target value.
 
     target_value : Any
         Target value for comparison.
 
     Returns
     -------
-    bool
-        Result of comparison.
+    Callable[[EventStateContext], bool]
+        Function performing comparison using provided context.
 
     """
-    state_value = state.get(field_name)
-
-    if state_value is None:
-        logger.warning(
-            'Comparing with None',
-            reason=(
-                f'{operator.__name__}({field_name}, {target_value}), '
-                f'where {field_name} = {state_value!r}'
-            ),
-        )
-        return False
-
-    try:
-        return operator(state_value, target_value)
-    except TypeError as e:
-        logger.warning(
-            'Comparing error',
-            reason=(
-                f'{operator.__name__}({field_name}, {target_value}), '
-                f'where {field_name} = {state_value!r}, reason: {e}'
-            ),
-        )
-        return False
+    state, field_name = _decompose_field(field)
+
+    def compare(context: EventStateContext) -> bool:
+        state_value = context[state].get(field_name)
+
+        if state_value is None:
+            logger.warning(
+                'Comparing with None',
+                reason=(
+                    f'{operator.__name__}({field_name}, {target_value}), '
+                    f'where {field_name} = {state_value!r}'
+                ),
+            )
+            return False
+
+        try:
+            return operator(state_value, target_value)
+        except TypeError as e:
+            logger.warning(
+                'Comparing error',
+                reason=(
+                    f'{operator.__name__}({field_name}, {target_value}), '
+                    f'where {field_name} = {state_value!r}, reason: {e}'
+                ),
+            )
+            return False
+
+    return compare
 
 
 def _decompose_field(
@@ -145,15 +167,9 @@ class Eq(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
     eq: dict[StateFieldName, Any] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.eq.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=eq,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(eq, field, value)
 
 
 class Gt(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
@@ -162,15 +178,9 @@ class Gt(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
     gt: dict[StateFieldName, float | int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.gt.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=gt,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(gt, field, value)
 
 
 class Ge(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
@@ -181,15 +191,9 @@ class Ge(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
     ge: dict[StateFieldName, float | int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.ge.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=ge,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(ge, field, value)
 
 
 class Lt(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
@@ -198,15 +202,9 @@ class Lt(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
     lt: dict[StateFieldName, float | int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.lt.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=lt,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(lt, field, value)
 
 
 class Le(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
@@ -217,15 +215,9 @@ class Le(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
     le: dict[StateFieldName, float | int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.le.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=le,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(le, field, value)
 
 
 class LenEq(
@@ -239,15 +231,9 @@ class LenEq(
     len_eq: dict[StateFieldName, int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.len_eq.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=len_eq,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(len_eq, field, value)
 
 
 class LenGt(
@@ -261,15 +247,9 @@ class LenGt(
     len_gt: dict[StateFieldName, int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.len_gt.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=len_gt,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(len_gt, field, value)
 
 
 class LenGe(
@@ -283,15 +263,9 @@ class LenGe(
     len_ge: dict[StateFieldName, int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.len_ge.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=len_ge,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(len_ge, field, value)
 
 
 class LenLt(
@@ -305,15 +279,9 @@ class LenLt(
     len_lt: dict[StateFieldName, int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.len_lt.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=len_lt,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(len_lt, field, value)
 
 
 class LenLe(
@@ -327,15 +295,9 @@ class LenLe(
     len_le: dict[StateFieldName, int] = Field(min_length=1, max_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.len_le.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=len_le,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(len_le, field, value)
 
 
 class Contains(  # type: ignore[misc]
@@ -351,15 +313,9 @@ class Contains(  # type: ignore[misc]
     model_config = ConfigDict(populate_by_name=True)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.contains.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=contains,
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(contains, field, value)
 
 
 class In(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):  # type: ignore[misc]
@@ -374,15 +330,9 @@ class In(BaseModel, Checkable[EventStateContext], frozen=True, extra='forbid'):
     model_config = ConfigDict(populate_by_name=True)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, value = next(iter(self.in_.items()))
-        state, field = _decompose_field(field)
-        return _compare_with_state(
-            operator=lambda a, b: contains(b, a),
-            state=context[state],
-            field_name=field,
-            target_value=value,
-        )
+        return _compile_state_comparison(is_in, field, value)
 
 
 class HasTags(
@@ -396,13 +346,16 @@ class HasTags(
     has_tags: str | list[str] = Field(min_length=1)
 
     @override
-    def check(self, context: EventTagsContext) -> bool:
+    def compile(self) -> Callable[[EventTagsContext], bool]:
         if isinstance(self.has_tags, str):
-            target_tags = [self.has_tags]
+            target_tags = frozenset([self.has_tags])
         else:
-            target_tags = self.has_tags
+            target_tags = frozenset(self.has_tags)
+
+        def check(context: EventTagsContext) -> bool:
+            return target_tags.issubset(context['tags'])
 
-        return set(target_tags).issubset(set(context['tags']))
+        return check
 
 
 class TimestampComponents(BaseModel, frozen=True, extra='forbid'):
@@ -436,14 +389,14 @@ class Before(
     before: TimestampComponents
 
     @override
-    def check(self, context: EventTimestampContext) -> bool:
-        dt = context['timestamp']
+    def compile(self) -> Callable[[EventTimestampContext], bool]:
+        components = self.before.model_dump(exclude_none=True)
 
-        target = dt.replace(
-            **self.before.model_dump(exclude_none=True),
-        )
+        def check(context: EventTimestampContext) -> bool:
+            dt = context['timestamp']
+            return dt < dt.replace(**components)
 
-        return dt < target
+        return check
 
 
 class After(
@@ -457,14 +410,14 @@ class After(
     after: TimestampComponents
 
     @override
-    def check(self, context: EventTimestampContext) -> bool:
-        dt = context['timestamp']
+    def compile(self) -> Callable[[EventTimestampContext], bool]:
+        components = self.after.model_dump(exclude_none=True)
 
-        target = dt.replace(
-            **self.after.model_dump(exclude_none=True),
-        )
+        def check(context: EventTimestampContext) -> bool:
+            dt = context['timestamp']
+            return dt >= dt.replace(**components)
 
-        return dt >= target
+        return check
 
 
 class Matches(
@@ -477,16 +430,33 @@ class Matches(
 
     matches: dict[StateFieldName, str] = Field(min_length=1, max_length=1)
 
+    @field_validator('matches')
+    @classmethod
+    def validate_pattern(cls, v: dict[str, str]) -> dict[str, str]:  # noqa: D102
+        for pattern in v.values():
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                msg = f'Invalid regular expression: {e}'
+                raise ValueError(msg) from None
+
+        return v
+
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         field, pattern = next(iter(self.matches.items()))
         state, field = _decompose_field(field)
-        state_value = context[state].get(field)
+        match = re.compile(pattern).match
 
-        if not isinstance(state_value, str):
-            return False
+        def check(context: EventStateContext) -> bool:
+            state_value = context[state].get(field)
+
+            if not isinstance(state_value, str):
+                return False
+
+            return match(state_value) is not None
 
-        return bool(re.match(pattern, state_value))
+        return check
 
 
 NotDefined = object()
@@ -503,9 +473,15 @@ class Defined(
     defined: StateFieldName = Field(min_length=1)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
+    def compile(self) -> Callable[[EventStateContext], bool]:
         state, field = _decompose_field(self.defined)
-        return context[state].get(field, default=NotDefined) is not NotDefined
+
+        def check(context: EventStateContext) -> bool:
+            return (
+                context[state].get(field, default=NotDefined) is not NotDefined
+            )
+
+        return check
 
 
 class Always(
@@ -519,8 +495,11 @@ class Always(
     always: None = Field(default=None)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
-        return True
+    def compile(self) -> Callable[[EventStateContext], bool]:
+        def check(context: EventStateContext) -> bool:  # noqa: ARG001
+            return True
+
+        return check
 
 
 class Never(
@@ -534,8 +513,11 @@ class Never(
     never: None = Field(default=None)
 
     @override
-    def check(self, context: EventStateContext) -> bool:
-        return False
+    def compile(self) -> Callable[[EventStateContext], bool]:
+        def check(context: EventStateContext) -> bool:  # noqa: ARG001
+            return False
+
+        return check
 
 
 type ConditionCheck = (
@@ -578,8 +560,13 @@ class Or(BaseModel, Checkable[EventContext], frozen=True, extra='forbid'):  # ty
     model_config = ConfigDict(populate_by_name=True)
 
     @override
-    def check(self, context: EventContext) -> bool:
-        return any(clause.check(context) for clause in self.or_)
+    def compile(self) -> Callable[[EventContext], bool]:
+        clauses = tuple(clause.compile() for clause in self.or_)
+
+        def check(context: EventContext) -> bool:
+            return any(clause(context) for clause in clauses)  # type: ignore[arg-type]
+
+        return check
 
 
 class And(BaseModel, Checkable[EventContext], frozen=True, extra='forbid'):  # type: ignore[misc]
@@ -592,8 +579,13 @@ class And(BaseModel, Checkable[EventContext], frozen=True, extra='forbid'):  # t
     model_config = ConfigDict(populate_by_name=True)
 
     @override
-    def check(self, context: EventContext) -> bool:
-        return all(clause.check(context) for clause in self.and_)
+    def compile(self) -> Callable[[EventContext], bool]:
+        clauses = tuple(clause.compile() for clause in self.and_)
+
+        def check(context: EventContext) -> bool:
+            return all(clause(context) for clause in clauses)  # type: ignore[arg-type]
+
+        return check
 
 
 class Not(BaseModel, Checkable[EventContext], frozen=True, extra='forbid'):  # type: ignore[misc]
@@ -606,8 +598,13 @@ class Not(BaseModel, Checkable[EventContext], frozen=True, extra='forbid'):  # t
     model_config = ConfigDict(populate_by_name=True)
 
     @override
-    def check(self, context: EventContext) -> bool:
-        return not self.not_.check(context)
+    def compile(self) -> Callable[[EventContext], bool]:
+        clause = self.not_.compile()
+
+        def check(context: EventContext) -> bool:
+            return not clause(context)  # type: ignore[arg-type]
+
+        return check
 
 
 # resolve forward references
@@ -1,6 +1,6 @@
 """Custom operators for FSM condition checks."""
 
-from collections.abc import Sequence
+from collections.abc import Container, Sequence
 
 
 def len_eq(a: Sequence, b: int) -> bool:
@@ -26,3 +26,8 @@ def len_lt(a: Sequence, b: int) -> bool:
 def len_le(a: Sequence, b: int) -> bool:
     """Same as len(a) <= b."""  # noqa: D401
     return len(a) <= b
+
+
+def is_in(a: object, b: Container) -> bool:
+    """Same as a in b."""  # noqa: D401
+    return a in b
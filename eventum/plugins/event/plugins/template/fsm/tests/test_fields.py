@@ -470,3 +470,47 @@ def test_never():
     )
 
     assert Never(never=None).check(context) is False
+
+
+def test_compiled_condition_follows_state_changes():
+    state = State({'field1': 10, 'field2': 'abc'})
+    context = EventContext(
+        timestamp=...,
+        tags=('tag1',),
+        locals=state,
+        shared=...,
+        globals=...,
+    )
+
+    check = And(
+        and_=[
+            Gt(gt={'locals.field1': 5}),
+            Matches(matches={'locals.field2': r'^a.*c$'}),
+            HasTags(has_tags='tag1'),
+        ],
+    ).compile()
+
+    assert check(context)
+
+    state.set('field1', 1)
+    assert not check(context)
+
+    state.set('field1', 6)
+    state.set('field2', 'xyz')
+    assert not check(context)
+
+
+def test_compiled_comparison_with_missing_value():
+    context = EventStateContext(
+        locals=State({'field': 'abc'}),
+        shared=...,
+        globals=...,
+    )
+
+    assert not Gt(gt={'locals.other_field': 5}).compile()(context)
+    assert not Gt(gt={'locals.field': 5}).compile()(context)
+
+
+def test_matches_with_invalid_pattern():
+    with pytest.raises(ValueError, match='Invalid regular expression'):
+        Matches(matches={'locals.field': r'^(a'})
@@ -5,6 +5,8 @@ from types import ModuleType
 
 import structlog
 
+from eventum.utils.seeding import derive_seed
+
 logger = structlog.stdlib.get_logger()
 
 
@@ -12,10 +14,12 @@ class ModuleProvider:
     """Provider of modules used in templates.
     By default custom modules are searched in `package_name` package,
     if module is not found there, then it is searched in environment
-    packages.
+    packages. If seed is provided, then modules of the package that
+    define `seed` function are seeded on import with seeds derived
+    from it.
     """
 
-    def __init__(self, package_name: str) -> None:
+    def __init__(self, package_name: str, seed: int | None = None) -> None:
         """Initialize module provider.
 
         Parameters
@@ -23,8 +27,12 @@ class ModuleProvider:
         package_name : str
             Absolute name of the package with modules.
 
+        seed : int | None, default=None
+            Seed for modules of the package.
+
         """
         self._package_name = package_name
+        self._seed = seed
         self._imported_modules: dict[str, ModuleType] = {}
 
     def __getitem__(self, key: str) -> ModuleType:
@@ -59,7 +67,29 @@ class ModuleProvider:
         except ImportError as e:
             msg = f'Failed to import module `{key}`: {e}'
             raise KeyError(msg) from None
+        else:
+            self._seed_module(key, module)
 
         self._imported_modules[key] = module
 
         return module
+
+    def _seed_module(self, key: str, module: ModuleType) -> None:
+        """Seed module if seed is provided and module supports it.
+
+        Parameters
+        ----------
+        key : str
+            Name of the module.
+
+        module : ModuleType
+            Module to seed.
+
+        """
+        if self._seed is None:
+            return
+
+        seed = getattr(module, 'seed', None)
+        if callable(seed):
+            logger.debug('Seeding module', module_name=key)
+            seed(derive_seed(self._seed, key))
@@ -2,23 +2,54 @@
 
 from faker import Faker
 
+from eventum.plugins.event.plugins.template.value_pool import GeneratorPools
+from eventum.utils.seeding import derive_seed
+
+
+def _create_generator(locale: str) -> Faker:
+    try:
+        return Faker(locale=locale)
+    except AttributeError:
+        msg = f'Unknown locale `{locale}`'
+        raise KeyError(msg) from None
+
+
+def _seed_generator(generator: Faker, seed: int) -> None:
+    generator.seed_instance(seed)
+
 
 class _Locale:
     def __init__(self) -> None:
         self._dict: dict[str, Faker] = {}
+        self._seed: int | None = None
+
+    def seed(self, value: int) -> None:
+        self._seed = value
+        for locale, generator in self._dict.items():
+            self._seed_generator(generator, locale)
+
+    def _seed_generator(self, generator: Faker, locale: str) -> None:
+        if self._seed is not None:
+            _seed_generator(generator, derive_seed(self._seed, locale))
 
     def __getitem__(self, locale: str) -> Faker:
         if locale in self._dict:
             return self._dict[locale]
 
-        try:
-            generator = Faker(locale=locale)
-        except AttributeError:
-            msg = f'Unknown locale `{locale}`'
-            raise KeyError(msg) from None
-
+        generator = _create_generator(locale)
+        self._seed_generator(generator, locale)
         self._dict[locale] = generator
         return generator
 
 
 locale = _Locale()
+
+pool = GeneratorPools(_create_generator, _seed_generator)
+
+
+def seed(value: int) -> None:
+    """Seed generators of all locales, including ones that are not
+    created yet.
+    """
+    locale.seed(value)
+    pool.seed(derive_seed(value, 'pool'))
@@ -4,21 +4,42 @@ import mimesis.enums as _enums
 import mimesis.random as _random
 from mimesis import Generic, Locale
 
+from eventum.plugins.event.plugins.template.value_pool import GeneratorPools
+from eventum.utils.seeding import derive_seed
+
+
+def _create_generator(locale: str) -> Generic:
+    try:
+        return Generic(Locale(locale))
+    except ValueError:
+        msg = f'Unknown locale `{locale}`'
+        raise KeyError(msg) from None
+
+
+def _seed_generator(generator: Generic, seed: int) -> None:
+    generator.reseed(seed)
+
 
 class _Locale:
     def __init__(self) -> None:
         self._dict: dict[str, Generic] = {}
+        self._seed: int | None = None
+
+    def seed(self, value: int) -> None:
+        self._seed = value
+        for locale, generator in self._dict.items():
+            self._seed_generator(generator, locale)
+
+    def _seed_generator(self, generator: Generic, locale: str) -> None:
+        if self._seed is not None:
+            _seed_generator(generator, derive_seed(self._seed, locale))
 
     def __getitem__(self, locale: str) -> Generic:
         if locale in self._dict:
             return self._dict[locale]
 
-        try:
-            generator = Generic(Locale(locale))
-        except ValueError:
-            msg = f'Unknown locale `{locale}`'
-            raise KeyError(msg) from None
-
+        generator = _create_generator(locale)
+        self._seed_generator(generator, locale)
         self._dict[locale] = generator
         return generator
 
@@ -27,3 +48,13 @@ enums = _enums
 random = _random
 
 locale = _Locale()
+
+pool = GeneratorPools(_create_generator, _seed_generator)
+
+
+def seed(value: int) -> None:
+    """Seed generators of all locales, including ones that are not
+    created yet.
+    """
+    locale.seed(value)
+    pool.seed(derive_seed(value, 'pool'))
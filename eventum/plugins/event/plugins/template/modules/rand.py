@@ -1,11 +1,13 @@
 """Rand module."""
 
+import bisect
 import datetime as dt
 import functools
+import io
 import ipaddress
+import itertools
 import random
-import uuid
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from string import (
     ascii_letters,
     ascii_lowercase,
@@ -15,8 +17,21 @@ from string import (
 )
 from typing import TypeVar, overload
 
+import numpy as np
+
+from eventum.plugins.event.plugins.template.alias_table import AliasTable
+from eventum.utils.seeding import derive_seed
+
 T = TypeVar('T')
 
+# Number of values drawn at once to refill pools of random values
+FLOATS_POOL_SIZE = 4096
+BYTES_POOL_SIZE = 65536
+
+# Max integer range served from pool of floats, wider ranges cannot
+# be uniformly covered by floats with 53 bit mantissa
+_MAX_POOLED_RANGE = 1 << 48
+
 _HEX_LOWER = digits + 'abcdef'
 _HEX_UPPER = digits + 'ABCDEF'
 _WORD = ascii_letters + digits
@@ -61,6 +76,179 @@ _VENDOR_OUIS: dict[str, tuple[str, ...]] = {
 }
 
 
+class _RandomPool:
+    """Pools of random values drawn in large blocks by numpy random
+    generator. Values are served from the pools one by one and pools
+    are refilled in bulk when exhausted, so getting a value is cheap.
+
+    Values are taken from pools by iterator and buffer reads that are
+    atomic, so pool can be shared by threads.
+    """
+
+    def __init__(self) -> None:
+        self._generator = np.random.default_rng()
+        self._floats: Iterator[float] = iter(())
+        self._bytes = io.BytesIO()
+
+    def seed(self, value: int) -> None:
+        """Reseed generator and drop values drawn before."""
+        self._generator = np.random.default_rng(value)
+        self._floats = iter(())
+        self._bytes = io.BytesIO()
+
+    def random(self) -> float:
+        """Return random float in range [0.0, 1.0)."""
+        try:
+            return next(self._floats)
+        except StopIteration:
+            self._floats = iter(
+                self._generator.random(FLOATS_POOL_SIZE).tolist(),
+            )
+            return next(self._floats)
+
+    def randbelow(self, n: int) -> int:
+        """Return random integer in range [0, n)."""
+        if n > _MAX_POOLED_RANGE:
+            return _RANDOM.randrange(n)
+
+        return min(int(self.random() * n), n - 1)
+
+    def bytes(self, size: int) -> bytes:
+        """Return `size` random bytes."""
+        data = self._bytes.read(size)
+
+        if len(data) < size:
+            self._bytes = io.BytesIO(
+                self._generator.bytes(max(BYTES_POOL_SIZE, size)),
+            )
+            data = self._bytes.read(size)
+
+        return data
+
+    def chars(self, charset: str, size: int) -> str:
+        """Return string of `size` random characters from ASCII
+        `charset`.
+        """
+        table = _charset_table(charset)
+
+        # bytes are drawn with reserve for rejected ones, so usually
+        # single draw is enough
+        result = self.bytes(2 * size + 8).translate(table).replace(b'\0', b'')
+        while len(result) < size:
+            result += (
+                self.bytes(2 * size + 8).translate(table).replace(b'\0', b'')
+            )
+
+        return result[:size].decode('ascii')
+
+
+# Generator of values that are not served from pools
+_RANDOM = random.Random()
+
+_POOL = _RandomPool()
+
+
+@functools.lru_cache(maxsize=256)
+def _alias_table(weights: tuple[float, ...]) -> AliasTable:
+    """Build alias table for weights, tables are cached as the same
+    weights are usually passed on each call.
+    """
+    return AliasTable(weights)
+
+
+def _weighted_table(items: Sequence, weights: Sequence[float]) -> AliasTable:
+    """Get alias table for weights of items.
+
+    Raises
+    ------
+    ValueError
+        If number of weights does not match number of items or
+        weights are invalid.
+
+    """
+    if len(weights) != len(items):
+        msg = 'The number of weights does not match the population'
+        raise ValueError(msg)
+
+    return _alias_table(tuple(weights))
+
+
+@functools.lru_cache(maxsize=256)
+def _charset_table(charset: str) -> bytes:
+    """Build table for translating random bytes to characters of ASCII
+    `charset`. Bytes that would make mapping non-uniform are
+    translated to null bytes that must be dropped.
+    """
+    n = len(charset)
+    limit = 256 - 256 % n
+    encoded = charset.encode('ascii')
+
+    return bytes(encoded[i % n] if i < limit else 0 for i in range(256))
+
+
+def _ip_v4_range(start: str, end: str) -> tuple[int, int]:
+    """Convert IPv4 range to range of integer representations."""
+    return int(ipaddress.IPv4Address(start)), int(ipaddress.IPv4Address(end))
+
+
+_PRIVATE_RANGES = (
+    _ip_v4_range('10.0.0.0', '10.255.255.255'),
+    _ip_v4_range('172.16.0.0', '172.31.255.255'),
+    _ip_v4_range('192.168.0.0', '192.168.255.255'),
+)
+_PRIVATE_CUM_WEIGHTS = tuple(itertools.accumulate((5, 2, 5)))
+
+_PUBLIC_RANGES = (
+    _ip_v4_range('1.0.0.0', '9.255.255.255'),
+    _ip_v4_range('11.0.0.0', '100.63.255.255'),
+    _ip_v4_range('100.128.0.0', '126.255.255.255'),
+    _ip_v4_range('128.0.0.0', '169.253.255.255'),
+    _ip_v4_range('169.255.0.0', '172.15.255.255'),
+    _ip_v4_range('172.32.0.0', '191.255.255.255'),
+    _ip_v4_range('192.0.1.0', '192.0.1.255'),
+    _ip_v4_range('192.0.3.0', '192.88.98.255'),
+    _ip_v4_range('192.88.100.0', '192.167.255.255'),
+    _ip_v4_range('192.169.0.0', '198.17.255.255'),
+    _ip_v4_range('198.20.0.0', '198.51.99.255'),
+    _ip_v4_range('198.51.101.0', '203.0.112.255'),
+    _ip_v4_range('203.0.114.0', '223.255.255.255'),
+)
+_PUBLIC_CUM_WEIGHTS = tuple(
+    itertools.accumulate((5, 8, 6, 7, 4, 9, 3, 4, 5, 6, 4, 6, 8)),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ip_v4_network(cidr: str) -> ipaddress.IPv4Network:
+    """Parse IPv4 network. Cached because callers may invoke
+    ``ip_v4_in_subnet()`` on the hot path with the same network
+    repeatedly.
+    """
+    return ipaddress.IPv4Network(cidr, strict=False)
+
+
+def _ip_v4_in_range(start: int, end: int) -> str:
+    """Return random IPv4 address in range [start, end] of integer
+    representations.
+    """
+    value = start + _POOL.randbelow(end - start + 1)
+    return (
+        f'{value >> 24}.{(value >> 16) & 0xFF}.'
+        f'{(value >> 8) & 0xFF}.{value & 0xFF}'
+    )
+
+
+def _ip_v4_in_ranges(
+    ranges: tuple[tuple[int, int], ...],
+    cum_weights: tuple[int, ...],
+) -> str:
+    """Return random IPv4 address in range picked from `ranges` with
+    cumulative weights `cum_weights`.
+    """
+    index = bisect.bisect(cum_weights, _POOL.random() * cum_weights[-1])
+    return _ip_v4_in_range(*ranges[index])
+
+
 @functools.lru_cache(maxsize=256)
 def _parse_oui(oui: str) -> tuple[int, int, int]:
     """Parse a 3-byte OUI prefix into a tuple of integers.
@@ -154,10 +342,20 @@ def _compile_pattern(format_string: str) -> tuple[tuple, ...]:
     return tuple(tokens)
 
 
+def seed(value: int) -> None:
+    """Seed random streams of the module.
+
+    After seeding with the same value the same sequence of calls
+    returns the same values.
+    """
+    _RANDOM.seed(value)
+    _POOL.seed(derive_seed(value, 'pool'))
+
+
 def shuffle(items: Sequence[T]) -> list[T] | str:
     """Shuffle sequence elements."""
     seq = list(items)
-    random.shuffle(seq)
+    _RANDOM.shuffle(seq)
 
     if isinstance(items, str):
         return ''.join(seq)  # type: ignore[arg-type]
@@ -166,12 +364,16 @@ def shuffle(items: Sequence[T]) -> list[T] | str:
 
 def choice(items: Sequence[T]) -> T:
     """Return random item from non empty sequence."""
-    return random.choice(items)
+    if not items:
+        msg = 'Cannot choose from an empty sequence'
+        raise IndexError(msg)
+
+    return items[_POOL.randbelow(len(items))]
 
 
 def choices(items: Sequence[T], n: int) -> list[T]:
     """Return `n` random items from non empty sequence."""
-    return random.choices(items, k=n)
+    return _RANDOM.choices(items, k=n)
 
 
 @overload
@@ -199,12 +401,13 @@ def weighted_choice(
         weighted_choice({'a': 70, 'b': 20, 'c': 10})
     """
     if isinstance(items, Mapping):
-        return random.choices(
-            list(items.keys()),
-            weights=list(items.values()),
-            k=1,
-        ).pop()
-    return random.choices(items, weights=weights, k=1).pop()
+        table = _alias_table(tuple(items.values()))
+        return list(items)[table.pick(_POOL.random())]
+
+    if weights is None:
+        return choice(items)
+
+    return items[_weighted_table(items, weights).pick(_POOL.random())]
 
 
 @overload
@@ -236,17 +439,16 @@ def weighted_choices(
         weighted_choices({'a': 70, 'b': 20, 'c': 10}, 5)
     """
     if isinstance(items, Mapping) and isinstance(weights, int):
-        return random.choices(
-            list(items.keys()),
-            weights=list(items.values()),
-            k=weights,
-        )
+        keys = list(items)
+        table = _alias_table(tuple(items.values()))
+        return [keys[table.pick(_POOL.random())] for _ in range(weights)]
     if (
         not isinstance(items, Mapping)
         and not isinstance(weights, int)
         and n is not None
     ):
-        return random.choices(items, weights=weights, k=n)
+        table = _weighted_table(items, weights)
+        return [items[table.pick(_POOL.random())] for _ in range(n)]
     msg = 'expected (dict, n) or (items, weights, n)'
     raise TypeError(msg)
 
@@ -259,7 +461,7 @@ def chance(prob: float) -> bool:
     if prob >= 1:
         return True
 
-    return random.random() < prob
+    return _POOL.random() < prob
 
 
 class number:  # noqa: N801
@@ -268,40 +470,44 @@ class number:  # noqa: N801
     @staticmethod
     def integer(a: int, b: int) -> int:
         """Return random integer in range [a, b]."""
-        return random.randint(a, b)
+        if a > b:
+            msg = f'empty range in integer({a}, {b})'
+            raise ValueError(msg)
+
+        return a + _POOL.randbelow(b - a + 1)
 
     @staticmethod
     def floating(a: float, b: float) -> float:
         """Return random floating point number in range [a, b]."""
-        return random.uniform(a, b)
+        return a + (b - a) * _POOL.random()
 
     @staticmethod
     def gauss(mu: float, sigma: float) -> float:
         """Return random floating point number with Gaussian
         distribution.
         """
-        return random.gauss(mu, sigma)
+        return _RANDOM.gauss(mu, sigma)
 
     @staticmethod
     def lognormal(mu: float, sigma: float) -> float:
         """Return random floating point number with log-normal
         distribution (always positive, right-skewed).
         """
-        return random.lognormvariate(mu, sigma)
+        return _RANDOM.lognormvariate(mu, sigma)
 
     @staticmethod
     def exponential(lambd: float) -> float:
         """Return random floating point number with exponential
         distribution. `lambd` is the rate parameter (1 / mean).
         """
-        return random.expovariate(lambd)
+        return _RANDOM.expovariate(lambd)
 
     @staticmethod
     def pareto(alpha: float, xmin: float = 1.0) -> float:
         """Return random floating point number with Pareto
         distribution (heavy-tailed, values >= `xmin`).
         """
-        return xmin * random.paretovariate(alpha)
+        return xmin * _RANDOM.paretovariate(alpha)
 
     @staticmethod
     def triangular(
@@ -312,7 +518,7 @@ class number:  # noqa: N801
         """Return random floating point number with triangular
         distribution in [`low`, `high`] peaking at `mode`.
         """
-        return random.triangular(low, high, mode)
+        return _RANDOM.triangular(low, high, mode)
 
     @staticmethod
     def clamp(
@@ -332,42 +538,42 @@ class string:  # noqa: N801
         """Return string of specified `size` that contains random ASCII
         lowercase letters.
         """
-        return ''.join(random.choices(ascii_lowercase, k=size))
+        return _POOL.chars(ascii_lowercase, size)
 
     @staticmethod
     def letters_uppercase(size: int) -> str:
         """Return string of specified `size` that contains random ASCII
         uppercase letters.
         """
-        return ''.join(random.choices(ascii_uppercase, k=size))
+        return _POOL.chars(ascii_uppercase, size)
 
     @staticmethod
     def letters(size: int) -> str:
         """Return string of specified `size` that contains random ASCII
         letters.
         """
-        return ''.join(random.choices(ascii_letters, k=size))
+        return _POOL.chars(ascii_letters, size)
 
     @staticmethod
     def digits(size: int) -> str:
         """Return string of specified `size` that contains random digit
         characters.
         """
-        return ''.join(random.choices(digits, k=size))
+        return _POOL.chars(digits, size)
 
     @staticmethod
     def punctuation(size: int) -> str:
         """Return string of specified `size` that contains random ASCII
         punctuation characters.
         """
-        return ''.join(random.choices(punctuation, k=size))
+        return _POOL.chars(punctuation, size)
 
     @staticmethod
     def hex(size: int) -> str:
         """Return string of specified `size` that contains random hex
         characters.
         """
-        return ''.join(random.choices(_HEX_LOWER, k=size))
+        return _POOL.bytes((size + 1) // 2).hex()[:size]
 
     @staticmethod
     def pattern(format_string: str) -> str:
@@ -400,7 +606,7 @@ class string:  # noqa: N801
                 parts.append(token[1])
             else:
                 _, charset, count = token
-                parts.append(''.join(random.choices(charset, k=count)))
+                parts.append(_POOL.chars(charset, count))
         return ''.join(parts)
 
 
@@ -410,127 +616,73 @@ class network:  # noqa: N801
     @staticmethod
     def ip_v4() -> str:
         """Return random IPv4 address."""
-        return '.'.join(str(random.randint(0, 255)) for _ in range(4))
+        return '.'.join(map(str, _POOL.bytes(4)))
 
     @staticmethod
     def ip_v4_private() -> str:
         """Return random private IPv4 address (RFC 1918, any class)."""
-        private_ranges = [
-            ('10.0.0.0', '10.255.255.255'),
-            ('172.16.0.0', '172.31.255.255'),
-            ('192.168.0.0', '192.168.255.255'),
-        ]
-        start, end = random.choices(
-            population=private_ranges,
-            weights=[5, 2, 5],
-            k=1,
-        ).pop()
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address(start)),
-            int(ipaddress.IPv4Address(end)),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        return _ip_v4_in_ranges(_PRIVATE_RANGES, _PRIVATE_CUM_WEIGHTS)
 
     @staticmethod
     def ip_v4_private_a() -> str:
         """Return random private IPv4 address of Class A."""
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address('10.0.0.0')),
-            int(ipaddress.IPv4Address('10.255.255.255')),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        return _ip_v4_in_range(*_PRIVATE_RANGES[0])
 
     @staticmethod
     def ip_v4_private_b() -> str:
         """Return random private IPv4 address of Class B."""
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address('172.16.0.0')),
-            int(ipaddress.IPv4Address('172.31.255.255')),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        return _ip_v4_in_range(*_PRIVATE_RANGES[1])
 
     @staticmethod
     def ip_v4_private_c() -> str:
         """Return random private IPv4 address of Class C."""
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address('192.168.0.0')),
-            int(ipaddress.IPv4Address('192.168.255.255')),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        return _ip_v4_in_range(*_PRIVATE_RANGES[2])
 
     @staticmethod
     def ip_v4_public() -> str:
         """Return random public IPv4 address."""
-        public_ranges = [
-            ('1.0.0.0', '9.255.255.255'),
-            ('11.0.0.0', '100.63.255.255'),
-            ('100.128.0.0', '126.255.255.255'),
-            ('128.0.0.0', '169.253.255.255'),
-            ('169.255.0.0', '172.15.255.255'),
-            ('172.32.0.0', '191.255.255.255'),
-            ('192.0.1.0', '192.0.1.255'),
-            ('192.0.3.0', '192.88.98.255'),
-            ('192.88.100.0', '192.167.255.255'),
-            ('192.169.0.0', '198.17.255.255'),
-            ('198.20.0.0', '198.51.99.255'),
-            ('198.51.101.0', '203.0.112.255'),
-            ('203.0.114.0', '223.255.255.255'),
-        ]
-
-        start, end = random.choices(
-            population=public_ranges,
-            weights=[5, 8, 6, 7, 4, 9, 3, 4, 5, 6, 4, 6, 8],
-            k=1,
-        ).pop()
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address(start)),
-            int(ipaddress.IPv4Address(end)),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        return _ip_v4_in_ranges(_PUBLIC_RANGES, _PUBLIC_CUM_WEIGHTS)
 
     @staticmethod
     def ip_v4_in_subnet(cidr: str) -> str:
         """Return random IPv4 host address within the given CIDR subnet."""
-        net = ipaddress.IPv4Network(cidr, strict=False)
+        net = _parse_ip_v4_network(cidr)
         prefix = net.prefixlen
 
         if prefix == 32:  # noqa: PLR2004
             return str(net.network_address)
 
+        start = int(net.network_address)
+
         if prefix == 31:  # noqa: PLR2004
-            return str(
-                random.choice(
-                    [net.network_address, net.broadcast_address],
-                )
-            )
+            return _ip_v4_in_range(start, start + 1)
 
-        offset = random.randint(1, net.num_addresses - 2)
-        return str(net.network_address + offset)
+        return _ip_v4_in_range(start + 1, start + net.num_addresses - 2)
 
     @staticmethod
     def ip_v6() -> str:
         """Return random IPv6 address."""
-        return str(ipaddress.IPv6Address(random.getrandbits(128)))
+        return str(ipaddress.IPv6Address(_RANDOM.getrandbits(128)))
 
     @staticmethod
     def ip_v6_global() -> str:
         """Return random global unicast IPv6 address (2000::/3)."""
         net = ipaddress.IPv6Network('2000::/3')
-        offset = random.randint(0, net.num_addresses - 1)
+        offset = _RANDOM.randint(0, net.num_addresses - 1)
         return str(ipaddress.IPv6Address(int(net.network_address) + offset))
 
     @staticmethod
     def ip_v6_link_local() -> str:
         """Return random link-local IPv6 address (fe80::/10)."""
         net = ipaddress.IPv6Network('fe80::/10')
-        offset = random.randint(0, net.num_addresses - 1)
+        offset = _RANDOM.randint(0, net.num_addresses - 1)
         return str(ipaddress.IPv6Address(int(net.network_address) + offset))
 
     @staticmethod
     def ip_v6_ula() -> str:
         """Return random unique local IPv6 address (fc00::/7)."""
         net = ipaddress.IPv6Network('fc00::/7')
-        offset = random.randint(0, net.num_addresses - 1)
+        offset = _RANDOM.randint(0, net.num_addresses - 1)
         return str(ipaddress.IPv6Address(int(net.network_address) + offset))
 
     @staticmethod
@@ -560,16 +712,14 @@ class network:  # noqa: N801
             if ouis is None:
                 msg = f'unknown vendor: {vendor!r}'
                 raise ValueError(msg)
-            oui = random.choice(ouis)
+            oui = choice(ouis)
 
         if oui is not None:
             prefix = _parse_oui(oui)
-            suffix = (random.randint(0, 0xFF) for _ in range(3))
-            octets = (*prefix, *suffix)
-        else:
-            octets = tuple(random.randint(0, 0xFF) for _ in range(6))
+            octets = (*prefix, *_POOL.bytes(3))
+            return ':'.join(f'{x:02x}' for x in octets)
 
-        return ':'.join(f'{x:02x}' for x in octets)
+        return _POOL.bytes(6).hex(':')
 
 
 class crypto:  # noqa: N801
@@ -578,22 +728,27 @@ class crypto:  # noqa: N801
     @staticmethod
     def uuid4() -> str:
         """Return universally unique identifier of version 4."""
-        return str(uuid.uuid4())
+        value = bytearray(_POOL.bytes(16))
+        value[6] = (value[6] & 0x0F) | 0x40
+        value[8] = (value[8] & 0x3F) | 0x80
+        h = value.hex()
+
+        return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
 
     @staticmethod
     def md5() -> str:
         """Return random MD5 hash."""
-        return f'{random.getrandbits(128):032x}'
+        return _POOL.bytes(16).hex()
 
     @staticmethod
     def sha1() -> str:
         """Return random SHA-1 hash."""
-        return f'{random.getrandbits(160):040x}'
+        return _POOL.bytes(20).hex()
 
     @staticmethod
     def sha256() -> str:
         """Return random SHA-256 hash."""
-        return f'{random.getrandbits(256):064x}'
+        return _POOL.bytes(32).hex()
 
 
 class datetime:  # noqa: N801
@@ -604,4 +759,4 @@ class datetime:  # noqa: N801
         """Return random timestamp in range [start; end]."""
         delta_seconds = (end - start).total_seconds()
 
-        return start + dt.timedelta(seconds=random.uniform(0, delta_seconds))
+        return start + dt.timedelta(seconds=_RANDOM.uniform(0, delta_seconds))
@@ -2,6 +2,7 @@ import pytest
 from faker import Faker
 
 import eventum.plugins.event.plugins.template.modules.faker as faker
+from eventum.plugins.event.plugins.template.value_pool import GeneratorPools
 
 
 # ---- Test _Locale ----
@@ -29,3 +30,50 @@ def test_locale_different_instances():
 def test_locale_invalid_locale():
     with pytest.raises(KeyError):
         faker.locale['invalid-locale']
+
+
+def test_seed(monkeypatch):
+    monkeypatch.setattr(faker, 'locale', faker._Locale())
+
+    generator = faker.locale['en_US']
+    faker.seed(1)
+    first = [generator.name() for _ in range(5)]
+
+    faker.seed(1)
+    assert [generator.name() for _ in range(5)] == first
+
+    # generators created after seeding are seeded as well
+    monkeypatch.setattr(faker, 'locale', faker._Locale())
+    faker.seed(1)
+    assert [faker.locale['en_US'].name() for _ in range(5)] == first
+
+
+def test_pool():
+    value = faker.pool['en_US'].user_name()
+    assert isinstance(value, str)
+
+    with pytest.raises(KeyError):
+        faker.pool['invalid-locale']
+
+
+def test_unique_pool():
+    pools = GeneratorPools(faker._create_generator, faker._seed_generator)
+    pools.seed(1)
+    pool = pools(size=5, unique=True)['en_US']
+
+    values = [pool.random_int(0, 99) for _ in range(50)]
+    assert len(set(values)) == 50
+
+
+def test_pool_seed(monkeypatch):
+    monkeypatch.setattr(
+        faker,
+        'pool',
+        GeneratorPools(faker._create_generator, faker._seed_generator),
+    )
+
+    faker.seed(1)
+    first = [faker.pool['en_US'].name() for _ in range(2000)]
+
+    faker.seed(1)
+    assert [faker.pool['en_US'].name() for _ in range(2000)] == first
@@ -40,3 +40,27 @@ def test_enums_import():
 
 def test_random_import():
     assert mimesis.random is random
+
+
+def test_seed(monkeypatch):
+    monkeypatch.setattr(mimesis, 'locale', mimesis._Locale())
+
+    generator = mimesis.locale['en']
+    mimesis.seed(1)
+    first = [generator.person.full_name() for _ in range(5)]
+
+    mimesis.seed(1)
+    assert [generator.person.full_name() for _ in range(5)] == first
+
+    # generators created after seeding are seeded as well
+    monkeypatch.setattr(mimesis, 'locale', mimesis._Locale())
+    mimesis.seed(1)
+    assert [mimesis.locale['en'].person.full_name() for _ in range(5)] == first
+
+
+def test_pool():
+    value = mimesis.pool['en'].person.username()
+    assert isinstance(value, str)
+
+    with pytest.raises(KeyError):
+        mimesis.pool['invalid-locale']
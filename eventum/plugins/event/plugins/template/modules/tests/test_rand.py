@@ -68,6 +68,18 @@ def test_weighted_choices_dict():
     assert all(item in mapping for item in results)
 
 
+def test_weighted_choices_distribution():
+    results = rand.weighted_choices(['a', 'b', 'c'], [1, 0, 3], 40000)
+
+    assert 'b' not in results
+    assert 0.72 < results.count('c') / len(results) < 0.78
+
+
+def test_weighted_choice_weights_mismatch():
+    with pytest.raises(ValueError, match='number of weights'):
+        rand.weighted_choice(['a', 'b'], [1])
+
+
 def test_chance():
     assert rand.chance(0.5) in [True, False]
 
@@ -78,6 +90,21 @@ def test_number_integer():
     assert 1 <= value <= 10
 
 
+def test_number_integer_covers_range():
+    values = {rand.number.integer(1, 3) for _ in range(1000)}
+    assert values == {1, 2, 3}
+
+
+def test_number_integer_wide_range():
+    value = rand.number.integer(0, 2**100)
+    assert 0 <= value <= 2**100
+
+
+def test_number_integer_empty_range():
+    with pytest.raises(ValueError):
+        rand.number.integer(10, 1)
+
+
 def test_number_floating():
     value = rand.number.floating(1.5, 5.5)
     assert 1.5 <= value <= 5.5
@@ -441,7 +468,30 @@ def test_mac_oui_and_vendor_mutually_exclusive():
 
 # ---- Crypto Namespace ----
 def test_uuid4():
-    assert isinstance(uuid.UUID(rand.crypto.uuid4()), uuid.UUID)
+    value = uuid.UUID(rand.crypto.uuid4())
+    assert value.version == 4
+    assert value.variant == uuid.RFC_4122
+
+
+# ---- Pools ----
+def test_pool_refill():
+    values = {
+        rand.crypto.md5() for _ in range(2 * rand.BYTES_POOL_SIZE // 16 + 1)
+    }
+    assert len(values) == 2 * rand.BYTES_POOL_SIZE // 16 + 1
+
+    floats = [
+        rand.number.floating(0, 1)
+        for _ in range(2 * rand.FLOATS_POOL_SIZE + 1)
+    ]
+    assert len(set(floats)) == len(floats)
+
+
+def test_pool_chars_are_uniform():
+    letters = rand.string.letters(52_000)
+    counts = [letters.count(c) for c in ascii_letters]
+    assert min(counts) > 800
+    assert max(counts) < 1200
 
 
 def test_md5():
@@ -469,3 +519,25 @@ def test_timestamp():
     ts = rand.datetime.timestamp(start, end)
 
     assert start <= ts <= end
+
+
+# ---- Seeding ----
+def _draw_values():
+    return (
+        [rand.number.integer(0, 10**6) for _ in range(10)],
+        rand.string.hex(16),
+        rand.network.ip_v4(),
+        rand.number.gauss(0, 1),
+        rand.weighted_choice(['a', 'b', 'c'], [1, 2, 3]),
+    )
+
+
+def test_seed():
+    rand.seed(42)
+    first = _draw_values()
+
+    rand.seed(42)
+    assert _draw_values() == first
+
+    rand.seed(43)
+    assert _draw_values() != first
@@ -1,7 +1,9 @@
 """Definition of template event plugin."""
 
+import random
 from collections.abc import MutableMapping
 from copy import copy
+from functools import partial
 from threading import RLock
 from typing import Any, NotRequired, override
 
@@ -16,9 +18,11 @@ from jinja2 import (
 )
 
 from eventum.plugins.event.base.plugin import (
+    BatchProduceParams,
     EventPlugin,
     EventPluginParams,
     ProduceParams,
+    iterate_produce_params,
 )
 from eventum.plugins.event.exceptions import (
     PluginEventDroppedError,
@@ -26,6 +30,9 @@ from eventum.plugins.event.exceptions import (
     PluginProduceError,
 )
 from eventum.plugins.event.plugins.template import modules
+from eventum.plugins.event.plugins.template.bytecode_cache import (
+    get_bytecode_cache,
+)
 from eventum.plugins.event.plugins.template.config import (
     TemplateConfigForGeneralModes,
     TemplateEventPluginConfig,
@@ -41,6 +48,10 @@ from eventum.plugins.event.plugins.template.dispatch import (
 from eventum.plugins.event.plugins.template.module_provider import (
     ModuleProvider,
 )
+from eventum.plugins.event.plugins.template.render_profiler import (
+    RenderProfile,
+    RenderProfiler,
+)
 from eventum.plugins.event.plugins.template.sample_reader import (
     SampleLoadError,
     SamplesReader,
@@ -57,6 +68,7 @@ from eventum.plugins.event.plugins.template.template_pickers import (
     get_picker_class,
 )
 from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.utils.seeding import derive_seed
 from eventum.utils.traceback_utils import shorten_traceback
 
 
@@ -96,6 +108,11 @@ class TemplateEventPlugin(
             value=list(TemplateEventPlugin._JINJA_EXTENSIONS),
         )
 
+        if self._seed is not None:
+            # samples and pickers draw from process wide random stream
+            self._logger.debug('Seeding random stream')
+            random.seed(derive_seed(self._seed, 'random'))
+
         self._logger.debug('Loading samples')
         self._sample_reader = self._load_samples()
 
@@ -103,7 +120,14 @@ class TemplateEventPlugin(
             'Initializing module provider with modules from package',
             package_name=modules.__name__,
         )
-        self._module_provider = ModuleProvider(modules.__name__)
+        self._module_provider = ModuleProvider(
+            modules.__name__,
+            seed=(
+                derive_seed(self._seed, 'modules')
+                if self._seed is not None
+                else None
+            ),
+        )
 
         self._logger.debug('Initializing subprocess runner')
         self._subprocess_runner = SubprocessRunner()
@@ -142,6 +166,23 @@ class TemplateEventPlugin(
         self._logger.debug('Loading templates')
         self._templates = self._load_templates()
 
+        # Render arguments are resolved once for each template for
+        # performance reasons (to not look them up in each render).
+        self._render_args = {
+            alias: (
+                template,
+                self._template_states[alias],
+                self._template_configs[alias].vars,
+            )
+            for alias, template in self._templates.items()
+        }
+
+        if self._config.root.profile:
+            self._logger.debug('Initializing render profiler')
+            self._render_profiler: RenderProfiler | None = RenderProfiler()
+        else:
+            self._render_profiler = None
+
         self._logger.debug('Initializing template picker')
         self._template_picker = self._initialize_template_picker()
 
@@ -202,6 +243,7 @@ class TemplateEventPlugin(
         env = Environment(
             loader=loader,
             extensions=TemplateEventPlugin._JINJA_EXTENSIONS,
+            bytecode_cache=get_bytecode_cache(),
         )
 
         self._logger.debug('Settings environment globals')
@@ -354,10 +396,22 @@ class TemplateEventPlugin(
         Dispatch signals propagate as-is. Other exceptions are
         wrapped in :class:`PluginProduceError`.
         """
+        template, template_locals, template_vars = self._render_args[alias]
         try:
-            return self._templates[alias].render(
-                locals=self._template_states[alias],
-                vars=self._template_configs[alias].vars,
+            if self._render_profiler is not None:
+                return self._render_profiler.render(
+                    alias,
+                    partial(
+                        template.render,
+                        locals=template_locals,
+                        vars=template_vars,
+                        **params,
+                    ),
+                )
+
+            return template.render(
+                locals=template_locals,
+                vars=template_vars,
                 **params,
             )
         except DispatchSignal:
@@ -446,6 +500,58 @@ class TemplateEventPlugin(
 
             return rendered
 
+    @override
+    def produce_batch(
+        self,
+        params: BatchProduceParams,
+    ) -> tuple[list[str], bool]:
+        # counters are accumulated locally and `_produce` is called
+        # directly to avoid per timestamp overhead of `produce`
+        events: list[str] = []
+        produced = produce_failed = dropped = 0
+        exhausted = False
+
+        for single_params in iterate_produce_params(params):
+            try:
+                rendered = self._produce(single_params)
+            except PluginEventDroppedError:
+                dropped += 1
+                continue
+            except PluginEventsExhaustedError:
+                exhausted = True
+                break
+            except PluginProduceError as e:
+                produce_failed += 1
+                self._logger.error(str(e), **e.context)
+                continue
+            except Exception as e:
+                produce_failed += 1
+                self._logger.exception(
+                    'Unexpected error during event plugin execution',
+                    reason=str(e),
+                )
+                continue
+
+            produced += len(rendered)
+            events.extend(rendered)
+
+        self.merge_counters(
+            produced=produced,
+            produce_failed=produce_failed,
+            dropped=dropped,
+        )
+        return events, exhausted
+
+    @property
+    def render_profile(self) -> RenderProfile | None:
+        """Profile of templates rendering, `None` if profiling is not
+        enabled.
+        """
+        if self._render_profiler is None:
+            return None
+
+        return self._render_profiler.profile()
+
     @property
     def local_states(self) -> dict[str, SingleThreadState]:
         """Local states of templates."""
@@ -162,7 +162,11 @@ def build_context_reference() -> ContextReference:
         Namespace(
             'module.faker',
             'Faker library access. Use module.faker.locale[code] to get '
-            'a Faker instance, then call any Faker provider method.',
+            'a Faker instance, then call any Faker provider method. '
+            'module.faker.pool[code].<method>() serves values of slow '
+            'providers from pools prefilled in background; use '
+            'module.faker.pool(size=n, unique=true)[code] to configure '
+            'pool size and uniqueness.',
             (),
         )
     )
@@ -171,7 +175,8 @@ def build_context_reference() -> ContextReference:
             'module.mimesis',
             'Mimesis library access. Use module.mimesis.locale[code] '
             'for a Generic provider; module.mimesis.enums/random are '
-            're-exported.',
+            're-exported. module.mimesis.pool[code] serves pooled '
+            'values the same way as module.faker.pool.',
             (),
         )
     )
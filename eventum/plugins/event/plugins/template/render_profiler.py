@@ -0,0 +1,278 @@
+"""Profiling of templates rendering with attribution of render time to
+templates and lines of their source.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any
+
+# Each n-th render of a template is traced to attribute its time to
+# lines of template source, tracing is expensive so only a sample of
+# renders is traced
+LINE_SAMPLING_INTERVAL = 100
+
+# Name of template object in globals of compiled jinja template code
+_TEMPLATE_GLOBAL = '__jinja_template__'
+
+type TraceFunction = Callable[[FrameType, str, Any], TraceFunction | None]
+
+
+@dataclass(slots=True)
+class _TemplateCounters:
+    """Render counters of single template."""
+
+    calls: int = 0
+    timed_calls: int = 0
+    timed_total: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateRenderStats:
+    """Render statistics of template.
+
+    Attributes
+    ----------
+    alias : str
+        Alias of the template.
+
+    calls : int
+        Number of renders.
+
+    total : float
+        Estimated total render time (in seconds).
+
+    mean : float
+        Mean render time (in seconds).
+
+    """
+
+    alias: str
+    calls: int
+    total: float
+    mean: float
+
+
+@dataclass(frozen=True, slots=True)
+class LineRenderStats:
+    """Render statistics of template source line, collected in traced
+    renders only.
+
+    Attributes
+    ----------
+    template : str
+        Name of the template.
+
+    line : int
+        Line number in template source.
+
+    hits : int
+        Number of executed lines of compiled template code mapped
+        to the line.
+
+    total : float
+        Total time spent on the line including time of functions
+        called from it (in seconds).
+
+    share : float
+        Share of line time in total time of traced renders.
+
+    """
+
+    template: str
+    line: int
+    hits: int
+    total: float
+    share: float
+
+
+@dataclass(frozen=True, slots=True)
+class RenderProfile:
+    """Profile of templates rendering.
+
+    Attributes
+    ----------
+    templates : list[TemplateRenderStats]
+        Statistics of templates ordered by total render time
+        descending.
+
+    lines : list[LineRenderStats]
+        Statistics of template lines ordered by total time descending.
+
+    """
+
+    templates: list[TemplateRenderStats]
+    lines: list[LineRenderStats]
+
+
+class RenderProfiler:
+    """Profiler of templates rendering.
+
+    Render time is measured for each render of the template, except
+    traced renders as tracing overhead would distort it. Each
+    `line_sampling_interval`-th render of template is traced with
+    attributing time between line events of compiled template code to
+    lines of template source using jinja debug line mapping.
+
+    Parameters
+    ----------
+    line_sampling_interval : int, default=LINE_SAMPLING_INTERVAL
+        Interval of traced renders.
+
+    Notes
+    -----
+    Profiler is not thread safe for rendering, renders must be
+    performed from a single thread, while profile can be taken from
+    any thread.
+
+    """
+
+    def __init__(
+        self,
+        line_sampling_interval: int = LINE_SAMPLING_INTERVAL,
+    ) -> None:
+        """Initialize profiler.
+
+        Parameters
+        ----------
+        line_sampling_interval : int, default=LINE_SAMPLING_INTERVAL
+            Interval of traced renders.
+
+        """
+        self._interval = line_sampling_interval
+        self._templates: dict[str, _TemplateCounters] = {}
+
+        # (template name, line) -> [hits, total time]
+        self._lines: dict[tuple[str, int], list[int]] = {}
+        self._traced_total = 0
+
+    def render(self, alias: str, render: Callable[[], str]) -> str:
+        """Render template with profiling.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the template.
+
+        render : Callable[[], str]
+            Function rendering the template.
+
+        Returns
+        -------
+        str
+            Rendered template.
+
+        """
+        counters = self._templates.get(alias)
+        if counters is None:
+            counters = self._templates[alias] = _TemplateCounters()
+
+        counters.calls += 1
+
+        if counters.calls % self._interval == 1 or self._interval == 1:
+            return self._render_traced(render)
+
+        start = time.perf_counter_ns()
+        try:
+            return render()
+        finally:
+            counters.timed_calls += 1
+            counters.timed_total += time.perf_counter_ns() - start
+
+    def _render_traced(self, render: Callable[[], str]) -> str:
+        """Render template with tracing lines of compiled template
+        code.
+        """
+        lines = self._lines
+
+        # frame -> (template name, line, time of line start)
+        line_starts: dict[FrameType, tuple[str, int, int]] = {}
+
+        def trace_lines(
+            frame: FrameType,
+            event: str,
+            arg: Any,  # noqa: ARG001
+        ) -> TraceFunction | None:
+            now = time.perf_counter_ns()
+
+            previous = line_starts.pop(frame, None)
+            if previous is not None:
+                name, line, start = previous
+                stats = lines.get((name, line))
+                if stats is None:
+                    stats = lines[name, line] = [0, 0]
+                stats[0] += 1
+                stats[1] += now - start
+
+            if event == 'line':
+                template = frame.f_globals[_TEMPLATE_GLOBAL]
+                line_starts[frame] = (
+                    template.name or '<string>',
+                    template.get_corresponding_lineno(frame.f_lineno),
+                    now,
+                )
+
+            return trace_lines
+
+        def trace_calls(
+            frame: FrameType,
+            event: str,
+            arg: Any,  # noqa: ARG001
+        ) -> TraceFunction | None:
+            if event == 'call' and _TEMPLATE_GLOBAL in frame.f_globals:
+                return trace_lines
+
+            return None
+
+        previous_trace = sys.gettrace()
+        start = time.perf_counter_ns()
+        sys.settrace(trace_calls)
+        try:
+            return render()
+        finally:
+            sys.settrace(previous_trace)
+            self._traced_total += time.perf_counter_ns() - start
+
+    def profile(self) -> RenderProfile:
+        """Get profile of rendering.
+
+        Returns
+        -------
+        RenderProfile
+            Profile of rendering.
+
+        """
+        templates: list[TemplateRenderStats] = []
+        for alias, counters in self._templates.copy().items():
+            mean = (
+                counters.timed_total / counters.timed_calls / 1e9
+                if counters.timed_calls
+                else 0.0
+            )
+            templates.append(
+                TemplateRenderStats(
+                    alias=alias,
+                    calls=counters.calls,
+                    total=mean * counters.calls,
+                    mean=mean,
+                ),
+            )
+
+        traced_total = self._traced_total
+        lines = [
+            LineRenderStats(
+                template=name,
+                line=line,
+                hits=hits,
+                total=total / 1e9,
+                share=total / traced_total if traced_total else 0.0,
+            )
+            for (name, line), (hits, total) in self._lines.copy().items()
+        ]
+
+        templates.sort(key=lambda stats: stats.total, reverse=True)
+        lines.sort(key=lambda stats: stats.total, reverse=True)
+
+        return RenderProfile(templates=templates, lines=lines)
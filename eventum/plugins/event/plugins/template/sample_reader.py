@@ -2,17 +2,23 @@
 of different types.
 """
 
+import math
 import random
+import threading
+import weakref
 from collections.abc import Callable, Iterable
 from io import StringIO
 from pathlib import Path
 from typing import Any, Self, TypeVar, overload
 
+import numpy as np
 import structlog
 import tablib  # type: ignore[import-untyped]
+from numpy.typing import NDArray
 from tablib.exceptions import InvalidDimensions  # type: ignore[import-untyped]
 
 from eventum.exceptions import ContextualError
+from eventum.plugins.event.plugins.template.alias_table import AliasTable
 from eventum.plugins.event.plugins.template.config import (
     CSVSampleConfig,
     ItemsSampleConfig,
@@ -20,6 +26,15 @@ from eventum.plugins.event.plugins.template.config import (
     SampleConfig,
     SampleType,
 )
+from eventum.plugins.event.plugins.template.sample_store import (
+    Column,
+    ColumnarStore,
+    InconsistentRowsError,
+    MappedCSVStore,
+    SampleStore,
+    encode_column,
+)
+from eventum.utils.lru_cache import LRUCache
 
 logger = structlog.stdlib.get_logger()
 
@@ -27,6 +42,19 @@ _EMPTY_FIELD_MAP: dict[str, int] = {}
 
 _MISSING: Any = object()
 
+# Max number of memoized results of `Sample.where` for each sample
+WHERE_CACHE_SIZE = 128
+
+# Min size of csv sample file (in bytes) for mapping it into memory
+# instead of reading
+MAPPED_SAMPLE_MIN_SIZE = 16 * 2**20
+
+# Samples loaded from files shared by all readers of the process
+_SAMPLES_CACHE: weakref.WeakValueDictionary[tuple, Sample] = (
+    weakref.WeakValueDictionary()
+)
+_SAMPLES_CACHE_LOCK = threading.Lock()
+
 T = TypeVar('T')
 
 
@@ -85,54 +113,254 @@ class Row(tuple):  # noqa: SLOT001
         return f'Row({super().__repr__()})'
 
 
+class ColumnIndex:
+    """Hash index of column mapping values to their codes and rows.
+
+    Rows are grouped by codes, so rows of any code are obtained as a
+    slice without scanning the column. Equal values of different types
+    (e.g. `1` and `1.0`) are mapped to all of their codes, so lookup
+    is consistent with equality comparison.
+
+    Parameters
+    ----------
+    column : Column
+        Column to index.
+
+    """
+
+    __slots__ = ('_categories', '_codes', '_order', '_starts', '_unhashable')
+
+    def __init__(self, column: Column) -> None:
+        """Build index of column.
+
+        Parameters
+        ----------
+        column : Column
+            Column to index.
+
+        """
+        categories, codes = column
+
+        self._categories = categories
+        self._order = np.argsort(codes, kind='stable')
+        self._starts = np.zeros(len(categories) + 1, dtype=np.intp)
+        np.cumsum(
+            np.bincount(codes, minlength=len(categories)),
+            out=self._starts[1:],
+        )
+
+        self._codes: dict[Any, list[int]] = {}
+        self._unhashable: list[int] = []
+        for code, category in enumerate(categories):
+            try:
+                self._codes.setdefault(category, []).append(code)
+            except TypeError:
+                self._unhashable.append(code)
+
+    def lookup(self, value: Any) -> list[int] | None:
+        """Get codes of values equal to specified value.
+
+        Parameters
+        ----------
+        value : Any
+            Value to look up.
+
+        Returns
+        -------
+        list[int] | None
+            Codes of equal values or `None` if value is unhashable and
+            cannot be looked up.
+
+        """
+        try:
+            codes = self._codes.get(value, [])
+        except TypeError:
+            return None
+
+        if self._unhashable:
+            codes = codes + [
+                code
+                for code in self._unhashable
+                if self._categories[code] == value
+            ]
+
+        return codes
+
+    def rows(self, codes: list[int]) -> NDArray[np.intp]:
+        """Get sorted indices of rows with specified codes.
+
+        Parameters
+        ----------
+        codes : list[int]
+            Codes of values.
+
+        Returns
+        -------
+        NDArray[np.intp]
+            Indices of rows.
+
+        """
+        if len(codes) == 1:
+            code = codes[0]
+            return self._order[self._starts[code] : self._starts[code + 1]]
+
+        return np.sort(
+            np.concatenate(
+                [
+                    self._order[self._starts[code] : self._starts[code + 1]]
+                    for code in codes
+                ]
+                or [np.empty(0, dtype=np.intp)],
+            ),
+        )
+
+
+class _SampleIndex:
+    """Hash indexes of sample columns built on first use, it is shared
+    by sample and all samples derived from it.
+
+    Parameters
+    ----------
+    store : SampleStore
+        Store of sample rows.
+
+    """
+
+    __slots__ = ('_indexes', '_store')
+
+    def __init__(self, store: SampleStore) -> None:
+        """Initialize indexes.
+
+        Parameters
+        ----------
+        store : SampleStore
+            Store of sample rows.
+
+        """
+        self._store = store
+        self._indexes: dict[int, ColumnIndex] = {}
+
+    def __getitem__(self, column: int) -> ColumnIndex:
+        index = self._indexes.get(column)
+        if index is None:
+            index = self._indexes[column] = ColumnIndex(
+                self._store.column(column),
+            )
+
+        return index
+
+
 class Sample:
-    """Immutable sample with picking and filtering support."""
+    """Immutable sample with picking and filtering support.
+
+    Rows are kept in store, which provides columns encoded as distinct
+    values and array of their codes, so filtering is performed with
+    vectorized comparison of codes and rows are materialized only
+    when they are accessed. Filtered samples share store and hash
+    indexes of its columns with sample they are derived from and only
+    keep indices of their rows. Results of filtering are memoized, so
+    repeated filters with the same conditions return the same sample
+    along with its alias tables built for weighted picks.
+
+    Parameters
+    ----------
+    store : SampleStore
+        Store of rows.
+
+    field_map : dict[str, int]
+        Mapping of column names to indices.
+
+    named : bool
+        Whether column names are defined by the source (rather than
+        generated from column indices).
+
+    rows : NDArray[np.intp] | None, default=None
+        Sorted indices of sample rows in store, if `None` then all
+        rows of store are in the sample.
+
+    index : _SampleIndex | None, default=None
+        Indexes of columns, if `None` then new indexes are created.
+
+    """
 
     __slots__ = (
-        '_cum_weights_cache',
-        '_dataset',
+        '__weakref__',
+        '_alias_tables',
         '_field_map',
+        '_index',
+        '_named',
         '_rows',
+        '_store',
+        '_where_cache',
     )
 
-    def __init__(self, dataset: tablib.Dataset) -> None:
+    def __init__(
+        self,
+        store: SampleStore,
+        field_map: dict[str, int],
+        *,
+        named: bool,
+        rows: NDArray[np.intp] | None = None,
+        index: _SampleIndex | None = None,
+    ) -> None:
         """Initialize sample.
 
         Parameters
         ----------
-        dataset : tablib.Dataset
-            Sample data.
+        store : SampleStore
+            Store of rows.
 
-        """
-        self._dataset = dataset
+        field_map : dict[str, int]
+            Mapping of column names to indices.
 
-        if dataset.headers:
-            headers = dataset.headers
-        else:
-            headers = [f'_{i}' for i in range(dataset.width)]
+        named : bool
+            Whether column names are defined by the source.
 
-        self._field_map: dict[str, int] = (
-            {name: i for i, name in enumerate(headers)}
-            if headers
-            else _EMPTY_FIELD_MAP
-        )
+        rows : NDArray[np.intp] | None, default=None
+            Sorted indices of sample rows in store, if `None` then all
+            rows of store are in the sample.
 
-        self._rows: tuple[Row, ...] = tuple(
-            Row(dataset[i], self._field_map) for i in range(len(dataset))
-        )
+        index : _SampleIndex | None, default=None
+            Indexes of columns, if `None` then new indexes are created.
+
+        """
+        self._store = store
+        self._field_map = field_map
+        self._named = named
+        self._index = index if index is not None else _SampleIndex(store)
+
+        if rows is None:
+            rows = np.arange(len(store), dtype=np.intp)
 
-        self._cum_weights_cache: dict[
-            str,
-            list[float],
-        ] = {}
+        self._rows = rows
+
+        self._alias_tables: dict[str, AliasTable] = {}
+        self._where_cache: LRUCache[tuple, Sample] | None = None
 
     def __len__(self) -> int:
         return len(self._rows)
 
     def __getitem__(self, key: Any) -> Any:
         if isinstance(key, int):
-            return self._rows[key]
-        return self._dataset[key]
+            return self._row(self._rows.item(key))
+
+        if isinstance(key, str):
+            if key not in self._field_map:
+                raise KeyError(key)
+
+            categories, codes = self._store.column(self._field_map[key])
+            return [categories[code] for code in codes[self._rows].tolist()]
+
+        return self._materialize(self._rows[key])
+
+    def _row(self, index: int) -> Row:
+        """Materialize row with specified index in store."""
+        return Row(self._store.row(index), self._field_map)
+
+    def _materialize(self, indices: NDArray[np.intp]) -> list[Row]:
+        """Materialize rows with specified indices in store."""
+        field_map = self._field_map
+        return [Row(row, field_map) for row in self._store.rows(indices)]
 
     @property
     def columns(self) -> list[str]:
@@ -177,21 +405,76 @@ class Sample:
                 },
             )
 
-        checks = [
-            (self._field_map[col], val) for col, val in conditions.items()
-        ]
+        try:
+            key = tuple(sorted(conditions.items()))
+            hash(key)
+        except TypeError:
+            # unhashable condition values cannot be memoized
+            return self._filter(conditions)
+
+        if self._where_cache is None:
+            self._where_cache = LRUCache(maxsize=WHERE_CACHE_SIZE)
+
+        try:
+            return self._where_cache[key]
+        except KeyError:
+            sample = self._where_cache[key] = self._filter(conditions)
+            return sample
+
+    def _filter(self, conditions: dict[str, Any]) -> Sample:
+        """Filter rows matching all equality conditions.
 
-        headers = self._dataset.headers
-        if headers:
-            new_data = tablib.Dataset(headers=list(headers))
-        else:
-            new_data = tablib.Dataset()
+        Parameters
+        ----------
+        conditions : dict[str, Any]
+            Column-to-value pairs to match, all columns must be present
+            in the sample.
 
-        for row in self._rows:
-            if all(row[idx] == val for idx, val in checks):
-                new_data.append(tuple(row))
+        Returns
+        -------
+        Sample
+            New sample containing matching rows.
 
-        return Sample(new_data)
+        """
+        # sample with all rows of store takes rows of the first
+        # condition from index without scanning
+        rows: NDArray[np.intp] | None = (
+            None if len(self._rows) == len(self._store) else self._rows
+        )
+
+        for column, value in conditions.items():
+            column_index = self._field_map[column]
+            categories, codes = self._store.column(column_index)
+            index = self._index[column_index]
+
+            matching = index.lookup(value)
+            if matching is None:
+                # values are compared once per distinct value and
+                # rows are matched by codes
+                matching = [
+                    code
+                    for code, category in enumerate(categories)
+                    if category == value
+                ]
+            elif rows is None:
+                rows = index.rows(matching)
+                continue
+
+            if rows is None:
+                rows = self._rows
+
+            rows = rows[np.isin(codes[rows], matching)]
+
+            if not len(rows):
+                break
+
+        return Sample(
+            self._store,
+            self._field_map,
+            named=self._named,
+            rows=rows,
+            index=self._index,
+        )
 
     @overload
     def pick(self) -> Row: ...
@@ -219,12 +502,13 @@ class Sample:
             If the sample is empty and no ``default`` is provided.
 
         """
-        if not self._rows:
+        size = len(self._rows)
+        if not size:
             if default is _MISSING:
                 msg = 'Cannot pick from empty sample'
                 raise SamplePickError(msg, context={})
             return default
-        return random.choice(self._rows)
+        return self._row(self._rows.item(random.randrange(size)))
 
     def pick_n(self, n: int) -> list[Row]:
         """Pick n random rows (uniform, with replacement).
@@ -232,9 +516,15 @@ class Sample:
         Returns an empty list when the sample is empty or ``n`` is
         not positive.
         """
-        if not self._rows or n <= 0:
+        size = len(self._rows)
+        if not size or n <= 0:
             return []
-        return random.choices(self._rows, k=n)
+        positions = np.fromiter(
+            (random.randrange(size) for _ in range(n)),
+            dtype=np.intp,
+            count=n,
+        )
+        return self._materialize(self._rows[positions])
 
     @overload
     def weighted_pick(self, weight: str) -> Row: ...
@@ -270,17 +560,13 @@ class Sample:
             or if the weight column is missing or invalid.
 
         """
-        if not self._rows:
+        if not len(self._rows):
             if default is _MISSING:
                 msg = 'Cannot pick from empty sample'
                 raise SamplePickError(msg, context={})
             return default
-        cum_weights = self._get_cum_weights(weight)
-        return random.choices(
-            self._rows,
-            cum_weights=cum_weights,
-            k=1,
-        )[0]
+        table = self._get_alias_table(weight)
+        return self._row(self._rows.item(table.pick(random.random())))
 
     def weighted_pick_n(
         self,
@@ -292,74 +578,170 @@ class Sample:
         Returns an empty list when the sample is empty or ``n`` is
         not positive.
         """
-        if not self._rows or n <= 0:
+        if not len(self._rows) or n <= 0:
             return []
-        cum_weights = self._get_cum_weights(weight)
-        return random.choices(
-            self._rows,
-            cum_weights=cum_weights,
-            k=n,
+        table = self._get_alias_table(weight)
+        positions = table.pick_many(
+            np.fromiter(
+                (random.random() for _ in range(n)),
+                dtype=np.float64,
+                count=n,
+            ),
         )
+        return self._materialize(self._rows[positions])
 
-    def _get_cum_weights(
-        self,
-        column: str,
-    ) -> list[float]:
-        """Get cached cumulative weights for a column."""
-        if column in self._cum_weights_cache:
-            return self._cum_weights_cache[column]
-
-        headers = self._dataset.headers
-        if headers is None or column not in headers:
+    def _get_alias_table(self, column: str) -> AliasTable:
+        """Get cached alias table of weights from a column."""
+        table = self._alias_tables.get(column)
+        if table is not None:
+            return table
+
+        if not self._named or column not in self._field_map:
             msg = 'Weight column not found in sample'
             raise SamplePickError(
                 msg,
                 context={
                     'column': column,
-                    'available_headers': (list(headers) if headers else []),
+                    'available_headers': (
+                        list(self._field_map) if self._named else []
+                    ),
                 },
             )
 
-        raw_weights = self._dataset[column]
+        categories, codes = self._store.column(self._field_map[column])
+        row_codes = codes[self._rows]
 
-        cum = 0.0
-        cum_weights: list[float] = []
-        for i, value in enumerate(raw_weights):
+        # weights are validated once per distinct value
+        weights = np.zeros(len(categories), dtype=np.float64)
+        for code in np.unique(row_codes).tolist():
+            value = categories[code]
             try:
-                w = float(value)
+                w: float | None = float(value)
             except TypeError, ValueError:
-                msg = 'Weight column contains non-numeric value'
-                raise SamplePickError(
-                    msg,
-                    context={
-                        'column': column,
-                        'row': i,
-                        'value': repr(value),
-                    },
-                ) from None
+                w = None
 
-            if w < 0:
+            if w is None or not math.isfinite(w):
+                msg = 'Weight column contains non-numeric value'
+            elif w < 0:
                 msg = 'Weight column contains negative value'
-                raise SamplePickError(
-                    msg,
-                    context={
-                        'column': column,
-                        'row': i,
-                        'value': repr(value),
-                    },
-                )
-            cum += w
-            cum_weights.append(cum)
+            else:
+                weights[code] = w
+                continue
+
+            raise SamplePickError(
+                msg,
+                context={
+                    'column': column,
+                    'row': int(np.flatnonzero(row_codes == code)[0]),
+                    'value': repr(value),
+                },
+            )
 
-        if cum == 0.0:
+        row_weights = weights[row_codes]
+        if not row_weights.any():
             msg = 'All weights are zero'
             raise SamplePickError(
                 msg,
                 context={'column': column},
             )
 
-        self._cum_weights_cache[column] = cum_weights
-        return cum_weights
+        table = self._alias_tables[column] = AliasTable(row_weights)
+        return table
+
+
+def _create_sample(store: SampleStore, headers: list[str] | None) -> Sample:
+    """Create sample from store of rows.
+
+    Parameters
+    ----------
+    store : SampleStore
+        Store of sample rows.
+
+    headers : list[str] | None
+        Names of columns, if not set then columns are named by their
+        indices.
+
+    Returns
+    -------
+    Sample
+        Created sample.
+
+    """
+    if headers:
+        names = headers
+    else:
+        names = [f'_{i}' for i in range(store.width)]
+
+    field_map: dict[str, int] = (
+        {name: i for i, name in enumerate(names)}
+        if names
+        else _EMPTY_FIELD_MAP
+    )
+
+    return Sample(store, field_map, named=bool(headers))
+
+
+def _create_dataset_sample(dataset: tablib.Dataset) -> Sample:
+    """Create sample from dataset.
+
+    Parameters
+    ----------
+    dataset : tablib.Dataset
+        Sample data.
+
+    Returns
+    -------
+    Sample
+        Created sample.
+
+    """
+    rows = dataset[:]
+    columns = tuple(
+        encode_column(row[i] for row in rows) for i in range(dataset.width)
+    )
+
+    return _create_sample(ColumnarStore(columns), dataset.headers)
+
+
+def _load_shared_sample(
+    path: Path,
+    options: tuple,
+    load: Callable[[Path], Sample],
+) -> Sample:
+    """Load sample from file or get sample of the same file loaded
+    with the same options from process wide cache.
+
+    Cache keeps samples only while they are referenced, entries are
+    keyed by modification time and size of file along with its path,
+    so changed files are loaded again.
+
+    Parameters
+    ----------
+    path : Path
+        Path to file of sample.
+
+    options : tuple
+        Hashable options of loading.
+
+    load : Callable[[Path], Sample]
+        Function for loading sample from file with resolved path.
+
+    Returns
+    -------
+    Sample
+        Loaded or cached sample.
+
+    """
+    resolved_path = path.resolve()
+    stat = resolved_path.stat()
+    key = (str(resolved_path), stat.st_mtime_ns, stat.st_size, *options)
+
+    with _SAMPLES_CACHE_LOCK:
+        sample = _SAMPLES_CACHE.get(key)
+        if sample is None:
+            sample = _SAMPLES_CACHE[key] = load(resolved_path)
+
+    return sample
 
 
 def _load_items_sample(config: ItemsSampleConfig, _: Path) -> Sample:
@@ -391,12 +773,40 @@ def _load_items_sample(config: ItemsSampleConfig, _: Path) -> Sample:
     else:
         data.extend((item,) for item in config.source)
 
-    return Sample(data)
+    return _create_dataset_sample(data)
+
+
+def _inconsistent_csv_rows_error(path: Path) -> SampleLoadError:
+    """Create error of csv sample with inconsistent column counts.
+
+    Parameters
+    ----------
+    path : Path
+        Path to csv file.
+
+    Returns
+    -------
+    SampleLoadError
+        Created error.
+
+    """
+    hint = (
+        'If values contain the delimiter character, '
+        'wrap them in quotes per RFC 4180'
+    )
+    msg = 'CSV rows have inconsistent column counts'
+    return SampleLoadError(
+        msg,
+        context={'file_path': str(path), 'hint': hint},
+    )
 
 
 def _load_csv_sample(config: CSVSampleConfig, base_path: Path) -> Sample:
     """Load sample using configuration of type `csv`.
 
+    Files of at least `MAPPED_SAMPLE_MIN_SIZE` bytes are mapped into
+    memory instead of being read.
+
     Parameters
     ----------
     config: CSVSampleConfig
@@ -416,37 +826,46 @@ def _load_csv_sample(config: CSVSampleConfig, base_path: Path) -> Sample:
         If some error occurs during sample loading.
 
     """
-    data = tablib.Dataset()
-
     if config.source.is_absolute():
         resolved_path = config.source
     else:
         resolved_path = base_path / config.source
 
-    with resolved_path.open() as f:
-        try:
-            data.load(
-                in_stream=f,
-                format='csv',
-                headers=config.header,
-                delimiter=config.delimiter,
-                quotechar=config.quotechar,
-            )
-        except InvalidDimensions:
-            hint = (
-                'If values contain the delimiter character, '
-                'wrap them in quotes per RFC 4180'
-            )
-            msg = 'CSV rows have inconsistent column counts'
-            raise SampleLoadError(
-                msg,
-                context={
-                    'file_path': str(resolved_path),
-                    'hint': hint,
-                },
-            ) from None
+    def load(path: Path) -> Sample:
+        size = path.stat().st_size
+        if size and size >= MAPPED_SAMPLE_MIN_SIZE:
+            try:
+                store = MappedCSVStore(
+                    path,
+                    header=config.header,
+                    delimiter=config.delimiter,
+                    quotechar=config.quotechar,
+                )
+            except InconsistentRowsError:
+                raise _inconsistent_csv_rows_error(path) from None
+
+            return _create_sample(store, store.headers)
+
+        data = tablib.Dataset()
+        with path.open() as f:
+            try:
+                data.load(
+                    in_stream=f,
+                    format='csv',
+                    headers=config.header,
+                    delimiter=config.delimiter,
+                    quotechar=config.quotechar,
+                )
+            except InvalidDimensions:
+                raise _inconsistent_csv_rows_error(path) from None
+
+        return _create_dataset_sample(data)
 
-        return Sample(data)
+    return _load_shared_sample(
+        resolved_path,
+        (SampleType.CSV, config.header, config.delimiter, config.quotechar),
+        load,
+    )
 
 
 def _load_json_sample(config: JSONSampleConfig, base_path: Path) -> Sample:
@@ -476,24 +895,27 @@ def _load_json_sample(config: JSONSampleConfig, base_path: Path) -> Sample:
     else:
         resolved_path = base_path / config.source
 
-    with resolved_path.open() as f:
-        content = f.read()
+    def load(path: Path) -> Sample:
+        with path.open() as f:
+            content = f.read()
 
-    data = tablib.Dataset()
+        data = tablib.Dataset()
 
-    try:
-        data.load(
-            in_stream=StringIO(content),
-            format='json',
-        )
-    except InvalidDimensions:
-        msg = 'JSON sample objects have inconsistent keys'
-        raise SampleLoadError(
-            msg,
-            context={'file_path': str(resolved_path)},
-        ) from None
-
-    return Sample(data)
+        try:
+            data.load(
+                in_stream=StringIO(content),
+                format='json',
+            )
+        except InvalidDimensions:
+            msg = 'JSON sample objects have inconsistent keys'
+            raise SampleLoadError(
+                msg,
+                context={'file_path': str(path)},
+            ) from None
+
+        return _create_dataset_sample(data)
+
+    return _load_shared_sample(resolved_path, (SampleType.JSON,), load)
 
 
 def _get_sample_loader(
@@ -0,0 +1,454 @@
+"""Stores of sample rows."""
+
+import csv
+import mmap
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from eventum.utils.byte_search import find_byte, find_line_starts
+
+_LF = ord('\n')
+_CR = ord('\r')
+
+
+class Column(NamedTuple):
+    """Column of sample encoded as categories and codes of values.
+
+    Attributes
+    ----------
+    categories : list[Any]
+        Distinct values of the column (unhashable values are not
+        deduplicated).
+
+    codes : NDArray[np.int32]
+        Index of value in categories for each row.
+
+    """
+
+    categories: list[Any]
+    codes: NDArray[np.int32]
+
+
+def encode_column(values: Iterable[Any]) -> Column:
+    """Encode column values as categories and codes.
+
+    Values are deduplicated by type and equality, so e.g. `1` and
+    `1.0` are different categories and are returned as they are in
+    the source.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        Column values.
+
+    Returns
+    -------
+    Column
+        Encoded column.
+
+    """
+    categories: list[Any] = []
+    index: dict[tuple[type, Any], int] = {}
+    codes: list[int] = []
+
+    for value in values:
+        key = (value.__class__, value)
+        try:
+            code = index.get(key)
+            if code is None:
+                code = index[key] = len(categories)
+                categories.append(value)
+        except TypeError:
+            code = len(categories)
+            categories.append(value)
+
+        codes.append(code)
+
+    return Column(
+        categories=categories,
+        codes=np.array(codes, dtype=np.int32),
+    )
+
+
+class InconsistentRowsError(ValueError):
+    """Rows of sample have inconsistent number of values."""
+
+
+class SampleStore(ABC):
+    """Read only store of sample rows."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @property
+    @abstractmethod
+    def width(self) -> int:
+        """Number of columns."""
+        ...
+
+    @abstractmethod
+    def row(self, index: int) -> list[Any]:
+        """Get values of row.
+
+        Parameters
+        ----------
+        index : int
+            Index of row.
+
+        Returns
+        -------
+        list[Any]
+            Values of row.
+
+        """
+        ...
+
+    @abstractmethod
+    def rows(self, indices: NDArray[np.intp]) -> Iterable[Iterable[Any]]:
+        """Get values of rows.
+
+        Parameters
+        ----------
+        indices : NDArray[np.intp]
+            Indices of rows.
+
+        Returns
+        -------
+        Iterable[Iterable[Any]]
+            Values of each row.
+
+        """
+        ...
+
+    @abstractmethod
+    def column(self, index: int) -> Column:
+        """Get encoded column.
+
+        Parameters
+        ----------
+        index : int
+            Index of column.
+
+        Returns
+        -------
+        Column
+            Encoded column.
+
+        """
+        ...
+
+
+class ColumnarStore(SampleStore):
+    """Store of rows kept in memory as encoded columns.
+
+    Parameters
+    ----------
+    columns : tuple[Column, ...]
+        Encoded columns.
+
+    """
+
+    __slots__ = ('_columns', '_size')
+
+    def __init__(self, columns: tuple[Column, ...]) -> None:
+        """Initialize store.
+
+        Parameters
+        ----------
+        columns : tuple[Column, ...]
+            Encoded columns.
+
+        """
+        self._columns = columns
+        self._size = len(columns[0].codes) if columns else 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def width(self) -> int:  # noqa: D102
+        return len(self._columns)
+
+    def row(self, index: int) -> list[Any]:  # noqa: D102
+        return [
+            categories[codes.item(index)]
+            for categories, codes in self._columns
+        ]
+
+    def rows(self, indices: NDArray[np.intp]) -> Iterable[Iterable[Any]]:  # noqa: D102
+        values = [
+            [categories[code] for code in codes[indices].tolist()]
+            for categories, codes in self._columns
+        ]
+        return zip(*values, strict=True)
+
+    def column(self, index: int) -> Column:  # noqa: D102
+        return self._columns[index]
+
+
+class MappedCSVStore(SampleStore):
+    """Store of rows of csv file mapped into memory.
+
+    File is mapped read only, so its pages are loaded lazily on access
+    and shared by all stores (also in other processes) mapping the
+    same file. Only offsets of records are kept in memory, rows are
+    parsed each time they are accessed and columns are encoded on
+    first use.
+
+    File must be in UTF-8 encoding. Empty lines are skipped and rows
+    shorter than the first row (header) are padded with empty
+    strings.
+
+    Parameters
+    ----------
+    path : Path
+        Path to csv file.
+
+    header : bool
+        Whether the first row of file is header.
+
+    delimiter : str
+        Delimiter of values.
+
+    quotechar : str
+        Character used to quote values.
+
+    Raises
+    ------
+    OSError
+        If file cannot be mapped.
+
+    InconsistentRowsError
+        If some row has more values than the first row (header).
+
+    Notes
+    -----
+    Offsets of records are found with vectorized scan of line breaks
+    unless quote character is present in the file, in this case file
+    is scanned with csv reader, as quoted values can contain line
+    breaks.
+
+    """
+
+    __slots__ = (
+        '_columns',
+        '_data',
+        '_ends',
+        '_format',
+        '_headers',
+        '_starts',
+        '_width',
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        header: bool,
+        delimiter: str,
+        quotechar: str,
+    ) -> None:
+        """Map file and build offsets index of its records.
+
+        Parameters
+        ----------
+        path : Path
+            Path to csv file.
+
+        header : bool
+            Whether the first row of file is header.
+
+        delimiter : str
+            Delimiter of values.
+
+        quotechar : str
+            Character used to quote values.
+
+        Raises
+        ------
+        OSError
+            If file cannot be mapped.
+
+        InconsistentRowsError
+            If some row has more values than the first row
+            (header).
+
+        """
+        with path.open('rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._format = {'delimiter': delimiter, 'quotechar': quotechar}
+        self._columns: dict[int, Column] = {}
+
+        if self._data.find(quotechar.encode()) == -1 and delimiter.isascii():
+            starts, ends, widths = self._scan_lines(ord(delimiter))
+        else:
+            starts, ends, widths = self._scan_records()
+
+        self._headers: list[str] | None = None
+        if header and len(starts):
+            self._headers = self._parse(starts[0], ends[0])
+            starts, ends = starts[1:], ends[1:]
+            self._width = len(self._headers)
+
+            if np.any(widths[1:] > self._width):
+                msg = 'Some rows have more values than header'
+                raise InconsistentRowsError(msg)
+        else:
+            self._width = int(widths[0]) if len(widths) else 0
+
+            if np.any(widths > self._width):
+                msg = 'Some rows have more values than the first row'
+                raise InconsistentRowsError(msg)
+
+        self._starts = starts
+        self._ends = ends
+
+    def _scan_lines(
+        self,
+        delimiter: int,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        """Find records as non empty lines of file.
+
+        Parameters
+        ----------
+        delimiter : int
+            Delimiter byte.
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]
+            Start offsets, end offsets and number of values of records.
+
+        """
+        size = len(self._data)
+        starts = find_line_starts(self._data)
+        if not len(starts):
+            return starts, starts, starts
+
+        buffer = np.frombuffer(self._data, dtype=np.uint8)
+        ends = np.append(starts[1:], size)
+
+        # end of line content without line break
+        content_ends = ends - (buffer[ends - 1] == _LF)
+        content_ends -= (content_ends > starts) & (
+            buffer[np.maximum(content_ends - 1, 0)] == _CR
+        )
+
+        non_empty = content_ends > starts
+        starts, ends = starts[non_empty], ends[non_empty]
+        content_ends = content_ends[non_empty]
+
+        delimiters = find_byte(self._data, delimiter)
+        widths = (
+            np.searchsorted(delimiters, content_ends)
+            - np.searchsorted(delimiters, starts)
+            + 1
+        )
+
+        return starts, ends, widths
+
+    def _scan_records(
+        self,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        """Find records of file by reading it with csv reader.
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]
+            Start offsets, end offsets and number of values of records.
+
+        """
+        starts_array = find_line_starts(self._data)
+        line_starts = starts_array.tolist()
+        line_ends = [*line_starts[1:], len(self._data)]
+
+        data = self._data
+        lines = (
+            data[start:end].decode()
+            for start, end in zip(line_starts, line_ends, strict=True)
+        )
+        reader = csv.reader(lines, **self._format)  # type: ignore[arg-type]
+
+        starts: list[int] = []
+        ends: list[int] = []
+        widths: list[int] = []
+        first_line = 0
+        for row in reader:
+            if row:
+                starts.append(line_starts[first_line])
+                ends.append(line_ends[reader.line_num - 1])
+                widths.append(len(row))
+
+            first_line = reader.line_num
+
+        return (
+            np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64),
+            np.array(widths, dtype=np.int64),
+        )
+
+    def _parse(self, start: int, end: int) -> list[str]:
+        """Parse record with specified offsets."""
+        return next(
+            csv.reader(
+                (self._data[start:end].decode(),),
+                **self._format,  # type: ignore[arg-type]
+            ),
+        )
+
+    def _iter_rows(
+        self,
+        starts: NDArray[np.int64],
+        ends: NDArray[np.int64],
+    ) -> Iterator[list[str]]:
+        """Parse records with specified offsets and pad them to the
+        width of store.
+        """
+        data = self._data
+        records = (
+            data[start:end].decode()
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+        )
+        width = self._width
+        for row in csv.reader(records, **self._format):  # type: ignore[arg-type]
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+            yield row
+
+    @property
+    def headers(self) -> list[str] | None:
+        """Header of file, `None` if file is read without header."""
+        return self._headers
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def width(self) -> int:  # noqa: D102
+        return self._width
+
+    def row(self, index: int) -> list[Any]:  # noqa: D102
+        row = self._parse(self._starts.item(index), self._ends.item(index))
+        if len(row) < self._width:
+            row.extend([''] * (self._width - len(row)))
+        return row
+
+    def rows(self, indices: NDArray[np.intp]) -> Iterable[Iterable[Any]]:  # noqa: D102
+        return self._iter_rows(self._starts[indices], self._ends[indices])
+
+    def column(self, index: int) -> Column:  # noqa: D102
+        column = self._columns.get(index)
+        if column is None:
+            column = self._columns[index] = encode_column(
+                row[index] for row in self._iter_rows(self._starts, self._ends)
+            )
+
+        return column
@@ -220,6 +220,15 @@ class FSMTemplatePicker(
         self._state = self._get_initial_state()
         self._initial_pick = True
 
+        # conditions are compiled once for all events
+        self._transitions = {
+            alias: [
+                (transition.when.compile(), transition.to)
+                for transition in conf.transitions
+            ]
+            for alias, conf in self._config.items()
+        }
+
     def _get_initial_state(self) -> str:
         """Get alias of initial state.
 
@@ -251,14 +260,9 @@ class FSMTemplatePicker(
             Context of event producing.
 
         """
-        transitions = self._config[self._state].transitions
-
-        if not transitions:
-            return
-
-        for transition in transitions:
-            if transition.when.check(context):
-                self._state = transition.to
+        for check, to in self._transitions[self._state]:
+            if check(context):
+                self._state = to
                 break
 
     @override
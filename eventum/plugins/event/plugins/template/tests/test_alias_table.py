@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from eventum.plugins.event.plugins.template.alias_table import AliasTable
+
+
+def test_pick_distribution():
+    table = AliasTable([1, 2, 3, 4])
+    rng = np.random.default_rng(1)
+
+    counts = np.bincount(
+        [table.pick(u) for u in rng.random(100_000).tolist()],
+        minlength=4,
+    )
+
+    assert len(table) == 4
+    assert np.allclose(counts / counts.sum(), [0.1, 0.2, 0.3, 0.4], atol=0.01)
+
+
+def test_pick_many_distribution():
+    table = AliasTable([1, 2, 3, 4])
+    rng = np.random.default_rng(1)
+
+    counts = np.bincount(table.pick_many(rng.random(100_000)), minlength=4)
+
+    assert np.allclose(counts / counts.sum(), [0.1, 0.2, 0.3, 0.4], atol=0.01)
+
+
+def test_zero_weights_are_never_picked():
+    table = AliasTable([0, 5, 0, 1])
+    rng = np.random.default_rng(1)
+
+    picked = set(table.pick_many(rng.random(10_000)).tolist())
+    picked.update(table.pick(u) for u in rng.random(10_000).tolist())
+
+    assert picked == {1, 3}
+
+
+def test_pick_bounds():
+    table = AliasTable([1, 1, 1])
+
+    assert table.pick(0.0) in {0, 1, 2}
+    assert table.pick(np.nextafter(1.0, 0.0)) in {0, 1, 2}
+
+
+@pytest.mark.parametrize(
+    'weights',
+    [[], [0, 0], [1, -1], [1, float('nan')], [float('inf')]],
+)
+def test_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
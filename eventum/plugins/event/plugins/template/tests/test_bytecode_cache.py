@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from eventum.plugins.event.plugins.template import bytecode_cache
+from eventum.plugins.event.plugins.template.bytecode_cache import (
+    BYTECODE_CACHE_SETTINGS,
+    TemplateBytecodeCache,
+    get_bytecode_cache,
+)
+from eventum.plugins.event.plugins.template.config import (
+    TemplateConfigForGeneralModes,
+    TemplateEventPluginConfig,
+    TemplateEventPluginConfigForGeneralModes,
+    TemplatePickingMode,
+)
+from eventum.plugins.event.plugins.template.plugin import TemplateEventPlugin
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'cache'
+    monkeypatch.setitem(BYTECODE_CACHE_SETTINGS, 'directory', directory)
+    return directory
+
+
+def _make_plugin(base_path: Path) -> TemplateEventPlugin:
+    return TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.ALL,
+                templates=[
+                    {
+                        'test': TemplateConfigForGeneralModes(
+                            template=Path('test.jinja')
+                        )
+                    }
+                ],
+            )
+        ),
+        params={'id': 1, 'base_path': base_path},
+    )
+
+
+def test_cache_disabled_by_default():
+    assert get_bytecode_cache() is None
+
+
+def test_cache_is_shared(cache_dir):
+    cache = get_bytecode_cache()
+
+    assert cache is not None
+    assert cache is get_bytecode_cache()
+    assert cache_dir.is_dir()
+
+
+def test_cache_key_depends_on_mtime(tmp_path):
+    template = tmp_path / 'test.jinja'
+    template.write_text('{{ 1 }}')
+    cache = TemplateBytecodeCache(tmp_path)
+
+    key = cache.get_cache_key('test.jinja', str(template))
+    assert key == cache.get_cache_key('test.jinja', str(template))
+
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert key != cache.get_cache_key('test.jinja', str(template))
+
+
+def test_cache_key_depends_on_version(tmp_path, monkeypatch):
+    cache = TemplateBytecodeCache(tmp_path)
+    key = cache.get_cache_key('test.jinja')
+
+    monkeypatch.setattr(bytecode_cache, '__version__', '0.0.0')
+    assert key != cache.get_cache_key('test.jinja')
+
+
+def test_plugin_uses_cache(tmp_path, cache_dir):
+    (tmp_path / 'test.jinja').write_text('{{ 1 + 1 }}')
+
+    _make_plugin(tmp_path)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    plugin = _make_plugin(tmp_path)
+    events = plugin.produce(
+        params={'tags': (), 'timestamp': None},  # type: ignore[typeddict-item]
+    )
+    assert events == ['2']
+    assert len(list(cache_dir.iterdir())) == 1
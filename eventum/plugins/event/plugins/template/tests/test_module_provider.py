@@ -26,3 +26,13 @@ def test_module_loader_invalid(module_provider):
     with pytest.raises(KeyError):
         module_provider['unexistent']
         module_provider['unexistent']
+
+
+def test_module_loader_seeds_local_modules():
+    ModuleProvider(modules.__name__, seed=1)['rand']
+    first = [rand.number.integer(0, 10**6) for _ in range(10)]
+
+    ModuleProvider(modules.__name__, seed=1)['rand']
+    second = [rand.number.integer(0, 10**6) for _ in range(10)]
+
+    assert first == second
@@ -1,6 +1,9 @@
 # type: ignore
 import os
 from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
 
 from jinja2 import DictLoader
 
@@ -532,3 +535,173 @@ def test_tags():
 
     assert len(events) == 1
     assert events.pop() == 'interesting'
+
+
+def test_produce_batch():
+    plugin = TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.ALL,
+                templates=[
+                    {
+                        'test': TemplateConfigForGeneralModes(
+                            template='test.jinja'
+                        )
+                    }
+                ],
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(
+                mapping={
+                    'test.jinja': (
+                        '{{ timestamp.isoformat() }} {{ tags[0] }}'
+                        '{% if tags[0] == "bad" %}{{ 1 / 0 }}{% endif %}'
+                    )
+                }
+            ),
+        },
+    )
+    tz = ZoneInfo('UTC')
+
+    events, exhausted = plugin.produce_batch(
+        params={
+            'timestamps': np.array(
+                [
+                    '2025-01-01T00:00:00',
+                    '2025-01-01T00:00:01',
+                    '2025-01-01T00:00:02',
+                ],
+                dtype='datetime64[us]',
+            ),
+            'timezone': tz,
+            'tags': [('a',), ('b',), ('bad',)],
+        }
+    )
+
+    assert not exhausted
+    assert events == [
+        '2025-01-01T00:00:00+00:00 a',
+        '2025-01-01T00:00:01+00:00 b',
+    ]
+    assert plugin.produced == 2
+    assert plugin.produce_failed == 1
+
+
+def test_render_profile():
+    plugin = TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                mode=TemplatePickingMode.ALL,
+                profile=True,
+                templates=[
+                    {
+                        'test': TemplateConfigForGeneralModes(
+                            template='test.jinja'
+                        )
+                    }
+                ],
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(
+                mapping={'test.jinja': '{{ 1 + 1 }}'}
+            ),
+        },
+    )
+
+    for _ in range(3):
+        plugin.produce(
+            params={'tags': tuple(), 'timestamp': datetime.now().astimezone()}
+        )
+
+    profile = plugin.render_profile
+    assert profile is not None
+    assert [(t.alias, t.calls) for t in profile.templates] == [('test', 3)]
+    assert profile.lines[0].template == 'test.jinja'
+
+
+def test_render_profile_disabled():
+    plugin = TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                mode=TemplatePickingMode.ALL,
+                templates=[
+                    {
+                        'test': TemplateConfigForGeneralModes(
+                            template='test.jinja'
+                        )
+                    }
+                ],
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(mapping={'test.jinja': '1'}),
+        },
+    )
+
+    assert plugin.render_profile is None
+
+
+def test_seed():
+    def render(seed):
+        plugin = TemplateEventPlugin(
+            config=TemplateEventPluginConfig(
+                root=TemplateEventPluginConfigForGeneralModes(
+                    params={},
+                    samples={
+                        'test_sample': ItemsSampleConfig(
+                            type=SampleType.ITEMS,
+                            source=[f'value{i}' for i in range(100)],
+                        )
+                    },
+                    mode=TemplatePickingMode.ANY,
+                    templates=[
+                        {
+                            'first': TemplateConfigForGeneralModes(
+                                template='test.jinja'
+                            )
+                        },
+                        {
+                            'second': TemplateConfigForGeneralModes(
+                                template='test.jinja'
+                            )
+                        },
+                    ],
+                )
+            ),
+            params={
+                'id': 1,
+                'seed': seed,
+                'templates_loader': DictLoader(
+                    mapping={
+                        'test.jinja': (
+                            '{{ module.rand.number.integer(0, 10**6) }} '
+                            '{{ module.rand.string.hex(8) }} '
+                            '{{ samples.test_sample.pick()[0] }}'
+                        )
+                    }
+                ),
+            },
+        )
+
+        return [
+            event
+            for _ in range(20)
+            for event in plugin.produce(
+                params={
+                    'tags': tuple(),
+                    'timestamp': datetime.now().astimezone(),
+                }
+            )
+        ]
+
+    first = render(1)
+
+    assert render(1) == first
+    assert render(2) != first
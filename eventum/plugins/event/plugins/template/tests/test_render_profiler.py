@@ -0,0 +1,59 @@
+import pytest
+from jinja2 import DictLoader, Environment
+
+from eventum.plugins.event.plugins.template.render_profiler import (
+    RenderProfiler,
+)
+
+
+def _make_environment() -> Environment:
+    return Environment(
+        loader=DictLoader(
+            mapping={
+                'cheap.jinja': 'cheap',
+                'heavy.jinja': (
+                    'start\n{% for i in range(1000) %}{{ i }}{% endfor %}\nend'
+                ),
+            }
+        )
+    )
+
+
+def test_templates_stats():
+    env = _make_environment()
+    profiler = RenderProfiler(line_sampling_interval=10)
+
+    for _ in range(20):
+        profiler.render('cheap', env.get_template('cheap.jinja').render)
+        profiler.render('heavy', env.get_template('heavy.jinja').render)
+
+    profile = profiler.profile()
+
+    assert [stats.alias for stats in profile.templates] == ['heavy', 'cheap']
+    assert all(stats.calls == 20 for stats in profile.templates)
+    assert all(stats.mean > 0 for stats in profile.templates)
+
+
+def test_lines_stats():
+    env = _make_environment()
+    profiler = RenderProfiler(line_sampling_interval=1)
+
+    rendered = profiler.render('heavy', env.get_template('heavy.jinja').render)
+
+    assert rendered.startswith('start\n0123')
+    profile = profiler.profile()
+
+    top = profile.lines[0]
+    assert (top.template, top.line) == ('heavy.jinja', 2)
+    assert top.hits >= 1000
+    assert 0 < top.share <= 1
+
+
+def test_render_error_propagates():
+    env = Environment(loader=DictLoader(mapping={'bad.jinja': '{{ 1 / 0 }}'}))
+    profiler = RenderProfiler(line_sampling_interval=1)
+
+    with pytest.raises(ZeroDivisionError):
+        profiler.render('bad', env.get_template('bad.jinja').render)
+
+    assert profiler.profile().templates[0].calls == 1
@@ -9,6 +9,7 @@ from eventum.plugins.event.plugins.template.config import (
     SampleConfig,
     SampleType,
 )
+import eventum.plugins.event.plugins.template.sample_reader as sample_reader_module
 from eventum.plugins.event.plugins.template.sample_reader import (
     Row,
     Sample,
@@ -17,6 +18,7 @@ from eventum.plugins.event.plugins.template.sample_reader import (
     SamplePickError,
     SamplesReader,
 )
+from eventum.plugins.event.plugins.template.sample_store import MappedCSVStore
 
 BASE_PATH = Path(__file__).parent
 
@@ -571,7 +573,7 @@ def test_weighted_pick_caches_weights(weighted_csv_sample_config):
     sample = sample_reader['weighted_csv']
 
     sample.weighted_pick('weight')
-    assert 'weight' in sample._cum_weights_cache
+    assert 'weight' in sample._alias_tables
 
     # Second call uses cache
     sample.weighted_pick('weight')
@@ -733,3 +735,211 @@ def test_where_on_items_sample_uses_numeric_columns(
     filtered = sample.where(_0='one')
     assert len(filtered) == 1
     assert filtered[0] == ('one', 'two')
+
+
+# --- Columnar storage tests ---
+
+
+def _items_sample(source):
+    sample_reader = SamplesReader(
+        {
+            'items_sample': SampleConfig(
+                root=ItemsSampleConfig(type=SampleType.ITEMS, source=source)
+            )
+        },
+        BASE_PATH,
+    )
+    return sample_reader['items_sample']
+
+
+def test_columns_store_distinct_values_once():
+    sample = _items_sample((('a', 1), ('b', 1), ('a', 2), ('a', 1)))
+
+    categories, codes = sample._store.column(0)
+    assert categories == ['a', 'b']
+    assert codes.tolist() == [0, 1, 0, 0]
+
+
+def test_values_keep_their_types():
+    sample = _items_sample(((1,), (1.0,), (True,)))
+
+    assert [type(row[0]) for row in sample[:]] == [int, float, bool]
+
+
+def test_where_uses_equality_of_values():
+    sample = _items_sample(((1,), (1.0,), (2,)))
+
+    assert sample.where(_0=1)[:] == [(1,), (1.0,)]
+
+
+def test_where_with_unhashable_values():
+    sample = _items_sample(((['a'], 1), (['a'], 2), (['b'], 3)))
+
+    assert sample.where(_0=['a'])['_1'] == [1, 2]
+
+
+def test_where_shares_store():
+    sample = _items_sample((('a', 1), ('b', 2), ('a', 3)))
+
+    filtered = sample.where(_0='a')
+    assert filtered._store is sample._store
+    assert filtered['_1'] == [1, 3]
+    assert filtered[-1] == ('a', 3)
+
+
+def test_weighted_pick_n_on_filtered_sample(weighted_csv_sample_config):
+    sample_reader = SamplesReader(weighted_csv_sample_config, BASE_PATH)
+    sample = sample_reader['weighted_csv']
+
+    filtered = sample.where(name='Jane')
+    picked = filtered.weighted_pick_n('weight', 10)
+
+    assert [row.name for row in picked] == ['Jane'] * 10
+
+
+# --- Memoized and indexed filtering tests ---
+
+
+def test_where_is_memoized(weighted_csv_sample_config):
+    sample_reader = SamplesReader(weighted_csv_sample_config, BASE_PATH)
+    sample = sample_reader['weighted_csv']
+
+    filtered = sample.where(name='Jane')
+    filtered.weighted_pick('weight')
+
+    assert sample.where(name='Jane') is filtered
+    assert 'weight' in sample.where(name='Jane')._alias_tables
+
+
+def test_where_memoization_ignores_conditions_order(csv_sample_config):
+    sample_reader = SamplesReader(csv_sample_config, BASE_PATH)
+    sample = sample_reader['csv_sample']
+
+    assert sample.where(name='Jane', position='HR') is sample.where(
+        position='HR',
+        name='Jane',
+    )
+
+
+def test_where_memoization_is_bounded(monkeypatch):
+    monkeypatch.setattr(sample_reader_module, 'WHERE_CACHE_SIZE', 2)
+    sample = _items_sample(((1,), (2,), (3,)))
+
+    first = sample.where(_0=1)
+    sample.where(_0=2)
+    sample.where(_0=3)
+
+    assert len(sample._where_cache) == 2
+    assert sample.where(_0=1) is not first
+
+
+def test_where_index_is_shared_by_derived_samples():
+    sample = _items_sample((('a', 1), ('b', 2), ('a', 3), ('a', 1)))
+
+    filtered = sample.where(_0='a')
+    assert filtered._index is sample._index
+    assert filtered.where(_1=1)[:] == [('a', 1), ('a', 1)]
+    assert sample.where(_1=1, _0='a')[:] == [('a', 1), ('a', 1)]
+
+
+def test_where_index_matches_equal_values_of_other_types():
+    sample = _items_sample(((1,), (2,), (1.0,), (True,)))
+
+    assert sample.where(_0=1)[:] == [(1,), (1.0,), (True,)]
+    assert sample.where(_0=5)[:] == []
+
+
+# --- Shared and mapped samples tests ---
+
+
+def _csv_sample(path, **kwargs):
+    sample_reader = SamplesReader(
+        {
+            'csv_sample': SampleConfig(
+                root=CSVSampleConfig(
+                    type=SampleType.CSV,
+                    source=path,
+                    **kwargs,
+                )
+            )
+        },
+        BASE_PATH,
+    )
+    return sample_reader['csv_sample']
+
+
+def test_samples_of_same_file_are_shared(csv_sample_config):
+    first = SamplesReader(csv_sample_config, BASE_PATH)['csv_sample']
+    second = SamplesReader(csv_sample_config, BASE_PATH)['csv_sample']
+
+    assert first is second
+
+
+def test_samples_with_other_options_are_not_shared(
+    csv_sample_config,
+    no_header_csv_sample_config,
+):
+    first = SamplesReader(csv_sample_config, BASE_PATH)['csv_sample']
+    second = SamplesReader(no_header_csv_sample_config, BASE_PATH)[
+        'csv_sample'
+    ]
+
+    assert first is not second
+
+
+def test_shared_sample_is_reloaded_after_file_change(tmp_path):
+    path = tmp_path / 'sample.csv'
+    path.write_text('name\nJohn\n')
+    first = _csv_sample(path, header=True)
+
+    path.write_text('name\nJane\nBob\n')
+    second = _csv_sample(path, header=True)
+
+    assert first is not second
+    assert second['name'] == ['Jane', 'Bob']
+
+
+def test_mapped_csv_sample(monkeypatch):
+    monkeypatch.setattr(sample_reader_module, 'MAPPED_SAMPLE_MIN_SIZE', 0)
+    sample = _csv_sample(BASE_PATH / 'static/weighted_sample.csv', header=True)
+
+    assert isinstance(sample._store, MappedCSVStore)
+    assert sample.columns == ['name', 'email', 'weight']
+    assert sample[1] == ('Jane', 'jane@example.com', '20')
+    assert sample['name'] == ['John', 'Jane', 'Bob']
+    assert sample.where(name='Bob')[:] == [('Bob', 'bob@example.com', '10')]
+    assert sample.weighted_pick('weight').name in {'John', 'Jane', 'Bob'}
+
+
+def test_mapped_csv_sample_with_quoted_values(monkeypatch, tmp_path):
+    monkeypatch.setattr(sample_reader_module, 'MAPPED_SAMPLE_MIN_SIZE', 0)
+    path = tmp_path / 'sample.csv'
+    path.write_text('a,b\r\n"x\ny",1\r\n\r\n"p,q"\r\n')
+
+    sample = _csv_sample(path, header=True)
+
+    assert isinstance(sample._store, MappedCSVStore)
+    assert sample[:] == [('x\ny', '1'), ('p,q', '')]
+
+
+def test_mapped_csv_sample_without_header(monkeypatch, tmp_path):
+    monkeypatch.setattr(sample_reader_module, 'MAPPED_SAMPLE_MIN_SIZE', 0)
+    path = tmp_path / 'sample.csv'
+    path.write_text('1|2\n\n3|4\n')
+
+    sample = _csv_sample(path, delimiter='|')
+
+    assert sample.columns == ['_0', '_1']
+    assert sample[:] == [('1', '2'), ('3', '4')]
+
+
+def test_mapped_csv_sample_with_inconsistent_rows(monkeypatch, tmp_path):
+    monkeypatch.setattr(sample_reader_module, 'MAPPED_SAMPLE_MIN_SIZE', 0)
+    path = tmp_path / 'sample.csv'
+    path.write_text('a,b\n1,2,3\n')
+
+    with pytest.raises(
+        SampleLoadError,
+        match='CSV rows have inconsistent column counts',
+    ):
+        _csv_sample(path, header=True)
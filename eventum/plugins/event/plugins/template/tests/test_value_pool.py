@@ -0,0 +1,105 @@
+import itertools
+
+import pytest
+
+from eventum.plugins.event.plugins.template.value_pool import (
+    GeneratorPools,
+    ValuePool,
+)
+
+
+def _counter():
+    counter = itertools.count()
+    return lambda: next(counter)
+
+
+def test_pool_serves_values_of_block():
+    pool = ValuePool(_counter(), 10, unique=False)
+
+    values = [pool() for _ in range(10)]
+
+    assert set(values) <= set(range(10))
+
+
+def test_seeded_pool_switches_blocks():
+    pool = ValuePool(_counter(), 10, unique=False, seed=1)
+
+    first = [pool() for _ in range(10)]
+    second = [pool() for _ in range(10)]
+
+    assert set(first) <= set(range(10))
+    assert set(second) <= set(range(10, 20))
+
+
+def test_seeded_pool_is_reproducible():
+    first = ValuePool(_counter(), 10, unique=False, seed=1)
+    second = ValuePool(_counter(), 10, unique=False, seed=1)
+
+    assert [first() for _ in range(50)] == [second() for _ in range(50)]
+
+
+def test_unique_pool():
+    values = itertools.cycle([1, 2, 1, 3, 2])
+    pool = ValuePool(lambda: next(values), 2, unique=True)
+
+    assert [pool() for _ in range(3)] == [1, 2, 3]
+
+    with pytest.raises(ValueError, match='unique'):
+        pool()
+
+
+def test_pool_with_invalid_size():
+    with pytest.raises(ValueError):
+        ValuePool(_counter(), 0, unique=False)
+
+
+class _Generator:
+    def __init__(self, locale):
+        self.locale = locale
+        self.seed = None
+        self.person = self
+
+    def name(self, prefix=''):
+        return f'{prefix}{self.locale}-{self.seed}'
+
+
+def _create_generator(locale):
+    if locale == 'unknown':
+        raise KeyError(locale)
+    return _Generator(locale)
+
+
+def _seed_generator(generator, seed):
+    generator.seed = seed
+
+
+def test_generator_pools():
+    pools = GeneratorPools(_create_generator, _seed_generator)
+
+    assert pools['en'].name() == 'en-None'
+    assert pools['en'].person.name(prefix='>') == '>en-None'
+    assert pools(size=1)['de'].name() == 'de-None'
+
+
+def test_generator_pools_with_unknown_locale():
+    pools = GeneratorPools(_create_generator, _seed_generator)
+
+    with pytest.raises(KeyError):
+        pools['unknown']
+
+
+def test_generator_pools_with_unhashable_arguments():
+    pools = GeneratorPools(_create_generator, _seed_generator)
+
+    with pytest.raises(TypeError, match='hashable'):
+        pools['en'].name(prefix=[])
+
+
+def test_generator_pools_seed():
+    pools = GeneratorPools(_create_generator, _seed_generator)
+    pools.seed(1)
+
+    first = pools['en'].name()
+    pools.seed(2)
+
+    assert pools['en'].name() != first
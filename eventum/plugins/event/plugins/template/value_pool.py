@@ -0,0 +1,499 @@
+"""Pools of values of slow data generators (e.g. Faker providers)
+prefilled in background.
+"""
+
+import os
+import random
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from eventum.utils.seeding import derive_seed
+
+# Default number of values generated at once to refill pool
+VALUE_POOL_SIZE = 1024
+
+# Max number of attempts to generate each value of unique pool
+UNIQUE_ATTEMPTS = 10
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _reset_executor() -> None:
+    """Drop executor inherited from parent process, as its thread is
+    not running in child process.
+    """
+    global _executor  # noqa: PLW0603
+    _executor = None
+
+
+os.register_at_fork(after_in_child=_reset_executor)
+
+
+def _submit(fn: Callable[[], list[Any]]) -> Future[list[Any]]:
+    """Submit generation of values to background thread.
+
+    All values are generated in single thread, so generators used by
+    pools are never accessed concurrently.
+
+    Parameters
+    ----------
+    fn : Callable[[], list[Any]]
+        Function generating values.
+
+    Returns
+    -------
+    Future[list[Any]]
+        Future of generated values.
+
+    """
+    global _executor  # noqa: PLW0603
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix='value-pool',
+                )
+
+    return _executor.submit(fn)
+
+
+class ValuePool:
+    """Pool of values generated in blocks in background thread.
+
+    Values of regular pool are picked randomly from the current block,
+    once the number of picks reaches size of block, pool switches to
+    the next block if its generation is completed, otherwise values
+    keep being picked from the current block. So values are served
+    without waiting for generator (except for the first block) at the
+    cost of repeating values more often when they are consumed faster
+    than generated. Pool with seed always waits for the next block to
+    serve reproducible values.
+
+    Values of unique pool are served in the order of their generation
+    and each value is served only once during lifetime of pool.
+
+    Parameters
+    ----------
+    generate : Callable[[], Any]
+        Function generating single value.
+
+    size : int
+        Number of values in block.
+
+    unique : bool
+        Whether to serve each value only once.
+
+    seed : int | None, default=None
+        Seed for picking values from blocks.
+
+    Raises
+    ------
+    ValueError
+        If size is not positive.
+
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[], Any],
+        size: int,
+        *,
+        unique: bool,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize pool.
+
+        Parameters
+        ----------
+        generate : Callable[[], Any]
+            Function generating single value.
+
+        size : int
+            Number of values in block.
+
+        unique : bool
+            Whether to serve each value only once.
+
+        seed : int | None, default=None
+            Seed for picking values from blocks.
+
+        Raises
+        ------
+        ValueError
+            If size is not positive.
+
+        """
+        if size < 1:
+            msg = 'Pool size must be greater or equal to 1'
+            raise ValueError(msg)
+
+        self._generate = generate
+        self._size = size
+        self._seen: set[Any] | None = set() if unique else None
+        self._wait = seed is not None
+        self._random = random.Random(seed)
+
+        self._block: list[Any] = []
+        self._values: Iterator[Any] = iter(())
+        self._picks = 0
+        self._next_block: Future[list[Any]] | None = None
+        self._lock = threading.Lock()
+
+    def _generate_block(self) -> list[Any]:
+        """Generate block of values.
+
+        Returns
+        -------
+        list[Any]
+            Generated values.
+
+        Raises
+        ------
+        ValueError
+            If no new unique value can be generated.
+
+        """
+        generate = self._generate
+
+        if self._seen is None:
+            return [generate() for _ in range(self._size)]
+
+        seen = self._seen
+        block: list[Any] = []
+        for _ in range(self._size * UNIQUE_ATTEMPTS):
+            value = generate()
+            if value not in seen:
+                seen.add(value)
+                block.append(value)
+
+                if len(block) == self._size:
+                    break
+
+        if not block:
+            msg = 'Failed to generate new unique value'
+            raise ValueError(msg)
+
+        return block
+
+    def _take_next_block(self) -> list[Any]:
+        """Wait for the next block and request generation of another
+        one.
+        """
+        block = self._next_block
+        self._next_block = None
+        if block is None:
+            block = _submit(self._generate_block)
+
+        values = block.result()
+        self._next_block = _submit(self._generate_block)
+
+        return values
+
+    def __call__(self) -> Any:
+        """Get next value of pool.
+
+        Returns
+        -------
+        Any
+            Value.
+
+        Raises
+        ------
+        Exception
+            If generation of values fails.
+
+        """
+        if self._seen is not None:
+            try:
+                return next(self._values)
+            except StopIteration:
+                return self._next_unique()
+
+        self._picks += 1
+        if self._picks > len(self._block):
+            self._switch_block()
+
+        block = self._block
+        return block[int(self._random.random() * len(block))]
+
+    def _next_unique(self) -> Any:
+        """Switch to the next block and return its first value."""
+        with self._lock:
+            # block could be switched by other thread
+            try:
+                return next(self._values)
+            except StopIteration:
+                pass
+
+            self._values = iter(self._take_next_block())
+            return next(self._values)
+
+    def _switch_block(self) -> None:
+        """Switch to the next block if it is generated or if pool must
+        wait for it.
+        """
+        next_block = self._next_block
+        if (
+            self._block
+            and not self._wait
+            and next_block is not None
+            and not next_block.done()
+        ):
+            return
+
+        with self._lock:
+            if self._picks <= len(self._block):
+                # block is switched by other thread
+                return
+
+            self._block = self._take_next_block()
+            self._picks = 1
+
+
+class _PoolAccessor:
+    """Accessor of pools by attribute path of generator method, e.g.
+    `pool.person.username()` serves values of
+    `generator.person.username()`.
+    """
+
+    __slots__ = ('_config', '_path', '_pools')
+
+    def __init__(
+        self,
+        pools: GeneratorPools,
+        config: tuple[str, int, bool],
+        path: tuple[str, ...] = (),
+    ) -> None:
+        self._pools = pools
+        self._config = config
+        self._path = path
+
+    def __getattr__(self, name: str) -> _PoolAccessor:
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return _PoolAccessor(self._pools, self._config, (*self._path, name))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self._path:
+            msg = 'Generator method is not specified'
+            raise TypeError(msg)
+
+        pool = self._pools._get_pool(  # noqa: SLF001
+            self._config,
+            self._path,
+            args,
+            kwargs,
+        )
+        return pool()
+
+
+class GeneratorPools:
+    """Pools of values of per locale generators.
+
+    Pools are accessed by locale and then by attribute path of
+    generator method, e.g. `pools['en_US'].user_name()`, separate pool
+    is created for each method and its arguments. Pool size and
+    uniqueness are configured by calling, e.g.
+    `pools(size=100, unique=True)['en_US'].user_name()`.
+
+    Each locale has its own generator dedicated to pools, so pools do
+    not affect values of generators used directly.
+
+    Parameters
+    ----------
+    create_generator : Callable[[str], Any]
+        Function creating generator for locale, it must raise
+        `KeyError` for unknown locales.
+
+    seed_generator : Callable[[Any, int], None]
+        Function seeding generator.
+
+    """
+
+    def __init__(
+        self,
+        create_generator: Callable[[str], Any],
+        seed_generator: Callable[[Any, int], None],
+    ) -> None:
+        """Initialize pools.
+
+        Parameters
+        ----------
+        create_generator : Callable[[str], Any]
+            Function creating generator for locale, it must raise
+            `KeyError` for unknown locales.
+
+        seed_generator : Callable[[Any, int], None]
+            Function seeding generator.
+
+        """
+        self._create_generator = create_generator
+        self._seed_generator = seed_generator
+        self._seed: int | None = None
+
+        self._generators: dict[str, Any] = {}
+        self._pools: dict[Hashable, ValuePool] = {}
+        self._lock = threading.Lock()
+
+    def seed(self, value: int) -> None:
+        """Seed generators of all locales and drop values generated
+        before.
+
+        Parameters
+        ----------
+        value : int
+            Seed.
+
+        """
+        with self._lock:
+            self._seed = value
+            self._generators = {}
+            self._pools = {}
+
+    def _get_generator(self, locale: str) -> Any:
+        """Get generator of locale dedicated to pools."""
+        generator = self._generators.get(locale)
+        if generator is not None:
+            return generator
+
+        with self._lock:
+            generator = self._generators.get(locale)
+            if generator is None:
+                generator = self._create_generator(locale)
+                if self._seed is not None:
+                    self._seed_generator(
+                        generator,
+                        derive_seed(self._seed, locale),
+                    )
+                self._generators[locale] = generator
+
+        return generator
+
+    def _get_pool(
+        self,
+        config: tuple[str, int, bool],
+        path: tuple[str, ...],
+        args: tuple,
+        kwargs: dict,
+    ) -> ValuePool:
+        """Get pool of generator method called with specified
+        arguments.
+
+        Parameters
+        ----------
+        config : tuple[str, int, bool]
+            Locale, size and uniqueness of pool.
+
+        path : tuple[str, ...]
+            Attribute path of generator method.
+
+        args : tuple
+            Positional arguments of method.
+
+        kwargs : dict
+            Keyword arguments of method.
+
+        Returns
+        -------
+        ValuePool
+            Pool of values.
+
+        Raises
+        ------
+        TypeError
+            If arguments are unhashable.
+
+        """
+        key = (config, path, args, tuple(sorted(kwargs.items())))
+        try:
+            pool = self._pools.get(key)
+        except TypeError:
+            msg = 'Arguments of pooled generator method must be hashable'
+            raise TypeError(msg) from None
+
+        if pool is not None:
+            return pool
+
+        locale, size, unique = config
+        generator = self._get_generator(locale)
+
+        def generate() -> Any:
+            method = generator
+            for name in path:
+                method = getattr(method, name)
+            return method(*args, **kwargs)
+
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = ValuePool(
+                    generate,
+                    size,
+                    unique=unique,
+                    seed=(
+                        None
+                        if self._seed is None
+                        else derive_seed(self._seed, repr(key))
+                    ),
+                )
+
+        return pool
+
+    def __call__(
+        self,
+        *,
+        size: int = VALUE_POOL_SIZE,
+        unique: bool = False,
+    ) -> _ConfiguredPools:
+        """Get pools with specified configuration.
+
+        Parameters
+        ----------
+        size : int, default=VALUE_POOL_SIZE
+            Number of values generated at once to refill pool.
+
+        unique : bool, default=False
+            Whether to serve each value only once.
+
+        Returns
+        -------
+        _ConfiguredPools
+            Pools accessed by locale.
+
+        """
+        return _ConfiguredPools(self, size, unique=unique)
+
+    def __getitem__(self, locale: str) -> _PoolAccessor:
+        return _ConfiguredPools(self, VALUE_POOL_SIZE, unique=False)[locale]
+
+
+class _ConfiguredPools:
+    """Pools with specific configuration accessed by locale."""
+
+    __slots__ = ('_pools', '_size', '_unique')
+
+    def __init__(
+        self,
+        pools: GeneratorPools,
+        size: int,
+        *,
+        unique: bool,
+    ) -> None:
+        self._pools = pools
+        self._size = size
+        self._unique = unique
+
+    def __getitem__(self, locale: str) -> _PoolAccessor:
+        # generator is created to fail early for unknown locales
+        self._pools._get_generator(locale)  # noqa: SLF001
+
+        return _PoolAccessor(
+            self._pools,
+            (locale, self._size, self._unique),
+        )
@@ -115,6 +115,18 @@ class InputPlugin(Plugin[ConfigT, ParamsT], register=False):
             self._generated += array.size
             yield array
 
+    def merge_counters(self, generated: int) -> None:
+        """Add counters of plugin replicas generating timestamps on
+        behalf of this plugin.
+
+        Parameters
+        ----------
+        generated : int
+            Number of generated timestamps.
+
+        """
+        self._generated += generated
+
     @abstractmethod
     def _generate(
         self,
@@ -260,6 +260,30 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
         if to_concatenate:
             yield np.concatenate(to_concatenate)
 
+    @property
+    def batch_size(self) -> int | None:
+        """Maximum size of producing batches."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int) -> None:
+        """Change maximum size of producing batches, new size is
+        applied starting from the currently accumulating batch.
+
+        Raises
+        ------
+        ValueError
+            If size is less than `MIN_BATCH_SIZE` attribute.
+
+        """
+        if value < self.MIN_BATCH_SIZE:
+            msg = (
+                f'Batch size must be greater or equal to {self.MIN_BATCH_SIZE}'
+            )
+            raise ValueError(msg)
+
+        self._batch_size = value
+
     @override
     def iterate(
         self,
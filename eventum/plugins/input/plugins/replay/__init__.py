@@ -0,0 +1 @@
+"""Package with replay input plugin implementation."""
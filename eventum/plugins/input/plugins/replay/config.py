@@ -0,0 +1,74 @@
+"""Definition of replay input plugin config."""
+
+import re
+from pathlib import Path
+
+from pydantic import Field, field_validator
+
+from eventum.plugins.fields import Encoding
+from eventum.plugins.input.base.config import InputPluginConfig
+from eventum.plugins.input.fields import VersatileDatetime
+
+
+class ReplayInputPluginConfig(InputPluginConfig, frozen=True):
+    """Configuration for `replay` input plugin.
+
+    Attributes
+    ----------
+    path : Path
+        Path to log file.
+
+    timestamp_pattern : str
+        Regular expression pattern with named group `timestamp` that
+        captures original timestamp of each line. For more information
+        about python regex syntax see:
+        https://docs.python.org/3/library/re.html#regular-expression-syntax
+
+    timestamp_format : str | None, default=None
+        Format string of original timestamps in C89 standard. For more
+        information see:
+        https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes
+        If value is not set, then timestamps are parsed in ISO 8601
+        format.
+
+    start : VersatileDatetime, default=None
+        Time to which the first line is shifted, if not set current
+        time is used.
+
+    speed : float, default=1.0
+        Speed factor of replaying, e.g. with value `10` intervals
+        between lines are ten times shorter than original ones.
+
+    encoding : Encoding, default='utf_8'
+        Encoding of the log file.
+
+    Notes
+    -----
+    Plugin generates exactly one timestamp per line of file, so it is
+    intended to be paired with `replay` event plugin reading the same
+    file. Lines without timestamp inherit timestamp of the previous
+    line.
+
+    """
+
+    path: Path
+    timestamp_pattern: str = Field(min_length=1)
+    timestamp_format: str | None = Field(default=None, min_length=1)
+    start: VersatileDatetime = Field(default=None, union_mode='left_to_right')
+    speed: float = Field(default=1.0, gt=0)
+    encoding: Encoding = Field(default='utf_8')
+
+    @field_validator('timestamp_pattern')
+    @classmethod
+    def validate_timestamp_pattern(cls, v: str) -> str:  # noqa: D102
+        try:
+            pattern = re.compile(v)
+        except re.error as e:
+            msg = f'Invalid regular expression: {e}'
+            raise ValueError(msg) from None
+
+        if 'timestamp' not in pattern.groupindex:
+            msg = 'Pattern must contain named group `timestamp`'
+            raise ValueError(msg)
+
+        return v
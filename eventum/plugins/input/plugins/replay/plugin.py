@@ -0,0 +1,297 @@
+"""Definition of replay input plugin."""
+
+import re
+from collections.abc import Iterator
+from datetime import datetime
+from typing import override
+
+import numpy as np
+from numpy import datetime64, timedelta64
+from numpy.typing import NDArray
+
+from eventum.plugins.event.plugins.replay.line_reader import MappedLineReader
+from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
+from eventum.plugins.input.exceptions import PluginGenerationError
+from eventum.plugins.input.normalizers import normalize_versatile_datetime
+from eventum.plugins.input.plugins.replay.config import (
+    ReplayInputPluginConfig,
+)
+from eventum.plugins.input.utils.time_utils import now64, to_naive
+
+
+class ReplayInputPlugin(
+    InputPlugin[ReplayInputPluginConfig, InputPluginParams],
+):
+    """Input plugin for generating timestamps with original timing of
+    lines of log file.
+
+    Notes
+    -----
+    Timestamps of all lines are parsed at initialization, each distinct
+    timestamp value is parsed only once. Generated timestamps are
+    intervals between original timestamps scaled by speed factor and
+    shifted to the start time.
+
+    """
+
+    @override
+    def __init__(
+        self,
+        config: ReplayInputPluginConfig,
+        params: InputPluginParams,
+    ) -> None:
+        super().__init__(config, params)
+        self._filepath = self.resolve_path(config.path)
+        self._pattern = re.compile(config.timestamp_pattern)
+
+        self._offsets = self._scale_offsets(
+            self._fill_timestamps(self._read_timestamps()),
+        )
+
+    def _extract_timestamp(self, line: str) -> str | None:
+        """Extract original timestamp from line.
+
+        Parameters
+        ----------
+        line : str
+            Line of file.
+
+        Returns
+        -------
+        str | None
+            Timestamp captured by `timestamp` group or `None` if it is
+            not found.
+
+        """
+        match = self._pattern.search(line)
+        if match is None:
+            return None
+
+        return match.group('timestamp')
+
+    def _parse_timestamp(self, value: str) -> datetime | None:
+        """Parse original timestamp.
+
+        Parameters
+        ----------
+        value : str
+            Timestamp captured from line.
+
+        Returns
+        -------
+        datetime | None
+            Naive timestamp in plugin timezone or `None` if value
+            cannot be parsed.
+
+        """
+        try:
+            if self._config.timestamp_format is None:
+                timestamp = datetime.fromisoformat(value)
+            else:
+                timestamp = datetime.strptime(  # noqa: DTZ007
+                    value,
+                    self._config.timestamp_format,
+                )
+        except ValueError:
+            return None
+
+        if timestamp.tzinfo is None:
+            return timestamp
+
+        return to_naive(timestamp, self._timezone)
+
+    def _read_timestamps(self) -> NDArray[datetime64]:
+        """Read original timestamps of all lines of file.
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Timestamp of each line, `NaT` for lines without timestamp.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If file cannot be read.
+
+        """
+        self._logger.debug(
+            'Reading timestamps from the file',
+            file_path=str(self._filepath),
+        )
+        try:
+            values = list(
+                MappedLineReader(
+                    path=self._filepath,
+                    encoding=self._config.encoding,
+                    parse=self._extract_timestamp,
+                ),
+            )
+        except (OSError, UnicodeDecodeError) as e:
+            msg = 'Failed to read file'
+            raise PluginConfigurationError(
+                msg,
+                context={
+                    'reason': str(e),
+                    'file_path': str(self._filepath),
+                },
+            ) from None
+
+        timestamps = np.full(len(values), np.datetime64('NaT', 'us'))
+        found = [i for i, value in enumerate(values) if value is not None]
+        if not found:
+            return timestamps
+
+        # timestamps are usually repeated in logs, so each distinct
+        # value is parsed once and then spread over lines
+        unique, inverse = np.unique(
+            np.array([values[i] for i in found]),
+            return_inverse=True,
+        )
+        parsed = np.array(
+            [self._parse_timestamp(value) for value in unique.tolist()],
+            dtype='datetime64[us]',
+        )
+        timestamps[found] = parsed[inverse]
+
+        return timestamps
+
+    def _fill_timestamps(
+        self,
+        timestamps: NDArray[datetime64],
+    ) -> NDArray[datetime64]:
+        """Fill missing timestamps with timestamps of previous lines and
+        align timestamps that are earlier than previous ones.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamp of each line, `NaT` for lines without timestamp.
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Timestamps sorted in ascending order.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If no timestamp is found in file.
+
+        """
+        valid = ~np.isnat(timestamps)
+        if not valid.any():
+            msg = 'No timestamps are found in file'
+            raise PluginConfigurationError(
+                msg,
+                context={'file_path': str(self._filepath)},
+            )
+
+        missing = int(np.count_nonzero(~valid))
+        if missing:
+            self._logger.warning(
+                'Timestamps are not found in some lines, '
+                'they inherit timestamp of previous line',
+                count=missing,
+            )
+
+        # index of the last line with timestamp, lines before the first
+        # timestamp inherit it
+        indices = np.maximum.accumulate(
+            np.where(valid, np.arange(len(timestamps)), 0),
+        )
+        indices[: np.argmax(valid)] = np.argmax(valid)
+        timestamps = timestamps[indices]
+
+        ordered = np.maximum.accumulate(timestamps)
+        unordered = int(np.count_nonzero(ordered != timestamps))
+        if unordered:
+            self._logger.warning(
+                'Some timestamps are earlier than previous ones, '
+                'they are aligned to previous ones',
+                count=unordered,
+            )
+
+        return ordered
+
+    def _scale_offsets(
+        self,
+        timestamps: NDArray[datetime64],
+    ) -> NDArray[timedelta64]:
+        """Get offsets of timestamps from the first one scaled by
+        speed factor.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamps sorted in ascending order.
+
+        Returns
+        -------
+        NDArray[timedelta64]
+            Scaled offsets.
+
+        """
+        offsets = (timestamps - timestamps[0]).astype(np.int64)
+
+        if self._config.speed != 1:
+            offsets = np.round(offsets / self._config.speed).astype(np.int64)
+
+        return offsets.astype('timedelta64[us]')
+
+    @override
+    def _generate(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[NDArray[datetime64]]:
+        moment = now64(self._timezone)
+
+        try:
+            start = normalize_versatile_datetime(
+                value=self._config.start,
+                timezone=self._timezone,
+                none_point='now',
+            )
+        except (ValueError, OverflowError) as e:
+            msg = 'Failed to normalize start time'
+            raise PluginGenerationError(
+                msg,
+                context={'reason': str(e)},
+            ) from None
+
+        timestamps = (
+            datetime64(to_naive(start, self._timezone).isoformat(), 'us')
+            + self._offsets
+        )
+
+        self._logger.debug(
+            'Generating in range',
+            start_timestamp=start.isoformat(),
+            end_timestamp=(
+                timestamps[-1].astype(datetime).replace(tzinfo=self._timezone)
+            ).isoformat(),
+        )
+
+        if skip_past:
+            # moment is taken before start, so timestamps starting now
+            # are not skipped
+            skipped = int(np.searchsorted(timestamps, moment, side='left'))
+            if skipped == len(timestamps):
+                self._logger.info(
+                    'All timestamps are in past, nothing to generate',
+                )
+                return
+
+            if skipped:
+                self._logger.warning(
+                    'Timestamps in past are skipped, so lines are not '
+                    'paired with their original timestamps',
+                    count=skipped,
+                )
+                timestamps = timestamps[skipped:]
+
+        self._buffer.mv_push(timestamps)
+
+        yield from self._buffer.read(size, partial=True)
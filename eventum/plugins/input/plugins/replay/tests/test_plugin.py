@@ -0,0 +1,175 @@
+from datetime import datetime, timedelta
+
+import pytest
+from numpy import datetime64
+from pydantic import ValidationError
+from zoneinfo import ZoneInfo
+
+from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.input.plugins.replay.config import (
+    ReplayInputPluginConfig,
+)
+from eventum.plugins.input.plugins.replay.plugin import ReplayInputPlugin
+
+PATTERN = r'^\[(?P<timestamp>[^\]]+)\]'
+
+
+def generate(plugin, skip_past=False):
+    timestamps = []
+    for batch in plugin.generate(size=100, skip_past=skip_past):
+        timestamps.extend(batch)
+
+    return timestamps
+
+
+def create_plugin(tmp_path, content, **kwargs):
+    path = tmp_path / 'test.log'
+    path.write_text(content)
+
+    config = ReplayInputPluginConfig(
+        path=path,
+        timestamp_pattern=PATTERN,
+        **kwargs,
+    )
+    return ReplayInputPlugin(
+        config=config,
+        params={'id': 1, 'timezone': ZoneInfo('UTC')},
+    )
+
+
+def test_plugin(tmp_path):
+    plugin = create_plugin(
+        tmp_path,
+        '[2020-05-01T10:00:00] first\n'
+        '[2020-05-01T10:00:00.500] second\n'
+        '[2020-05-01T10:00:03] third\n',
+        start=datetime.fromisoformat('2024-01-01T00:00:00Z'),
+    )
+
+    assert generate(plugin) == [
+        datetime64('2024-01-01T00:00:00.000'),
+        datetime64('2024-01-01T00:00:00.500'),
+        datetime64('2024-01-01T00:00:03.000'),
+    ]
+
+
+def test_speed(tmp_path):
+    plugin = create_plugin(
+        tmp_path,
+        '[2020-05-01T10:00:00] first\n[2020-05-01T10:00:10] second\n',
+        start=datetime.fromisoformat('2024-01-01T00:00:00Z'),
+        speed=10,
+    )
+
+    assert generate(plugin) == [
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:01'),
+    ]
+
+
+def test_timestamp_format(tmp_path):
+    plugin = create_plugin(
+        tmp_path,
+        '[01/May/2020:10:00:00 +0300] first\n'
+        '[01/May/2020:07:00:01 +0000] second\n',
+        timestamp_format='%d/%b/%Y:%H:%M:%S %z',
+        start=datetime.fromisoformat('2024-01-01T00:00:00Z'),
+    )
+
+    assert generate(plugin) == [
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:01'),
+    ]
+
+
+def test_lines_without_timestamp(tmp_path):
+    plugin = create_plugin(
+        tmp_path,
+        'header\n'
+        '[2020-05-01T10:00:01] first\n'
+        '  traceback line\n'
+        '[invalid] second\n'
+        '[2020-05-01T10:00:02] third\n',
+        start=datetime.fromisoformat('2024-01-01T00:00:00Z'),
+    )
+
+    assert generate(plugin) == [
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:01'),
+    ]
+
+
+def test_unordered_timestamps(tmp_path):
+    plugin = create_plugin(
+        tmp_path,
+        '[2020-05-01T10:00:02] first\n'
+        '[2020-05-01T10:00:01] second\n'
+        '[2020-05-01T10:00:03] third\n',
+        start=datetime.fromisoformat('2024-01-01T00:00:00Z'),
+    )
+
+    assert generate(plugin) == [
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:00'),
+        datetime64('2024-01-01T00:00:01'),
+    ]
+
+
+def test_start_now_is_not_skipped(tmp_path):
+    plugin = create_plugin(
+        tmp_path,
+        '[2020-05-01T10:00:00] first\n[2020-05-01T10:00:00] second\n',
+    )
+
+    timestamps = generate(plugin, skip_past=True)
+
+    assert len(timestamps) == 2
+    assert timestamps[0] == timestamps[1]
+
+
+def test_past_timestamps_are_skipped(tmp_path):
+    start = datetime.now().astimezone(ZoneInfo('UTC')) - timedelta(hours=1)
+    plugin = create_plugin(
+        tmp_path,
+        '[2020-05-01T10:00:00] first\n[2020-05-01T12:00:00] second\n',
+        start=start,
+    )
+
+    timestamps = generate(plugin, skip_past=True)
+
+    assert timestamps == [
+        datetime64(
+            (start.replace(tzinfo=None) + timedelta(hours=2)).isoformat(),
+            'us',
+        ),
+    ]
+
+
+def test_no_timestamps(tmp_path):
+    with pytest.raises(PluginConfigurationError):
+        create_plugin(tmp_path, 'first\nsecond\n')
+
+
+def test_missing_file(tmp_path):
+    config = ReplayInputPluginConfig(
+        path=tmp_path / 'missing.log',
+        timestamp_pattern=PATTERN,
+    )
+
+    with pytest.raises(PluginConfigurationError):
+        ReplayInputPlugin(
+            config=config,
+            params={'id': 1, 'timezone': ZoneInfo('UTC')},
+        )
+
+
+@pytest.mark.parametrize('pattern', ['(', r'^\[(?P<time>.+)\]'])
+def test_invalid_pattern(tmp_path, pattern):
+    with pytest.raises(ValidationError):
+        ReplayInputPluginConfig(
+            path=tmp_path / 'test.log',
+            timestamp_pattern=pattern,
+        )
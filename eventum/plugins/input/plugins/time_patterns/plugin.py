@@ -93,7 +93,7 @@ class TimePatternInputPlugin(
         super().__init__(config, params)
 
         self._logger.debug('Creating RNG')
-        self._rng = np.random.default_rng()
+        self._rng = np.random.default_rng(self._seed)
 
         self._logger.debug('Generating randomizer factors')
         self._randomizer_factors = self._generate_randomizer_factors(
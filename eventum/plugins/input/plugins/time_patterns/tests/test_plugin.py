@@ -101,3 +101,24 @@ def test_time_pattern_conflicting_dotted_keys_config():
         )
 
     assert 'oscillator.start' in exc.value.context['reason']
+
+
+def test_plugin_seed():
+    config = TimePatternsInputPluginConfig(
+        patterns=[STATIC_FILES_DIR / 'pattern_seeded.yml'],
+    )
+
+    def generate(seed):
+        plugin = TimePatternsInputPlugin(
+            config=config,
+            params={'id': 1, 'timezone': ZoneInfo('UTC'), 'seed': seed},
+        )
+        timestamps = []
+        for batch in plugin.generate(1000, skip_past=False):
+            timestamps.extend(batch)
+        return timestamps
+
+    first = generate(1)
+
+    assert first == generate(1)
+    assert first != generate(2)
@@ -102,3 +102,25 @@ def test_delay_with_size_batching(uneven_delay_source):
     batches = list(batcher.iterate(skip_past=False))
 
     assert [batch.size for batch in batches] == [10, 10, 10, 15, 5]
+
+
+def test_batch_size_change_during_iteration(source):
+    batcher = TimestampsBatcher(
+        source=source, batch_size=1000, batch_delay=None
+    )
+
+    sizes = []
+    for batch in batcher.iterate(skip_past=False):
+        sizes.append(batch.size)
+        if len(sizes) == 2:
+            batcher.batch_size = 500_000
+
+    assert sizes[:3] == [1000, 1000, 500_000]
+    assert sum(sizes) == 1_000_000
+
+
+def test_batch_size_below_minimum(source):
+    batcher = TimestampsBatcher(source=source, batch_size=1000)
+
+    with pytest.raises(ValueError):
+        batcher.batch_size = 0
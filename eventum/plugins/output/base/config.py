@@ -20,6 +20,10 @@ class OutputPluginConfig(PluginConfig, ABC, frozen=True):
     formatter : FormatterConfigT, default=SimpleFormatterConfig(...)
         Formatter configuration.
 
+    best_effort : bool, default=False
+        Whether events can be dropped for the plugin when it cannot
+        keep up with the pipeline instead of slowing it down.
+
     """
 
     formatter: FormatterConfigT = Field(
@@ -27,3 +31,4 @@ class OutputPluginConfig(PluginConfig, ABC, frozen=True):
         validate_default=True,
         discriminator='format',
     )
+    best_effort: bool = Field(default=False)
@@ -1,8 +1,9 @@
 """Definition of base output plugin."""
 
 import asyncio
+import time
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Awaitable, Hashable, Sequence
 from typing import TypeVar, assert_never, override
 
 from pydantic import RootModel
@@ -10,14 +11,19 @@ from pydantic import RootModel
 from eventum.plugins.base.plugin import Plugin, PluginParams
 from eventum.plugins.exceptions import PluginConfigurationError
 from eventum.plugins.output.base.config import OutputPluginConfig
+from eventum.plugins.output.batch import EventBatch
 from eventum.plugins.output.exceptions import PluginWriteError
-from eventum.plugins.output.fields import FormatterConfigT
+from eventum.plugins.output.fields import Format, FormatterConfigT
 from eventum.plugins.output.formatters import (
     Formatter,
     FormatterParams,
     FormattingResult,
     get_formatter_class,
 )
+from eventum.utils.profiler import LatencyHistogram
+
+# Formatting result with duration of formatting in nanoseconds
+type TimedFormattingResult = tuple[FormattingResult, int]
 
 
 class OutputPluginParams(PluginParams):
@@ -44,28 +50,43 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
 
         self._formatter_config = self._get_formatter_config()
         self._formatter = self._get_formatter()
+        self._is_best_effort = self._get_base_config().best_effort
 
         self._written = 0
         self._format_failed = 0
         self._write_failed = 0
 
-    def _get_formatter_config(self) -> FormatterConfigT:
-        """Get formatter config.
+        self._format_latency = LatencyHistogram()
+        self._write_latency = LatencyHistogram()
+
+    def _get_base_config(self) -> OutputPluginConfig:
+        """Get config with base fields of output plugins.
 
         Returns
         -------
-        FormatterConfigT
-            Formatter config.
+        OutputPluginConfig
+            Config with base fields.
 
         """
         match self._config:
             case OutputPluginConfig():
-                return self._config.formatter
+                return self._config
             case RootModel():
-                return self._config.root.formatter
+                return self._config.root
             case t:
                 assert_never(t)
 
+    def _get_formatter_config(self) -> FormatterConfigT:
+        """Get formatter config.
+
+        Returns
+        -------
+        FormatterConfigT
+            Formatter config.
+
+        """
+        return self._get_base_config().formatter
+
     def _get_formatter(self) -> Formatter:
         """Get formatter corresponding to config.
 
@@ -124,27 +145,25 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
 
         await self._logger.adebug('Plugin is closed')
 
-    async def _format_events(self, events: Sequence[str]) -> FormattingResult:
-        """Format events.
+    async def _consume_formatting(
+        self,
+        formatting: Awaitable[TimedFormattingResult],
+    ) -> FormattingResult:
+        """Await formatting, record its duration and log its errors.
 
         Parameters
         ----------
-        events : Sequence[str]
-            Events to format.
+        formatting : Awaitable[TimedFormattingResult]
+            Formatting result with its duration in nanoseconds.
 
         Returns
         -------
         FormattingResult
             Formatting result.
 
-        Notes
-        -----
-        All errors from formatting result are logged.
-
         """
-        formatting_result = await asyncio.to_thread(
-            lambda: self._formatter.format_events(events),
-        )
+        formatting_result, duration = await formatting
+        self._format_latency.record(duration)
 
         if formatting_result.errors:
             contexts: list[dict] = []
@@ -169,13 +188,70 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
 
         return formatting_result
 
-    async def write(self, events: Sequence[str]) -> int:
+    @property
+    def formatter_key(self) -> Hashable | None:
+        """Key identifying formatting done by the plugin, plugins with
+        equal keys produce the same formatting result for the same
+        events. `None` if the plugin formatter preserves original
+        format of events.
+        """
+        if self._formatter_config.format == Format.PLAIN:
+            return None
+
+        return (self._formatter_config, self._base_path)
+
+    async def format(
+        self,
+        events: Sequence[str],
+    ) -> TimedFormattingResult:
+        """Format events with plugin formatter.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Events to format.
+
+        Returns
+        -------
+        TimedFormattingResult
+            Formatting result and duration of formatting in
+            nanoseconds.
+
+        Notes
+        -----
+        Errors from formatting result are not logged and duration is
+        not recorded, this is done by each plugin the result is passed
+        to via `formatting` parameter of `write` method. Result can be
+        passed to plugins with the same `formatter_key`.
+
+        """
+        start = time.perf_counter_ns()
+        formatting_result = await asyncio.to_thread(
+            lambda: self._formatter.format_events(events),
+        )
+        return formatting_result, time.perf_counter_ns() - start
+
+    async def write(
+        self,
+        events: Sequence[str],
+        formatting: Awaitable[TimedFormattingResult] | None = None,
+    ) -> int:
         """Write events.
 
         Parameters
         ----------
         events : Sequence[str]
-            Sequence of events to write.
+            Sequence of events to write. If events are passed as
+            `EventBatch` and plugin formatter preserves original format
+            of events, the batch is passed to plugin without formatting.
+
+        formatting : Awaitable[TimedFormattingResult] | None, default=None
+            Result of `format` method shared with other plugins that
+            have the same `formatter_key`, if not provided events are
+            formatted by the plugin. Awaitable is shielded from
+            cancellation, so it can be awaited by multiple plugins.
+            Duration of formatting and its errors are recorded and
+            logged by each plugin.
 
         Returns
         -------
@@ -198,8 +274,26 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
                 context={},
             )
 
+        if (
+            isinstance(events, EventBatch)
+            and self._formatter_config.format == Format.PLAIN
+        ):
+            try:
+                with self._write_latency.measure():
+                    written = await self._write_batch(events)
+            except:
+                self._write_failed += len(events)
+                raise
+
+            self._written += written
+            return written
+
         try:
-            formatting_result = await self._format_events(events)
+            formatting_result = await self._consume_formatting(
+                self.format(events)
+                if formatting is None
+                else asyncio.shield(formatting),
+            )
         except:
             self._format_failed += len(events)
             raise
@@ -208,7 +302,8 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
             return 0
 
         try:
-            written = await self._write(formatting_result.events)
+            with self._write_latency.measure():
+                written = await self._write(formatting_result.events)
         except:
             self._write_failed += formatting_result.formatted_count
             raise
@@ -224,6 +319,43 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
         self._written += written
         return written
 
+    def drop(self, count: int) -> None:
+        """Count events that are dropped without writing as
+        unsuccessfully written.
+
+        Parameters
+        ----------
+        count : int
+            Number of dropped events.
+
+        """
+        self._write_failed += count
+
+    def merge_counters(
+        self,
+        written: int,
+        write_failed: int,
+        format_failed: int,
+    ) -> None:
+        """Add counters of plugin replicas writing events on behalf of
+        this plugin.
+
+        Parameters
+        ----------
+        written : int
+            Number of written events.
+
+        write_failed : int
+            Number of unsuccessfully written events.
+
+        format_failed : int
+            Number of unsuccessfully formatted events.
+
+        """
+        self._written += written
+        self._write_failed += write_failed
+        self._format_failed += format_failed
+
     @abstractmethod
     async def _open(self) -> None:
         """Open plugin for writing.
@@ -258,6 +390,28 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
         """
         ...
 
+    async def _write_batch(self, batch: EventBatch) -> int:
+        """Write batch of events that are not required to be formatted.
+
+        Parameters
+        ----------
+        batch : EventBatch
+            Batch of events.
+
+        Returns
+        -------
+        int
+            Number of successfully written events.
+
+        Notes
+        -----
+        Default implementation delegates to `_write` method, plugins
+        that write bytes can override it to use buffer of the batch
+        without encoding each event separately.
+
+        """
+        return await self._write(batch)
+
     @property
     def written(self) -> int:
         """Number of written events."""
@@ -272,3 +426,20 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
     def format_failed(self) -> int:
         """Number of unsuccessfully formatted events."""
         return self._format_failed
+
+    @property
+    def is_best_effort(self) -> bool:
+        """Whether events can be dropped for the plugin when it cannot
+        keep up with the pipeline.
+        """
+        return self._is_best_effort
+
+    @property
+    def format_latency(self) -> LatencyHistogram:
+        """Histogram of formatting durations of event batches."""
+        return self._format_latency
+
+    @property
+    def write_latency(self) -> LatencyHistogram:
+        """Histogram of writing durations of event batches."""
+        return self._write_latency
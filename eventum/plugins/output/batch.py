@@ -0,0 +1,333 @@
+"""Columnar batch of events passed from event stage to output plugins."""
+
+import codecs
+from collections.abc import Iterator, Sequence
+from itertools import pairwise
+from typing import Any, overload, override
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def is_utf8(encoding: str) -> bool:
+    """Check whether encoding is UTF-8 (or its alias).
+
+    Parameters
+    ----------
+    encoding : str
+        Name of encoding.
+
+    Returns
+    -------
+    bool
+        `True` if encoding is UTF-8, `False` otherwise.
+
+    """
+    try:
+        return codecs.lookup(encoding).name == 'utf-8'
+    except LookupError:
+        return False
+
+
+class EventBatch(Sequence[str]):
+    """Batch of events that can be represented as one contiguous UTF-8
+    buffer with offsets of each event in it.
+
+    Batch behaves as a sequence of strings, so it can be passed
+    anywhere a sequence of events is expected. Output plugins that
+    write bytes can use the buffer directly instead of encoding each
+    event separately. Buffer is built on first access, so plugins that
+    only work with strings do not pay for encoding.
+
+    Parameters
+    ----------
+    events : list[str] | None, default=None
+        Events, can be omitted if `buffer` and `offsets` are provided.
+
+    buffer : bytes | None, default=None
+        UTF-8 encoded events concatenated without separators.
+
+    offsets : NDArray[np.int64] | None, default=None
+        Offsets of events in buffer, `offsets[i]` and `offsets[i + 1]`
+        are the bounds of i-th event, so the array length is the
+        number of events plus one.
+
+    valid : bool, default=True
+        Whether buffer is a valid UTF-8, it is `False` when some of
+        the events contain characters that are not encodable (e.g.
+        lone surrogates).
+
+    Raises
+    ------
+    ValueError
+        If neither events nor buffer with offsets are provided.
+
+    Notes
+    -----
+    When pickled only the buffer and offsets are transferred, original
+    events are decoded lazily on the receiving side.
+
+    """
+
+    __slots__ = ('_buffer', '_events', '_offsets', '_valid')
+
+    def __init__(
+        self,
+        events: list[str] | None = None,
+        *,
+        buffer: bytes | None = None,
+        offsets: NDArray[np.int64] | None = None,
+        valid: bool = True,
+    ) -> None:
+        """Initialize event batch.
+
+        Parameters
+        ----------
+        events : list[str] | None, default=None
+            Events.
+
+        buffer : bytes | None, default=None
+            UTF-8 encoded events concatenated without separators.
+
+        offsets : NDArray[np.int64] | None, default=None
+            Offsets of events in buffer.
+
+        valid : bool, default=True
+            Whether buffer is a valid UTF-8.
+
+        Raises
+        ------
+        ValueError
+            If neither events nor buffer with offsets are provided.
+
+        """
+        if events is None and (buffer is None or offsets is None):
+            msg = 'Either events or buffer with offsets must be provided'
+            raise ValueError(msg)
+
+        self._events = events
+        self._buffer = buffer
+        self._offsets = offsets
+        self._valid = valid
+
+    @classmethod
+    def from_events(cls, events: Sequence[str]) -> EventBatch:
+        """Build batch from events.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Events to build batch from.
+
+        Returns
+        -------
+        EventBatch
+            Built batch.
+
+        """
+        if isinstance(events, EventBatch):
+            return events
+
+        return cls(list(events))
+
+    def _encode(self) -> tuple[bytes, NDArray[np.int64]]:
+        """Build buffer and offsets from events if they are not built
+        yet.
+        """
+        if self._buffer is not None and self._offsets is not None:
+            return self._buffer, self._offsets
+
+        events = self.events
+        offsets = np.zeros(len(events) + 1, dtype=np.int64)
+        joined = ''.join(events)
+
+        # for ASCII text byte lengths are equal to string lengths, so
+        # the whole batch is encoded at once
+        if joined.isascii():
+            np.cumsum(
+                np.fromiter(map(len, events), np.int64, len(events)),
+                out=offsets[1:],
+            )
+            buffer = joined.encode('ascii')
+        else:
+            try:
+                encoded = [event.encode('utf-8') for event in events]
+            except UnicodeEncodeError:
+                encoded = [
+                    event.encode('utf-8', errors='surrogatepass')
+                    for event in events
+                ]
+                self._valid = False
+
+            np.cumsum(
+                np.fromiter(map(len, encoded), np.int64, len(encoded)),
+                out=offsets[1:],
+            )
+            buffer = b''.join(encoded)
+
+        self._buffer = buffer
+        self._offsets = offsets
+        return buffer, offsets
+
+    @property
+    def buffer(self) -> bytes:
+        """Contiguous UTF-8 buffer of events, built on first access."""
+        return self._encode()[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of buffer in bytes, buffer is built on first access."""
+        return len(self._encode()[0])
+
+    @property
+    def offsets(self) -> NDArray[np.int64]:
+        """Offsets of events in buffer, built on first access."""
+        return self._encode()[1]
+
+    @property
+    def events(self) -> list[str]:
+        """Events as strings, decoded from buffer on first access."""
+        if self._events is None:
+            buffer, offsets = self._encode()
+            errors = 'strict' if self._valid else 'surrogatepass'
+            self._events = [
+                buffer[start:end].decode('utf-8', errors=errors)
+                for start, end in pairwise(offsets.tolist())
+            ]
+
+        return self._events
+
+    def _join_utf8(self, separator: bytes, *, terminate: bool) -> bytes:
+        """Join UTF-8 encoded events with separator using single pass
+        over the buffer.
+        """
+        buffer, offsets = self._encode()
+        count = len(self)
+        sep_count = count if terminate else max(count - 1, 0)
+
+        if not separator or sep_count == 0:
+            return buffer
+
+        sep_size = len(separator)
+        size = len(buffer) + sep_count * sep_size
+
+        # positions of separators in the resulting buffer
+        sep_starts = (
+            offsets[1 : sep_count + 1]
+            + np.arange(sep_count, dtype=np.int64) * sep_size
+        )
+        sep_positions = (
+            sep_starts[:, np.newaxis] + np.arange(sep_size, dtype=np.int64)
+        ).ravel()
+
+        is_event_byte = np.ones(size, dtype=np.bool_)
+        is_event_byte[sep_positions] = False
+
+        result = np.empty(size, dtype=np.uint8)
+        result[is_event_byte] = np.frombuffer(buffer, dtype=np.uint8)
+        result[sep_positions] = np.tile(
+            np.frombuffer(separator, dtype=np.uint8),
+            sep_count,
+        )
+
+        return result.tobytes()
+
+    def join(
+        self,
+        separator: str = '',
+        encoding: str = 'utf-8',
+        *,
+        terminate: bool = False,
+    ) -> bytes:
+        """Join events with separator and encode the result.
+
+        Parameters
+        ----------
+        separator : str, default=''
+            Separator to place between events.
+
+        encoding : str, default='utf-8'
+            Encoding of the result.
+
+        terminate : bool, default=False
+            Whether to place separator after the last event too.
+
+        Returns
+        -------
+        bytes
+            Encoded joined events.
+
+        Raises
+        ------
+        UnicodeEncodeError
+            If events cannot be encoded with specified encoding.
+
+        LookupError
+            If encoding is unknown.
+
+        """
+        if is_utf8(encoding):
+            # validity of buffer is known only after it is built
+            self._encode()
+            if self._valid:
+                return self._join_utf8(
+                    separator.encode('utf-8'),
+                    terminate=terminate,
+                )
+
+        joined = separator.join(self.events)
+        if terminate and self.events:
+            joined += separator
+
+        return joined.encode(encoding)
+
+    @override
+    def __len__(self) -> int:
+        if self._events is not None:
+            return len(self._events)
+
+        return len(self._encode()[1]) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return self.events[index]
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.events)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EventBatch):
+            return self.events == other.events
+
+        if isinstance(other, list):
+            return self.events == other
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self) -> str:
+        return f'EventBatch({self.events!r})'
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        buffer, offsets = self._encode()
+        return (_restore_batch, (buffer, offsets, self._valid))
+
+
+def _restore_batch(
+    buffer: bytes,
+    offsets: NDArray[np.int64],
+    valid: bool,  # noqa: FBT001
+) -> EventBatch:
+    """Restore pickled event batch."""
+    return EventBatch(buffer=buffer, offsets=offsets, valid=valid)
@@ -8,6 +8,7 @@ from clickhouse_connect.driver.binding import quote_identifier as quote
 from clickhouse_connect.driver.httputil import get_pool_manager
 
 from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
+from eventum.plugins.output.batch import EventBatch
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
 from eventum.plugins.output.plugins.clickhouse.config import (
     ClickhouseOutputPluginConfig,
@@ -121,14 +122,55 @@ class ClickhouseOutputPlugin(
 
     @override
     async def _write(self, events: Sequence[str]) -> int:
+        return await self._insert(
+            self._config.header
+            + self._config.separator.join(events)
+            + self._config.footer,
+        )
+
+    @override
+    async def _write_batch(self, batch: EventBatch) -> int:
+        try:
+            insert_block = (
+                self._config.header.encode()
+                + batch.join(self._config.separator)
+                + self._config.footer.encode()
+            )
+        except UnicodeEncodeError as e:
+            msg = 'Failed to encode events'
+            raise PluginWriteError(
+                msg,
+                context={
+                    'reason': str(e),
+                    'host': self._config.host,
+                },
+            ) from e
+
+        return await self._insert(insert_block)
+
+    async def _insert(self, insert_block: str | bytes) -> int:
+        """Insert block of events to the table.
+
+        Parameters
+        ----------
+        insert_block : str | bytes
+            Block of events in configured input format.
+
+        Returns
+        -------
+        int
+            Number of written rows.
+
+        Raises
+        ------
+        PluginWriteError
+            If insertion fails.
+
+        """
         try:
             result = await self._client.raw_insert(
                 table=self._fq_table_name,
-                insert_block=(
-                    self._config.header
-                    + self._config.separator.join(events)
-                    + self._config.footer
-                ),
+                insert_block=insert_block,
                 fmt=self._config.input_format,
             )
         except Exception as e:
@@ -7,6 +7,7 @@ from typing import assert_never, override
 from aioconsole import get_standard_streams  # type: ignore[import-untyped]
 
 from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
+from eventum.plugins.output.batch import EventBatch
 from eventum.plugins.output.exceptions import PluginWriteError
 from eventum.plugins.output.plugins.stdout.config import (
     StdoutOutputPluginConfig,
@@ -79,3 +80,25 @@ class StdoutOutputPlugin(
             await self._writer.drain()
 
         return len(events)
+
+    @override
+    async def _write_batch(self, batch: EventBatch) -> int:
+        try:
+            data = batch.join(
+                self._config.separator,
+                self._config.encoding,
+                terminate=True,
+            )
+        except UnicodeEncodeError as e:
+            msg = 'Cannot encode events'
+            raise PluginWriteError(
+                msg,
+                context={'reason': str(e)},
+            ) from e
+
+        self._writer.write(data)
+
+        if self._config.flush_interval == 0:
+            await self._writer.drain()
+
+        return len(batch)
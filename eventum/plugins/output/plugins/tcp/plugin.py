@@ -8,6 +8,7 @@ from typing import override
 
 from eventum.plugins.exceptions import PluginConfigurationError
 from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
+from eventum.plugins.output.batch import EventBatch
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
 from eventum.plugins.output.plugins.tcp.config import TcpOutputPluginConfig
 from eventum.plugins.output.ssl import create_ssl_context
@@ -143,9 +144,6 @@ class TcpOutputPlugin(
 
     @override
     async def _write(self, events: Sequence[str]) -> int:
-        if self._writer.is_closing():
-            await self._reconnect()
-
         try:
             data = b''.join(
                 f'{event}{self._config.separator}'.encode(
@@ -160,6 +158,44 @@ class TcpOutputPlugin(
                 context={'reason': str(e)},
             ) from e
 
+        await self._send(data)
+        return len(events)
+
+    @override
+    async def _write_batch(self, batch: EventBatch) -> int:
+        try:
+            data = batch.join(
+                self._config.separator,
+                self._config.encoding,
+                terminate=True,
+            )
+        except UnicodeEncodeError as e:
+            msg = 'Cannot encode events'
+            raise PluginWriteError(
+                msg,
+                context={'reason': str(e)},
+            ) from e
+
+        await self._send(data)
+        return len(batch)
+
+    async def _send(self, data: bytes) -> None:
+        """Send data over connection, reconnecting if it is closed.
+
+        Parameters
+        ----------
+        data : bytes
+            Data to send.
+
+        Raises
+        ------
+        PluginWriteError
+            If sending fails.
+
+        """
+        if self._writer.is_closing():
+            await self._reconnect()
+
         try:
             self._writer.write(data)
             await self._writer.drain()
@@ -173,5 +209,3 @@ class TcpOutputPlugin(
                     'port': self._config.port,
                 },
             ) from e
-
-        return len(events)
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import ValidationError
 
+from eventum.plugins.output.batch import EventBatch
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
 from eventum.plugins.output.plugins.tcp.config import TcpOutputPluginConfig
 from eventum.plugins.output.plugins.tcp.plugin import TcpOutputPlugin
@@ -200,6 +201,50 @@ async def test_plugin_custom_separator(mock_open_conn):
     await plugin.close()
 
 
+@pytest.mark.asyncio
+@patch(
+    'eventum.plugins.output.plugins.tcp.plugin.asyncio.open_connection',
+)
+async def test_plugin_write_batch(mock_open_conn):
+    writer = _make_mock_writer()
+    mock_open_conn.return_value = (MagicMock(), writer)
+
+    config = _make_config(separator='|')
+    plugin = TcpOutputPlugin(config=config, params={'id': 1})
+
+    await plugin.open()
+    written = await plugin.write(
+        events=EventBatch.from_events(['a', 'b\u00e9']),
+    )
+    assert written == 2
+    assert plugin.written == 2
+
+    writer.write.assert_called_once_with('a|b\u00e9|'.encode())
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+@patch(
+    'eventum.plugins.output.plugins.tcp.plugin.asyncio.open_connection',
+)
+async def test_plugin_write_batch_encoding_error(mock_open_conn):
+    writer = _make_mock_writer()
+    mock_open_conn.return_value = (MagicMock(), writer)
+
+    config = _make_config(encoding='ascii')
+    plugin = TcpOutputPlugin(config=config, params={'id': 1})
+
+    await plugin.open()
+
+    with pytest.raises(PluginWriteError):
+        await plugin.write(events=EventBatch.from_events(['\xe9']))
+
+    assert plugin.write_failed == 1
+
+    await plugin.close()
+
+
 @pytest.mark.asyncio
 @patch(
     'eventum.plugins.output.plugins.tcp.plugin.asyncio.open_connection',
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import ValidationError
 
+from eventum.plugins.output.batch import EventBatch
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
 from eventum.plugins.output.plugins.udp.config import UdpOutputPluginConfig
 from eventum.plugins.output.plugins.udp.plugin import UdpOutputPlugin
@@ -234,6 +235,60 @@ async def test_plugin_partial_encoding_error():
         await plugin.close()
 
 
+@pytest.mark.asyncio
+async def test_plugin_write_batch():
+    transport = _make_mock_transport()
+    loop = asyncio.get_running_loop()
+
+    with patch.object(
+        loop,
+        'create_datagram_endpoint',
+        new=AsyncMock(return_value=(transport, MagicMock())),
+    ):
+        config = _make_config(separator='|')
+        plugin = UdpOutputPlugin(config=config, params={'id': 1})
+
+        await plugin.open()
+
+        written = await plugin.write(
+            events=EventBatch.from_events(['a', '\u00e9', 'c']),
+        )
+        assert written == 3
+
+        assert [call.args[0] for call in transport.sendto.call_args_list] == [
+            b'a|',
+            '\u00e9|'.encode(),
+            b'c|',
+        ]
+
+        await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_plugin_write_batch_partial_encoding_error():
+    transport = _make_mock_transport()
+    loop = asyncio.get_running_loop()
+
+    with patch.object(
+        loop,
+        'create_datagram_endpoint',
+        new=AsyncMock(return_value=(transport, MagicMock())),
+    ):
+        config = _make_config(encoding='ascii')
+        plugin = UdpOutputPlugin(config=config, params={'id': 1})
+
+        await plugin.open()
+
+        written = await plugin.write(
+            events=EventBatch.from_events(['good', '\xe9bad']),
+        )
+        assert written == 1
+
+        transport.sendto.assert_called_once_with(b'good\n')
+
+        await plugin.close()
+
+
 @pytest.mark.asyncio
 async def test_plugin_write_empty_events():
     transport = _make_mock_transport()
@@ -0,0 +1,114 @@
+"""Tests for columnar event batch."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from eventum.plugins.output.batch import EventBatch, is_utf8
+
+
+def test_from_ascii_events():
+    batch = EventBatch.from_events(['a', 'bc', '', 'def'])
+
+    assert len(batch) == 4
+    assert batch.buffer == b'abcdef'
+    assert batch.offsets.tolist() == [0, 1, 3, 3, 6]
+    assert list(batch) == ['a', 'bc', '', 'def']
+    assert batch[1] == 'bc'
+    assert batch[-1] == 'def'
+    assert batch[1:3] == ['bc', '']
+
+
+def test_from_non_ascii_events():
+    batch = EventBatch.from_events(['é', 'x', '€€'])
+
+    assert batch.buffer == 'éx€€'.encode()
+    assert batch.offsets.tolist() == [0, 2, 3, 9]
+    assert list(batch) == ['é', 'x', '€€']
+
+
+def test_from_empty_events():
+    batch = EventBatch.from_events([])
+
+    assert len(batch) == 0
+    assert not batch
+    assert batch.join('\n', terminate=True) == b''
+
+
+def test_buffer_is_built_lazily():
+    batch = EventBatch.from_events(['a', 'é'])
+
+    assert list(batch) == ['a', 'é']
+    assert batch.join('\n', 'utf-16') == 'a\né'.encode('utf-16')
+    assert batch._buffer is None
+
+    assert batch.nbytes == 3
+    assert batch._buffer == 'aé'.encode()
+
+
+def test_requires_events_or_buffer():
+    with pytest.raises(ValueError, match='buffer'):
+        EventBatch(buffer=b'a')
+
+
+def test_from_batch_returns_same_batch():
+    batch = EventBatch.from_events(['a'])
+    assert EventBatch.from_events(batch) is batch
+
+
+@pytest.mark.parametrize(
+    ('separator', 'terminate', 'expected'),
+    [
+        ('', False, 'aébc'),
+        ('\n', False, 'a\né\nbc'),
+        ('\n', True, 'a\né\nbc\n'),
+        ('\r\n', True, 'a\r\né\r\nbc\r\n'),
+        (' ', False, 'a é bc'),
+    ],
+)
+def test_join(separator, terminate, expected):
+    batch = EventBatch.from_events(['a', 'é', 'bc'])
+
+    assert batch.join(separator, terminate=terminate) == expected.encode()
+    assert batch.join(
+        separator,
+        'utf-16',
+        terminate=terminate,
+    ) == expected.encode('utf-16')
+
+
+def test_join_with_unencodable_events():
+    batch = EventBatch.from_events(['a', 'é'])
+
+    with pytest.raises(UnicodeEncodeError):
+        batch.join('\n', 'ascii')
+
+
+def test_surrogates_are_preserved():
+    batch = EventBatch.from_events(['ok', '\ud800'])
+
+    assert list(batch) == ['ok', '\ud800']
+
+    with pytest.raises(UnicodeEncodeError):
+        batch.join('\n')
+
+    restored = pickle.loads(pickle.dumps(batch))  # noqa: S301
+    assert list(restored) == ['ok', '\ud800']
+
+
+def test_pickle_transfers_buffer_only():
+    batch = EventBatch.from_events(['a', 'é'])
+    restored = pickle.loads(pickle.dumps(batch))  # noqa: S301
+
+    assert restored.buffer == batch.buffer
+    assert np.array_equal(restored.offsets, batch.offsets)
+    assert restored == batch
+    assert restored == ['a', 'é']
+
+
+def test_is_utf8():
+    assert is_utf8('utf_8')
+    assert is_utf8('UTF-8')
+    assert not is_utf8('utf-16')
+    assert not is_utf8('unknown')
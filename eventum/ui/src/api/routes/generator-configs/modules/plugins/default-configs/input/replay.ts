@@ -0,0 +1,6 @@
+import { ReplayInputPluginConfig } from '@/api/routes/generator-configs/schemas/plugins/input/configs/replay';
+
+export const ReplayInputPluginDefaultConfig: ReplayInputPluginConfig = {
+  path: './static/data.log',
+  timestamp_pattern: '^(?P<timestamp>\\S+)',
+};
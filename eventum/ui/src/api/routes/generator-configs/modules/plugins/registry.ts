@@ -33,6 +33,7 @@ import { TemplateEventPluginDefaultConfig } from './default-configs/event/templa
 import { CronInputPluginDefaultConfig } from './default-configs/input/cron';
 import { HTTPInputPluginDefaultConfig } from './default-configs/input/http';
 import { LinspaceInputPluginDefaultConfig } from './default-configs/input/linspace';
+import { ReplayInputPluginDefaultConfig } from './default-configs/input/replay';
 import { StaticInputPluginDefaultConfig } from './default-configs/input/static';
 import { TimePatternsInputPluginDefaultConfig } from './default-configs/input/time_patterns';
 import { TimerInputPluginDefaultConfig } from './default-configs/input/timer';
@@ -85,6 +86,11 @@ export const INPUT_PLUGINS_INFO = {
     icon: IconCalendarMonthFilled,
     description: 'Generate timestamps linearly spaced in date range',
   },
+  replay: {
+    label: 'Replay',
+    icon: IconRepeat,
+    description: 'Generate timestamps with original timing of log file',
+  },
   static: {
     label: 'Static',
     icon: IconNumber100Small,
@@ -184,6 +190,7 @@ export const INPUT_PLUGIN_DEFAULT_CONFIGS = {
   cron: CronInputPluginDefaultConfig,
   http: HTTPInputPluginDefaultConfig,
   linspace: LinspaceInputPluginDefaultConfig,
+  replay: ReplayInputPluginDefaultConfig,
   static: StaticInputPluginDefaultConfig,
   time_patterns: TimePatternsInputPluginDefaultConfig,
   timer: TimerInputPluginDefaultConfig,
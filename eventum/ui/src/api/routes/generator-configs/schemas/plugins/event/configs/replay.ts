@@ -11,6 +11,7 @@ export const ReplayEventPluginConfigSchema = BaseEventPluginConfigSchema.extend(
     timestamp_format: z.string().min(1).nullable().optional(),
     repeat: orPlaceholder(z.boolean()).optional(),
     chunk_size: orPlaceholder(z.number().int().gte(0)).optional(),
+    mmap: orPlaceholder(z.boolean()).optional(),
     encoding: orPlaceholder(z.enum(ENCODINGS)).optional(),
   }
 );
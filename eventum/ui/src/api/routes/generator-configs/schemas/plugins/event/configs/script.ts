@@ -1,10 +1,13 @@
 import z from 'zod';
 
+import { orPlaceholder } from '../../../placeholder';
 import { BaseEventPluginConfigSchema } from '../base-config';
 
 export const ScriptEventPluginConfigSchema = BaseEventPluginConfigSchema.extend(
   {
     path: z.string().min(1),
+    workers: orPlaceholder(z.number().int().gte(0)).optional(),
+    batch_size: orPlaceholder(z.number().int().gte(1)).optional(),
   }
 );
 export type ScriptEventPluginConfig = z.infer<
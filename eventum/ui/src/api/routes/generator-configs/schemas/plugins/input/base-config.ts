@@ -8,6 +8,7 @@ export type InputPluginName =
   | 'cron'
   | 'http'
   | 'linspace'
+  | 'replay'
   | 'static'
   | 'time_patterns'
   | 'timer'
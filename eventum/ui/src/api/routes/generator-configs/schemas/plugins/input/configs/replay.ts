@@ -0,0 +1,23 @@
+import z from 'zod';
+
+import { ENCODINGS } from '../../../encodings';
+import { orPlaceholder } from '../../../placeholder';
+import { BaseInputPluginConfigSchema } from '../base-config';
+import { VersatileDatetimeSchema } from '../versatile-datetime';
+
+export const ReplayInputPluginConfigSchema = BaseInputPluginConfigSchema.extend(
+  {
+    path: z.string().min(1),
+    timestamp_pattern: z.string().min(1),
+    timestamp_format: z.string().min(1).nullable().optional(),
+    start: VersatileDatetimeSchema.optional(),
+    speed: orPlaceholder(z.number().gt(0)).optional(),
+    encoding: orPlaceholder(z.enum(ENCODINGS)).optional(),
+  }
+);
+export type ReplayInputPluginConfig = z.infer<
+  typeof ReplayInputPluginConfigSchema
+>;
+export const ReplayInputPluginNamedConfigSchema = z.object({
+  replay: ReplayInputPluginConfigSchema,
+});
@@ -12,6 +12,10 @@ import {
   LinspaceInputPluginConfigSchema,
   LinspaceInputPluginNamedConfigSchema,
 } from './configs/linspace';
+import {
+  ReplayInputPluginConfigSchema,
+  ReplayInputPluginNamedConfigSchema,
+} from './configs/replay';
 import {
   StaticInputPluginConfigSchema,
   StaticInputPluginNamedConfigSchema,
@@ -33,6 +37,7 @@ export const InputPluginNamedConfigSchema = z.union([
   CronInputPluginNamedConfigSchema,
   HTTPInputPluginNamedConfigSchema,
   LinspaceInputPluginNamedConfigSchema,
+  ReplayInputPluginNamedConfigSchema,
   StaticInputPluginNamedConfigSchema,
   TimePatternsInputPluginNamedConfigSchema,
   TimerInputPluginNamedConfigSchema,
@@ -46,6 +51,7 @@ export const InputPluginConfigSchema = z.union([
   CronInputPluginConfigSchema,
   HTTPInputPluginConfigSchema,
   LinspaceInputPluginConfigSchema,
+  ReplayInputPluginConfigSchema,
   StaticInputPluginConfigSchema,
   TimePatternsInputPluginConfigSchema,
   TimerInputPluginConfigSchema,
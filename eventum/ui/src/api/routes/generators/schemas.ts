@@ -65,6 +65,7 @@ export const GeneratorParametersSchema = GenerationParametersSchema.extend({
   live_mode: z.boolean().optional(),
   skip_past: z.boolean().optional(),
   params: z.record(z.string(), z.any()).optional(),
+  seed: z.int().nonnegative().nullable().optional(),
 });
 export type GeneratorParameters = z.infer<typeof GeneratorParametersSchema>;
 
@@ -119,6 +119,17 @@ export const ReplayEventPluginParams: FC<ReplayEventPluginParamsProps> = ({
         }
         {...form.getInputProps('repeat', { type: 'checkbox' })}
       />
+      <Switch
+        label={
+          <LabelWithTooltip
+            label="Memory map"
+            tooltip="Whether to map the file into memory instead of reading it by
+                chunks. Offsets of lines are indexed once and lines of small
+                files are cached for repeated replaying."
+          />
+        }
+        {...form.getInputProps('mmap', { type: 'checkbox' })}
+      />
       <NumberInput
         label={
           <LabelWithTooltip
@@ -1,4 +1,4 @@
-import { Stack } from '@mantine/core';
+import { Group, NumberInput, Stack } from '@mantine/core';
 import { useForm } from '@mantine/form';
 import { zod4Resolver } from 'mantine-form-zod-resolver';
 import { FC } from 'react';
@@ -42,6 +42,49 @@ export const ScriptEventPluginParams: FC<ScriptEventPluginParamsProps> = ({
           form.setFieldValue('path', value ?? undefined!);
         }}
       />
+      <Group grow align="start">
+        <NumberInput
+          label={
+            <LabelWithTooltip
+              label="Workers"
+              tooltip="Number of worker processes running the script, each process
+                imports the script separately. If 0 is provided then script is
+                run in the generator process. Default is 0."
+            />
+          }
+          min={0}
+          allowDecimal={false}
+          placeholder="processes"
+          {...form.getInputProps('workers')}
+          value={form.getValues().workers ?? ''}
+          onChange={(value) =>
+            form.setFieldValue(
+              'workers',
+              typeof value === 'number' ? value : undefined
+            )
+          }
+        />
+        <NumberInput
+          label={
+            <LabelWithTooltip
+              label="Batch size"
+              tooltip="Max number of timestamps sent to worker process at once.
+                Not used if number of workers is 0. Default is 1000."
+            />
+          }
+          min={1}
+          allowDecimal={false}
+          placeholder="timestamps"
+          {...form.getInputProps('batch_size')}
+          value={form.getValues().batch_size ?? ''}
+          onChange={(value) =>
+            form.setFieldValue(
+              'batch_size',
+              typeof value === 'number' ? value : undefined
+            )
+          }
+        />
+      </Group>
     </Stack>
   );
 };
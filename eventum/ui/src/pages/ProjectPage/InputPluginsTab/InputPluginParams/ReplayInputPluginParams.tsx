@@ -0,0 +1,189 @@
+import {
+  Anchor,
+  Group,
+  NumberInput,
+  Select,
+  Stack,
+  TagsInput,
+  TextInput,
+} from '@mantine/core';
+import { useForm } from '@mantine/form';
+import { zod4Resolver } from 'mantine-form-zod-resolver';
+import { FC } from 'react';
+
+import { ENCODINGS } from '@/api/routes/generator-configs/schemas/encodings';
+import {
+  ReplayInputPluginConfig,
+  ReplayInputPluginConfigSchema,
+} from '@/api/routes/generator-configs/schemas/plugins/input/configs/replay';
+import { LabelWithTooltip } from '@/components/ui/LabelWithTooltip';
+import { VersatileDatetimeInput } from '@/pages/ProjectPage/VersatileDatetimeInput';
+import { ProjectFileSelect } from '@/pages/ProjectPage/components/ProjectFileSelect';
+
+interface ReplayInputPluginParamsProps {
+  initialConfig: ReplayInputPluginConfig;
+  onChange: (config: ReplayInputPluginConfig) => void;
+}
+
+export const ReplayInputPluginParams: FC<ReplayInputPluginParamsProps> = ({
+  initialConfig,
+  onChange,
+}) => {
+  const form = useForm<ReplayInputPluginConfig>({
+    initialValues: initialConfig,
+    onValuesChange: onChange,
+    validate: zod4Resolver(ReplayInputPluginConfigSchema),
+    validateInputOnChange: true,
+    onSubmitPreventDefault: 'always',
+  });
+
+  return (
+    <Stack gap="xs">
+      <ProjectFileSelect
+        label={
+          <LabelWithTooltip
+            label="Path"
+            tooltip="Path to log file with original timestamps"
+          />
+        }
+        placeholder="path"
+        clearable
+        searchable
+        required
+        {...form.getInputProps('path')}
+        value={form.getValues().path ?? null}
+        onChange={(value) => form.setFieldValue('path', value ?? undefined!)}
+      />
+      <TextInput
+        label={
+          <Group gap="xs">
+            <LabelWithTooltip
+              label="Timestamp pattern"
+              tooltip="Regular expression pattern with named group `timestamp` that
+                  captures original timestamp of each line. Lines without timestamp
+                  inherit timestamp of the previous line. Regular expression must be
+                  specified in Python regex dialect."
+            />
+            <Anchor
+              size="sm"
+              target="_blank"
+              href="https://docs.python.org/3/library/re.html#regular-expression-syntax"
+            >
+              Regex syntax
+            </Anchor>
+          </Group>
+        }
+        placeholder="regular expression"
+        required
+        {...form.getInputProps('timestamp_pattern')}
+        onChange={(value) =>
+          form.setFieldValue(
+            'timestamp_pattern',
+            value.currentTarget.value !== ''
+              ? value.currentTarget.value
+              : undefined!
+          )
+        }
+      />
+      <TextInput
+        label={
+          <Group>
+            <LabelWithTooltip
+              label="Timestamp format"
+              tooltip="Format string of original timestamps. The format follows C89
+                  standard. If value is not set, then timestamps are parsed in
+                  ISO 8601 format."
+            />
+            <Anchor
+              size="sm"
+              target="_blank"
+              href="https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes"
+            >
+              C89 format
+            </Anchor>
+          </Group>
+        }
+        placeholder="format string"
+        {...form.getInputProps('timestamp_format')}
+        onChange={(value) =>
+          form.setFieldValue(
+            'timestamp_format',
+            value.currentTarget.value !== ''
+              ? value.currentTarget.value
+              : undefined
+          )
+        }
+      />
+      <Group grow align="start">
+        <VersatileDatetimeInput
+          label={
+            <LabelWithTooltip
+              label="Start time"
+              tooltip="Time to which the first line is shifted, if not set current time is used"
+            />
+          }
+          placeholder="time expression"
+          {...form.getInputProps('start')}
+          value={form.getValues().start ?? ''}
+          onChange={(value) =>
+            form.setFieldValue(
+              'start',
+              value.currentTarget.value !== ''
+                ? value.currentTarget.value
+                : undefined
+            )
+          }
+        />
+        <NumberInput
+          label={
+            <LabelWithTooltip
+              label="Speed"
+              tooltip="Speed factor of replaying, e.g. with value 10 intervals between lines are ten times shorter than original ones. Default is 1."
+            />
+          }
+          suffix="x"
+          placeholder="factor"
+          min={0}
+          step={1}
+          {...form.getInputProps('speed')}
+          value={form.getValues().speed ?? ''}
+          onChange={(value) =>
+            form.setFieldValue(
+              'speed',
+              typeof value === 'number' ? value : undefined
+            )
+          }
+        />
+      </Group>
+      <Select
+        label={
+          <LabelWithTooltip
+            label="Encoding"
+            tooltip="Encoding of the log file. Default is UTF-8."
+          />
+        }
+        placeholder="encoding"
+        data={ENCODINGS}
+        clearable
+        searchable
+        {...form.getInputProps('encoding')}
+        value={form.getValues().encoding ?? null}
+        onChange={(value) => form.setFieldValue('encoding', value ?? undefined)}
+      />
+      <TagsInput
+        label={
+          <LabelWithTooltip
+            label="Tags"
+            tooltip="Tags list attached to an input plugin"
+          />
+        }
+        placeholder="Press Enter to submit a tag"
+        {...form.getInputProps('tags')}
+        value={form.getValues().tags ?? []}
+        onChange={(value) =>
+          form.setFieldValue('tags', value.length > 0 ? value : undefined)
+        }
+      />
+    </Stack>
+  );
+};
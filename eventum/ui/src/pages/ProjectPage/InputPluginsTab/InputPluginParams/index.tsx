@@ -3,6 +3,7 @@ import { FC } from 'react';
 import { CronInputPluginParams } from './CronInputPluginParams';
 import { HTTPInputPluginParams } from './HTTPInputPluginParams';
 import { LinspaceInputPluginParams } from './LinspaceInputPluginParams';
+import { ReplayInputPluginParams } from './ReplayInputPluginParams';
 import { StaticInputPluginParams } from './StaticInputPluginParams';
 import { TimePatternsInputPluginParams } from './TimePatternsInputPluginParams';
 import { TimerInputPluginParams } from './TimerInputPluginParams';
@@ -29,6 +30,7 @@ const pluginNamesToParamsComponent = {
   cron: CronInputPluginParams,
   http: HTTPInputPluginParams,
   linspace: LinspaceInputPluginParams,
+  replay: ReplayInputPluginParams,
   static: StaticInputPluginParams,
   time_patterns: TimePatternsInputPluginParams,
   timer: TimerInputPluginParams,
@@ -0,0 +1,64 @@
+"""Vectorized search in large byte buffers (e.g. mapped files)."""
+
+from collections.abc import Buffer
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Size of buffer blocks scanned at once, it bounds memory used for
+# temporary arrays
+SCAN_BLOCK_SIZE = 64 * 2**20
+
+
+def find_byte(data: Buffer, value: int) -> NDArray[np.int64]:
+    """Find positions of byte in buffer.
+
+    Parameters
+    ----------
+    data : Buffer
+        Buffer to search in.
+
+    value : int
+        Byte to find.
+
+    Returns
+    -------
+    NDArray[np.int64]
+        Sorted positions of byte.
+
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    positions = [
+        np.flatnonzero(buffer[start : start + SCAN_BLOCK_SIZE] == value)
+        + start
+        for start in range(0, len(buffer), SCAN_BLOCK_SIZE)
+    ]
+
+    return np.concatenate(positions or [np.empty(0, dtype=np.int64)])
+
+
+def find_line_starts(data: Buffer) -> NDArray[np.int64]:
+    """Find start positions of lines in buffer, lines are separated by
+    line feed byte.
+
+    Parameters
+    ----------
+    data : Buffer
+        Buffer to search in.
+
+    Returns
+    -------
+    NDArray[np.int64]
+        Sorted start positions of lines, empty buffer has no lines and
+        trailing line break does not start a new line.
+
+    """
+    size = memoryview(data).nbytes
+    if not size:
+        return np.empty(0, dtype=np.int64)
+
+    starts = np.concatenate(([0], find_byte(data, ord('\n')) + 1))
+    if starts[-1] == size:
+        starts = starts[:-1]
+
+    return starts.astype(np.int64, copy=False)
@@ -0,0 +1,375 @@
+"""Latency profiling with log-linear histograms."""
+
+import threading
+import time
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self
+
+# Number of bits of value mantissa kept in bucket index, it defines
+# relative precision of recorded values (2 ** -SUB_BUCKET_BITS)
+SUB_BUCKET_BITS = 4
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_BUCKETS = (64 - SUB_BUCKET_BITS + 1) * _SUB_BUCKETS
+
+
+def _bucket_index(value: int) -> int:
+    """Get index of bucket for value."""
+    exponent = value.bit_length() - 1
+    if exponent < SUB_BUCKET_BITS:
+        return max(value, 0)
+
+    shift = exponent - SUB_BUCKET_BITS
+    return ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Get highest value equivalent to values of bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = (index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySnapshot:
+    """Summary of recorded latencies.
+
+    Attributes
+    ----------
+    count : int
+        Number of recorded values.
+
+    total : float
+        Sum of recorded values (in seconds).
+
+    min : float
+        Minimal recorded value (in seconds).
+
+    mean : float
+        Mean of recorded values (in seconds).
+
+    max : float
+        Maximal recorded value (in seconds).
+
+    p50 : float
+        50th percentile (in seconds).
+
+    p90 : float
+        90th percentile (in seconds).
+
+    p99 : float
+        99th percentile (in seconds).
+
+    p999 : float
+        99.9th percentile (in seconds).
+
+    """
+
+    count: int
+    total: float
+    min: float
+    mean: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+    p999: float
+
+
+class LatencyHistogram:
+    """Histogram of latencies with log-linear buckets (HDR-style).
+
+    Values are recorded in nanoseconds into buckets with fixed
+    relative precision, so recording is a constant time operation
+    and memory usage does not depend on number of recorded values.
+
+    Notes
+    -----
+    Histogram is thread-safe. Pickled histogram is a consistent copy
+    of its state.
+
+    """
+
+    __slots__ = ('_count', '_counts', '_lock', '_max', '_min', '_total')
+
+    def __init__(self) -> None:
+        """Initialize empty histogram."""
+        self._lock = threading.Lock()
+        self._counts = [0] * _BUCKETS
+        self._count = 0
+        self._total = 0
+        self._min = 0
+        self._max = 0
+
+    def record(self, duration: int) -> None:
+        """Record duration.
+
+        Parameters
+        ----------
+        duration : int
+            Duration in nanoseconds, negative values are recorded
+            as zero.
+
+        """
+        duration = max(duration, 0)
+        index = _bucket_index(duration)
+
+        with self._lock:
+            self._counts[index] += 1
+
+            if self._count == 0 or duration < self._min:
+                self._min = duration
+
+            self._max = max(self._max, duration)
+            self._count += 1
+            self._total += duration
+
+    def measure(self) -> LatencyMeasurement:
+        """Create context manager that records duration of its body.
+
+        Returns
+        -------
+        LatencyMeasurement
+            Context manager.
+
+        """
+        return LatencyMeasurement(self)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add values recorded by other histogram.
+
+        Parameters
+        ----------
+        other : LatencyHistogram
+            Histogram to merge.
+
+        """
+        state = other.__getstate__()
+
+        with self._lock:
+            if state['count'] == 0:
+                return
+
+            if self._count == 0 or state['min'] < self._min:
+                self._min = state['min']
+
+            self._max = max(self._max, state['max'])
+            self._count += state['count']
+            self._total += state['total']
+
+            for index, count in enumerate(state['counts']):
+                self._counts[index] += count
+
+    def percentile(self, percent: float) -> int:
+        """Get percentile of recorded values.
+
+        Parameters
+        ----------
+        percent : float
+            Percent in range [0; 100].
+
+        Returns
+        -------
+        int
+            Highest value equivalent to the percentile (in
+            nanoseconds) with precision of histogram buckets, or zero
+            if there are no recorded values.
+
+        """
+        with self._lock:
+            return self._percentile(percent)
+
+    def _percentile(self, percent: float) -> int:
+        """Get percentile of recorded values without locking."""
+        if self._count == 0:
+            return 0
+
+        target = max(1, round(self._count * min(percent, 100) / 100))
+        seen = 0
+
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(_bucket_upper_bound(index), self._max)
+
+        return self._max
+
+    def snapshot(self) -> LatencySnapshot:
+        """Get summary of recorded values.
+
+        Returns
+        -------
+        LatencySnapshot
+            Summary of recorded values.
+
+        """
+        with self._lock:
+            count = self._count
+            return LatencySnapshot(
+                count=count,
+                total=self._total / 1e9,
+                min=self._min / 1e9,
+                mean=(self._total / count / 1e9) if count else 0.0,
+                max=self._max / 1e9,
+                p50=self._percentile(50) / 1e9,
+                p90=self._percentile(90) / 1e9,
+                p99=self._percentile(99) / 1e9,
+                p999=self._percentile(99.9) / 1e9,
+            )
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self._count
+
+    @property
+    def total(self) -> int:
+        """Sum of recorded values (in nanoseconds)."""
+        return self._total
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get consistent copy of histogram state."""
+        with self._lock:
+            return {
+                'counts': self._counts.copy(),
+                'count': self._count,
+                'total': self._total,
+                'min': self._min,
+                'max': self._max,
+            }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore histogram state."""
+        self._lock = threading.Lock()
+        self._counts = state['counts']
+        self._count = state['count']
+        self._total = state['total']
+        self._min = state['min']
+        self._max = state['max']
+
+
+class LatencyMeasurement:
+    """Context manager that records duration of its body into
+    histogram.
+
+    Parameters
+    ----------
+    histogram : LatencyHistogram
+        Histogram to record duration into.
+
+    """
+
+    __slots__ = ('_histogram', '_start')
+
+    def __init__(self, histogram: LatencyHistogram) -> None:
+        """Initialize measurement.
+
+        Parameters
+        ----------
+        histogram : LatencyHistogram
+            Histogram to record duration into.
+
+        """
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self) -> Self:
+        """Start measurement."""
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Record duration."""
+        self._histogram.record(time.perf_counter_ns() - self._start)
+
+
+class PipelineProfiler:
+    """Registry of named latency histograms of pipeline.
+
+    Names are dotted strings with the component as the first part,
+    e.g. `event.render` or `output.1.write`.
+
+    Notes
+    -----
+    Profiler is picklable, so it can be transferred from other
+    processes and merged.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty profiler."""
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Get histogram by name, creating it if it does not exist.
+
+        Parameters
+        ----------
+        name : str
+            Name of the histogram.
+
+        Returns
+        -------
+        LatencyHistogram
+            Histogram.
+
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms.setdefault(name, LatencyHistogram())
+
+        return histogram
+
+    def register(self, name: str, histogram: LatencyHistogram) -> None:
+        """Register histogram owned by other component (e.g. plugin).
+
+        Parameters
+        ----------
+        name : str
+            Name of the histogram.
+
+        histogram : LatencyHistogram
+            Histogram to register.
+
+        """
+        self._histograms[name] = histogram
+
+    def merge(self, other: PipelineProfiler) -> None:
+        """Add values recorded by histograms of other profiler.
+
+        Parameters
+        ----------
+        other : PipelineProfiler
+            Profiler to merge.
+
+        """
+        for name, histogram in other.histograms.items():
+            self.histogram(name).merge(histogram)
+
+    def snapshot(self) -> dict[str, LatencySnapshot]:
+        """Get summary of all histograms.
+
+        Returns
+        -------
+        dict[str, LatencySnapshot]
+            Summary of histograms by their names.
+
+        """
+        return {
+            name: histogram.snapshot()
+            for name, histogram in self.histograms.items()
+        }
+
+    @property
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        """Histograms by their names."""
+        return dict(self._histograms)
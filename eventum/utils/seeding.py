@@ -0,0 +1,31 @@
+"""Derivation of seeds for independent random streams."""
+
+from hashlib import blake2b
+
+
+def derive_seed(seed: int, *key: int | str) -> int:
+    """Derive seed of independent random stream from base seed.
+
+    Derived seed depends only on the base seed and the key, so it is
+    stable across processes and runs (unlike builtin `hash` of
+    strings), while streams seeded with different keys do not
+    correlate.
+
+    Parameters
+    ----------
+    seed : int
+        Base seed.
+
+    *key : int | str
+        Key identifying the stream (e.g. plugin type and its ID).
+
+    Returns
+    -------
+    int
+        Derived 64 bit non negative seed.
+
+    """
+    data = '|'.join(str(part) for part in (seed, *key)).encode('utf-8')
+    digest = blake2b(data, digest_size=8).digest()
+
+    return int.from_bytes(digest, 'big')
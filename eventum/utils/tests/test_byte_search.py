@@ -0,0 +1,21 @@
+import eventum.utils.byte_search as byte_search_module
+from eventum.utils.byte_search import find_byte, find_line_starts
+
+
+def test_find_byte():
+    assert find_byte(b'a,b,,c', ord(',')).tolist() == [1, 3, 4]
+    assert find_byte(b'abc', ord(',')).tolist() == []
+    assert find_byte(b'', ord(',')).tolist() == []
+
+
+def test_find_byte_in_blocks(monkeypatch):
+    monkeypatch.setattr(byte_search_module, 'SCAN_BLOCK_SIZE', 2)
+
+    assert find_byte(b'a,b,,c,', ord(',')).tolist() == [1, 3, 4, 6]
+
+
+def test_find_line_starts():
+    assert find_line_starts(b'a\nbb\n\nc').tolist() == [0, 2, 5, 6]
+    assert find_line_starts(b'a\nbb\n').tolist() == [0, 2]
+    assert find_line_starts(b'\n').tolist() == [0]
+    assert find_line_starts(b'').tolist() == []
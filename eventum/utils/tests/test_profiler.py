@@ -0,0 +1,80 @@
+import pickle
+
+import pytest
+
+from eventum.utils.profiler import (
+    LatencyHistogram,
+    PipelineProfiler,
+    _bucket_index,
+    _bucket_upper_bound,
+)
+
+
+@pytest.mark.parametrize('value', [0, 1, 15, 16, 17, 1000, 123_456_789])
+def test_bucket_bounds(value):
+    upper = _bucket_upper_bound(_bucket_index(value))
+
+    assert upper >= value
+    assert upper - value <= value / 16
+
+
+def test_empty_histogram():
+    snapshot = LatencyHistogram().snapshot()
+
+    assert snapshot.count == 0
+    assert snapshot.max == 0
+    assert snapshot.p99 == 0
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.count == 1000
+    assert snapshot.min == pytest.approx(1e-6)
+    assert snapshot.max == pytest.approx(1e-3)
+    assert snapshot.mean == pytest.approx(500.5e-6)
+    assert snapshot.p50 == pytest.approx(500e-6, rel=0.07)
+    assert snapshot.p99 == pytest.approx(990e-6, rel=0.07)
+
+
+def test_histogram_measure():
+    histogram = LatencyHistogram()
+
+    with histogram.measure():
+        pass
+
+    assert histogram.count == 1
+
+
+def test_histogram_merge():
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.record(10)
+    second.record(5)
+    second.record(20)
+
+    first.merge(second)
+    snapshot = first.snapshot()
+
+    assert snapshot.count == 3
+    assert snapshot.min == pytest.approx(5e-9)
+    assert snapshot.max == pytest.approx(20e-9)
+
+
+def test_profiler_pickle_and_merge():
+    profiler = PipelineProfiler()
+    profiler.histogram('event.render').record(100)
+    profiler.register('output.1.write', LatencyHistogram())
+
+    restored = pickle.loads(pickle.dumps(profiler))  # noqa: S301
+    merged = PipelineProfiler()
+    merged.merge(restored)
+    merged.merge(restored)
+
+    snapshot = merged.snapshot()
+    assert snapshot['event.render'].count == 2
+    assert snapshot['output.1.write'].count == 0
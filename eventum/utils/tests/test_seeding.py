@@ -0,0 +1,24 @@
+from eventum.utils.seeding import derive_seed
+
+
+def test_derive_seed_is_stable():
+    assert derive_seed(42, 'event', 1) == derive_seed(42, 'event', 1)
+    assert derive_seed(42, 'event', 1) == 16546495016910272611
+
+
+def test_derive_seed_depends_on_key():
+    seeds = {
+        derive_seed(42),
+        derive_seed(43),
+        derive_seed(42, 'event', 1),
+        derive_seed(42, 'event', 2),
+        derive_seed(42, 'input', 1),
+    }
+
+    assert len(seeds) == 5
+
+
+def test_derive_seed_range():
+    seed = derive_seed(0, 'any')
+
+    assert 0 <= seed < 2**64